@@ -19,15 +19,37 @@ Capabilities:
 - Rate limiting and connection tracking
 - Deep packet inspection (DPI) for ICS protocols
 - Stateful inspection
+
+Rules are compiled into an index keyed on the most selective field of each
+rule (source/destination CIDR, zone/network, protocol and port), so a
+connection check only evaluates rules that could match it. Source and
+destination IP criteria accept single addresses or CIDR prefixes.
+
+Decisions are remembered in a connection-tracking table, so repeat flows
+(SCADA polling, scanner retries) skip rule evaluation until they go idle
+or the ruleset changes.
+
+Blocks are counted in per-second buckets over a one-minute window, per rule
+and per source IP, so block rates and top blocked sources are available
+without scanning the block history.
 """
 
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 from components.devices.core.base_device import BaseDevice
+from components.network.prefix_trie import (
+    IPAddress,
+    PrefixTrie,
+    parse_address,
+    parse_network,
+)
 from components.security.logging_system import AlarmPriority, AlarmState, EventSeverity
+from components.security.sliding_window import SlidingCounter
 from components.state.data_store import DataStore
 
 
@@ -94,9 +116,269 @@ class FirewallRule:
     log_matches: bool = True
 
 
-@dataclass
+class _CompiledRule:
+    """Firewall rule with match criteria pre-parsed for fast evaluation.
+
+    IP criteria are held as networks when they parse as an address or CIDR
+    prefix, otherwise they fall back to exact string comparison (e.g.
+    device names passed as dest_ip by the protocol simulator).
+    """
+
+    __slots__ = (
+        "rule",
+        "rank",
+        "source_net",
+        "dest_net",
+    )
+
+    def __init__(self, rule: FirewallRule, sequence: int):
+        self.rule = rule
+        # Priority first, then insertion order: the order of Firewall.rules
+        self.rank = (rule.priority, sequence)
+        self.source_net = (
+            parse_network(rule.source_ip) if rule.source_ip != "any" else None
+        )
+        self.dest_net = parse_network(rule.dest_ip) if rule.dest_ip != "any" else None
+
+    def matches(
+        self,
+        source_ip: str,
+        source_addr: IPAddress | None,
+        source_network: str,
+        source_zone: str,
+        dest_ip: str,
+        dest_addr: IPAddress | None,
+        dest_network: str,
+        dest_zone: str,
+        dest_port: int,
+        protocol: str,
+    ) -> bool:
+        """Check if the rule matches connection criteria."""
+        rule = self.rule
+        if not rule.enabled:
+            return False
+
+        # Source IP (address or CIDR, else exact string)
+        if rule.source_ip != "any":
+            if self.source_net is not None:
+                if source_addr is None or source_addr not in self.source_net:
+                    return False
+            elif rule.source_ip != source_ip:
+                return False
+
+        # Dest IP
+        if rule.dest_ip != "any":
+            if self.dest_net is not None:
+                if dest_addr is None or dest_addr not in self.dest_net:
+                    return False
+            elif rule.dest_ip != dest_ip:
+                return False
+
+        if rule.source_network != "any" and rule.source_network != source_network:
+            return False
+        if rule.source_zone != "any" and rule.source_zone != source_zone:
+            return False
+        if rule.dest_network != "any" and rule.dest_network != dest_network:
+            return False
+        if rule.dest_zone != "any" and rule.dest_zone != dest_zone:
+            return False
+        if rule.dest_port is not None and rule.dest_port != dest_port:
+            return False
+        if rule.protocol != RuleProtocol.ANY and rule.protocol.value != protocol:
+            return False
+
+        return True
+
+
+class _RuleIndex:
+    """
+    Classifier over enabled firewall rules.
+
+    Each rule is filed under its most selective criterion: source IP prefix
+    trie, destination IP prefix trie, a hashed (field, value) bucket for
+    zones, networks and non-IP addresses, a (protocol, port) bucket, or the
+    wildcard list. A lookup gathers the buckets a connection can hit,
+    verifies those candidates and returns the highest-priority match, so
+    cost tracks the number of plausible rules rather than the ruleset size.
+    """
+
+    _BUCKET_FIELDS = (
+        "source_network",
+        "dest_network",
+        "source_zone",
+        "dest_zone",
+    )
+
+    def __init__(self) -> None:
+        self._source_trie = PrefixTrie()
+        self._dest_trie = PrefixTrie()
+        self._buckets: dict[tuple[str, Any], dict[str, _CompiledRule]] = {}
+        self._wildcard: dict[str, _CompiledRule] = {}
+        self._locations: dict[str, tuple[str, Any]] = {}
+        self._sequence: dict[str, int] = {}
+        self._next_sequence = 0
+
+    def __len__(self) -> int:
+        """Number of indexed (enabled) rules."""
+        return len(self._locations)
+
+    def add(self, rule: FirewallRule) -> None:
+        """Index an enabled rule, keeping its original insertion order."""
+        self.discard(rule.rule_id)
+        sequence = self._sequence.get(rule.rule_id)
+        if sequence is None:
+            sequence = self._sequence[rule.rule_id] = self._next_sequence
+            self._next_sequence += 1
+        compiled = _CompiledRule(rule, sequence)
+
+        location = self._location_for(compiled)
+        kind, key = location
+        if kind == "source_trie":
+            bucket = self._source_trie.get(key)
+            if bucket is None:
+                bucket = {}
+                self._source_trie[key] = bucket
+        elif kind == "dest_trie":
+            bucket = self._dest_trie.get(key)
+            if bucket is None:
+                bucket = {}
+                self._dest_trie[key] = bucket
+        elif kind == "bucket":
+            bucket = self._buckets.setdefault(key, {})
+        else:
+            bucket = self._wildcard
+        bucket[rule.rule_id] = compiled
+        self._locations[rule.rule_id] = location
+
+    def discard(self, rule_id: str) -> None:
+        """Remove a rule from the index (e.g. when disabled)."""
+        location = self._locations.pop(rule_id, None)
+        if location is None:
+            return
+        kind, key = location
+        if kind in ("source_trie", "dest_trie"):
+            trie = self._source_trie if kind == "source_trie" else self._dest_trie
+            bucket = trie[key]
+            del bucket[rule_id]
+            if not bucket:
+                del trie[key]
+        elif kind == "bucket":
+            bucket = self._buckets[key]
+            del bucket[rule_id]
+            if not bucket:
+                del self._buckets[key]
+        else:
+            del self._wildcard[rule_id]
+
+    def forget(self, rule_id: str) -> None:
+        """Remove a deleted rule, including its insertion order."""
+        self.discard(rule_id)
+        self._sequence.pop(rule_id, None)
+
+    def clear(self) -> None:
+        """Remove all rules."""
+        self._source_trie.clear()
+        self._dest_trie.clear()
+        self._buckets.clear()
+        self._wildcard.clear()
+        self._locations.clear()
+        self._sequence.clear()
+
+    def lookup(
+        self,
+        source_ip: str,
+        source_network: str,
+        source_zone: str,
+        dest_ip: str,
+        dest_network: str,
+        dest_zone: str,
+        dest_port: int,
+        protocol: str,
+    ) -> FirewallRule | None:
+        """Find the first rule (by priority) matching a connection."""
+        source_addr = parse_address(source_ip)
+        dest_addr = parse_address(dest_ip)
+
+        candidates: list[dict[str, _CompiledRule]] = []
+        if source_addr is not None:
+            candidates.extend(b for _, b in self._source_trie.matches(source_addr))
+        if dest_addr is not None:
+            candidates.extend(b for _, b in self._dest_trie.matches(dest_addr))
+        buckets = self._buckets
+        for key in (
+            ("source_ip", source_ip),
+            ("dest_ip", dest_ip),
+            ("source_network", source_network),
+            ("dest_network", dest_network),
+            ("source_zone", source_zone),
+            ("dest_zone", dest_zone),
+            ("service", (protocol, dest_port)),
+            ("service", (protocol, None)),
+            ("service", (RuleProtocol.ANY.value, dest_port)),
+        ):
+            bucket = buckets.get(key)
+            if bucket:
+                candidates.append(bucket)
+        if self._wildcard:
+            candidates.append(self._wildcard)
+
+        best: _CompiledRule | None = None
+        for bucket in candidates:
+            for compiled in bucket.values():
+                if best is not None and compiled.rank >= best.rank:
+                    continue
+                if compiled.matches(
+                    source_ip,
+                    source_addr,
+                    source_network,
+                    source_zone,
+                    dest_ip,
+                    dest_addr,
+                    dest_network,
+                    dest_zone,
+                    dest_port,
+                    protocol,
+                ):
+                    best = compiled
+        return best.rule if best is not None else None
+
+    def _location_for(self, compiled: _CompiledRule) -> tuple[str, Any]:
+        """Choose the most selective index slot for a rule."""
+        rule = compiled.rule
+        if rule.source_ip != "any":
+            if compiled.source_net is not None:
+                return "source_trie", compiled.source_net
+            return "bucket", ("source_ip", rule.source_ip)
+        if rule.dest_ip != "any":
+            if compiled.dest_net is not None:
+                return "dest_trie", compiled.dest_net
+            return "bucket", ("dest_ip", rule.dest_ip)
+        for name in self._BUCKET_FIELDS:
+            value = getattr(rule, name)
+            if value != "any":
+                return "bucket", (name, value)
+        if rule.protocol != RuleProtocol.ANY or rule.dest_port is not None:
+            return "bucket", ("service", (rule.protocol.value, rule.dest_port))
+        return "wildcard", None
+
+
+class _TrackedFlow:
+    """Connection-tracking entry: the rule that decided a flow.
+
+    ``rule`` is None when the default policy applied; the current default
+    action is used on each hit so changing it needs no flush.
+    """
+
+    __slots__ = ("rule", "last_seen")
+
+    def __init__(self, rule: FirewallRule | None, last_seen: float):
+        self.rule = rule
+        self.last_seen = last_seen
+
+
+@dataclass(frozen=True, slots=True)
 class BlockedConnection:
-    """Blocked connection attempt log."""
+    """Blocked connection attempt log (immutable, slotted)."""
 
     timestamp: float
     source_ip: str
@@ -153,6 +435,8 @@ class Firewall(BaseDevice):
         scan_interval: float = 1.0,
         log_dir: Path | None = None,
         block_history_limit: int = 1000,
+        conntrack_idle_timeout: float = 300.0,
+        conntrack_max_entries: int = 4096,
     ):
         """
         Initialize firewall.
@@ -165,6 +449,10 @@ class Firewall(BaseDevice):
             scan_interval: Device scan cycle interval
             log_dir: Directory for log files
             block_history_limit: Maximum blocked connections to retain
+            conntrack_idle_timeout: Simulation seconds before an idle tracked
+                flow is re-evaluated against the rules
+            conntrack_max_entries: Maximum tracked flows (least recently
+                used flows are evicted)
         """
         super().__init__(
             device_name=device_name,
@@ -179,15 +467,27 @@ class Firewall(BaseDevice):
         self.block_history_limit = block_history_limit
         self.default_action = RuleAction.ALLOW  # Default allow (can be changed)
 
-        # Firewall rules (priority sorted)
+        # Firewall rules (priority sorted) and the compiled index over them
         self.rules: list[FirewallRule] = []
+        self._rule_index = _RuleIndex()
         self._next_rule_id = 1
 
+        # Connection tracking (LRU order: least recently seen first)
+        self.conntrack_idle_timeout = conntrack_idle_timeout
+        self.conntrack_max_entries = conntrack_max_entries
+        self._conntrack: OrderedDict[tuple, _TrackedFlow] = OrderedDict()
+        self.conntrack_hits = 0
+        self.conntrack_misses = 0
+
         # Statistics
         self.total_connections_checked = 0
         self.total_connections_allowed = 0
         self.total_connections_blocked = 0
-        self.blocked_connections: list[BlockedConnection] = []
+        self.blocked_connections: deque[BlockedConnection] = deque(
+            maxlen=block_history_limit
+        )
+        self._blocks_by_rule = SlidingCounter(window=60.0)
+        self._blocks_by_source = SlidingCounter(window=60.0)
 
         # Alarm state
         self.block_rate_alarm_raised = False
@@ -211,7 +511,16 @@ class Firewall(BaseDevice):
             config: Configuration dict with keys:
                 - default_action: "allow" or "deny"
                 - baseline_rules: List of rule definitions
+                - connection_tracking: Optional idle_timeout / max_entries
         """
+        conntrack_config = config.get("connection_tracking", {})
+        self.conntrack_idle_timeout = conntrack_config.get(
+            "idle_timeout", self.conntrack_idle_timeout
+        )
+        self.conntrack_max_entries = conntrack_config.get(
+            "max_entries", self.conntrack_max_entries
+        )
+
         # Set default action
         default_action_str = config.get("default_action", "allow")
         try:
@@ -270,6 +579,7 @@ class Firewall(BaseDevice):
                 )
 
                 self.rules.append(rule)
+                self._index_rule(rule)
 
                 self.logger.info(
                     f"Loaded baseline rule: {rule.name} (priority {rule.priority}, action {rule.action.value})"
@@ -282,6 +592,7 @@ class Firewall(BaseDevice):
 
         # Sort rules by priority
         self._sort_rules()
+        self._flush_conntrack()
 
         self.logger.info(
             f"Firewall config loaded: default_action={self.default_action.value}, "
@@ -312,6 +623,7 @@ class Firewall(BaseDevice):
                 "total_connections_allowed": 0,
                 "total_connections_blocked": 0,
                 "block_rate_per_minute": 0.0,
+                "tracked_connections": 0,
             }
         )
 
@@ -324,13 +636,12 @@ class Firewall(BaseDevice):
         self.memory_map["total_connections_allowed"] = self.total_connections_allowed
         self.memory_map["total_connections_blocked"] = self.total_connections_blocked
 
-        # Calculate block rate (blocks per minute)
-        recent_blocks = [
-            b
-            for b in self.blocked_connections
-            if self.sim_time.now() - b.timestamp < 60.0
-        ]
-        block_rate = len(recent_blocks)
+        # Age out idle tracked flows
+        self._expire_conntrack()
+        self.memory_map["tracked_connections"] = len(self._conntrack)
+
+        # Block rate (blocks per minute)
+        block_rate = self.get_block_rate()
         self.memory_map["block_rate_per_minute"] = block_rate
 
         # Alarm if high block rate (possible attack)
@@ -420,6 +731,7 @@ class Firewall(BaseDevice):
 
         self.rules.append(rule)
         self._sort_rules()
+        self._index_rule(rule)
 
         await self.logger.log_audit(
             message=f"Firewall rule added: {name} ({action.value}) by {user}",
@@ -461,6 +773,8 @@ class Firewall(BaseDevice):
         for i, rule in enumerate(self.rules):
             if rule.rule_id == rule_id:
                 self.rules.pop(i)
+                self._rule_index.forget(rule_id)
+                self._flush_conntrack()
 
                 await self.logger.log_audit(
                     message=f"Firewall rule removed: {rule.name} by {user}",
@@ -483,6 +797,7 @@ class Firewall(BaseDevice):
         for rule in self.rules:
             if rule.rule_id == rule_id:
                 rule.enabled = True
+                self._index_rule(rule)
                 await self.logger.log_audit(
                     message=f"Firewall rule enabled: {rule.name} by {user}",
                     user=user,
@@ -497,6 +812,8 @@ class Firewall(BaseDevice):
         for rule in self.rules:
             if rule.rule_id == rule_id:
                 rule.enabled = False
+                self._rule_index.discard(rule_id)
+                self._flush_conntrack()
                 await self.logger.log_audit(
                     message=f"Firewall rule disabled: {rule.name} by {user}",
                     user=user,
@@ -510,6 +827,34 @@ class Firewall(BaseDevice):
         """Sort rules by priority (lower number = higher priority)."""
         self.rules.sort(key=lambda r: r.priority)
 
+    def _index_rule(self, rule: FirewallRule) -> None:
+        """Add or refresh a rule in the compiled index."""
+        if rule.enabled:
+            self._rule_index.add(rule)
+        else:
+            self._rule_index.discard(rule.rule_id)
+        self._flush_conntrack()
+
+    def _flush_conntrack(self) -> None:
+        """Forget tracked flows so they are re-evaluated against the rules."""
+        self._conntrack.clear()
+
+    def _expire_conntrack(self) -> int:
+        """Drop tracked flows idle for longer than the timeout.
+
+        Returns:
+            Number of flows expired
+        """
+        cutoff = self.sim_time.now() - self.conntrack_idle_timeout
+        expired = 0
+        while self._conntrack:
+            key, flow = next(iter(self._conntrack.items()))
+            if flow.last_seen >= cutoff:
+                break
+            del self._conntrack[key]
+            expired += 1
+        return expired
+
     # ----------------------------------------------------------------
     # Connection Checking (Called by protocol_simulator)
     # ----------------------------------------------------------------
@@ -528,7 +873,9 @@ class Firewall(BaseDevice):
         """
         Check if connection is allowed by firewall rules.
 
-        Called by protocol_simulator before accepting connection.
+        Called by protocol_simulator before accepting connection. Flows seen
+        within the idle timeout reuse their tracked decision; hit counters,
+        statistics and block logging are applied either way.
 
         Args:
             source_ip: Source IP address
@@ -544,78 +891,89 @@ class Firewall(BaseDevice):
             Tuple of (allowed: bool, reason: str)
         """
         self.total_connections_checked += 1
+        now = self.sim_time.now()
+
+        flow_key = (
+            source_ip,
+            source_network,
+            source_zone,
+            dest_ip,
+            dest_network,
+            dest_zone,
+            dest_port,
+            protocol,
+        )
+        flow = self._conntrack.get(flow_key)
+        if flow is not None and now - flow.last_seen <= self.conntrack_idle_timeout:
+            # Tracked flow - reuse decision
+            self.conntrack_hits += 1
+            flow.last_seen = now
+            self._conntrack.move_to_end(flow_key)
+            rule = flow.rule
+        else:
+            # New or idle flow - first matching rule in priority order
+            self.conntrack_misses += 1
+            rule = self._rule_index.lookup(*flow_key)
+            self._conntrack[flow_key] = _TrackedFlow(rule, now)
+            self._conntrack.move_to_end(flow_key)
+            while len(self._conntrack) > self.conntrack_max_entries:
+                self._conntrack.popitem(last=False)
+
+        if rule is not None:
+            # Rule matched - apply action
+            rule.hit_count += 1
+            rule.last_hit = now
+
+            if rule.action in (RuleAction.ALLOW,):
+                self.total_connections_allowed += 1
+
+                if rule.log_matches:
+                    self.logger.debug(
+                        "Firewall ALLOW: %s -> %s:%s (%s) - Rule: %s",
+                        source_ip,
+                        dest_ip,
+                        dest_port,
+                        protocol,
+                        rule.name,
+                    )
 
-        # Check each rule in priority order
-        for rule in self.rules:
-            if not rule.enabled:
-                continue
-
-            # Check if rule matches
-            if self._rule_matches(
-                rule,
-                source_ip,
-                source_network,
-                source_zone,
-                dest_ip,
-                dest_network,
-                dest_zone,
-                dest_port,
-                protocol,
-            ):
-                # Rule matched - apply action
-                rule.hit_count += 1
-                rule.last_hit = self.sim_time.now()
-
-                if rule.action in (RuleAction.ALLOW,):
-                    self.total_connections_allowed += 1
-
-                    if rule.log_matches:
-                        self.logger.debug(
-                            f"Firewall ALLOW: {source_ip} -> {dest_ip}:{dest_port} "
-                            f"({protocol}) - Rule: {rule.name}"
-                        )
-
-                    return True, f"Allowed by rule {rule.rule_id}: {rule.name}"
-
-                else:  # DENY, DROP, REJECT
-                    self.total_connections_blocked += 1
-
-                    # Log blocked connection
-                    blocked = BlockedConnection(
-                        timestamp=self.sim_time.now(),
-                        source_ip=source_ip,
-                        dest_ip=dest_ip,
-                        dest_port=dest_port,
-                        protocol=protocol,
-                        rule_id=rule.rule_id,
-                        reason=rule.name,
+                return True, f"Allowed by rule {rule.rule_id}: {rule.name}"
+
+            else:  # DENY, DROP, REJECT
+                self.total_connections_blocked += 1
+
+                # Log blocked connection
+                blocked = BlockedConnection(
+                    timestamp=now,
+                    source_ip=source_ip,
+                    dest_ip=dest_ip,
+                    dest_port=dest_port,
+                    protocol=protocol,
+                    rule_id=rule.rule_id,
+                    reason=rule.name,
+                )
+                self.blocked_connections.append(blocked)
+                self._blocks_by_rule.add(now, rule.rule_id)
+                self._blocks_by_source.add(now, source_ip)
+
+                if rule.log_matches:
+                    await self.logger.log_security(
+                        f"Firewall BLOCK: {source_ip} -> {dest_ip}:{dest_port} "
+                        f"({protocol}) - Rule: {rule.name}",
+                        severity=EventSeverity.WARNING,
+                        data={
+                            "source_ip": source_ip,
+                            "source_zone": source_zone,
+                            "dest_ip": dest_ip,
+                            "dest_port": dest_port,
+                            "protocol": protocol,
+                            "rule_id": rule.rule_id,
+                            "rule_name": rule.name,
+                            "action": rule.action.value,
+                        },
                     )
-                    self.blocked_connections.append(blocked)
-
-                    # Trim history
-                    if len(self.blocked_connections) > self.block_history_limit:
-                        self.blocked_connections = self.blocked_connections[
-                            -self.block_history_limit :
-                        ]
-
-                    if rule.log_matches:
-                        await self.logger.log_security(
-                            f"Firewall BLOCK: {source_ip} -> {dest_ip}:{dest_port} "
-                            f"({protocol}) - Rule: {rule.name}",
-                            severity=EventSeverity.WARNING,
-                            data={
-                                "source_ip": source_ip,
-                                "source_zone": source_zone,
-                                "dest_ip": dest_ip,
-                                "dest_port": dest_port,
-                                "protocol": protocol,
-                                "rule_id": rule.rule_id,
-                                "rule_name": rule.name,
-                                "action": rule.action.value,
-                            },
-                        )
-
-                    return False, f"Blocked by rule {rule.rule_id}: {rule.name}"
+
+                return False, f"Blocked by rule {rule.rule_id}: {rule.name}"
 
         # No rule matched - apply default action
         if self.default_action == RuleAction.ALLOW:
@@ -625,53 +983,6 @@ class Firewall(BaseDevice):
             self.total_connections_blocked += 1
             return False, "Blocked by default policy"
 
-    def _rule_matches(
-        self,
-        rule: FirewallRule,
-        source_ip: str,
-        source_network: str,
-        source_zone: str,
-        dest_ip: str,
-        dest_network: str,
-        dest_zone: str,
-        dest_port: int,
-        protocol: str,
-    ) -> bool:
-        """Check if rule matches connection criteria."""
-        # Source IP
-        if rule.source_ip != "any" and rule.source_ip != source_ip:
-            return False
-
-        # Source network
-        if rule.source_network != "any" and rule.source_network != source_network:
-            return False
-
-        # Source zone
-        if rule.source_zone != "any" and rule.source_zone != source_zone:
-            return False
-
-        # Dest IP
-        if rule.dest_ip != "any" and rule.dest_ip != dest_ip:
-            return False
-
-        # Dest network
-        if rule.dest_network != "any" and rule.dest_network != dest_network:
-            return False
-
-        # Dest zone
-        if rule.dest_zone != "any" and rule.dest_zone != dest_zone:
-            return False
-
-        # Dest port
-        if rule.dest_port is not None and rule.dest_port != dest_port:
-            return False
-
-        # Protocol
-        if rule.protocol != RuleProtocol.ANY and rule.protocol.value != protocol:
-            return False
-
-        return True
-
     # ----------------------------------------------------------------
     # Query Methods
     # ----------------------------------------------------------------
@@ -693,11 +1004,40 @@ class Firewall(BaseDevice):
         self, limit: int = 100, source_ip: str | None = None
     ) -> list[BlockedConnection]:
         """Get recent blocked connections."""
-        connections = self.blocked_connections[-limit:]
+        connections = list(islice(reversed(self.blocked_connections), limit))
+        connections.reverse()
         if source_ip:
             connections = [c for c in connections if c.source_ip == source_ip]
         return connections
 
+    def get_block_rate(
+        self, source_ip: str | None = None, rule_id: str | None = None
+    ) -> int:
+        """
+        Get blocks in the last minute.
+
+        Args:
+            source_ip: Only count blocks from this source IP
+            rule_id: Only count blocks by this rule (ignored if source_ip set)
+
+        Returns:
+            Number of blocked connections in the last 60 seconds
+        """
+        now = self.sim_time.now()
+        if source_ip is not None:
+            return self._blocks_by_source.count(now, source_ip)
+        if rule_id is not None:
+            return self._blocks_by_rule.count(now, rule_id)
+        return self._blocks_by_rule.count(now)
+
+    def get_top_blocked_sources(self, n: int = 10) -> list[tuple[str, int]]:
+        """Get the source IPs blocked most often in the last minute."""
+        return self._blocks_by_source.top(self.sim_time.now(), n)
+
+    def get_top_blocking_rules(self, n: int = 10) -> list[tuple[str, int]]:
+        """Get the rules that blocked most often in the last minute."""
+        return self._blocks_by_rule.top(self.sim_time.now(), n)
+
     def get_statistics(self) -> dict[str, Any]:
         """Get firewall statistics."""
         return {
@@ -708,4 +1048,12 @@ class Firewall(BaseDevice):
             "total_connections_blocked": self.total_connections_blocked,
             "block_rate_per_minute": self.memory_map.get("block_rate_per_minute", 0.0),
             "blocked_connections_history": len(self.blocked_connections),
+            "top_blocked_sources": self.get_top_blocked_sources(5),
+            "connection_tracking": {
+                "entries": len(self._conntrack),
+                "max_entries": self.conntrack_max_entries,
+                "idle_timeout": self.conntrack_idle_timeout,
+                "hits": self.conntrack_hits,
+                "misses": self.conntrack_misses,
+            },
         }
@@ -13,6 +13,7 @@ Multi-Protocol Support:
 - Proprietary: Vendor-specific protocols (PI, Proficy, etc.)
 """
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -26,15 +27,20 @@ from components.security.logging_system import (
 from components.state.data_store import DataStore
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataPoint:
-    """Historical data point with quality indicator."""
+    """Historical data point with quality indicator (immutable, slotted)."""
 
     tag_name: str
     timestamp: float
     value: Any
     quality: str = "good"  # good, bad, uncertain
 
+    def __post_init__(self) -> None:
+        # The same few tags repeat across every retained point
+        if type(self.tag_name) is str:
+            object.__setattr__(self, "tag_name", sys.intern(self.tag_name))
+
 
 class Historian(BaseDevice):
     """
@@ -18,6 +18,10 @@ Detection capabilities:
 - Command injection attempts
 """
 
+import heapq
+import itertools
+import json
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -25,11 +29,18 @@ from typing import Any
 from uuid import uuid4
 
 from components.devices.core.base_device import BaseDevice
+from components.network.prefix_trie import IPNetwork, PrefixTrie, parse_network
+from components.security.alert_store import AlertStore
 from components.security.logging_system import (
     AlarmPriority,
     AlarmState,
     EventSeverity,
 )
+from components.security.pattern_matcher import PatternMatcher
+from components.security.sliding_window import (
+    SlidingCountMinSketch,
+    SlidingDistinctCounter,
+)
 from components.state.data_store import DataStore
 
 
@@ -54,9 +65,9 @@ class AlertStatus(Enum):
     CLOSED = "closed"
 
 
-@dataclass
+@dataclass(slots=True)
 class IDSAlert:
-    """IDS alert/detection."""
+    """IDS alert/detection (slotted; status changes go through AlertStore)."""
 
     alert_id: str
     timestamp: float
@@ -76,6 +87,202 @@ class IDSAlert:
     false_positive_reason: str = ""
 
 
+# Statuses that take an alert out of the active set
+_CLOSED_STATUSES = frozenset({AlertStatus.CLOSED, AlertStatus.FALSE_POSITIVE})
+
+
+class _BlockEntry:
+    """Single blocklist entry. ``expires_at`` is None for permanent blocks."""
+
+    __slots__ = ("key", "network", "expires_at", "reason")
+
+    def __init__(
+        self,
+        key: str,
+        network: IPNetwork | None,
+        expires_at: float | None,
+        reason: str,
+    ):
+        self.key = key
+        self.network = network
+        self.expires_at = expires_at
+        self.reason = reason
+
+    def active(self, now: float) -> bool:
+        """Check whether the block is still in force at time now."""
+        return self.expires_at is None or self.expires_at > now
+
+
+class _Blocklist:
+    """
+    IPS blocklist with CIDR matching and per-entry expiry.
+
+    IP addresses and CIDR ranges live in a prefix trie, so checking an
+    address costs one trie walk no matter how many ranges are blocked.
+    Anything that is not an IP (hostnames, network names) is matched
+    exactly. Temporary blocks are tracked in a min-heap keyed on expiry
+    time; ``expire()`` pops only the entries that are due instead of
+    scanning the whole list. Heap items left behind by unblocked or
+    re-added entries are skipped when they surface.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _BlockEntry] = {}
+        self._prefixes = PrefixTrie()
+        self._expiry: list[tuple[float, int, _BlockEntry]] = []
+        self._sequence = itertools.count()
+
+    @staticmethod
+    def canonical(value: str) -> tuple[str, IPNetwork | None]:
+        """Normalise a block target to its display key and network.
+
+        Bare addresses keep their address form ("10.0.0.5"), ranges are
+        reduced to their network ("10.0.0.7/24" -> "10.0.0.0/24") and
+        non-IP values are returned unchanged with no network.
+        """
+        network = parse_network(value)
+        if network is None:
+            return value, None
+        if network.prefixlen == network.max_prefixlen:
+            return str(network.network_address), network
+        return str(network), network
+
+    def add(self, value: str, expires_at: float | None, reason: str) -> bool:
+        """Add a block, returning False if the target is already blocked."""
+        key, network = self.canonical(value)
+        if key in self._entries:
+            return False
+        entry = _BlockEntry(key, network, expires_at, reason)
+        self._entries[key] = entry
+        if network is not None:
+            self._prefixes[network] = entry
+        if expires_at is not None:
+            heapq.heappush(self._expiry, (expires_at, next(self._sequence), entry))
+        return True
+
+    def discard(self, value: str) -> bool:
+        """Remove a block, returning False if the target was not blocked."""
+        key, _ = self.canonical(value)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        if entry.network is not None:
+            del self._prefixes[entry.network]
+        return True
+
+    def expire(self, now: float) -> list[_BlockEntry]:
+        """Remove and return every temporary block that has lapsed by now."""
+        expired = []
+        while self._expiry and self._expiry[0][0] <= now:
+            _, _, entry = heapq.heappop(self._expiry)
+            if self._entries.get(entry.key) is not entry:
+                continue  # Unblocked (or re-added) since it was scheduled
+            self.discard(entry.key)
+            expired.append(entry)
+        return expired
+
+    def blocks(self, address: str, now: float) -> bool:
+        """Check whether address falls under any block in force at now."""
+        entry = self._entries.get(address)
+        if entry is not None and entry.active(now):
+            return True
+        return any(entry.active(now) for _, entry in self._prefixes.matches(address))
+
+    def get(self, value: str) -> _BlockEntry | None:
+        """Get the entry for an exact block target."""
+        return self._entries.get(self.canonical(value)[0])
+
+    def clear(self) -> None:
+        """Remove all blocks."""
+        self._entries.clear()
+        self._prefixes.clear()
+        self._expiry.clear()
+
+    def __contains__(self, value: object) -> bool:
+        return isinstance(value, str) and self.canonical(value)[0] in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def temporary(self) -> int:
+        """Number of blocks that will expire."""
+        return sum(1 for e in self._entries.values() if e.expires_at is not None)
+
+
+class _AuditCursor:
+    """
+    Read position in the central audit log for a polling detection rule.
+
+    Rules poll the most recent audit events every cycle, so consecutive
+    queries overlap. The cursor keeps the highest append ``sequence``
+    (stamped by SystemState) already processed, so each event is handed to
+    the rule once however the log returns it, and the newest simulation
+    time seen, to notice clock resets.
+    """
+
+    __slots__ = ("since", "sequence")
+
+    def __init__(self) -> None:
+        self.since: float | None = None
+        self.sequence = 0
+
+    def rewound(self, now: float) -> bool:
+        """Notice the simulation clock going back past the cursor.
+
+        Only the clock position is forgotten: events already processed stay
+        behind the sequence, so the old timeline is not replayed.
+        """
+        if self.since is None or now >= self.since:
+            return False
+        self.since = None
+        return True
+
+    def advance(self, events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Filter events down to unseen ones and move the cursor past them.
+
+        Args:
+            events: Audit events, most recent first
+
+        Returns:
+            Unseen events in chronological order
+        """
+        fresh = [
+            event
+            for event in reversed(events)
+            if event.get("sequence", 0) > self.sequence
+        ]
+        if fresh:
+            self.sequence = fresh[-1]["sequence"]
+            newest = max(e.get("simulation_time", 0) for e in fresh)
+            if self.since is None or newest > self.since:
+                self.since = newest
+        return fresh
+
+    def reset(self) -> None:
+        """Start again from the beginning of the log."""
+        self.since = None
+        self.sequence = 0
+
+
+class _ScanWindow:
+    """Distinct targets and (target, port) endpoints one source hit recently."""
+
+    __slots__ = ("targets", "endpoints")
+
+    def __init__(self, window: float):
+        self.targets = SlidingDistinctCounter(window)
+        self.endpoints = SlidingDistinctCounter(window)
+
+    def clear(self) -> None:
+        self.targets.clear()
+        self.endpoints.clear()
+
+
 class IDSSystem(BaseDevice):
     """
     Network-based IDS for ICS environments.
@@ -143,19 +350,23 @@ class IDSSystem(BaseDevice):
         self.prevention_mode = (
             False  # False = IDS (detect only), True = IPS (detect + block)
         )
-        self.blocked_ips: set[str] = set()  # IP addresses blocked by IPS
+        self.blocked_ips = _Blocklist()  # IPs and CIDR ranges blocked by IPS
         self.auto_block_on_critical = True  # Auto-block on CRITICAL alerts
+        self.auto_block_ttl: float | None = 3600.0  # None = never expire
 
-        # Detection state
-        self.alerts: list[IDSAlert] = []
+        # Detection state (alerts indexed by ID with live counters)
+        self.alerts = AlertStore(
+            inactive_statuses=_CLOSED_STATUSES,
+            fields=("severity", "rule_name", "category"),
+        )
         self.total_packets_analyzed = 0
         self.total_alerts_generated = 0
         self.total_ips_blocked = 0
 
         # Detection rule state tracking
-        self.scan_tracker: dict[str, list[tuple[str, float]]] = (
-            {}
-        )  # source_ip -> [(dest_ip, timestamp), ...]
+        self.scan_tracker: dict[str, _ScanWindow] = {}  # source -> sliding window
+        self.denied_volume = SlidingCountMinSketch(window=60.0)  # all sources
+        self._scan_cursor = _AuditCursor()
         self.protocol_violations: dict[str, int] = {}  # device -> count
         self.unauthorized_access_attempts: dict[str, int] = {}  # source_ip -> count
         self.traffic_baseline: dict[str, int] = {}  # device -> normal packet count
@@ -163,6 +374,7 @@ class IDSSystem(BaseDevice):
         # Detection thresholds
         self.scan_threshold = 5  # ports scanned in time window
         self.scan_time_window = 60.0  # seconds
+        self.heavy_hitter_threshold = 100  # denied attempts per source in window
         self.violation_threshold = 3  # protocol violations
         self.unauthorized_threshold = 3  # unauthorized access attempts
         self.traffic_anomaly_multiplier = 3.0  # 3x normal traffic
@@ -174,6 +386,9 @@ class IDSSystem(BaseDevice):
             "industroyer": ["IEC-104", "MMS-GOOSE", "OPC-DA"],
             "havex": ["lighttpd", "OPC-Proxy", "remote-exec"],
         }
+        self.malware_min_matches = 2  # distinct patterns for high confidence
+        self._malware_matcher = PatternMatcher.from_groups(self.malware_signatures)
+        self._malware_cursor = _AuditCursor()
 
         # Alarm state
         self.critical_alerts_alarm_raised = False
@@ -199,17 +414,23 @@ class IDSSystem(BaseDevice):
             config: Configuration dict with keys:
                 - prevention_mode: bool (IDS vs IPS mode)
                 - auto_block_on_critical: bool
-                - permanent_blocked_ips: list of IP addresses
+                - auto_block_ttl: seconds auto-blocks last (None/0 = permanent)
+                - permanent_blocked_ips: list of IP addresses or CIDR ranges
                 - detection_thresholds: dict of threshold values
+                - malware_signatures: dict of family -> patterns (added to
+                  or replacing the built-in families)
         """
         # Load prevention mode
         self.prevention_mode = config.get("prevention_mode", False)
         self.auto_block_on_critical = config.get("auto_block_on_critical", True)
+        if "auto_block_ttl" in config:
+            self.auto_block_ttl = config["auto_block_ttl"] or None
 
         # Load permanent blocked IPs
         permanent_ips = config.get("permanent_blocked_ips", [])
         for ip in permanent_ips:
-            self.blocked_ips.add(ip)
+            if not self.blocked_ips.add(ip, None, "permanent (config)"):
+                continue
             self.total_ips_blocked += 1
             self.logger.info(f"Loaded permanent IP block: {ip}")
 
@@ -225,6 +446,13 @@ class IDSSystem(BaseDevice):
             self.unauthorized_threshold = thresholds["unauthorized_threshold"]
         if "traffic_anomaly_multiplier" in thresholds:
             self.traffic_anomaly_multiplier = thresholds["traffic_anomaly_multiplier"]
+        if "heavy_hitter_threshold" in thresholds:
+            self.heavy_hitter_threshold = thresholds["heavy_hitter_threshold"]
+        self._reset_scan_tracking()
+
+        # Load extra threat-intel signatures and compile the matcher once
+        self.malware_signatures.update(config.get("malware_signatures", {}))
+        self._malware_matcher = PatternMatcher.from_groups(self.malware_signatures)
 
         mode_str = (
             "IPS (Prevention)" if self.prevention_mode else "IDS (Detection Only)"
@@ -283,6 +511,9 @@ class IDSSystem(BaseDevice):
         and monitors for alarm conditions.
         """
         try:
+            # Lift temporary IPS blocks that have run their course
+            self._expire_blocks()
+
             # Simulate network packet capture and analysis
             await self._analyze_network_traffic()
 
@@ -354,63 +585,101 @@ class IDSSystem(BaseDevice):
         Detect network scanning and reconnaissance.
 
         Detects port scans by tracking connection attempts from single source
-        to multiple destinations in short time window.
+        to multiple destinations in short time window. Each source keeps
+        sliding-window distinct counts of targets and (target, port)
+        endpoints, so every denied attempt costs O(1) and the threshold is
+        checked as it arrives. A count-min sketch tracks denied volume
+        across all sources for heavy-hitter reporting.
         """
         try:
+            current_time = self.sim_time.now()
+            if self._scan_cursor.rewound(current_time):
+                self._reset_scan_tracking()  # Simulation clock was reset
+
             # Simulate scanning detection by checking network simulator events
             network_events = await self.data_store.get_audit_log(
                 limit=100, event_type="network_access"
             )
 
-            current_time = self.sim_time.now()
+            for event in self._scan_cursor.advance(network_events):
+                data = event.get("data", {})
+                if "DENIED" not in str(data):
+                    continue
 
-            for event in network_events:
-                if "DENIED" in str(event.get("data", {})):
-                    source = event.get("data", {}).get("source_network", "unknown")
-                    target = event.get("device", "unknown")
-                    timestamp = event.get("simulation_time", current_time)
+                source = data.get("source_network", "unknown")
+                target = event.get("device", "unknown")
+                port = data.get("port", data.get("target_port"))
+                timestamp = event.get("simulation_time", current_time)
 
-                    # Track scan attempts
-                    if source not in self.scan_tracker:
-                        self.scan_tracker[source] = []
+                self.denied_volume.add(timestamp, source, count=event.get("count", 1))
 
-                    self.scan_tracker[source].append((target, timestamp))
+                window = self.scan_tracker.get(source)
+                if window is None:
+                    window = self.scan_tracker[source] = _ScanWindow(
+                        self.scan_time_window
+                    )
+                unique_targets = window.targets.add(timestamp, target)
+                unique_endpoints = window.endpoints.add(timestamp, (target, port))
 
-                    # Clean old entries
-                    self.scan_tracker[source] = [
-                        (t, ts)
-                        for t, ts in self.scan_tracker[source]
-                        if current_time - ts < self.scan_time_window
-                    ]
+                # Check threshold
+                if max(unique_targets, unique_endpoints) < self.scan_threshold:
+                    continue
 
-                    # Check threshold
-                    unique_targets = len({t for t, _ in self.scan_tracker[source]})
-                    if unique_targets >= self.scan_threshold:
-                        await self._generate_alert(
-                            severity=AlertSeverity.HIGH,
-                            rule_name="network_scanning",
-                            category="reconnaissance",
-                            title=f"Network Scan Detected from {source}",
-                            description=f"Source {source} attempted to access {unique_targets} different targets in {self.scan_time_window}s window",
-                            source_ip=source,
-                            destination_ip="multiple",
-                            protocol="multiple",
-                            affected_devices=list(
-                                {t for t, _ in self.scan_tracker[source]}
-                            ),
-                            indicators={
-                                "targets_scanned": unique_targets,
-                                "time_window": self.scan_time_window,
-                                "threshold": self.scan_threshold,
-                            },
-                        )
+                await self._generate_alert(
+                    severity=AlertSeverity.HIGH,
+                    rule_name="network_scanning",
+                    category="reconnaissance",
+                    title=f"Network Scan Detected from {source}",
+                    description=f"Source {source} attempted to access {unique_targets} different targets ({unique_endpoints} endpoints) in {self.scan_time_window}s window",
+                    source_ip=source,
+                    destination_ip="multiple",
+                    protocol="multiple",
+                    affected_devices=window.targets.keys(timestamp),
+                    indicators={
+                        "targets_scanned": unique_targets,
+                        "endpoints_scanned": unique_endpoints,
+                        "time_window": self.scan_time_window,
+                        "threshold": self.scan_threshold,
+                    },
+                )
 
-                        # Clear tracker to avoid duplicate alerts
-                        self.scan_tracker[source] = []
+                # Clear tracker to avoid duplicate alerts
+                window.clear()
+
+            # Drop sources that have gone quiet so idle state does not pile up
+            for source in [
+                s
+                for s, w in self.scan_tracker.items()
+                if not w.targets.count(current_time)
+            ]:
+                del self.scan_tracker[source]
 
         except Exception as e:
             self.logger.error(f"Scan detection error: {e}", exc_info=True)
 
+    def _reset_scan_tracking(self) -> None:
+        """Discard scan windows (after a config or clock change)."""
+        self.scan_tracker.clear()
+        self.denied_volume = SlidingCountMinSketch(
+            window=self.scan_time_window,
+            heavy_threshold=self.heavy_hitter_threshold,
+        )
+
+    def get_top_denied_sources(self, n: int = 10) -> list[tuple[str, int]]:
+        """
+        Get sources with the most denied attempts in the scan window.
+
+        Only sources at or above ``heavy_hitter_threshold`` are reported;
+        counts are count-min estimates and may slightly overcount.
+
+        Args:
+            n: Maximum number of sources
+
+        Returns:
+            List of (source, estimated_attempts), loudest first
+        """
+        return self.denied_volume.heavy_hitters(self.sim_time.now(), n)
+
     async def _detect_protocol_violations(self) -> None:
         """
         Detect ICS protocol violations.
@@ -488,9 +757,11 @@ class IDSSystem(BaseDevice):
                         "source_ip", event.get("user", "unknown")
                     )
 
-                    self.unauthorized_access_attempts[source] = (
-                        self.unauthorized_access_attempts.get(source, 0) + 1
-                    )
+                    self.unauthorized_access_attempts[
+                        source
+                    ] = self.unauthorized_access_attempts.get(source, 0) + event.get(
+                        "count", 1
+                    )  # Aggregated summaries
 
                     if (
                         self.unauthorized_access_attempts[source]
@@ -529,21 +800,26 @@ class IDSSystem(BaseDevice):
         Detect known ICS malware signatures.
 
         Scans for patterns associated with Stuxnet, Triton, Industroyer, etc.
+        All signatures are compiled into one Aho-Corasick automaton, so each
+        new event's message and serialised data are matched in a single
+        pass whatever the number of signatures loaded.
         """
         try:
             # In real IDS, this would scan packet payloads
             # For simulation, check audit log for suspicious patterns
+            self._malware_cursor.rewound(self.sim_time.now())
             events = await self.data_store.get_audit_log(limit=100)
 
-            for event in events:
-                message = event.get("message", "").lower()
+            for event in self._malware_cursor.advance(events):
                 device = event.get("device", "unknown")
+                if device == self.device_name:
+                    continue  # Our own alerts quote the patterns they matched
 
                 # Check against known malware signatures
-                for malware_name, patterns in self.malware_signatures.items():
-                    matches = [p.lower() for p in patterns if p.lower() in message]
+                for malware_name, hits in self._match_signatures(event).items():
+                    matches = sorted({hit["pattern"].lower() for hit in hits})
 
-                    if len(matches) >= 2:  # Multiple pattern matches = high confidence
+                    if len(matches) >= self.malware_min_matches:
                         await self._generate_alert(
                             severity=AlertSeverity.CRITICAL,
                             rule_name="malware_detection",
@@ -557,6 +833,7 @@ class IDSSystem(BaseDevice):
                             indicators={
                                 "malware_family": malware_name,
                                 "matched_patterns": matches,
+                                "matches": hits,
                                 "confidence": "high",
                             },
                         )
@@ -577,6 +854,35 @@ class IDSSystem(BaseDevice):
         except Exception as e:
             self.logger.error(f"Malware detection error: {e}", exc_info=True)
 
+    def _match_signatures(
+        self, event: dict[str, Any]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Match an audit event against all malware signatures.
+
+        Args:
+            event: Audit event with message and optional data
+
+        Returns:
+            Dict of malware family -> list of {"pattern", "field", "offset"}
+        """
+        fields = {"message": event.get("message", "")}
+        data = event.get("data")
+        if data:
+            fields["data"] = json.dumps(data, default=str, sort_keys=True)
+
+        families: dict[str, list[dict[str, Any]]] = {}
+        for field_name, text in fields.items():
+            for match in self._malware_matcher.find(text):
+                families.setdefault(match.label, []).append(
+                    {
+                        "pattern": match.pattern,
+                        "field": field_name,
+                        "offset": match.offset,
+                    }
+                )
+        return families
+
     async def _detect_traffic_anomalies(self) -> None:
         """
         Detect traffic anomalies.
@@ -666,7 +972,7 @@ class IDSSystem(BaseDevice):
             indicators=indicators,
         )
 
-        self.alerts.append(alert)
+        self.alerts.add(alert)
         self.total_alerts_generated += 1
 
         # Log to audit trail
@@ -717,41 +1023,41 @@ class IDSSystem(BaseDevice):
         Returns:
             True if updated successfully
         """
-        for alert in self.alerts:
-            if alert.alert_id == alert_id:
-                old_status = alert.status
-                alert.status = status
-
-                if assigned_to:
-                    alert.assigned_to = assigned_to
-
-                if note:
-                    alert.notes.append(f"[{self.sim_time.now():.1f}] {note}")
-
-                if false_positive_reason:
-                    alert.false_positive_reason = false_positive_reason
-
-                # Audit log
-                await self.logger.log_audit(
-                    message=f"IDS alert {alert_id} status changed: {old_status.value} -> {status.value}",
-                    user=assigned_to or "system",
-                    action="ids_alert_update",
-                    result="SUCCESS",
-                    data={
-                        "ids_system": self.device_name,
-                        "alert_id": alert_id,
-                        "old_status": old_status.value,
-                        "new_status": status.value,
-                        "assigned_to": assigned_to,
-                        "note": note,
-                    },
-                )
+        alert = self.alerts.get(alert_id)
+        if alert is None:
+            self.logger.warning(f"Alert {alert_id} not found")
+            return False
+
+        old_status = alert.status
+        self.alerts.set_status(alert, status)
+
+        if assigned_to:
+            alert.assigned_to = assigned_to
 
-                self.logger.info(f"Alert {alert_id} status updated to {status.value}")
-                return True
+        if note:
+            alert.notes.append(f"[{self.sim_time.now():.1f}] {note}")
+
+        if false_positive_reason:
+            alert.false_positive_reason = false_positive_reason
+
+        # Audit log
+        await self.logger.log_audit(
+            message=f"IDS alert {alert_id} status changed: {old_status.value} -> {status.value}",
+            user=assigned_to or "system",
+            action="ids_alert_update",
+            result="SUCCESS",
+            data={
+                "ids_system": self.device_name,
+                "alert_id": alert_id,
+                "old_status": old_status.value,
+                "new_status": status.value,
+                "assigned_to": assigned_to,
+                "note": note,
+            },
+        )
 
-        self.logger.warning(f"Alert {alert_id} not found")
-        return False
+        self.logger.info(f"Alert {alert_id} status updated to {status.value}")
+        return True
 
     def get_active_alerts(
         self, severity: AlertSeverity | None = None, category: str | None = None
@@ -766,19 +1072,7 @@ class IDSSystem(BaseDevice):
         Returns:
             List of matching alerts
         """
-        alerts = [
-            a
-            for a in self.alerts
-            if a.status not in [AlertStatus.CLOSED, AlertStatus.FALSE_POSITIVE]
-        ]
-
-        if severity:
-            alerts = [a for a in alerts if a.severity == severity]
-
-        if category:
-            alerts = [a for a in alerts if a.category == category]
-
-        return alerts
+        return self.alerts.active(severity=severity, category=category)
 
     def get_all_alerts(
         self, severity: AlertSeverity | None = None, category: str | None = None
@@ -793,7 +1087,7 @@ class IDSSystem(BaseDevice):
         Returns:
             List of matching alerts
         """
-        alerts = self.alerts.copy()
+        alerts = list(self.alerts)
 
         if severity:
             alerts = [a for a in alerts if a.severity == severity]
@@ -804,24 +1098,17 @@ class IDSSystem(BaseDevice):
         return alerts
 
     def _trim_alert_history(self) -> None:
-        """Trim alert history to configured limit."""
-        if len(self.alerts) > self.alert_history_limit:
-            # Keep most recent alerts, prioritizing unresolved
-            active = [
-                a
-                for a in self.alerts
-                if a.status not in [AlertStatus.CLOSED, AlertStatus.FALSE_POSITIVE]
-            ]
-            closed = [
-                a
-                for a in self.alerts
-                if a.status in [AlertStatus.CLOSED, AlertStatus.FALSE_POSITIVE]
-            ]
-
-            # Keep all active + recent closed
-            closed.sort(key=lambda a: a.timestamp, reverse=True)
-            max_closed = self.alert_history_limit - len(active)
-            self.alerts = active + closed[:max_closed]
+        """
+        Trim alert history to configured limit.
+
+        Unresolved alerts are always kept; closed alerts are dropped
+        longest-closed first until the history fits.
+        """
+        while len(self.alerts) > self.alert_history_limit:
+            closed = self.alerts.oldest_inactive()
+            if closed is None:
+                break
+            self.alerts.remove(closed.alert_id)
 
     # ----------------------------------------------------------------
     # Alarm conditions
@@ -830,12 +1117,8 @@ class IDSSystem(BaseDevice):
     async def _check_alarm_conditions(self) -> None:
         """Check for conditions requiring alarm escalation."""
         # Critical alerts alarm
-        critical_count = len(
-            [
-                a
-                for a in self.alerts
-                if a.severity == AlertSeverity.CRITICAL and a.status == AlertStatus.NEW
-            ]
+        critical_count = self.alerts.count(
+            "severity", AlertSeverity.CRITICAL, status=AlertStatus.NEW
         )
 
         if critical_count > 0 and not self.critical_alerts_alarm_raised:
@@ -848,9 +1131,8 @@ class IDSSystem(BaseDevice):
                     "critical_alert_count": critical_count,
                     "alert_ids": [
                         a.alert_id
-                        for a in self.alerts
-                        if a.severity == AlertSeverity.CRITICAL
-                        and a.status == AlertStatus.NEW
+                        for a in self.alerts.active(severity=AlertSeverity.CRITICAL)
+                        if a.status == AlertStatus.NEW
                     ],
                 },
             )
@@ -868,12 +1150,8 @@ class IDSSystem(BaseDevice):
             self.critical_alerts_alarm_raised = False
 
         # Network scanning alarm
-        scan_detections = len(
-            [
-                a
-                for a in self.alerts
-                if a.rule_name == "network_scanning" and a.status == AlertStatus.NEW
-            ]
+        scan_detections = self.alerts.count(
+            "rule_name", "network_scanning", status=AlertStatus.NEW
         )
 
         if scan_detections >= 3 and not self.scan_detection_alarm_raised:
@@ -902,32 +1180,22 @@ class IDSSystem(BaseDevice):
 
     async def _update_statistics(self) -> None:
         """Update memory map statistics."""
-        active_alerts = self.get_active_alerts()
+        active = self.alerts.active_count
 
         self.memory_map.update(
             {
                 "total_packets_analyzed": self.total_packets_analyzed,
                 "total_alerts_generated": self.total_alerts_generated,
-                "active_alerts": len(active_alerts),
-                "critical_alerts": len(
-                    [a for a in active_alerts if a.severity == AlertSeverity.CRITICAL]
-                ),
-                "high_alerts": len(
-                    [a for a in active_alerts if a.severity == AlertSeverity.HIGH]
-                ),
-                "medium_alerts": len(
-                    [a for a in active_alerts if a.severity == AlertSeverity.MEDIUM]
-                ),
-                "low_alerts": len(
-                    [a for a in active_alerts if a.severity == AlertSeverity.LOW]
-                ),
-                "scan_detections": len(
-                    [a for a in self.alerts if a.rule_name == "network_scanning"]
-                ),
+                "active_alerts": active(),
+                "critical_alerts": active("severity", AlertSeverity.CRITICAL),
+                "high_alerts": active("severity", AlertSeverity.HIGH),
+                "medium_alerts": active("severity", AlertSeverity.MEDIUM),
+                "low_alerts": active("severity", AlertSeverity.LOW),
+                "scan_detections": self.alerts.count("rule_name", "network_scanning"),
                 "protocol_violations": sum(self.protocol_violations.values()),
                 "unauthorized_access": sum(self.unauthorized_access_attempts.values()),
-                "malware_detections": len(
-                    [a for a in self.alerts if a.rule_name == "malware_detection"]
+                "malware_detections": self.alerts.count(
+                    "rule_name", "malware_detection"
                 ),
             }
         )
@@ -939,7 +1207,8 @@ class IDSSystem(BaseDevice):
         Returns:
             Dictionary with traffic analysis and detection stats
         """
-        active_alerts = self.get_active_alerts()
+        active = self.alerts.active_count
+        count = self.alerts.count
 
         return {
             "traffic": {
@@ -948,42 +1217,26 @@ class IDSSystem(BaseDevice):
             },
             "alerts": {
                 "total_generated": self.total_alerts_generated,
-                "active": len(active_alerts),
+                "active": active(),
                 "by_severity": {
-                    "critical": len(
-                        [
-                            a
-                            for a in active_alerts
-                            if a.severity == AlertSeverity.CRITICAL
-                        ]
-                    ),
-                    "high": len(
-                        [a for a in active_alerts if a.severity == AlertSeverity.HIGH]
-                    ),
-                    "medium": len(
-                        [a for a in active_alerts if a.severity == AlertSeverity.MEDIUM]
-                    ),
-                    "low": len(
-                        [a for a in active_alerts if a.severity == AlertSeverity.LOW]
-                    ),
+                    "critical": active("severity", AlertSeverity.CRITICAL),
+                    "high": active("severity", AlertSeverity.HIGH),
+                    "medium": active("severity", AlertSeverity.MEDIUM),
+                    "low": active("severity", AlertSeverity.LOW),
+                },
+                "by_status": {
+                    status.value: self.alerts.count("status", status)
+                    for status in AlertStatus
                 },
             },
             "detections": {
-                "scan_detections": len(
-                    [a for a in self.alerts if a.rule_name == "network_scanning"]
-                ),
-                "protocol_violations": len(
-                    [a for a in self.alerts if a.rule_name == "protocol_violation"]
-                ),
-                "unauthorized_access": len(
-                    [a for a in self.alerts if a.rule_name == "unauthorized_access"]
-                ),
-                "malware_detections": len(
-                    [a for a in self.alerts if a.rule_name == "malware_detection"]
-                ),
-                "traffic_anomalies": len(
-                    [a for a in self.alerts if a.rule_name == "traffic_anomaly"]
-                ),
+                "scan_detections": count("rule_name", "network_scanning"),
+                "protocol_violations": count("rule_name", "protocol_violation"),
+                "unauthorized_access": count("rule_name", "unauthorized_access"),
+                "malware_detections": count("rule_name", "malware_detection"),
+                "traffic_anomalies": count("rule_name", "traffic_anomaly"),
+                "tracked_scan_sources": len(self.scan_tracker),
+                "top_denied_sources": self.get_top_denied_sources(5),
             },
             "system": {
                 "alert_history_size": len(self.alerts),
@@ -992,8 +1245,10 @@ class IDSSystem(BaseDevice):
             "ips": {
                 "prevention_mode": self.prevention_mode,
                 "blocked_ips": len(self.blocked_ips),
+                "temporary_blocks": self.blocked_ips.temporary,
                 "total_ips_blocked": self.total_ips_blocked,
                 "auto_block_enabled": self.auto_block_on_critical,
+                "auto_block_ttl": self.auto_block_ttl,
             },
         }
 
@@ -1036,23 +1291,30 @@ class IDSSystem(BaseDevice):
             self.logger.info(f"IDS '{self.device_name}': IDS mode - detection only")
 
     async def block_ip(
-        self, ip_address: str, reason: str, user: str = "system"
+        self,
+        ip_address: str,
+        reason: str,
+        user: str = "system",
+        ttl: float | None = None,
     ) -> bool:
         """
-        Block IP address (IPS action).
+        Block IP address or CIDR range (IPS action).
 
         Args:
-            ip_address: IP address to block
+            ip_address: IP address or CIDR range (e.g. "10.99.0.0/16") to block
             reason: Reason for blocking
             user: User initiating block
+            ttl: Seconds until the block lifts automatically (None = permanent)
 
         Returns:
             True if blocked, False if already blocked
         """
-        if ip_address in self.blocked_ips:
+        now = self.sim_time.now()
+        expires_at = now + ttl if ttl else None
+        self._expire_blocks(now)
+        if not self.blocked_ips.add(ip_address, expires_at, reason):
             return False
 
-        self.blocked_ips.add(ip_address)
         self.total_ips_blocked += 1
         self.memory_map["total_ips_blocked"] = self.total_ips_blocked
 
@@ -1064,6 +1326,7 @@ class IDSSystem(BaseDevice):
                 "reason": reason,
                 "user": user,
                 "prevention_mode": self.prevention_mode,
+                "expires_at": expires_at,
             },
         )
 
@@ -1071,20 +1334,21 @@ class IDSSystem(BaseDevice):
 
     async def unblock_ip(self, ip_address: str, user: str = "system") -> bool:
         """
-        Unblock IP address.
+        Unblock IP address or CIDR range.
+
+        Only removes the exact entry given; an address inside a blocked
+        range stays blocked until the range itself is unblocked.
 
         Args:
-            ip_address: IP address to unblock
+            ip_address: IP address or CIDR range to unblock
             user: User initiating unblock
 
         Returns:
             True if unblocked, False if not blocked
         """
-        if ip_address not in self.blocked_ips:
+        if not self.blocked_ips.discard(ip_address):
             return False
 
-        self.blocked_ips.remove(ip_address)
-
         await self.logger.log_audit(
             message=f"IDS/IPS '{self.device_name}': Unblocked IP {ip_address} by {user}",
             user=user,
@@ -1098,7 +1362,9 @@ class IDSSystem(BaseDevice):
         """
         Check if IP address is blocked.
 
-        Called by protocol_simulator during connection attempt.
+        Called by protocol_simulator during connection attempt. Matches
+        exact entries and any blocked CIDR range containing the address;
+        lapsed temporary blocks are ignored even before they are purged.
 
         Args:
             ip_address: IP address to check
@@ -1106,17 +1372,30 @@ class IDSSystem(BaseDevice):
         Returns:
             True if blocked, False if allowed
         """
-        return ip_address in self.blocked_ips
+        return self.blocked_ips.blocks(ip_address, self.sim_time.now())
 
     def get_blocked_ips(self) -> list[str]:
-        """Get list of blocked IP addresses."""
+        """Get list of blocked IP addresses and CIDR ranges."""
+        self._expire_blocks()
         return list(self.blocked_ips)
 
+    def _expire_blocks(self, now: float | None = None) -> None:
+        """Remove temporary blocks whose TTL has elapsed."""
+        if now is None:
+            now = self.sim_time.now()
+        for entry in self.blocked_ips.expire(now):
+            self.logger.info(
+                f"IDS/IPS '{self.device_name}': Block on {entry.key} expired "
+                f"({entry.reason})"
+            )
+
     async def _auto_block_on_alert(self, alert: IDSAlert) -> None:
         """
         Automatically block source IP when in IPS mode.
 
-        Called after generating CRITICAL alerts.
+        Called after generating CRITICAL alerts. Auto-blocks lift after
+        ``auto_block_ttl`` seconds so a long-running IPS does not keep
+        every address that ever tripped a rule.
 
         Args:
             alert: The alert that triggered auto-block
@@ -1136,6 +1415,7 @@ class IDSSystem(BaseDevice):
                 ip_address=alert.source_ip,
                 reason=f"Auto-block: {alert.title}",
                 user="ids_auto",
+                ttl=self.auto_block_ttl,
             )
 
     def get_summary(self) -> str:
@@ -15,6 +15,7 @@ Features:
 """
 
 import asyncio
+import re
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -23,6 +24,13 @@ from pathlib import Path
 from typing import Any
 
 from components.devices.core.base_device import BaseDevice
+from components.security.alert_store import AlertStore
+from components.security.correlation import (
+    CorrelationEngine,
+    CorrelationMatch,
+    decode_event,
+    resolve,
+)
 from components.security.logging_system import (
     AlarmPriority,
     AlarmState,
@@ -31,7 +39,117 @@ from components.security.logging_system import (
 )
 from components.state.data_store import DataStore
 
-__all__ = ["SIEMSystem", "SIEMAlert", "AlertSeverity", "IncidentStatus"]
+__all__ = [
+    "SIEMSystem",
+    "SIEMAlert",
+    "AlertSeverity",
+    "IncidentStatus",
+    "DEFAULT_CORRELATION_RULES",
+]
+
+# Built-in detection rules (see components/security/correlation.py for the
+# rule format). config/siem_correlation.yml carries the same set and can
+# replace it via load_config().
+DEFAULT_CORRELATION_RULES: list[dict[str, Any]] = [
+    {
+        "name": "failed_auth",
+        "filter": {
+            "data.action": ["authorize", "login", "authenticate"],
+            "data.result": "FAILED",
+            "user": {"exists": True},
+        },
+        "group_by": ["user"],
+        "window": 60,
+        "threshold": 3,
+        "alert": {
+            "severity": "HIGH",
+            "category": "authentication",
+            "title": "Multiple failed authentication attempts: {user}",
+            "description": "User '{user}' has {count} failed authentication "
+            "attempts in the last {window:g} seconds",
+            "indicators": {
+                "user": "{user}",
+                "failure_count": "{count}",
+                "time_window": "{window:g}s",
+            },
+        },
+    },
+    {
+        "name": "network_violation",
+        "filter": {"message": {"contains": "denied by network segmentation"}},
+        "group_by": ["data.source_network", "device"],
+        "window": 120,
+        "threshold": 5,
+        "alert": {
+            "severity": "MEDIUM",
+            "category": "network_security",
+            "title": "Network segmentation violations: {source_network} -> {device}",
+            "description": "Multiple attempts ({count}) to bypass network "
+            "segmentation from {source_network} to {device}",
+            "indicators": {
+                "source_network": "{source_network}",
+                "target_device": "{device}",
+                "violation_count": "{count}",
+            },
+        },
+    },
+    {
+        "name": "safety_bypass",
+        "filter": {"data.action": "activate_safety_bypass"},
+        "group_by": ["device"],
+        "alert": {
+            "severity": "HIGH",
+            "category": "safety",
+            "title": "Safety bypass activated: {device}",
+            "description": "Safety system bypass activated on {device} by {user}",
+            "indicators": {
+                "device": "{device}",
+                "user": "{user}",
+                "action": "{action}",
+            },
+        },
+    },
+    {
+        "name": "reactor_scram",
+        "filter": {"data.action": {"icontains": "scram"}},
+        "alert": {
+            "severity": "CRITICAL",
+            "category": "safety",
+            "title": "Reactor SCRAM: {device}",
+            "description": "Reactor SCRAM operation detected on {device}: {action}",
+            "indicators": {"device": "{device}", "action": "{action}"},
+        },
+    },
+    {
+        "name": "unusual_writes",
+        "filter": {"data.action": {"icontains": "write"}, "device": {"exists": True}},
+        "group_by": ["device"],
+        "window": 5,
+        "threshold": 51,
+        "alert": {
+            "severity": "MEDIUM",
+            "category": "anomaly",
+            "title": "Unusual write activity: {device}",
+            "description": "Device {device} has received {count} write "
+            "operations in {window:g}s",
+            "indicators": {
+                "device": "{device}",
+                "write_count": "{count}",
+                "interval": "{window}",
+            },
+        },
+    },
+]
+
+# Indicator templates that are a single placeholder keep the raw value type
+_SINGLE_FIELD = re.compile(r"\{(\w+)\}")
+
+
+class _TemplateFields(dict):
+    """Template context that renders missing fields as "unknown"."""
+
+    def __missing__(self, key: str) -> str:
+        return "unknown"
 
 
 class AlertSeverity(Enum):
@@ -54,9 +172,9 @@ class IncidentStatus(Enum):
     FALSE_POSITIVE = "false_positive"  # Not a real threat
 
 
-@dataclass
+@dataclass(slots=True)
 class SIEMAlert:
-    """Security alert generated by SIEM."""
+    """Security alert generated by SIEM (slotted)."""
 
     alert_id: str
     severity: AlertSeverity
@@ -101,13 +219,12 @@ class SIEMSystem(BaseDevice):
 
     Monitors audit trail for security incidents and generates alerts.
 
-    Detection Rules:
+    Detection Rules (declarative, see DEFAULT_CORRELATION_RULES):
     - Multiple failed authentication attempts
     - Unauthorized access attempts (network segmentation violations)
     - Safety bypass operations
+    - Reactor SCRAM operations
     - Unusual write patterns to critical devices
-    - Protocol anomalies
-    - Privilege escalation attempts
 
     Example:
         >>> siem = SIEMSystem(
@@ -154,16 +271,22 @@ class SIEMSystem(BaseDevice):
         self.analysis_interval = analysis_interval
         self.alert_history_limit = alert_history_limit
 
-        # Alert storage
-        self.alerts: list[SIEMAlert] = []
+        # Alert storage (indexed by ID with live counters)
+        self.alerts = AlertStore(
+            inactive_statuses={
+                IncidentStatus.CONTAINED,
+                IncidentStatus.RESOLVED,
+                IncidentStatus.FALSE_POSITIVE,
+            },
+            fields=("severity", "category"),
+        )
         self.alert_count_by_severity: dict[AlertSeverity, int] = defaultdict(int)
 
-        # Tracking for pattern detection
-        self._last_processed_event_index = 0
-        self._failed_auth_attempts: dict[str, list[float]] = defaultdict(list)
-        self._device_write_counts: dict[str, int] = defaultdict(int)
-        self._network_denials: dict[str, list[float]] = defaultdict(list)
-        self._safety_bypasses: dict[str, list[dict]] = defaultdict(list)
+        # Event correlation; the cursor is the highest append sequence
+        # (stamped by SystemState) already analysed, which stays valid
+        # when the capped audit log drops its oldest events
+        self._last_sequence = 0
+        self.correlation = CorrelationEngine(DEFAULT_CORRELATION_RULES)
 
         # Statistics
         self.total_events_analyzed = 0
@@ -174,6 +297,30 @@ class SIEMSystem(BaseDevice):
             f"alert_limit={alert_history_limit}"
         )
 
+    # ----------------------------------------------------------------
+    # Configuration Loading
+    # ----------------------------------------------------------------
+
+    async def load_config(self, config: dict[str, Any]) -> None:
+        """
+        Load correlation rules from config dict.
+
+        Config is provided by ConfigLoader (respects layering).
+
+        Args:
+            config: Configuration dict with keys:
+                - rules: list of correlation rule declarations; replaces
+                  the built-in rules when present
+
+        Raises:
+            ValueError: If a rule declaration is invalid
+        """
+        rules = config.get("rules")
+        if rules is None:
+            return
+        self.correlation.load(rules)
+        self.logger.info(f"SIEM correlation rules loaded: {len(rules)} rules")
+
     # ----------------------------------------------------------------
     # BaseDevice abstract methods
     # ----------------------------------------------------------------
@@ -205,15 +352,22 @@ class SIEMSystem(BaseDevice):
         Fetches new audit trail events and runs detection rules.
         """
         try:
-            # Fetch audit trail events we haven't seen yet
+            # Fetch audit trail events we haven't seen yet (most recent first)
             all_events = await self.data_store.get_audit_log(limit=None)
 
-            # Process new events
-            new_events = all_events[self._last_processed_event_index :]
+            new_events = []
+            for event in all_events:
+                if event.get("sequence", 0) <= self._last_sequence:
+                    break
+                new_events.append(event)
+            new_events.reverse()
+
+            # Let correlation windows for quiet keys lapse
+            self.correlation.expire(self.sim_time.now())
 
             if new_events:
                 self.total_events_analyzed += len(new_events)
-                self._last_processed_event_index = len(all_events)
+                self._last_sequence = new_events[-1]["sequence"]
 
                 # Run detection rules
                 await self._analyze_events(new_events)
@@ -223,7 +377,7 @@ class SIEMSystem(BaseDevice):
 
                 self.logger.debug(
                     f"Analyzed {len(new_events)} new events, "
-                    f"{len(self.get_active_alerts())} active alerts"
+                    f"{self.alerts.active_count()} active alerts"
                 )
 
         except Exception as e:
@@ -238,187 +392,68 @@ class SIEMSystem(BaseDevice):
         """
         Analyze events and generate alerts.
 
+        Each event is routed by the correlation engine to the rules whose
+        filters can match it; every rule that fires raises one alert.
+        ``data`` is decoded once per event, so rule filters and alert
+        templates both see its fields.
+
         Args:
-            events: List of audit trail events to analyze
+            events: List of audit trail events to analyze, oldest first
         """
         for event in events:
-            # Extract event details
-            action = event.get("data", {}).get("action", "")
-            result = event.get("data", {}).get("result", "")
-            device = event.get("device", "")
-            user = event.get("user", "")
-            sim_time = event.get("simulation_time", 0.0)
-
-            # Detection Rule 1: Failed authentication attempts
-            if action in ["authorize", "login", "authenticate"] and result == "FAILED":
-                await self._detect_failed_auth(user, device, sim_time, event)
-
-            # Detection Rule 2: Network segmentation violations
-            if "denied by network segmentation" in event.get("message", ""):
-                await self._detect_network_violation(event, sim_time)
-
-            # Detection Rule 3: Safety bypass operations
-            if action in ["activate_safety_bypass", "deactivate_safety_bypass"]:
-                await self._detect_safety_bypass(event, sim_time)
-
-            # Detection Rule 4: SCRAM operations
-            if "scram" in action.lower():
-                await self._detect_scram_event(event, sim_time)
-
-            # Detection Rule 5: High-frequency writes to critical devices
-            if "write" in action.lower() and device:
-                await self._detect_unusual_write_pattern(device, sim_time, event)
-
-    async def _detect_failed_auth(
-        self, user: str, device: str, sim_time: float, event: dict
-    ) -> None:
-        """Detect multiple failed authentication attempts."""
-        if not user:
-            return
+            for match in self.correlation.process(decode_event(event)):
+                await self._alert_from_match(match)
 
-        # Track failed attempts per user
-        self._failed_auth_attempts[user].append(sim_time)
-
-        # Keep only recent attempts (last 60 simulation seconds)
-        self._failed_auth_attempts[user] = [
-            t for t in self._failed_auth_attempts[user] if sim_time - t < 60.0
-        ]
-
-        # Alert if 3+ failures in 60 seconds
-        if len(self._failed_auth_attempts[user]) >= 3:
-            await self._generate_alert(
-                severity=AlertSeverity.HIGH,
-                category="authentication",
-                title=f"Multiple failed authentication attempts: {user}",
-                description=f"User '{user}' has {len(self._failed_auth_attempts[user])} "
-                f"failed authentication attempts in the last 60 seconds",
-                events=[event],
-                affected_devices=[device] if device else [],
-                indicators={
-                    "user": user,
-                    "failure_count": len(self._failed_auth_attempts[user]),
-                    "time_window": "60s",
-                },
-                sim_time=sim_time,
-            )
-
-            # Clear to avoid duplicate alerts
-            self._failed_auth_attempts[user] = []
-
-    async def _detect_network_violation(self, event: dict, sim_time: float) -> None:
-        """Detect network segmentation violations."""
-        source = event.get("data", {}).get("source_network", "unknown")
-        device = event.get("device", "unknown")
-        key = f"{source}->{device}"
-
-        # Track violations
-        self._network_denials[key].append(sim_time)
-
-        # Keep recent (last 120 seconds)
-        self._network_denials[key] = [
-            t for t in self._network_denials[key] if sim_time - t < 120.0
-        ]
-
-        # Alert if 5+ denials in 120 seconds (potential reconnaissance)
-        if len(self._network_denials[key]) >= 5:
-            await self._generate_alert(
-                severity=AlertSeverity.MEDIUM,
-                category="network_security",
-                title=f"Network segmentation violations: {source} -> {device}",
-                description=f"Multiple attempts ({len(self._network_denials[key])}) to "
-                f"bypass network segmentation from {source} to {device}",
-                events=[event],
-                affected_devices=[device],
-                indicators={
-                    "source_network": source,
-                    "target_device": device,
-                    "violation_count": len(self._network_denials[key]),
-                },
-                sim_time=sim_time,
-            )
-
-            self._network_denials[key] = []
-
-    async def _detect_safety_bypass(self, event: dict, sim_time: float) -> None:
-        """Detect safety system bypass operations."""
-        device = event.get("device", "")
-        action = event.get("data", {}).get("action", "")
-        user = event.get("user", "")
-
-        # Track bypasses per device
-        self._safety_bypasses[device].append(
-            {
-                "time": sim_time,
-                "action": action,
-                "user": user,
-                "event": event,
-            }
-        )
+    async def _alert_from_match(self, match: CorrelationMatch) -> SIEMAlert:
+        """
+        Generate the alert declared by a fired correlation rule.
 
-        # Always alert on bypass activation (HIGH priority)
-        if action == "activate_safety_bypass":
-            await self._generate_alert(
-                severity=AlertSeverity.HIGH,
-                category="safety",
-                title=f"Safety bypass activated: {device}",
-                description=f"Safety system bypass activated on {device} by {user}",
-                events=[event],
-                affected_devices=[device],
-                indicators={
-                    "device": device,
-                    "user": user,
-                    "action": action,
-                },
-                sim_time=sim_time,
-            )
-
-    async def _detect_scram_event(self, event: dict, sim_time: float) -> None:
-        """Detect reactor SCRAM operations."""
-        device = event.get("device", "")
-        action = event.get("data", {}).get("action", "")
-
-        # SCRAM is always a critical event
-        await self._generate_alert(
-            severity=AlertSeverity.CRITICAL,
-            category="safety",
-            title=f"Reactor SCRAM: {device}",
-            description=f"Reactor SCRAM operation detected on {device}: {action}",
-            events=[event],
-            affected_devices=[device],
-            indicators={
-                "device": device,
-                "action": action,
-            },
-            sim_time=sim_time,
-        )
+        Templates are filled from the triggering event (top-level fields,
+        then its data fields), the rule's group-by values, ``count`` and
+        ``window``. Missing fields render as "unknown".
 
-    async def _detect_unusual_write_pattern(
-        self, device: str, sim_time: float, event: dict
-    ) -> None:
-        """Detect high-frequency write operations to devices."""
-        self._device_write_counts[device] += 1
-
-        # Alert if a device has excessive writes (>50 in scan interval)
-        # This could indicate automated attack or malfunction
-        if self._device_write_counts[device] > 50:
-            await self._generate_alert(
-                severity=AlertSeverity.MEDIUM,
-                category="anomaly",
-                title=f"Unusual write activity: {device}",
-                description=f"Device {device} has received {self._device_write_counts[device]} "
-                f"write operations in {self.analysis_interval}s interval",
-                events=[event],
-                affected_devices=[device],
-                indicators={
-                    "device": device,
-                    "write_count": self._device_write_counts[device],
-                    "interval": self.analysis_interval,
-                },
-                sim_time=sim_time,
-            )
+        Args:
+            match: Fired correlation rule
 
-            # Reset counter after alert
-            self._device_write_counts[device] = 0
+        Returns:
+            Generated alert
+        """
+        rule, event = match.rule, match.event
+        spec = rule.alert
+        fields = _TemplateFields(
+            (k, v)
+            for k, v in {
+                **event.get("data", {}),
+                **{k: v for k, v in event.items() if k != "data"},
+                **match.group,
+            }.items()
+            if v not in (None, "")
+        )
+        fields.update(count=match.count, window=rule.window, rule=rule.name)
+
+        def render(template: Any) -> Any:
+            if not isinstance(template, str):
+                return template
+            single = _SINGLE_FIELD.fullmatch(template)
+            if single:
+                return fields[single.group(1)]
+            return template.format_map(fields)
+
+        affected = spec.get("affected_devices", ["device"])
+        if isinstance(affected, str):
+            affected = [affected]
+        devices = [resolve(event, tuple(path.split("."))) for path in affected]
+
+        return await self._generate_alert(
+            severity=AlertSeverity[str(spec.get("severity", "MEDIUM")).upper()],
+            category=spec.get("category", "correlation"),
+            title=render(spec.get("title", f"Correlation rule fired: {rule.name}")),
+            description=render(spec.get("description", "")),
+            events=[event],
+            affected_devices=[d for d in devices if d],
+            indicators={k: render(v) for k, v in spec.get("indicators", {}).items()},
+            sim_time=match.last_seen,
+        )
 
     # ----------------------------------------------------------------
     # Alert management
@@ -451,14 +486,13 @@ class SIEMSystem(BaseDevice):
             indicators=indicators,
         )
 
-        self.alerts.append(alert)
+        self.alerts.add(alert)
         self.alert_count_by_severity[severity] += 1
         self.total_alerts_generated += 1
 
         # Trim history if needed
-        if len(self.alerts) > self.alert_history_limit:
-            oldest = self.alerts[0]
-            self.alerts = self.alerts[-self.alert_history_limit :]
+        while len(self.alerts) > self.alert_history_limit:
+            oldest = self.alerts.remove(self.alerts.oldest().alert_id)
             self.logger.debug(f"Trimmed alert history, removed {oldest.alert_id}")
 
         # Log alert generation
@@ -504,16 +538,7 @@ class SIEMSystem(BaseDevice):
         Returns:
             List of active alerts
         """
-        active = [
-            a
-            for a in self.alerts
-            if a.status in (IncidentStatus.NEW, IncidentStatus.INVESTIGATING)
-        ]
-
-        if severity:
-            active = [a for a in active if a.severity == severity]
-
-        return active
+        return self.alerts.active(severity=severity)
 
     def get_all_alerts(
         self,
@@ -530,7 +555,7 @@ class SIEMSystem(BaseDevice):
         Returns:
             List of alerts
         """
-        alerts = self.alerts
+        alerts = list(self.alerts)
 
         if category:
             alerts = [a for a in alerts if a.category == category]
@@ -562,31 +587,31 @@ class SIEMSystem(BaseDevice):
         Returns:
             True if alert found and updated
         """
-        for alert in self.alerts:
-            if alert.alert_id == alert_id:
-                alert.status = status
-                if assigned_to:
-                    alert.assigned_to = assigned_to
-                if note:
-                    alert.notes.append(f"{datetime.now()}: {note}")
-
-                # Log status change
-                await self.logger.log_audit(
-                    message=f"SIEM alert {alert_id} status changed to {status.value}",
-                    user=assigned_to or "system",
-                    action="update_alert_status",
-                    result="SUCCESS",
-                    data={
-                        "alert_id": alert_id,
-                        "new_status": status.value,
-                        "assigned_to": assigned_to,
-                    },
-                )
-
-                self.logger.info(f"Alert {alert_id} status: {status.value}")
-                return True
+        alert = self.alerts.get(alert_id)
+        if alert is None:
+            return False
+
+        self.alerts.set_status(alert, status)
+        if assigned_to:
+            alert.assigned_to = assigned_to
+        if note:
+            alert.notes.append(f"{datetime.now()}: {note}")
+
+        # Log status change
+        await self.logger.log_audit(
+            message=f"SIEM alert {alert_id} status changed to {status.value}",
+            user=assigned_to or "system",
+            action="update_alert_status",
+            result="SUCCESS",
+            data={
+                "alert_id": alert_id,
+                "new_status": status.value,
+                "assigned_to": assigned_to,
+            },
+        )
 
-        return False
+        self.logger.info(f"Alert {alert_id} status: {status.value}")
+        return True
 
     # ----------------------------------------------------------------
     # Statistics and reporting
@@ -594,26 +619,21 @@ class SIEMSystem(BaseDevice):
 
     async def _update_statistics(self) -> None:
         """Update SIEM statistics in memory map."""
-        active_alerts = self.get_active_alerts()
+        active = self.alerts.active_count
 
         self.memory_map["total_events_analyzed"] = self.total_events_analyzed
         self.memory_map["total_alerts_generated"] = self.total_alerts_generated
-        self.memory_map["active_alerts"] = len(active_alerts)
+        self.memory_map["active_alerts"] = active()
 
         # Count by severity
-        critical = sum(1 for a in active_alerts if a.severity == AlertSeverity.CRITICAL)
-        high = sum(1 for a in active_alerts if a.severity == AlertSeverity.HIGH)
-        medium = sum(1 for a in active_alerts if a.severity == AlertSeverity.MEDIUM)
-        low = sum(1 for a in active_alerts if a.severity == AlertSeverity.LOW)
-
-        self.memory_map["critical_alerts"] = critical
-        self.memory_map["high_alerts"] = high
-        self.memory_map["medium_alerts"] = medium
-        self.memory_map["low_alerts"] = low
+        self.memory_map["critical_alerts"] = active("severity", AlertSeverity.CRITICAL)
+        self.memory_map["high_alerts"] = active("severity", AlertSeverity.HIGH)
+        self.memory_map["medium_alerts"] = active("severity", AlertSeverity.MEDIUM)
+        self.memory_map["low_alerts"] = active("severity", AlertSeverity.LOW)
 
         # Update metadata
         self.metadata["total_alerts"] = self.total_alerts_generated
-        self.metadata["active_alerts"] = len(active_alerts)
+        self.metadata["active_alerts"] = active()
 
     def get_statistics(self) -> dict[str, Any]:
         """
@@ -622,7 +642,7 @@ class SIEMSystem(BaseDevice):
         Returns:
             Dictionary with SIEM metrics
         """
-        active_alerts = self.get_active_alerts()
+        by_status = self.alerts.count
 
         return {
             "events": {
@@ -631,7 +651,7 @@ class SIEMSystem(BaseDevice):
             },
             "alerts": {
                 "total_generated": self.total_alerts_generated,
-                "active": len(active_alerts),
+                "active": self.alerts.active_count(),
                 "by_severity": {
                     "critical": self.alert_count_by_severity[AlertSeverity.CRITICAL],
                     "high": self.alert_count_by_severity[AlertSeverity.HIGH],
@@ -639,26 +659,15 @@ class SIEMSystem(BaseDevice):
                     "low": self.alert_count_by_severity[AlertSeverity.LOW],
                 },
                 "by_status": {
-                    "new": sum(
-                        1 for a in self.alerts if a.status == IncidentStatus.NEW
-                    ),
-                    "investigating": sum(
-                        1
-                        for a in self.alerts
-                        if a.status == IncidentStatus.INVESTIGATING
-                    ),
-                    "contained": sum(
-                        1 for a in self.alerts if a.status == IncidentStatus.CONTAINED
-                    ),
-                    "resolved": sum(
-                        1 for a in self.alerts if a.status == IncidentStatus.RESOLVED
-                    ),
+                    "new": by_status("status", IncidentStatus.NEW),
+                    "investigating": by_status("status", IncidentStatus.INVESTIGATING),
+                    "contained": by_status("status", IncidentStatus.CONTAINED),
+                    "resolved": by_status("status", IncidentStatus.RESOLVED),
                 },
             },
             "detection_rules": {
-                "failed_auth_tracked": len(self._failed_auth_attempts),
-                "network_violations_tracked": len(self._network_denials),
-                "safety_bypasses_tracked": len(self._safety_bypasses),
+                rule.name: self.correlation.tracked_keys(rule.name)
+                for rule in self.correlation.rules
             },
             "system": {
                 "running": self._running,
@@ -6,6 +6,7 @@ Central Supervisory Control and Data Acquisition system that polls field devices
 aggregates data, manages alarms, and provides operator interface.
 """
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -37,9 +38,9 @@ class TagDefinition:
     alarm_low: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Alarm:
-    """Active alarm."""
+    """Active alarm (slotted)."""
 
     tag_name: str
     alarm_type: str  # 'high', 'low', 'change_of_state', 'comms_failure'
@@ -48,6 +49,10 @@ class Alarm:
     value: Any = None
     message: str = ""
 
+    def __post_init__(self) -> None:
+        if type(self.tag_name) is str:
+            self.tag_name = sys.intern(self.tag_name)
+
 
 class SCADAServer(BaseSupervisoryDevice):
     """
@@ -12,8 +12,10 @@ Source of truth:
 
 import asyncio
 from collections import Counter
+from dataclasses import dataclass
 from typing import Any
 
+from components.network.prefix_trie import PrefixTrie, parse_address
 from components.security.logging_system import (
     EventSeverity,
     ICSLogger,
@@ -24,6 +26,46 @@ from config.config_loader import ConfigLoader
 
 __all__ = ["NetworkSimulator"]
 
+# Upper bound on cached reachability decisions. Port scans produce one
+# denial per probed port, so the table is flushed rather than left to grow.
+_MAX_CACHED_DECISIONS = 65536
+
+# Upper bound on cached peer address -> network lookups.
+_MAX_CACHED_ADDRESSES = 65536
+
+
+def _normalize_protocol(protocol: str) -> str:
+    """Normalise protocol names for policy comparison (modbus_tcp -> modbus)."""
+    return protocol.replace("_tcp", "").replace("_rtu", "")
+
+
+@dataclass(frozen=True, slots=True)
+class _ZonePolicy:
+    """Inter-zone policy compiled for one (source zone, destination zone) pair.
+
+    Protocol names are normalised once at load time. ``firewall_ports`` maps
+    each normalised protocol to its allowed ports, or is None when the
+    policy has no firewall rules (any port allowed).
+    """
+
+    allowed_protocols: frozenset[str]
+    firewall_ports: dict[str, frozenset[int]] | None
+    reason: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Decision:
+    """Cached reachability decision.
+
+    ``message`` is logged at debug level on every lookup. Denials that are
+    security events carry ``event`` (message, log_security kwargs) so the
+    audit trail is unchanged by caching.
+    """
+
+    allowed: bool
+    message: str = ""
+    event: tuple[str, dict[str, Any]] | None = None
+
 
 class NetworkSimulator:
     """
@@ -62,11 +104,23 @@ class NetworkSimulator:
         # Zone-based security policies
         self.inter_zone_policies: list[dict[str, Any]] = []
         self.network_to_zone: dict[str, str] = {}  # network_name -> zone_name
+        self._zone_policies: dict[tuple[str, str], _ZonePolicy] = {}
+
+        # Subnet -> network name, for mapping client addresses to networks
+        self._subnets = PrefixTrie()
+        self._address_networks: dict[str, str | None] = {}
 
         # Network segmentation control
         self.segmentation_enabled: bool = False
         self.segmentation_mode: str = "none"
 
+        # Reachability decisions keyed on (src_network, dst_node, protocol, port).
+        # Invalidated whenever topology, services or segmentation change.
+        self._decisions: dict[tuple[str, str, str, int], _Decision] = {}
+        self._decisions_segmentation: tuple[bool, str] = (False, "none")
+        self._decision_hits = 0
+        self._decision_misses = 0
+
         self._lock = asyncio.Lock()
         self._loaded = False
         self.logger: ICSLogger = get_logger(__name__, device="network_simulator")
@@ -189,6 +243,8 @@ class NetworkSimulator:
                 device_count = len(self.device_networks)
                 self.logger.info(f"Mapped {device_count} device(s) to networks")
 
+                self._build_subnet_index()
+
                 # Build network-to-zone mapping
                 self.network_to_zone.clear()
                 for network_name, network_info in self.networks.items():
@@ -209,6 +265,8 @@ class NetworkSimulator:
                 else:
                     self.logger.warning("No inter-zone security policies defined")
 
+                self._compile_zone_policies()
+                self._invalidate_decisions()
                 self._loaded = True
 
             except FileNotFoundError as e:
@@ -218,6 +276,37 @@ class NetworkSimulator:
                 self.logger.error(f"Failed to load network configuration: {e}")
                 raise ValueError(f"Invalid network configuration: {e}") from e
 
+    def _build_subnet_index(self) -> None:
+        """Index network subnets for longest-prefix address lookups.
+
+        Each network's ``subnet`` and optional ``client_subnets`` (extra
+        prefixes clients connect from, e.g. loopback aliases) are mapped to
+        the network name. Where prefixes overlap the most specific wins.
+
+        Note: Should only be called while holding self._lock
+        """
+        self._subnets.clear()
+        self._address_networks.clear()
+        for network_name, network_info in self.networks.items():
+            prefixes = [network_info.get("subnet")]
+            prefixes.extend(network_info.get("client_subnets", []))
+            for prefix in prefixes:
+                if not prefix:
+                    continue
+                try:
+                    existing = self._subnets.get(prefix)
+                    if existing and existing != network_name:
+                        self.logger.warning(
+                            f"Subnet {prefix} claimed by {existing} and "
+                            f"{network_name}, keeping {existing}"
+                        )
+                        continue
+                    self._subnets[prefix] = network_name
+                except ValueError:
+                    self.logger.warning(
+                        f"Invalid subnet '{prefix}' for network {network_name}"
+                    )
+
     # ----------------------------------------------------------------
     # Service exposure
     # ----------------------------------------------------------------
@@ -259,6 +348,7 @@ class NetworkSimulator:
                 )
 
             self.services[(node, port)] = protocol
+            self._invalidate_decisions()
             networks = self.device_networks.get(node, set())
             self.logger.info(
                 f"Exposed service: {node}:{port} ({protocol}) "
@@ -280,6 +370,7 @@ class NetworkSimulator:
             if key in self.services:
                 protocol = self.services[key]
                 del self.services[key]
+                self._invalidate_decisions()
                 self.logger.info(f"Unexposed service: {node}:{port} ({protocol})")
                 return True
             return False
@@ -361,94 +452,71 @@ class NetworkSimulator:
         if src_zone == dst_zone:
             return True, "same_zone"
 
-        # Check inter-zone policies
+        policy = self._zone_policies.get((src_zone, dst_zone))
+        if policy is None:
+            # No policy found - default deny
+            return False, "no_inter_zone_policy"
+
+        normalized_protocol = _normalize_protocol(protocol)
+        if normalized_protocol not in policy.allowed_protocols:
+            return False, f"protocol_{protocol}_not_allowed"
+
+        # Check firewall rules for port
+        if policy.firewall_ports is not None and port not in (
+            policy.firewall_ports.get(normalized_protocol, ())
+        ):
+            return False, f"port_{port}_not_in_firewall_rules"
+
+        return True, policy.reason
+
+    def _compile_zone_policies(self) -> None:
+        """Index inter-zone policies by (source zone, destination zone).
+
+        The first policy matching a zone pair wins, as when policies were
+        scanned in order. Bidirectional policies also cover the reverse pair.
+
+        Note: Should only be called while holding self._lock
+        """
+        self._zone_policies.clear()
         for policy in self.inter_zone_policies:
             from_zone = policy.get("from_zone")
             to_zone = policy.get("to_zone")
+            direction = policy.get("direction", "bidirectional")
 
-            # Check if policy matches this zone pair
-            if from_zone == src_zone and to_zone == dst_zone:
-                # Found matching policy - check protocol
-                allowed_protocols = policy.get("allowed_protocols", [])
-
-                # Normalize protocol names for comparison (modbus_tcp -> modbus, opcua stays opcua)
-                def normalize_protocol(p: str) -> str:
-                    return p.replace("_tcp", "").replace("_rtu", "")
-
-                normalized_protocol = normalize_protocol(protocol)
-                normalized_allowed = [normalize_protocol(p) for p in allowed_protocols]
-
-                if normalized_protocol not in normalized_allowed:
-                    return False, f"protocol_{protocol}_not_allowed"
-
-                # Check firewall rules for port
-                firewall_rules = policy.get("firewall_rules", [])
-                if firewall_rules:
-                    port_allowed = False
-                    for rule in firewall_rules:
-                        rule_protocol = rule.get("allow", "")
-                        rule_ports = rule.get("ports", [])
-
-                        # Normalize rule protocol for comparison
-                        if (
-                            normalize_protocol(rule_protocol) == normalized_protocol
-                            and port in rule_ports
-                        ):
-                            port_allowed = True
-                            break
-
-                    if not port_allowed:
-                        return False, f"port_{port}_not_in_firewall_rules"
-
-                # Check direction
-                direction = policy.get("direction", "bidirectional")
-                if direction == "outbound_only":
-                    # Only allowed from source to destination, not reverse
-                    return True, "outbound_policy_allows"
-                else:
-                    # Bidirectional allowed
-                    return True, "bidirectional_policy_allows"
-
-            # Check reverse direction if bidirectional
-            elif from_zone == dst_zone and to_zone == src_zone:
-                direction = policy.get("direction", "bidirectional")
-                if direction == "bidirectional":
-                    # Same checks as above
-                    allowed_protocols = policy.get("allowed_protocols", [])
-
-                    # Normalize protocol names for comparison
-                    def normalize_protocol(p: str) -> str:
-                        return p.replace("_tcp", "").replace("_rtu", "")
-
-                    normalized_protocol = normalize_protocol(protocol)
-                    normalized_allowed = [
-                        normalize_protocol(p) for p in allowed_protocols
-                    ]
-
-                    if normalized_protocol not in normalized_allowed:
-                        return False, f"protocol_{protocol}_not_allowed"
-
-                    firewall_rules = policy.get("firewall_rules", [])
-                    if firewall_rules:
-                        port_allowed = False
-                        for rule in firewall_rules:
-                            rule_protocol = rule.get("allow", "")
-                            rule_ports = rule.get("ports", [])
-
-                            if (
-                                normalize_protocol(rule_protocol) == normalized_protocol
-                                and port in rule_ports
-                            ):
-                                port_allowed = True
-                                break
-
-                        if not port_allowed:
-                            return False, f"port_{port}_not_in_firewall_rules"
-
-                    return True, "bidirectional_policy_allows_reverse"
-
-        # No policy found - default deny
-        return False, "no_inter_zone_policy"
+            allowed_protocols = frozenset(
+                _normalize_protocol(p) for p in policy.get("allowed_protocols", [])
+            )
+            firewall_ports: dict[str, frozenset[int]] | None = None
+            firewall_rules = policy.get("firewall_rules", [])
+            if firewall_rules:
+                ports_by_protocol: dict[str, set[int]] = {}
+                for rule in firewall_rules:
+                    ports_by_protocol.setdefault(
+                        _normalize_protocol(rule.get("allow", "")), set()
+                    ).update(rule.get("ports", []))
+                firewall_ports = {
+                    proto: frozenset(ports)
+                    for proto, ports in ports_by_protocol.items()
+                }
+
+            forward_reason = (
+                "outbound_policy_allows"
+                if direction == "outbound_only"
+                else "bidirectional_policy_allows"
+            )
+            self._zone_policies.setdefault(
+                (from_zone, to_zone),
+                _ZonePolicy(allowed_protocols, firewall_ports, forward_reason),
+            )
+            if direction == "bidirectional":
+                self._zone_policies.setdefault(
+                    (to_zone, from_zone),
+                    _ZonePolicy(
+                        allowed_protocols,
+                        firewall_ports,
+                        "bidirectional_policy_allows_reverse",
+                    ),
+                )
 
     # ----------------------------------------------------------------
     # Reachability checks
@@ -477,6 +545,10 @@ class NetworkSimulator:
         - Direction must permit the connection (bidirectional vs outbound_only)
         - Default deny if no policy exists
 
+        Decisions are cached per (src_network, dst_node, protocol, port) and
+        invalidated by load(), expose_service(), unexpose_service(), reset()
+        and changes to the segmentation settings.
+
         Args:
             src_network: Source network name
             dst_node: Destination device name
@@ -486,110 +558,163 @@ class NetworkSimulator:
         Returns:
             True if connection is allowed, False otherwise
         """
-        async with self._lock:
-            # Service must exist
-            service_key = (dst_node, port)
-            if service_key not in self.services:
-                self.logger.debug(
-                    f"Reachability denied: {src_network} -> {dst_node}:{port} "
-                    f"(service not exposed)"
-                )
-                return False
-
-            # Protocol must match
-            if self.services[service_key] != protocol:
-                self.logger.debug(
-                    f"Reachability denied: {src_network} -> {dst_node}:{port} "
-                    f"(protocol mismatch: requested {protocol}, "
-                    f"service is {self.services[service_key]})"
-                )
-                return False
+        key = (src_network, dst_node, protocol, port)
+        segmentation = (self.segmentation_enabled, self.segmentation_mode)
+
+        # Fast path: repeat decisions are a dict lookup without the lock
+        decision = self._decisions.get(key)
+        if decision is not None and segmentation == self._decisions_segmentation:
+            self._decision_hits += 1
+        else:
+            async with self._lock:
+                if (
+                    self.segmentation_enabled,
+                    self.segmentation_mode,
+                ) != self._decisions_segmentation:
+                    self._invalidate_decisions()
+                decision = self._decisions.get(key)
+                if decision is None:
+                    decision = self._decide(src_network, dst_node, protocol, port)
+                    if len(self._decisions) >= _MAX_CACHED_DECISIONS:
+                        self._decisions.clear()
+                    self._decisions[key] = decision
+                    self._decision_misses += 1
+                else:
+                    self._decision_hits += 1
 
-            # Get destination networks
-            dst_networks = self.device_networks.get(dst_node, set())
+        if decision.event is not None:
+            message, kwargs = decision.event
+            await self.logger.log_security(
+                message, severity=EventSeverity.WARNING, **kwargs
+            )
+        else:
+            self.logger.debug(decision.message)
 
-            if not dst_networks:
-                await self.logger.log_security(
-                    message=f"Access denied: destination device {dst_node} not on any network",
-                    severity=EventSeverity.WARNING,
-                    source_ip="",
-                    data={
-                        "source_network": src_network,
-                        "destination_node": dst_node,
-                        "port": port,
-                        "protocol": protocol,
-                        "reason": "device_not_on_network",
+        return decision.allowed
+
+    def _decide(
+        self,
+        src_network: str,
+        dst_node: str,
+        protocol: str,
+        port: int,
+    ) -> _Decision:
+        """Evaluate reachability against the current topology and policies.
+
+        Note: Should only be called while holding self._lock
+        """
+        # Service must exist
+        service_key = (dst_node, port)
+        if service_key not in self.services:
+            return _Decision(
+                False,
+                f"Reachability denied: {src_network} -> {dst_node}:{port} "
+                f"(service not exposed)",
+            )
+
+        # Protocol must match
+        if self.services[service_key] != protocol:
+            return _Decision(
+                False,
+                f"Reachability denied: {src_network} -> {dst_node}:{port} "
+                f"(protocol mismatch: requested {protocol}, "
+                f"service is {self.services[service_key]})",
+            )
+
+        # Get destination networks
+        dst_networks = self.device_networks.get(dst_node, set())
+
+        if not dst_networks:
+            return _Decision(
+                False,
+                event=(
+                    f"Access denied: destination device {dst_node} not on any network",
+                    {
+                        "source_ip": "",
+                        "data": {
+                            "source_network": src_network,
+                            "destination_node": dst_node,
+                            "port": port,
+                            "protocol": protocol,
+                            "reason": "device_not_on_network",
+                        },
                     },
-                )
-                return False
+                ),
+            )
 
-            # Check 1: Same network = always allowed (no zone check needed)
-            if src_network in dst_networks:
-                self.logger.debug(
-                    f"Reachability allowed: {src_network} -> {dst_node}:{port} "
-                    f"({protocol}) [same network]"
-                )
-                return True
+        # Check 1: Same network = always allowed (no zone check needed)
+        if src_network in dst_networks:
+            return _Decision(
+                True,
+                f"Reachability allowed: {src_network} -> {dst_node}:{port} "
+                f"({protocol}) [same network]",
+            )
 
-            # Check 2: If segmentation disabled or mode is "none", allow all cross-zone traffic
-            if not self.segmentation_enabled or self.segmentation_mode == "none":
-                self.logger.debug(
-                    f"Reachability allowed: {src_network} -> {dst_node}:{port} "
-                    f"({protocol}) [segmentation disabled or mode=none]"
-                )
-                return True
+        # Check 2: If segmentation disabled or mode is "none", allow all cross-zone traffic
+        if not self.segmentation_enabled or self.segmentation_mode == "none":
+            return _Decision(
+                True,
+                f"Reachability allowed: {src_network} -> {dst_node}:{port} "
+                f"({protocol}) [segmentation disabled or mode=none]",
+            )
 
-            # Check 3: Different networks - check zone-based policies
-            src_zone = self._get_zone_for_network(src_network)
-            dst_zone = None
-
-            # Find which destination network to use for zone checking
-            # (device might be on multiple networks)
-            for dst_net in dst_networks:
-                zone = self._get_zone_for_network(dst_net)
-                if zone:
-                    dst_zone = zone
-                    break
-
-            # If either zone is unknown, deny (can't evaluate policy)
-            if not src_zone or not dst_zone:
-                await self.logger.log_security(
+        # Check 3: Different networks - check zone-based policies
+        src_zone = self._get_zone_for_network(src_network)
+        dst_zone = None
+
+        # Find which destination network to use for zone checking
+        # (device might be on multiple networks)
+        for dst_net in dst_networks:
+            zone = self._get_zone_for_network(dst_net)
+            if zone:
+                dst_zone = zone
+                break
+
+        # If either zone is unknown, deny (can't evaluate policy)
+        if not src_zone or not dst_zone:
+            return _Decision(
+                False,
+                event=(
                     f"Zone policy check failed: {src_network} -> {dst_node}:{port}",
-                    severity=EventSeverity.WARNING,
-                    data={
-                        "source_network": src_network,
-                        "source_zone": src_zone or "unknown",
-                        "destination_node": dst_node,
-                        "destination_zone": dst_zone or "unknown",
-                        "port": port,
-                        "protocol": protocol,
-                        "reason": "zone_not_defined",
+                    {
+                        "data": {
+                            "source_network": src_network,
+                            "source_zone": src_zone or "unknown",
+                            "destination_node": dst_node,
+                            "destination_zone": dst_zone or "unknown",
+                            "port": port,
+                            "protocol": protocol,
+                            "reason": "zone_not_defined",
+                        },
                     },
-                )
-                return False
+                ),
+            )
 
-            # Check zone-based policy according to segmentation mode
-            if self.segmentation_mode == "common":
-                allowed, reason = self._check_common_mode_policy(
-                    src_zone, dst_zone, protocol, port
-                )
-            else:
-                # "strict" or "custom" modes use inter_zone_policies from config
-                allowed, reason = self._check_zone_policy(
-                    src_zone, dst_zone, protocol, port
-                )
+        # Check zone-based policy according to segmentation mode
+        if self.segmentation_mode == "common":
+            allowed, reason = self._check_common_mode_policy(
+                src_zone, dst_zone, protocol, port
+            )
+        else:
+            # "strict" or "custom" modes use inter_zone_policies from config
+            allowed, reason = self._check_zone_policy(
+                src_zone, dst_zone, protocol, port
+            )
 
-            if allowed:
-                self.logger.debug(
-                    f"Reachability allowed: {src_network} ({src_zone}) -> "
-                    f"{dst_node}:{port} ({dst_zone}) [{protocol}] - {reason}"
-                )
-            else:
-                await self.logger.log_security(
-                    f"Zone policy denied: {src_network} ({src_zone}) -> "
-                    f"{dst_node}:{port} ({dst_zone})",
-                    severity=EventSeverity.WARNING,
-                    data={
+        if allowed:
+            return _Decision(
+                True,
+                f"Reachability allowed: {src_network} ({src_zone}) -> "
+                f"{dst_node}:{port} ({dst_zone}) [{protocol}] - {reason}",
+            )
+
+        return _Decision(
+            False,
+            event=(
+                f"Zone policy denied: {src_network} ({src_zone}) -> "
+                f"{dst_node}:{port} ({dst_zone})",
+                {
+                    "data": {
                         "source_network": src_network,
                         "source_zone": src_zone,
                         "destination_node": dst_node,
@@ -598,9 +723,20 @@ class NetworkSimulator:
                         "protocol": protocol,
                         "reason": reason,
                     },
-                )
+                },
+            ),
+        )
+
+    def _invalidate_decisions(self) -> None:
+        """Drop cached reachability decisions.
 
-            return allowed
+        Note: Should only be called while holding self._lock
+        """
+        self._decisions.clear()
+        self._decisions_segmentation = (
+            self.segmentation_enabled,
+            self.segmentation_mode,
+        )
 
     async def can_reach_from_device(
         self,
@@ -644,6 +780,40 @@ class NetworkSimulator:
     # Network queries
     # ----------------------------------------------------------------
 
+    def network_for_address(self, address: str | None) -> str | None:
+        """Map a client IP address to the network whose subnet contains it.
+
+        Uses longest-prefix match over the subnets declared in network.yml.
+        Results are cached per address until the configuration is reloaded.
+        IPv4-mapped IPv6 addresses (::ffff:a.b.c.d) are matched as IPv4.
+
+        Args:
+            address: Client IP address (e.g. from a socket peername)
+
+        Returns:
+            Network name, or None if no declared subnet contains the address
+        """
+        if not address:
+            return None
+        try:
+            return self._address_networks[address]
+        except KeyError:
+            pass
+
+        network = None
+        ip = parse_address(address)
+        if ip is not None:
+            if ip.version == 6 and ip.ipv4_mapped is not None:
+                ip = ip.ipv4_mapped
+            match = self._subnets.longest_match(ip)
+            if match is not None:
+                network = match[1]
+
+        if len(self._address_networks) >= _MAX_CACHED_ADDRESSES:
+            self._address_networks.clear()
+        self._address_networks[address] = network
+        return network
+
     async def get_device_networks(self, device: str) -> set[str]:
         """Get all networks a device is connected to.
 
@@ -721,6 +891,11 @@ class NetworkSimulator:
                     "count": len(self.services),
                     "by_protocol": self._count_services_by_protocol(),
                 },
+                "reachability_cache": {
+                    "entries": len(self._decisions),
+                    "hits": self._decision_hits,
+                    "misses": self._decision_misses,
+                },
             }
 
     def _count_services_by_protocol(self) -> dict[str, int]:
@@ -743,5 +918,10 @@ class NetworkSimulator:
             self.networks.clear()
             self.device_networks.clear()
             self.services.clear()
+            self.network_to_zone.clear()
+            self._zone_policies.clear()
+            self._subnets.clear()
+            self._address_networks.clear()
+            self._invalidate_decisions()
             self._loaded = False
             self.logger.info("Network simulator reset")
@@ -0,0 +1,246 @@
+# components/network/prefix_trie.py
+"""
+Binary prefix trie for IPv4/IPv6 CIDR lookups.
+
+Maps CIDR prefixes to values and answers, for a single address, which
+stored prefixes contain it. Lookups walk at most one node per prefix bit,
+so cost is bounded by the address length (32 or 128) regardless of how
+many prefixes are stored.
+
+Used wherever the simulator classifies addresses against many subnets:
+firewall rule matching, IP-to-network mapping and IDS blocklists.
+"""
+
+import ipaddress
+from collections.abc import Iterator
+from typing import Any
+
+__all__ = ["IPAddress", "IPNetwork", "PrefixTrie", "parse_address", "parse_network"]
+
+IPAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+def parse_address(value: str) -> IPAddress | None:
+    """Parse an IP address, returning None for anything that is not one.
+
+    Args:
+        value: Address string (e.g. "10.10.1.5", "::1", "unknown")
+
+    Returns:
+        Parsed address, or None if value is not an IP address
+    """
+    try:
+        return ipaddress.ip_address(value)
+    except ValueError:
+        return None
+
+
+def parse_network(value: str) -> IPNetwork | None:
+    """Parse a CIDR prefix or bare address, returning None if invalid.
+
+    Host bits are ignored ("10.0.0.7/24" is 10.0.0.0/24) and a bare
+    address is treated as a host prefix (/32 or /128).
+
+    Args:
+        value: Prefix string (e.g. "10.10.0.0/16", "192.168.1.100")
+
+    Returns:
+        Parsed network, or None if value is not an IP prefix
+    """
+    try:
+        return ipaddress.ip_network(value, strict=False)
+    except ValueError:
+        return None
+
+
+class _Node:
+    """Trie node. ``value`` is only meaningful when ``occupied`` is set."""
+
+    __slots__ = ("children", "occupied", "value")
+
+    def __init__(self) -> None:
+        self.children: list[_Node | None] = [None, None]
+        self.occupied = False
+        self.value: Any = None
+
+
+class PrefixTrie:
+    """
+    CIDR prefix trie with longest-prefix and all-prefix matching.
+
+    IPv4 and IPv6 prefixes are kept in separate tries. Keys may be given
+    as strings or ``ipaddress`` network objects.
+
+    Example:
+        >>> trie = PrefixTrie()
+        >>> trie["10.10.0.0/16"] = "control_zone"
+        >>> trie["10.10.1.0/24"] = "turbine_network"
+        >>> trie.longest_match("10.10.1.5")
+        (IPv4Network('10.10.1.0/24'), 'turbine_network')
+        >>> [value for _, value in trie.matches("10.10.1.5")]
+        ['control_zone', 'turbine_network']
+    """
+
+    def __init__(self) -> None:
+        """Initialise empty trie."""
+        self._roots: dict[int, _Node] = {4: _Node(), 6: _Node()}
+        self._size = 0
+
+    # ----------------------------------------------------------------
+    # Mapping interface
+    # ----------------------------------------------------------------
+
+    def __setitem__(self, prefix: str | IPNetwork, value: Any) -> None:
+        """Store value for a prefix, replacing any existing value.
+
+        Raises:
+            ValueError: If prefix is not a valid IP prefix
+        """
+        network = self._network(prefix)
+        node = self._roots[network.version]
+        bits = int(network.network_address)
+        width = network.max_prefixlen
+        for depth in range(network.prefixlen):
+            bit = (bits >> (width - 1 - depth)) & 1
+            child = node.children[bit]
+            if child is None:
+                child = node.children[bit] = _Node()
+            node = child
+        if not node.occupied:
+            self._size += 1
+        node.occupied = True
+        node.value = value
+
+    def __getitem__(self, prefix: str | IPNetwork) -> Any:
+        """Get value stored for an exact prefix.
+
+        Raises:
+            KeyError: If prefix is not stored
+        """
+        node = self._find(self._network(prefix))
+        if node is None or not node.occupied:
+            raise KeyError(prefix)
+        return node.value
+
+    def __delitem__(self, prefix: str | IPNetwork) -> None:
+        """Remove an exact prefix, pruning empty branches.
+
+        Raises:
+            KeyError: If prefix is not stored
+        """
+        network = self._network(prefix)
+        node = self._roots[network.version]
+        bits = int(network.network_address)
+        width = network.max_prefixlen
+        path: list[tuple[_Node, int]] = []
+        for depth in range(network.prefixlen):
+            bit = (bits >> (width - 1 - depth)) & 1
+            child = node.children[bit]
+            if child is None:
+                raise KeyError(prefix)
+            path.append((node, bit))
+            node = child
+        if not node.occupied:
+            raise KeyError(prefix)
+
+        node.occupied = False
+        node.value = None
+        self._size -= 1
+
+        # Prune now-empty leaves back towards the root
+        for parent, bit in reversed(path):
+            child = parent.children[bit]
+            if child.occupied or child.children[0] or child.children[1]:
+                break
+            parent.children[bit] = None
+
+    def __contains__(self, prefix: object) -> bool:
+        """Check whether an exact prefix is stored."""
+        network = parse_network(prefix) if isinstance(prefix, str) else prefix
+        if not isinstance(network, ipaddress.IPv4Network | ipaddress.IPv6Network):
+            return False
+        node = self._find(network)
+        return node is not None and node.occupied
+
+    def __len__(self) -> int:
+        """Number of stored prefixes."""
+        return self._size
+
+    def get(self, prefix: str | IPNetwork, default: Any = None) -> Any:
+        """Get value for an exact prefix, or default if not stored."""
+        try:
+            return self[prefix]
+        except (KeyError, ValueError):
+            return default
+
+    def clear(self) -> None:
+        """Remove all prefixes."""
+        self._roots = {4: _Node(), 6: _Node()}
+        self._size = 0
+
+    # ----------------------------------------------------------------
+    # Address lookups
+    # ----------------------------------------------------------------
+
+    def matches(self, address: str | IPAddress) -> Iterator[tuple[IPNetwork, Any]]:
+        """Yield every stored prefix containing address, shortest first.
+
+        Non-IP addresses (e.g. "unknown") match nothing.
+
+        Args:
+            address: IP address string or object
+
+        Yields:
+            Tuples of (network, value)
+        """
+        ip = parse_address(address) if isinstance(address, str) else address
+        if ip is None:
+            return
+        node: _Node | None = self._roots[ip.version]
+        bits = int(ip)
+        width = ip.max_prefixlen
+        depth = 0
+        while node is not None:
+            if node.occupied:
+                yield ipaddress.ip_network((ip, depth), strict=False), node.value
+            if depth == width:
+                return
+            node = node.children[(bits >> (width - 1 - depth)) & 1]
+            depth += 1
+
+    def longest_match(self, address: str | IPAddress) -> tuple[IPNetwork, Any] | None:
+        """Find the most specific stored prefix containing address.
+
+        Args:
+            address: IP address string or object
+
+        Returns:
+            Tuple of (network, value), or None if no prefix contains address
+        """
+        best = None
+        for match in self.matches(address):
+            best = match
+        return best
+
+    # ----------------------------------------------------------------
+    # Internal helpers
+    # ----------------------------------------------------------------
+
+    @staticmethod
+    def _network(prefix: str | IPNetwork) -> IPNetwork:
+        """Normalise a prefix key, raising ValueError if invalid."""
+        if isinstance(prefix, str):
+            return ipaddress.ip_network(prefix, strict=False)
+        return prefix
+
+    def _find(self, network: IPNetwork) -> _Node | None:
+        """Walk to the node for an exact prefix, if present."""
+        node: _Node | None = self._roots[network.version]
+        bits = int(network.network_address)
+        width = network.max_prefixlen
+        for depth in range(network.prefixlen):
+            if node is None:
+                return None
+            node = node.children[(bits >> (width - 1 - depth)) & 1]
+        return node
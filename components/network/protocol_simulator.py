@@ -305,11 +305,12 @@ class _Listener:
         peername = writer.get_extra_info("peername")
         client_addr = f"{peername[0]}:{peername[1]}" if peername else "unknown"
 
-        # Determine source network
-        # TODO: In real implementation, map client IP to network
-        # For simulation, we assume connections from corporate network
-        # unless coming from localhost (which might be another simulated device)
-        src_network = self._determine_source_network(peername[0] if peername else None)
+        # Determine source network from the subnets declared in network.yml,
+        # falling back to the localhost/corporate heuristic
+        client_ip = peername[0] if peername else None
+        src_network = self.network_sim.network_for_address(
+            client_ip
+        ) or self._determine_source_network(client_ip)
 
         self.logger.debug(
             f"Connection attempt: {client_addr} ({src_network}) -> "
@@ -430,10 +431,11 @@ class _Listener:
 
     @staticmethod
     def _determine_source_network(client_ip: str | None) -> str:
-        """Determine source network from client IP.
+        """Fallback source network for clients outside any declared subnet.
 
-        In a real implementation, this would map IP addresses to networks.
-        For simulation purposes, we use simple heuristics.
+        Addresses inside a subnet from network.yml are mapped by
+        NetworkSimulator.network_for_address(); everything else is
+        classified with simple heuristics.
 
         Args:
             client_ip: Client IP address
@@ -450,6 +452,6 @@ class _Listener:
             # For now, assume localhost is a simulated device on plant network
             return "plant_network"
 
-        # External connections assumed from corporate network
-        # In real testing scenarios, this would be configured
+        # External connections assumed from corporate network; declare
+        # client_subnets in network.yml to place them elsewhere
         return "corporate_network"
@@ -134,7 +134,8 @@ class ModbusRTUServer:
                         bytesize=self.bytesize,
                         parity=self.parity,
                         stopbits=self.stopbits,
-                    )
+                    ),
+                    name=f"modbus_rtu_server[{self.port}]",
                 )
 
                 # Give server time to open serial port
@@ -232,7 +232,8 @@ class ModbusTCPServer:
                         trace_pdu=(
                             self._filter_function_code if self.modbus_filter else None
                         ),
-                    )
+                    ),
+                    name=f"modbus_tcp_server[{self.host}:{self.port}]",
                 )
 
                 # Add callback to catch unhandled exceptions
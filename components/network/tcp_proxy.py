@@ -317,7 +317,7 @@ class TCPProxy:
 
                 if not data:
                     # EOF reached
-                    self.logger.debug(f"EOF on {direction}")
+                    self.logger.debug("EOF on %s", direction)
                     break
 
                 self.bytes_proxied += len(data)
@@ -325,10 +325,10 @@ class TCPProxy:
                 writer.write(data)
                 await writer.drain()
 
-                self.logger.debug(f"Proxied {len(data)} bytes: {direction}")
+                self.logger.debug("Proxied %d bytes: %s", len(data), direction)
 
         except asyncio.CancelledError:
-            self.logger.debug(f"Pipe cancelled: {direction}")
+            self.logger.debug("Pipe cancelled: %s", direction)
             raise
         except Exception as e:
             self.logger.error(f"Pipe error on {direction}: {e}")
@@ -11,16 +11,95 @@ Provides common infrastructure for:
 
 All physics engines should inherit from either BasePhysicsEngine (system-wide)
 or BaseDevicePhysicsEngine (device-specific).
+
+Device engines share an adaptive sub-stepping integrator. When enabled, each
+update(dt) is split into error-controlled forward-Euler sub-steps (step
+doubling), so large outer ticks at high time acceleration stay stable.
+
+Device engines can also start at equilibrium: initialise(steady_state=True)
+reads the configured setpoints and solves for the steady state directly
+(analytic where the engine provides one, then damped fixed-point iteration).
 """
 
+import dataclasses
+import math
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Any
 
+from components.physics.coupling import Port
 from components.security.logging_system import ICSLogger, get_logger
 from components.state.data_store import DataStore
 from components.time.simulation_time import SimulationTime
 
-__all__ = ["BasePhysicsEngine", "BaseDevicePhysicsEngine"]
+__all__ = [
+    "BasePhysicsEngine",
+    "BaseDevicePhysicsEngine",
+    "IntegratorConfig",
+    "IntegratorStats",
+    "SteadyStateResult",
+]
+
+
+@dataclass
+class IntegratorConfig:
+    """Adaptive sub-stepping integrator settings.
+
+    Attributes:
+        adaptive: Enable error-controlled sub-stepping (False = one Euler step)
+        max_substep: Largest sub-step in seconds
+        min_substep: Smallest sub-step in seconds (accepted regardless of error)
+        rel_tolerance: Relative local error tolerance per sub-step
+        abs_tolerance: Absolute local error tolerance per sub-step
+        max_substeps: Sub-step budget per update; the remainder is taken in one step
+    """
+
+    adaptive: bool = False
+    max_substep: float = 0.25
+    min_substep: float = 0.001
+    rel_tolerance: float = 1e-3
+    abs_tolerance: float = 1e-3
+    max_substeps: int = 1000
+
+
+@dataclass
+class IntegratorStats:
+    """Integrator step counters.
+
+    Attributes:
+        updates: Number of update(dt) calls integrated
+        accepted_steps: Total accepted sub-steps
+        rejected_steps: Total sub-steps rejected by error control
+        last_substeps: Accepted sub-steps in the most recent update
+        max_substeps_per_update: Largest sub-step count seen in one update
+        budget_exhausted: Updates that hit the max_substeps budget
+    """
+
+    updates: int = 0
+    accepted_steps: int = 0
+    rejected_steps: int = 0
+    last_substeps: int = 0
+    max_substeps_per_update: int = 0
+    budget_exhausted: int = 0
+
+
+@dataclass
+class SteadyStateResult:
+    """Outcome of a steady-state solve.
+
+    Attributes:
+        converged: True if the residual fell below tolerance
+        analytic: True if the engine supplied an analytic starting point
+        iterations: Fixed-point iterations performed
+        residual: Final scaled rate of change (per second)
+    """
+
+    converged: bool
+    analytic: bool
+    iterations: int
+    residual: float
 
 
 class BasePhysicsEngine(ABC):
@@ -141,6 +220,56 @@ class BasePhysicsEngine(ABC):
         """
         pass
 
+    # ----------------------------------------------------------------
+    # Coupling ports
+    # ----------------------------------------------------------------
+
+    def get_input_ports(self) -> dict[str, Port]:
+        """Get ports this engine accepts values on.
+
+        Returns:
+            Input ports keyed by name (none by default)
+        """
+        return {}
+
+    def get_output_ports(self) -> dict[str, Port]:
+        """Get ports this engine publishes values on.
+
+        Returns:
+            Output ports keyed by name (none by default)
+        """
+        return {}
+
+    def read_output(self, port: str) -> float:
+        """Read an output port value.
+
+        Output ports default to the state field of the same name.
+
+        Args:
+            port: Output port name
+
+        Returns:
+            Current port value
+
+        Raises:
+            KeyError: If the port is not declared
+        """
+        if port not in self.get_output_ports():
+            raise KeyError(f"{self.__class__.__name__} has no output port '{port}'")
+        return float(getattr(self.get_state(), port))
+
+    def write_input(self, port: str, value: float) -> None:
+        """Write a value to an input port.
+
+        Args:
+            port: Input port name
+            value: Value from connected output ports (summed)
+
+        Raises:
+            KeyError: If the port is not declared
+        """
+        raise KeyError(f"{self.__class__.__name__} has no input port '{port}'")
+
     # ----------------------------------------------------------------
     # Status
     # ----------------------------------------------------------------
@@ -186,6 +315,11 @@ class BaseDevicePhysicsEngine(BasePhysicsEngine):
         # Control input cache (populated by read_control_inputs)
         self._control_cache: dict[str, Any] = {}
 
+        # Adaptive integrator (disabled by default: update(dt) is one Euler step)
+        self.integrator = IntegratorConfig()
+        self.integrator_stats = IntegratorStats()
+        self._next_substep: float | None = None
+
         # Override logger with device name
         self.logger = get_logger(self.__class__.__name__, device=device_name)
 
@@ -193,17 +327,21 @@ class BaseDevicePhysicsEngine(BasePhysicsEngine):
     # Device lifecycle (with common patterns)
     # ----------------------------------------------------------------
 
-    async def initialise(self) -> None:
+    async def initialise(self, steady_state: bool = False) -> None:
         """Initialize device physics engine.
 
         Validates device exists in DataStore, writes initial telemetry,
         and sets initialisation flag.
 
         Subclasses should:
-        1. Call super().initialise()
+        1. Call super().initialise(steady_state)
         2. Initialize engine-specific state
         3. Optionally call write_telemetry()
 
+        Args:
+            steady_state: Read control inputs and start at the equilibrium
+                for those setpoints instead of cold defaults
+
         Raises:
             RuntimeError: If device not found in DataStore
         """
@@ -218,6 +356,10 @@ class BaseDevicePhysicsEngine(BasePhysicsEngine):
         self._last_update_time = self.sim_time.now()
         self._initialised = True
 
+        if steady_state:
+            await self.read_control_inputs()
+            self.solve_steady_state()
+
         self.logger.info(
             f"{self.__class__.__name__} initialised for device '{self.device_name}'"
         )
@@ -282,3 +424,292 @@ class BaseDevicePhysicsEngine(BasePhysicsEngine):
             Cached value or default
         """
         return self._control_cache.get(address, default)
+
+    # ----------------------------------------------------------------
+    # Adaptive integration
+    # ----------------------------------------------------------------
+
+    # Private attributes (besides self.state) that _step() mutates and that
+    # must be rolled back when a trial step is rejected
+    _integrated_attributes: tuple[str, ...] = ()
+
+    # Control cache keys read by _step() (exchanged with out-of-process workers)
+    _control_inputs: tuple[str, ...] = ()
+
+    @abstractmethod
+    def _step(self, dt: float) -> None:
+        """Advance physics by one explicit step of length dt.
+
+        Device engines implement their dynamics here; _integrate() and
+        solve_steady_state() advance the state through it.
+
+        Args:
+            dt: Step length in seconds
+        """
+        pass
+
+    def configure_integrator(self, **settings: Any) -> None:
+        """Update integrator settings.
+
+        Args:
+            **settings: IntegratorConfig fields to override
+
+        Raises:
+            ValueError: If a setting is unknown or out of range
+        """
+        known = {f.name for f in dataclasses.fields(IntegratorConfig)}
+        unknown = set(settings) - known
+        if unknown:
+            raise ValueError(f"Unknown integrator settings: {sorted(unknown)}")
+
+        config = dataclasses.replace(self.integrator, **settings)
+        if not 0 < config.min_substep <= config.max_substep:
+            raise ValueError("Integrator requires 0 < min_substep <= max_substep")
+        if config.rel_tolerance <= 0 or config.abs_tolerance <= 0:
+            raise ValueError("Integrator tolerances must be positive")
+        if config.max_substeps < 1:
+            raise ValueError("Integrator max_substeps must be at least 1")
+
+        self.integrator = config
+        self._next_substep = None
+
+    def get_integrator_stats(self) -> dict[str, Any]:
+        """Get integrator settings and step counters.
+
+        Returns:
+            Dictionary of step counts for status/monitoring
+        """
+        return {
+            "adaptive": self.integrator.adaptive,
+            **dataclasses.asdict(self.integrator_stats),
+        }
+
+    def _integrate(self, dt: float) -> None:
+        """Advance physics by dt using the configured integrator.
+
+        With adaptive integration disabled this is a single _step(dt). When
+        enabled, each sub-step h is compared against two half steps; the half
+        steps are kept if their difference is within tolerance, otherwise h
+        shrinks. Forward Euler has local error O(h²), so the next step scales
+        with the square root of the error ratio.
+
+        Args:
+            dt: Time delta in seconds
+        """
+        stats = self.integrator_stats
+        stats.updates += 1
+
+        if not self.integrator.adaptive:
+            self._step(dt)
+            stats.accepted_steps += 1
+            stats.last_substeps = 1
+            stats.max_substeps_per_update = max(stats.max_substeps_per_update, 1)
+            return
+
+        cfg = self.integrator
+        remaining = dt
+        substeps = 0
+        h = min(self._next_substep or cfg.max_substep, cfg.max_substep)
+
+        while remaining > 1e-12:
+            if substeps >= cfg.max_substeps:
+                # Budget exhausted - take the rest in one step rather than stall
+                self._step(remaining)
+                substeps += 1
+                stats.budget_exhausted += 1
+                self.logger.warning(
+                    f"{self.device_name}: integrator budget of {cfg.max_substeps} "
+                    f"sub-steps exhausted, stepping {remaining:.3f}s directly"
+                )
+                break
+
+            h = min(h, remaining)
+            start = self._snapshot_integrated_state()
+
+            with self._silenced_logger():
+                self._step(h)
+            full_step = self._snapshot_integrated_state()
+
+            self._restore_integrated_state(start)
+            self._step(h / 2.0)
+            self._step(h / 2.0)
+
+            error = self._integration_error(full_step[0], self.state)
+            if error <= 1.0 or h <= cfg.min_substep:
+                remaining -= h
+                substeps += 1
+            else:
+                self._restore_integrated_state(start)
+                stats.rejected_steps += 1
+
+            factor = 5.0 if error == 0.0 else 0.9 / math.sqrt(error)
+            h = max(
+                cfg.min_substep, min(cfg.max_substep, h * min(5.0, max(0.2, factor)))
+            )
+
+        self._next_substep = h
+        stats.accepted_steps += substeps
+        stats.last_substeps = substeps
+        stats.max_substeps_per_update = max(stats.max_substeps_per_update, substeps)
+
+    def _snapshot_integrated_state(self) -> tuple[Any, dict[str, Any]]:
+        """Copy the state dataclass and integrated private attributes."""
+        state = dataclasses.replace(self.state)  # type: ignore[attr-defined]
+        extras = {name: getattr(self, name) for name in self._integrated_attributes}
+        return state, extras
+
+    def _restore_integrated_state(self, snapshot: tuple[Any, dict[str, Any]]) -> None:
+        """Restore a snapshot taken by _snapshot_integrated_state()."""
+        state, extras = snapshot
+        # Restore in place - PLCs and tests hold references to self.state
+        for f in dataclasses.fields(state):
+            setattr(self.state, f.name, getattr(state, f.name))  # type: ignore[attr-defined]
+        for name, value in extras.items():
+            setattr(self, name, value)
+
+    def _integration_error(self, coarse: Any, fine: Any) -> float:
+        """Scaled local error between one full step and two half steps.
+
+        Args:
+            coarse: State after one step of h
+            fine: State after two steps of h/2
+
+        Returns:
+            Largest error across float fields relative to tolerance (≤1 accepts)
+        """
+        rtol = self.integrator.rel_tolerance
+        atol = self.integrator.abs_tolerance
+        worst = 0.0
+        for f in dataclasses.fields(fine):
+            a = getattr(coarse, f.name)
+            b = getattr(fine, f.name)
+            if isinstance(b, float):
+                scale = atol + rtol * max(abs(a), abs(b))
+                worst = max(worst, abs(a - b) / scale)
+        return worst
+
+    @contextmanager
+    def _silenced_logger(self) -> Iterator[None]:
+        """Suppress log output from the discarded full-length trial step."""
+        python_logger = self.logger.logger
+        was_disabled = python_logger.disabled
+        python_logger.disabled = True
+        try:
+            yield
+        finally:
+            python_logger.disabled = was_disabled
+
+    # ----------------------------------------------------------------
+    # Steady-state initialisation
+    # ----------------------------------------------------------------
+
+    # State fields that accumulate history (elapsed time, damage) rather than
+    # settle; excluded from the residual and left untouched by the solve
+    _steady_state_excluded: tuple[str, ...] = ()
+
+    def _analytic_steady_state(self) -> bool:
+        """Set state to the analytic equilibrium for current controls.
+
+        Subclasses override this where the equilibrium has a closed form.
+        Fields it cannot solve may be left for the fixed-point iteration.
+
+        Returns:
+            True if an analytic starting point was applied
+        """
+        return False
+
+    def solve_steady_state(
+        self, tolerance: float = 1e-8, max_iterations: int = 20000
+    ) -> SteadyStateResult:
+        """Move state to equilibrium for the cached control inputs.
+
+        Starts from the analytic equilibrium (if any), then iterates
+        x <- x + h·f(x) with _step(h) until the scaled rate of change is
+        below tolerance. The pseudo time step h grows while the residual
+        falls and is halved (with rollback) when it rises, which damps the
+        iteration for stiff or oscillating dynamics.
+
+        Args:
+            tolerance: Largest accepted rate of change per second, relative
+                to (1 + |value|)
+            max_iterations: Iteration budget
+
+        Returns:
+            SteadyStateResult describing the solve
+        """
+        state = self.state  # type: ignore[attr-defined]
+        history = {name: getattr(state, name) for name in self._steady_state_excluded}
+        analytic = self._analytic_steady_state()
+
+        cfg = self.integrator
+        h = cfg.max_substep
+        max_h = cfg.max_substep * 40.0
+        residual = math.inf
+        iterations = 0
+        converged = False
+
+        with self._silenced_logger():
+            while iterations < max_iterations:
+                start = self._snapshot_integrated_state()
+                self._step(h)
+                iterations += 1
+
+                rate = self._steady_state_residual(start, h)
+                if rate <= tolerance:
+                    residual = rate
+                    converged = True
+                    break
+
+                if rate > 2.0 * residual and h > cfg.min_substep:
+                    # Residual jumped - likely unstable, roll back and damp
+                    self._restore_integrated_state(start)
+                    h = max(cfg.min_substep, h / 2.0)
+                    residual = math.inf
+                    continue
+
+                if rate < residual:
+                    h = min(max_h, h * 1.2)
+                residual = rate
+
+        for name, value in history.items():
+            setattr(state, name, value)
+
+        result = SteadyStateResult(converged, analytic, iterations, residual)
+        if converged:
+            self.logger.info(
+                f"{self.device_name}: steady state reached in {iterations} "
+                f"iterations{' (analytic start)' if analytic else ''}"
+            )
+        else:
+            self.logger.warning(
+                f"{self.device_name}: steady state not reached after {iterations} "
+                f"iterations (residual {residual:.2e}/s), keeping last state"
+            )
+        return result
+
+    def _steady_state_residual(
+        self, start: tuple[Any, dict[str, Any]], h: float
+    ) -> float:
+        """Largest scaled rate of change since a snapshot.
+
+        Args:
+            start: Snapshot taken before the pseudo time step
+            h: Pseudo time step in seconds
+
+        Returns:
+            max |Δx| / (h·(1 + |x|)) over float state fields and integrated
+            attributes
+        """
+        before_state, before_extras = start
+        pairs = [
+            (getattr(before_state, f.name), getattr(self.state, f.name))  # type: ignore[attr-defined]
+            for f in dataclasses.fields(before_state)
+            if f.name not in self._steady_state_excluded
+        ]
+        pairs += [(value, getattr(self, name)) for name, value in before_extras.items()]
+
+        worst = 0.0
+        for a, b in pairs:
+            if isinstance(b, float):
+                worst = max(worst, abs(b - a) / (h * (1.0 + abs(b))))
+        return worst
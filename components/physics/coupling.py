@@ -0,0 +1,274 @@
+# components/physics/coupling.py
+"""
+Direct engine-to-engine coupling for physics simulation.
+
+Engines declare typed ports (name, unit, value type). A PhysicsCouplingGraph
+connects output ports to input ports and steps engines in topological
+order, passing values directly between them each tick. Values keep full
+float precision and never round-trip through DataStore memory maps.
+
+Example coupling:
+
+    turbine_plc_1.power_output_mw [MW] ─┐
+    turbine_plc_2.power_output_mw [MW] ─┴─> grid.generation_mw [MW] (summed)
+
+Multiple sources connected to one input port are summed (e.g. total
+generation on a grid or bus).
+
+Integrates with:
+- BasePhysicsEngine port declarations (get_input_ports/get_output_ports)
+- PowerFlow, which declares ports without inheriting BasePhysicsEngine
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+from components.security.logging_system import get_logger
+
+__all__ = ["Port", "PortConnection", "PhysicsCouplingGraph"]
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Port:
+    """Typed engine port.
+
+    Attributes:
+        name: Port name, unique per engine and direction
+        unit: Physical unit (connections require matching units)
+        dtype: Value type carried by the port
+    """
+
+    name: str
+    unit: str
+    dtype: type = float
+
+
+@dataclass(frozen=True)
+class PortConnection:
+    """Connection from an engine output port to an engine input port.
+
+    Attributes:
+        source: Source engine name
+        output: Output port on the source engine
+        target: Target engine name
+        input: Input port on the target engine
+    """
+
+    source: str
+    output: str
+    target: str
+    input: str
+
+
+class PhysicsCouplingGraph:
+    """
+    Couples physics engines through typed ports.
+
+    Engines must provide get_input_ports(), get_output_ports(),
+    read_output(port), write_input(port, value) and update(dt).
+
+    Example:
+        >>> graph = PhysicsCouplingGraph()
+        >>> graph.add_engine("turbine_plc_1", turbine)
+        >>> graph.add_engine("grid", grid)
+        >>> graph.connect("turbine_plc_1", "power_output_mw", "grid", "generation_mw")
+        >>> graph.step(dt)  # turbine.update, then grid inputs, then grid.update
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty coupling graph."""
+        self._engines: dict[str, Any] = {}
+        self._connections: list[PortConnection] = []
+        self._inputs: dict[str, dict[str, list[PortConnection]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        self._order: list[str] | None = None
+
+        # Statistics
+        self._steps = 0
+        self._transfers = 0
+
+    # ----------------------------------------------------------------
+    # Construction
+    # ----------------------------------------------------------------
+
+    def add_engine(self, name: str, engine: Any) -> None:
+        """Add an engine to the graph.
+
+        Args:
+            name: Unique engine name (typically device name)
+            engine: Physics engine declaring ports
+
+        Raises:
+            ValueError: If name is empty or already registered
+        """
+        if not name:
+            raise ValueError("Engine name cannot be empty")
+        if name in self._engines:
+            raise ValueError(f"Engine '{name}' already in coupling graph")
+
+        self._engines[name] = engine
+        self._order = None
+
+    def connect(self, source: str, output: str, target: str, input: str) -> None:
+        """Connect a source output port to a target input port.
+
+        Args:
+            source: Source engine name
+            output: Output port name on source
+            target: Target engine name
+            input: Input port name on target
+
+        Raises:
+            KeyError: If an engine or port does not exist
+            ValueError: If port types or units differ, or the connection
+                would create a cycle
+        """
+        out_port = self._port(source, output, outputs=True)
+        in_port = self._port(target, input, outputs=False)
+
+        if out_port.unit != in_port.unit or out_port.dtype is not in_port.dtype:
+            raise ValueError(
+                f"Cannot connect {source}.{output} [{out_port.unit}] "
+                f"to {target}.{input} [{in_port.unit}]: port types differ"
+            )
+
+        connection = PortConnection(source, output, target, input)
+        if connection in self._connections:
+            return
+
+        self._connections.append(connection)
+        self._inputs[target][input].append(connection)
+        self._order = None
+
+        try:
+            self.order()
+        except ValueError:
+            self._connections.remove(connection)
+            self._inputs[target][input].remove(connection)
+            # Unconnected inputs keep the engine's own value (see propagate)
+            if not self._inputs[target][input]:
+                del self._inputs[target][input]
+            if not self._inputs[target]:
+                del self._inputs[target]
+            self._order = None
+            raise
+
+        logger.debug(f"Coupled {source}.{output} -> {target}.{input}")
+
+    def _port(self, engine_name: str, port_name: str, outputs: bool) -> Port:
+        """Look up a declared port."""
+        if engine_name not in self._engines:
+            raise KeyError(f"Engine '{engine_name}' not in coupling graph")
+
+        engine = self._engines[engine_name]
+        ports = engine.get_output_ports() if outputs else engine.get_input_ports()
+        if port_name not in ports:
+            direction = "output" if outputs else "input"
+            raise KeyError(f"Engine '{engine_name}' has no {direction} '{port_name}'")
+        return ports[port_name]
+
+    def order(self) -> list[str]:
+        """Get engine update order (sources before targets).
+
+        Engines without connections keep their insertion order.
+
+        Returns:
+            Engine names in topological order
+
+        Raises:
+            ValueError: If the connections contain a cycle
+        """
+        if self._order is not None:
+            return self._order
+
+        dependents: dict[str, set[str]] = defaultdict(set)
+        indegree = dict.fromkeys(self._engines, 0)
+        for conn in self._connections:
+            if conn.target not in dependents[conn.source]:
+                dependents[conn.source].add(conn.target)
+                indegree[conn.target] += 1
+
+        ready = [name for name in self._engines if indegree[name] == 0]
+        order: list[str] = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for dependent in self._engines:
+                if dependent in dependents[name]:
+                    indegree[dependent] -= 1
+                    if indegree[dependent] == 0:
+                        ready.append(dependent)
+
+        if len(order) != len(self._engines):
+            cyclic = sorted(set(self._engines) - set(order))
+            raise ValueError(f"Coupling graph contains a cycle through {cyclic}")
+
+        self._order = order
+        return order
+
+    # ----------------------------------------------------------------
+    # Stepping
+    # ----------------------------------------------------------------
+
+    def propagate(self, target: str) -> None:
+        """Write current source outputs into a target engine's inputs.
+
+        Args:
+            target: Engine whose connected inputs are refreshed
+        """
+        engine = self._engines[target]
+        for input_name, connections in self._inputs.get(target, {}).items():
+            if not connections:
+                continue
+            total = 0.0
+            for conn in connections:
+                total += self._engines[conn.source].read_output(conn.output)
+            engine.write_input(input_name, total)
+            self._transfers += len(connections)
+
+    def step(self, dt: float, skip: set[str] | frozenset[str] = frozenset()) -> None:
+        """Propagate inputs and update every engine in topological order.
+
+        Args:
+            dt: Time delta in simulation seconds
+            skip: Engines already updated this tick (e.g. by a physics
+                worker); their inputs and outputs are still propagated
+        """
+        for name in self.order():
+            self.propagate(name)
+            if name not in skip:
+                self._engines[name].update(dt)
+        self._steps += 1
+
+    # ----------------------------------------------------------------
+    # Status
+    # ----------------------------------------------------------------
+
+    def get_connections(self) -> list[PortConnection]:
+        """Get all port connections.
+
+        Returns:
+            List of connections in the order they were added
+        """
+        return list(self._connections)
+
+    def get_status(self) -> dict[str, Any]:
+        """Get coupling graph status.
+
+        Returns:
+            Dictionary with order, connections and transfer counts
+        """
+        return {
+            "engines": len(self._engines),
+            "order": list(self.order()),
+            "connections": [
+                f"{c.source}.{c.output} -> {c.target}.{c.input}"
+                for c in self._connections
+            ],
+            "steps": self._steps,
+            "transfers": self._transfers,
+        }
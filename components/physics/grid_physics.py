@@ -17,7 +17,11 @@ Integrates with:
 from dataclasses import dataclass
 from typing import Any
 
-from components.physics.base_physics_engine import BasePhysicsEngine
+from components.physics.base_physics_engine import (
+    BasePhysicsEngine,
+    SteadyStateResult,
+)
+from components.physics.coupling import Port
 from components.state.data_store import DataStore
 
 
@@ -111,10 +115,14 @@ class GridPhysics(BasePhysicsEngine):
     # Initialisation
     # ----------------------------------------------------------------
 
-    async def initialise(self) -> None:
+    async def initialise(self, steady_state: bool = False) -> None:
         """Initialise grid physics.
 
         Sets initial state to nominal conditions.
+
+        Args:
+            steady_state: Start at the equilibrium frequency and voltage for
+                the aggregated generation and load instead of nominal
         """
         self.state.frequency_hz = self.params.nominal_frequency_hz
         self.state.voltage_pu = 1.0
@@ -122,6 +130,9 @@ class GridPhysics(BasePhysicsEngine):
         # Initial load/gen aggregation
         await self.update_from_devices()
 
+        if steady_state:
+            self.solve_steady_state()
+
         self._last_update_time = self.sim_time.now()
         self._initialised = True
 
@@ -222,6 +233,62 @@ class GridPhysics(BasePhysicsEngine):
                 f"(imbalance: {imbalance_mw:.1f}MW)"
             )
 
+    def solve_steady_state(self) -> SteadyStateResult:
+        """Set frequency and voltage to equilibrium for current gen/load.
+
+        Setting df/dt = 0 in the swing equation gives
+
+            f = f_nom + (P_gen - P_load) / D
+
+        Without load damping there is no equilibrium unless generation
+        and load balance. If the equilibrium lies outside the frequency
+        protection band, damping alone cannot hold the imbalance (in a real
+        system governor response would), so the solve is refused rather
+        than starting the grid tripped. In both cases frequency and voltage
+        are left where they are.
+
+        Returns:
+            SteadyStateResult (always analytic, no iterations)
+        """
+        imbalance_mw = self.state.total_gen_mw - self.state.total_load_mw
+
+        if self.params.damping > 0:
+            frequency_hz = (
+                self.params.nominal_frequency_hz + imbalance_mw / self.params.damping
+            )
+            converged = (
+                self.params.min_frequency_hz
+                <= frequency_hz
+                <= self.params.max_frequency_hz
+            )
+        else:
+            frequency_hz = self.state.frequency_hz
+            converged = imbalance_mw == 0.0
+
+        if converged:
+            self.state.frequency_hz = frequency_hz
+            self.state.voltage_pu = 1.0 + imbalance_mw / 10000.0
+            self._update_protection()
+        elif self.params.damping > 0:
+            self.logger.warning(
+                f"Grid steady state rejected: {imbalance_mw:.1f}MW imbalance "
+                f"gives {frequency_hz:.3f}Hz with {self.params.damping}MW/Hz "
+                "damping, outside the protection band"
+            )
+        else:
+            self.logger.warning(
+                f"Grid has no steady state: {imbalance_mw:.1f}MW imbalance "
+                "with zero load damping"
+            )
+        return SteadyStateResult(
+            converged=converged,
+            analytic=True,
+            iterations=0,
+            residual=(
+                0.0 if converged else abs(imbalance_mw) / self.params.inertia_constant
+            ),
+        )
+
     def _update_protection(self) -> None:
         """Update grid protection trip status.
 
@@ -273,6 +340,44 @@ class GridPhysics(BasePhysicsEngine):
                 f"(limit: {self.params.max_voltage_pu}pu)"
             )
 
+    # ----------------------------------------------------------------
+    # Coupling ports
+    # ----------------------------------------------------------------
+
+    def get_input_ports(self) -> dict[str, Port]:
+        """Get grid input ports (aggregate generation and load).
+
+        When coupled, these replace update_from_devices() aggregation.
+        """
+        return {
+            "generation_mw": Port("generation_mw", "MW"),
+            "load_mw": Port("load_mw", "MW"),
+        }
+
+    def get_output_ports(self) -> dict[str, Port]:
+        """Get grid output ports (frequency, voltage)."""
+        return {
+            "frequency_hz": Port("frequency_hz", "Hz"),
+            "voltage_pu": Port("voltage_pu", "pu"),
+        }
+
+    def write_input(self, port: str, value: float) -> None:
+        """Write aggregate generation or load.
+
+        Args:
+            port: "generation_mw" or "load_mw"
+            value: Summed value from connected ports in MW
+
+        Raises:
+            KeyError: If the port is not declared
+        """
+        if port == "generation_mw":
+            self.state.total_gen_mw = value
+        elif port == "load_mw":
+            self.state.total_load_mw = value
+        else:
+            super().write_input(port, value)
+
     # ----------------------------------------------------------------
     # State access
     # ----------------------------------------------------------------
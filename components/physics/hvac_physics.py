@@ -26,6 +26,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from components.physics.base_physics_engine import BaseDevicePhysicsEngine
+from components.physics.coupling import Port
 from components.state.data_store import DataStore
 
 
@@ -136,6 +137,23 @@ class HVACPhysics(BaseDevicePhysicsEngine):
     MODE_COOL = 2
     MODE_AUTO = 3
 
+    # PID controller state is integrated alongside self.state
+    _integrated_attributes = (
+        "_temp_integral",
+        "_temp_last_error",
+        "_humidity_integral",
+        "_humidity_last_error",
+    )
+    _control_inputs = (
+        "temperature_setpoint_c",
+        "humidity_setpoint_percent",
+        "fan_speed_command",
+        "mode_select",
+        "damper_command",
+        "system_enable",
+        "lspace_dampener_enable",
+    )
+
     def __init__(
         self,
         device_name: str,
@@ -174,13 +192,17 @@ class HVACPhysics(BaseDevicePhysicsEngine):
     # Initialisation
     # ----------------------------------------------------------------
 
-    async def initialise(self) -> None:
+    async def initialise(self, steady_state: bool = False) -> None:
         """Initialise HVAC physics and write initial state to DataStore.
 
+        Args:
+            steady_state: Start at equilibrium for the configured setpoints,
+                fan, damper and mode instead of a cold, idle plant
+
         Raises:
             RuntimeError: If device not found in DataStore
         """
-        await super().initialise()
+        await super().initialise(steady_state)
         await self._write_telemetry()
 
     # ----------------------------------------------------------------
@@ -236,6 +258,20 @@ class HVACPhysics(BaseDevicePhysicsEngine):
         if not self._validate_update(dt):
             return
 
+        self._integrate(dt)
+
+        self.logger.debug(
+            f"{self.device_name}: T={self.state.zone_temperature_c:.1f}°C, "
+            f"RH={self.state.zone_humidity_percent:.1f}%, "
+            f"L-space={self.state.lspace_stability:.2f}"
+        )
+
+    def _step(self, dt: float) -> None:
+        """Advance HVAC dynamics by one integration step.
+
+        Args:
+            dt: Step length in seconds
+        """
         # Read control inputs
         temp_setpoint = self._read_control_input("temperature_setpoint_c", 20.0)
         humidity_setpoint = self._read_control_input("humidity_setpoint_percent", 45.0)
@@ -270,12 +306,6 @@ class HVACPhysics(BaseDevicePhysicsEngine):
         # Calculate energy consumption
         self._update_energy_consumption()
 
-        self.logger.debug(
-            f"{self.device_name}: T={self.state.zone_temperature_c:.1f}°C, "
-            f"RH={self.state.zone_humidity_percent:.1f}%, "
-            f"L-space={self.state.lspace_stability:.2f}"
-        )
-
     async def write_telemetry(self) -> None:
         """Write current HVAC state to device memory map."""
         await self._write_telemetry()
@@ -349,6 +379,30 @@ class HVACPhysics(BaseDevicePhysicsEngine):
         pressure_error = target_pressure - self.state.duct_pressure_pa
         self.state.duct_pressure_pa += pressure_error * 0.5 * dt
 
+    def _analytic_steady_state(self) -> bool:
+        """Set fan, duct pressure and damper to their commanded values.
+
+        Actuators are first-order lags, so they settle exactly on command.
+        Zone temperature, humidity and the PI integrators depend on valve
+        saturation and mode switching and are left to the fixed-point
+        iteration.
+
+        Returns:
+            True if the actuator equilibrium was applied
+        """
+        if not self._read_control_input("system_enable", False):
+            return False
+
+        fan = self._read_control_input("fan_speed_command", 0.0)
+        damper = self._read_control_input("damper_command", 0.0)
+
+        self.state.fan_speed_percent = max(0.0, min(100.0, fan))
+        self.state.duct_pressure_pa = (
+            500.0 * (self.state.fan_speed_percent / 100.0) ** 2
+        )
+        self.state.damper_position_percent = max(0.0, min(100.0, damper))
+        return True
+
     def _update_damper(self, dt: float, damper_command: float) -> None:
         """Update outside air damper position.
 
@@ -662,6 +716,17 @@ class HVACPhysics(BaseDevicePhysicsEngine):
 
         await self.data_store.bulk_write_memory(self.device_name, telemetry)
 
+    # ----------------------------------------------------------------
+    # Coupling ports
+    # ----------------------------------------------------------------
+
+    def get_output_ports(self) -> dict[str, Port]:
+        """Get HVAC output ports (electrical demand, zone temperature)."""
+        return {
+            "energy_consumption_kw": Port("energy_consumption_kw", "kW"),
+            "zone_temperature_c": Port("zone_temperature_c", "degC"),
+        }
+
     # ----------------------------------------------------------------
     # State access
     # ----------------------------------------------------------------
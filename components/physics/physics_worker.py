@@ -0,0 +1,488 @@
+# components/physics/physics_worker.py
+"""
+Out-of-process execution for device physics engines.
+
+Runs TurbinePhysics, ReactorPhysics and HVACPhysics in a dedicated worker
+process so physics steps use their own core instead of blocking the asyncio
+event loop (protocol servers, device scans).
+
+The engines in the simulator process stay the authoritative view: PLCs
+write setpoints into their control caches and read their state, and
+operator actions (SCRAM reset, outside conditions) change state and
+params directly. Each tick:
+
+1. Changed params are sent to the worker over the pipe
+2. Engine state, control caches and the tick header are packed into a
+   shared-memory block
+3. The worker is signalled over a pipe, copies state and controls into
+   its own engines and runs update(dt)
+4. The worker packs engine state back into the block, and the simulator
+   copies it into its engines in place
+
+Shared memory layout (all slots float64, native byte order):
+
+    header:   [simulation_time, dt]
+    engine 0: [control inputs...][state fields... integrated attrs... stats...]
+    engine 1: ...
+
+A missing control input is encoded as NaN so the worker falls back to the
+engine's default.
+
+Integrates with:
+- BaseDevicePhysicsEngine for state, control and integrator contracts
+- SimulationTime so time-dependent terms see the simulator's clock
+"""
+
+import asyncio
+import copy
+import dataclasses
+import math
+import multiprocessing
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from components.physics.base_physics_engine import (
+    BaseDevicePhysicsEngine,
+    IntegratorStats,
+)
+from components.security.logging_system import get_logger
+
+__all__ = ["PhysicsWorker"]
+
+logger = get_logger(__name__)
+
+_HEADER_SLOTS = 2  # simulation_time, dt
+_SLOT_BYTES = 8  # float64
+_STAT_FIELDS = tuple(f.name for f in dataclasses.fields(IntegratorStats))
+
+
+@dataclass
+class _EngineLayout:
+    """Slot offsets for one engine in the shared-memory block.
+
+    Attributes:
+        name: Device name of the engine
+        control_keys: Control cache keys, in slot order
+        state_fields: State dataclass fields, in slot order
+        extra_attributes: Integrated private attributes, in slot order
+        control_offset: Index of the first control slot
+        state_offset: Index of the first state slot
+    """
+
+    name: str
+    control_keys: tuple[str, ...]
+    state_fields: tuple[str, ...]
+    extra_attributes: tuple[str, ...]
+    control_offset: int
+    state_offset: int
+
+    @property
+    def state_slots(self) -> int:
+        return len(self.state_fields) + len(self.extra_attributes) + len(_STAT_FIELDS)
+
+    @property
+    def end(self) -> int:
+        return self.state_offset + self.state_slots
+
+
+def _build_layouts(engines: dict[str, BaseDevicePhysicsEngine]) -> list[_EngineLayout]:
+    """Assign fixed slot offsets to each engine."""
+    layouts = []
+    offset = _HEADER_SLOTS
+    for name, engine in engines.items():
+        control_keys = engine._control_inputs
+        state_fields = tuple(f.name for f in dataclasses.fields(engine.get_state()))
+        layout = _EngineLayout(
+            name=name,
+            control_keys=control_keys,
+            state_fields=state_fields,
+            extra_attributes=engine._integrated_attributes,
+            control_offset=offset,
+            state_offset=offset + len(control_keys),
+        )
+        layouts.append(layout)
+        offset = layout.end
+    return layouts
+
+
+def _pack_controls(
+    slots: memoryview, layout: _EngineLayout, engine: BaseDevicePhysicsEngine
+) -> None:
+    for i, key in enumerate(layout.control_keys):
+        value = engine._control_cache.get(key)
+        slots[layout.control_offset + i] = math.nan if value is None else float(value)
+
+
+def _unpack_controls(
+    slots: memoryview, layout: _EngineLayout, engine: BaseDevicePhysicsEngine
+) -> None:
+    for i, key in enumerate(layout.control_keys):
+        value = slots[layout.control_offset + i]
+        if math.isnan(value):
+            engine._control_cache.pop(key, None)
+        else:
+            engine._control_cache[key] = value
+
+
+def _pack_state(
+    slots: memoryview, layout: _EngineLayout, engine: BaseDevicePhysicsEngine
+) -> None:
+    i = layout.state_offset
+    state = engine.get_state()
+    for name in layout.state_fields:
+        slots[i] = float(getattr(state, name))
+        i += 1
+    for name in layout.extra_attributes:
+        slots[i] = float(getattr(engine, name))
+        i += 1
+    for name in _STAT_FIELDS:
+        slots[i] = float(getattr(engine.integrator_stats, name))
+        i += 1
+
+
+def _unpack_state(
+    slots: memoryview, layout: _EngineLayout, engine: BaseDevicePhysicsEngine
+) -> None:
+    i = layout.state_offset
+    state = engine.get_state()
+    for name in layout.state_fields:
+        setattr(state, name, slots[i])
+        i += 1
+    for name in layout.extra_attributes:
+        # Preserve attribute types (e.g. the reactor SCRAM latch is a bool)
+        setattr(engine, name, type(getattr(engine, name))(slots[i]))
+        i += 1
+    for name in _STAT_FIELDS:
+        setattr(engine.integrator_stats, name, int(slots[i]))
+        i += 1
+
+
+# ----------------------------------------------------------------
+# Worker process
+# ----------------------------------------------------------------
+
+
+async def _build_worker_engines(
+    specs: list[tuple[type, str, Any, Any]],
+) -> dict[str, BaseDevicePhysicsEngine]:
+    """Recreate engines inside the worker against a private DataStore."""
+    from components.state.data_store import DataStore
+    from components.state.system_state import SystemState
+
+    data_store = DataStore(SystemState())
+    engines: dict[str, BaseDevicePhysicsEngine] = {}
+    for device_id, (engine_cls, device_name, params, integrator) in enumerate(specs):
+        await data_store.register_device(
+            device_name=device_name,
+            device_type="physics_worker",
+            device_id=device_id,
+            protocols=[],
+        )
+        engine = engine_cls(device_name, data_store, params)
+        engine.integrator = integrator
+        await engine.initialise()
+        engines[device_name] = engine
+    return engines
+
+
+def _worker_main(
+    conn: Connection, shm_name: str, specs: list[tuple[type, str, Any, Any]]
+) -> None:
+    """Worker process entry point: serve step/sync commands until stopped."""
+    from components.time.simulation_time import SimulationTime
+
+    shm = SharedMemory(name=shm_name)
+    slots = shm.buf.cast("d")
+    try:
+        engines = asyncio.run(_build_worker_engines(specs))
+        layouts = _build_layouts(engines)
+        sim_time = SimulationTime()
+
+        for layout in layouts:
+            _unpack_state(slots, layout, engines[layout.name])
+        conn.send(("ready", None))
+
+        while True:
+            command = conn.recv()
+            try:
+                if command == "step":
+                    sim_time.state.simulation_time = slots[0]
+                    dt = slots[1]
+                    for layout in layouts:
+                        engine = engines[layout.name]
+                        _unpack_state(slots, layout, engine)
+                        _unpack_controls(slots, layout, engine)
+                        engine.update(dt)
+                        _pack_state(slots, layout, engine)
+                elif command == "sync":
+                    for layout in layouts:
+                        _unpack_state(slots, layout, engines[layout.name])
+                elif isinstance(command, tuple) and command[0] == "params":
+                    for name, params in command[1].items():
+                        engines[name].params = params
+                elif command == "stop":
+                    conn.send(("ok", None))
+                    break
+                conn.send(("ok", None))
+            except Exception as e:
+                conn.send(("error", f"{type(e).__name__}: {e}"))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        slots.release()
+        shm.close()
+        conn.close()
+
+
+# ----------------------------------------------------------------
+# Simulator-side handle
+# ----------------------------------------------------------------
+
+
+class PhysicsWorker:
+    """
+    Runs device physics engines in a dedicated worker process.
+
+    The engines passed in remain the simulator-side view: their state,
+    control caches and (when changed) params are sent to the worker and
+    their state is overwritten in place with the worker's result after
+    every step.
+
+    Example:
+        >>> worker = PhysicsWorker({"turbine_plc_1": turbine})
+        >>> await worker.start()
+        >>> await worker.step(dt)       # replaces turbine.update(dt)
+        >>> await turbine.write_telemetry()
+        >>> await worker.stop()
+    """
+
+    def __init__(
+        self,
+        engines: dict[str, BaseDevicePhysicsEngine],
+        start_timeout: float = 30.0,
+        step_timeout: float = 5.0,
+    ):
+        """Initialise physics worker.
+
+        Args:
+            engines: Device physics engines keyed by device name
+            start_timeout: Seconds to wait for the worker to build its engines
+            step_timeout: Seconds to wait for a single step
+
+        Raises:
+            ValueError: If no engines are provided
+        """
+        if not engines:
+            raise ValueError("PhysicsWorker requires at least one engine")
+
+        self.engines = dict(engines)
+        self.start_timeout = start_timeout
+        self.step_timeout = step_timeout
+
+        self._layouts = _build_layouts(self.engines)
+        self._slot_count = self._layouts[-1].end
+        self._shm: SharedMemory | None = None
+        self._slots: memoryview | None = None
+        self._conn: Connection | None = None
+        self._process: multiprocessing.process.BaseProcess | None = None
+        # Params as last sent to the worker, to detect simulator-side changes
+        self._sent_params: dict[str, Any] = {}
+
+        # Statistics
+        self._steps = 0
+        self._last_step_wall = 0.0
+
+    # ----------------------------------------------------------------
+    # Lifecycle
+    # ----------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the worker process and load current engine state into it.
+
+        Raises:
+            RuntimeError: If already running or the worker fails to start
+        """
+        if self.is_running():
+            raise RuntimeError("PhysicsWorker already running")
+
+        self._shm = SharedMemory(create=True, size=self._slot_count * _SLOT_BYTES)
+        self._slots = self._shm.buf.cast("d")
+        for layout in self._layouts:
+            _pack_state(self._slots, layout, self.engines[layout.name])
+
+        specs = [
+            (type(engine), name, engine.params, engine.integrator)
+            for name, engine in self.engines.items()
+        ]
+        self._sent_params = {
+            name: copy.deepcopy(engine.params) for name, engine in self.engines.items()
+        }
+
+        # Spawn rather than fork: the parent holds a running event loop
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self._shm.name, specs),
+            name="physics-worker",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+
+        try:
+            await self._receive(self.start_timeout)
+        except RuntimeError:
+            await self.stop()
+            raise
+
+        logger.info(
+            f"Physics worker started (pid={self._process.pid}, "
+            f"{len(self.engines)} engines, {self._slot_count * _SLOT_BYTES} bytes shared)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the worker process and release shared memory."""
+        if self._conn and self._process and self._process.is_alive():
+            try:
+                self._conn.send("stop")
+                await self._receive(self.step_timeout)
+            except (RuntimeError, OSError):
+                pass
+
+        if self._process:
+            await asyncio.to_thread(self._process.join, 1.0)
+            if self._process.is_alive():
+                self._process.terminate()
+                await asyncio.to_thread(self._process.join, 1.0)
+            self._process = None
+
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+
+        if self._slots is not None:
+            self._slots.release()
+            self._slots = None
+
+        if self._shm:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+        logger.info(f"Physics worker stopped after {self._steps} steps")
+
+    def is_running(self) -> bool:
+        """Check if the worker process is alive.
+
+        Returns:
+            True if the worker is running
+        """
+        return self._process is not None and self._process.is_alive()
+
+    # ----------------------------------------------------------------
+    # Stepping
+    # ----------------------------------------------------------------
+
+    async def step(self, dt: float, simulation_time: float | None = None) -> None:
+        """Advance all engines by dt in the worker process.
+
+        Args:
+            dt: Time delta in simulation seconds
+            simulation_time: Clock value for time-dependent terms
+                (defaults to the simulator's SimulationTime)
+
+        Raises:
+            RuntimeError: If the worker is not running or the step fails
+        """
+        if not self.is_running() or self._slots is None or self._conn is None:
+            raise RuntimeError("PhysicsWorker not running. Call start() first.")
+
+        await self._send_changed_params()
+
+        slots = self._slots
+        if simulation_time is None:
+            simulation_time = next(iter(self.engines.values())).sim_time.now()
+        slots[0] = simulation_time
+        slots[1] = dt
+        for layout in self._layouts:
+            engine = self.engines[layout.name]
+            # Full state each tick, so simulator-side changes (SCRAM reset,
+            # restored snapshots) are not overwritten by the worker's copy
+            _pack_state(slots, layout, engine)
+            _pack_controls(slots, layout, engine)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        self._conn.send("step")
+        await self._receive(self.step_timeout)
+        self._last_step_wall = loop.time() - started
+
+        for layout in self._layouts:
+            _unpack_state(slots, layout, self.engines[layout.name])
+        self._steps += 1
+
+    async def sync(self) -> None:
+        """Push simulator-side engine state to the worker without stepping.
+
+        Raises:
+            RuntimeError: If the worker is not running
+        """
+        if not self.is_running() or self._slots is None or self._conn is None:
+            raise RuntimeError("PhysicsWorker not running. Call start() first.")
+
+        for layout in self._layouts:
+            _pack_state(self._slots, layout, self.engines[layout.name])
+        self._conn.send("sync")
+        await self._receive(self.step_timeout)
+
+    async def _send_changed_params(self) -> None:
+        """Send params changed on the simulator side since the last send."""
+        changed = {
+            name: engine.params
+            for name, engine in self.engines.items()
+            if engine.params != self._sent_params.get(name)
+        }
+        if not changed:
+            return
+        self._conn.send(("params", changed))
+        await self._receive(self.step_timeout)
+        for name, params in changed.items():
+            self._sent_params[name] = copy.deepcopy(params)
+
+    async def _receive(self, timeout: float) -> None:
+        """Wait off the event loop for the worker's reply."""
+        conn = self._conn
+        if conn is None:
+            raise RuntimeError("PhysicsWorker connection closed")
+
+        ready = await asyncio.to_thread(conn.poll, timeout)
+        if not ready:
+            raise RuntimeError(f"Physics worker did not respond within {timeout}s")
+        try:
+            status, detail = conn.recv()
+        except EOFError as e:
+            raise RuntimeError("Physics worker exited unexpectedly") from e
+        if status == "error":
+            raise RuntimeError(f"Physics worker failed: {detail}")
+
+    # ----------------------------------------------------------------
+    # Status
+    # ----------------------------------------------------------------
+
+    def get_status(self) -> dict[str, Any]:
+        """Get worker status.
+
+        Returns:
+            Dictionary with process and step statistics
+        """
+        return {
+            "running": self.is_running(),
+            "pid": self._process.pid if self._process else None,
+            "engines": list(self.engines),
+            "shared_memory_bytes": self._slot_count * _SLOT_BYTES,
+            "steps": self._steps,
+            "last_step_wall_ms": round(self._last_step_wall * 1000.0, 3),
+        }
@@ -17,6 +17,7 @@ Integrates with:
 from dataclasses import dataclass, field
 from typing import Any
 
+from components.physics.coupling import Port
 from components.security.logging_system import get_logger
 from components.state.data_store import DataStore
 from components.time.simulation_time import SimulationTime
@@ -334,6 +335,59 @@ class PowerFlow:
                     f"{apparent_mva:.1f}MVA (limit: {self.params.line_max_mva}MVA)"
                 )
 
+    # ----------------------------------------------------------------
+    # Coupling ports
+    # ----------------------------------------------------------------
+
+    def get_input_ports(self) -> dict[str, Port]:
+        """Get bus injection input ports ("<bus>.gen_mw", "<bus>.load_mw").
+
+        When coupled, these replace update_from_devices() aggregation.
+        """
+        ports = {}
+        for bus_name in self.params.buses:
+            for quantity in ("gen_mw", "load_mw"):
+                name = f"{bus_name}.{quantity}"
+                ports[name] = Port(name, "MW")
+        return ports
+
+    def get_output_ports(self) -> dict[str, Port]:
+        """Get output ports (none - power flow is a sink)."""
+        return {}
+
+    def read_output(self, port: str) -> float:
+        """Read an output port value.
+
+        Raises:
+            KeyError: Power flow declares no output ports
+        """
+        raise KeyError(f"PowerFlow has no output port '{port}'")
+
+    def write_input(self, port: str, value: float) -> None:
+        """Write a bus injection.
+
+        Reactive power follows the same 0.9 power factor assumption as
+        update_from_devices().
+
+        Args:
+            port: "<bus>.gen_mw" or "<bus>.load_mw"
+            value: Summed active power in MW
+
+        Raises:
+            KeyError: If the bus or quantity is unknown
+        """
+        bus_name, _, quantity = port.rpartition(".")
+        bus = self.params.buses.get(bus_name)
+        if bus is None or quantity not in ("gen_mw", "load_mw"):
+            raise KeyError(f"PowerFlow has no input port '{port}'")
+
+        if quantity == "gen_mw":
+            bus.gen_mw = value
+            bus.gen_mvar = value * 0.484  # tan(acos(0.9))
+        else:
+            bus.load_mw = value
+            bus.load_mvar = value * 0.5
+
     # ----------------------------------------------------------------
     # State access
     # ----------------------------------------------------------------
@@ -22,6 +22,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from components.physics.base_physics_engine import BaseDevicePhysicsEngine
+from components.physics.coupling import Port
 from components.state.data_store import DataStore
 
 
@@ -112,6 +113,17 @@ class ReactorPhysics(BaseDevicePhysicsEngine):
         >>> reactor.update(delta_time)  # Called each simulation cycle
     """
 
+    # SCRAM latch is part of the integrated state (auto-SCRAM fires mid-step)
+    _integrated_attributes = ("_scram_active",)
+    _control_inputs = (
+        "power_setpoint_percent",
+        "coolant_pump_speed",
+        "control_rods_position",
+        "emergency_shutdown",
+        "thaumic_dampener_enabled",
+    )
+    _steady_state_excluded = ("cumulative_overtemp_time", "damage_level")
+
     def __init__(
         self,
         device_name: str,
@@ -141,13 +153,17 @@ class ReactorPhysics(BaseDevicePhysicsEngine):
     # Initialisation
     # ----------------------------------------------------------------
 
-    async def initialise(self) -> None:
+    async def initialise(self, steady_state: bool = False) -> None:
         """Initialise reactor physics and write initial state to DataStore.
 
+        Args:
+            steady_state: Start at equilibrium for the configured power
+                setpoint, rods and coolant pump instead of cold shutdown
+
         Raises:
             RuntimeError: If device not found in DataStore
         """
-        await super().initialise()
+        await super().initialise(steady_state)
         await self._write_telemetry()
 
     # ----------------------------------------------------------------
@@ -193,6 +209,20 @@ class ReactorPhysics(BaseDevicePhysicsEngine):
         if not self._validate_update(dt):
             return
 
+        self._integrate(dt)
+
+        self.logger.debug(
+            f"{self.device_name}: T={self.state.core_temperature_c:.1f}°C, "
+            f"P={self.state.power_output_mw:.1f}MW, "
+            f"Thaumic={self.state.thaumic_field_strength:.2f}"
+        )
+
+    def _step(self, dt: float) -> None:
+        """Advance reactor dynamics by one integration step.
+
+        Args:
+            dt: Step length in seconds
+        """
         # Read control inputs
         power_setpoint = self._read_control_input("power_setpoint_percent", 0.0)
         coolant_pump = self._read_control_input("coolant_pump_speed", 0.0)
@@ -223,12 +253,6 @@ class ReactorPhysics(BaseDevicePhysicsEngine):
         self._update_power_output()
         self._update_damage(dt)
 
-        self.logger.debug(
-            f"{self.device_name}: T={self.state.core_temperature_c:.1f}°C, "
-            f"P={self.state.power_output_mw:.1f}MW, "
-            f"Thaumic={self.state.thaumic_field_strength:.2f}"
-        )
-
     async def write_telemetry(self) -> None:
         """Write current reactor state to device memory map."""
         await self._write_telemetry()
@@ -333,6 +357,54 @@ class ReactorPhysics(BaseDevicePhysicsEngine):
         self.state.core_temperature_c = max(25.0, self.state.core_temperature_c)
         self.state.coolant_temperature_c = max(25.0, self.state.coolant_temperature_c)
 
+    def _analytic_steady_state(self) -> bool:
+        """Set reaction rate and temperatures to their equilibrium values.
+
+        At equilibrium the reaction rate equals its target and heat removed
+        by the coolant matches heat generated. With coolant outlet at
+        25 + 0.3·(T - 25) this gives
+
+            T_core = 25 + rate·P_rated / (0.7·flow·coolant_capacity)
+
+        SCRAM, a stalled coolant pump or an equilibrium beyond the critical
+        temperature (which would auto-SCRAM) are left to the fixed-point
+        iteration.
+
+        Returns:
+            True if the analytic equilibrium was applied
+        """
+        if self._scram_active or self._read_control_input("emergency_shutdown", False):
+            return False
+
+        power_setpoint = self._read_control_input("power_setpoint_percent", 0.0)
+        control_rods = self._read_control_input("control_rods_position", 100.0)
+        coolant_pump = self._read_control_input("coolant_pump_speed", 0.0)
+
+        power_setpoint = max(0.0, min(100.0, power_setpoint))
+        control_rods = max(0.0, min(100.0, control_rods))
+        rate = min(power_setpoint, control_rods) / 100.0
+        flow = max(0.0, min(100.0, coolant_pump)) / 100.0
+
+        if rate == 0.0:
+            core_temp = 25.0
+        elif flow > 0.01:
+            core_temp = 25.0 + rate * self.params.rated_power_mw / (
+                0.7 * flow * self.params.coolant_capacity
+            )
+        else:
+            return False
+
+        if core_temp > self.params.critical_temperature_c:
+            return False
+
+        self.state.reaction_rate = rate
+        self.state.coolant_flow_rate = flow
+        self.state.core_temperature_c = core_temp
+        self.state.coolant_temperature_c = 25.0 + (core_temp - 25.0) * 0.3
+        self._update_pressure()
+        self._update_power_output()
+        return True
+
     def _update_pressure(self) -> None:
         """Update vessel pressure based on temperature.
 
@@ -506,6 +578,17 @@ class ReactorPhysics(BaseDevicePhysicsEngine):
 
         await self.data_store.bulk_write_memory(self.device_name, telemetry)
 
+    # ----------------------------------------------------------------
+    # Coupling ports
+    # ----------------------------------------------------------------
+
+    def get_output_ports(self) -> dict[str, Port]:
+        """Get reactor output ports (thermal, not electrical, power)."""
+        return {
+            "power_output_mw": Port("power_output_mw", "MWth"),
+            "core_temperature_c": Port("core_temperature_c", "degC"),
+        }
+
     # ----------------------------------------------------------------
     # State access
     # ----------------------------------------------------------------
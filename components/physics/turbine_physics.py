@@ -19,6 +19,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from components.physics.base_physics_engine import BaseDevicePhysicsEngine
+from components.physics.coupling import Port
 from components.state.data_store import DataStore
 
 
@@ -60,6 +61,7 @@ class TurbineParameters:
         inertia: Rotational inertia in kg·m²
         acceleration_rate: Maximum acceleration in RPM/second
         deceleration_rate: Natural deceleration in RPM/second
+        governor_gain: Governor proportional gain (RPM/second per RPM of error)
         vibration_normal_mils: Normal operating vibration
         vibration_critical_mils: Dangerous vibration threshold
     """
@@ -72,6 +74,7 @@ class TurbineParameters:
     inertia: float = 5000.0
     acceleration_rate: float = 100.0  # RPM/s
     deceleration_rate: float = 50.0  # RPM/s
+    governor_gain: float = 10.0  # RPM/s per RPM error
     vibration_normal_mils: float = 2.0
     vibration_critical_mils: float = 10.0
 
@@ -100,6 +103,9 @@ class TurbinePhysics(BaseDevicePhysicsEngine):
         >>> turbine.update(delta_time)  # Called each simulation cycle
     """
 
+    _control_inputs = ("holding_registers[10]", "coils[10]", "coils[11]")
+    _steady_state_excluded = ("cumulative_overspeed_time", "damage_level")
+
     def __init__(
         self,
         device_name: str,
@@ -131,16 +137,20 @@ class TurbinePhysics(BaseDevicePhysicsEngine):
     # Initialisation
     # ----------------------------------------------------------------
 
-    async def initialise(self) -> None:
+    async def initialise(self, steady_state: bool = False) -> None:
         """Initialise turbine physics and write initial state to DataStore.
 
         Should be called once before simulation starts.
 
+        Args:
+            steady_state: Start at equilibrium for the configured speed
+                setpoint and governor/trip coils instead of standstill
+
         Raises:
             RuntimeError: If device not found in DataStore
         """
         # Base class handles device validation and initialization
-        await super().initialise()
+        await super().initialise(steady_state)
 
         # Write initial state to memory map
         await self.write_telemetry()
@@ -192,6 +202,19 @@ class TurbinePhysics(BaseDevicePhysicsEngine):
         if not self._validate_update(dt):
             return
 
+        self._integrate(dt)
+
+        self.logger.debug(
+            f"{self.device_name}: RPM={self.state.shaft_speed_rpm:.0f}, "
+            f"Power={self.state.power_output_mw:.1f}MW"
+        )
+
+    def _step(self, dt: float) -> None:
+        """Advance turbine dynamics by one integration step.
+
+        Args:
+            dt: Step length in seconds
+        """
         # Read control inputs from PLC (via memory map)
         # These are set by protocol handlers or test scripts
         speed_setpoint = self._read_control_input("holding_registers[10]", 0.0)
@@ -212,11 +235,6 @@ class TurbinePhysics(BaseDevicePhysicsEngine):
         self._update_power_output()
         self._update_damage(dt)
 
-        self.logger.debug(
-            f"{self.device_name}: RPM={self.state.shaft_speed_rpm:.0f}, "
-            f"Power={self.state.power_output_mw:.1f}MW"
-        )
-
     async def write_telemetry(self) -> None:
         """Write current turbine state to device memory map.
 
@@ -245,11 +263,17 @@ class TurbinePhysics(BaseDevicePhysicsEngine):
         # Proportional control (simplified governor model)
         if speed_error > 0:
             # Accelerating - limited by maximum steam flow
-            accel = min(self.params.acceleration_rate, abs(speed_error) * 10.0)
+            accel = min(
+                self.params.acceleration_rate,
+                abs(speed_error) * self.params.governor_gain,
+            )
             self.state.shaft_speed_rpm += accel * dt
         else:
             # Decelerating - reduce steam flow
-            decel = min(self.params.deceleration_rate, abs(speed_error) * 10.0)
+            decel = min(
+                self.params.deceleration_rate,
+                abs(speed_error) * self.params.governor_gain,
+            )
             self.state.shaft_speed_rpm -= decel * dt
 
         # Physical limit - can't have negative speed
@@ -308,6 +332,30 @@ class TurbinePhysics(BaseDevicePhysicsEngine):
         Args:
             dt: Time delta in seconds
         """
+        target_bearing_temp, target_steam_temp, target_steam_pressure = (
+            self._temperature_targets()
+        )
+
+        # First-order thermal lag (faster for simulation purposes)
+        thermal_time_constant = 0.15  # Faster heating response
+        temp_error = target_bearing_temp - self.state.bearing_temperature_c
+        self.state.bearing_temperature_c += temp_error * thermal_time_constant * dt
+
+        # Steam has slower thermal response
+        steam_time_constant = 0.05
+        temp_error = target_steam_temp - self.state.steam_temperature_c
+        self.state.steam_temperature_c += temp_error * steam_time_constant * dt
+
+        # Pressure follows similar dynamics
+        pressure_error = target_steam_pressure - self.state.steam_pressure_psi
+        self.state.steam_pressure_psi += pressure_error * thermal_time_constant * dt
+
+    def _temperature_targets(self) -> tuple[float, float, float]:
+        """Temperatures and pressure the turbine settles to at current speed.
+
+        Returns:
+            (bearing temperature °C, steam temperature °C, steam pressure psi)
+        """
         # Bearing temperature increases with speed and vibration
         speed_factor = self.state.shaft_speed_rpm / self.params.rated_speed_rpm
         vibration_factor = self.state.vibration_mils / self.params.vibration_normal_mils
@@ -318,11 +366,6 @@ class TurbinePhysics(BaseDevicePhysicsEngine):
         # Normal operating: ~136°C at rated speed (well above 93°C trip point)
         target_bearing_temp = 21.0 + (speed_factor * 58.0) + (vibration_factor * 15.0)
 
-        # First-order thermal lag (faster for simulation purposes)
-        thermal_time_constant = 0.15  # Faster heating response
-        temp_error = target_bearing_temp - self.state.bearing_temperature_c
-        self.state.bearing_temperature_c += temp_error * thermal_time_constant * dt
-
         # Steam temperature correlates with load (Celsius)
         if self.state.shaft_speed_rpm > 100:
             target_steam_temp = 315.0 + (
@@ -333,14 +376,37 @@ class TurbinePhysics(BaseDevicePhysicsEngine):
             target_steam_temp = 21.0  # Celsius ambient
             target_steam_pressure = 0.0
 
-        # Steam has slower thermal response
-        steam_time_constant = 0.05
-        temp_error = target_steam_temp - self.state.steam_temperature_c
-        self.state.steam_temperature_c += temp_error * steam_time_constant * dt
+        return target_bearing_temp, target_steam_temp, target_steam_pressure
 
-        # Pressure follows similar dynamics
-        pressure_error = target_steam_pressure - self.state.steam_pressure_psi
-        self.state.steam_pressure_psi += pressure_error * thermal_time_constant * dt
+    def _analytic_steady_state(self) -> bool:
+        """Set speed and dependent states to their equilibrium values.
+
+        With the governor on, speed settles at the (clamped) setpoint;
+        otherwise the shaft coasts to standstill. Temperatures and pressure
+        then equal their targets for that speed. A tripped turbine is left
+        to the fixed-point iteration (trip cooling mixes two lags).
+
+        Returns:
+            True if the analytic equilibrium was applied
+        """
+        if self._read_control_input("coils[11]", False):
+            return False
+
+        if self._read_control_input("coils[10]", False):
+            setpoint = self._read_control_input("holding_registers[10]", 0.0)
+            speed = max(0.0, min(setpoint, self.params.max_safe_speed_rpm * 1.1))
+        else:
+            speed = 0.0
+
+        self.state.shaft_speed_rpm = speed
+        self._update_vibration()
+        self._update_power_output()
+        (
+            self.state.bearing_temperature_c,
+            self.state.steam_temperature_c,
+            self.state.steam_pressure_psi,
+        ) = self._temperature_targets()
+        return True
 
     def _update_vibration(self) -> None:
         """Calculate vibration based on operating conditions.
@@ -445,6 +511,17 @@ class TurbinePhysics(BaseDevicePhysicsEngine):
 
         await self.data_store.bulk_write_memory(self.device_name, telemetry)
 
+    # ----------------------------------------------------------------
+    # Coupling ports
+    # ----------------------------------------------------------------
+
+    def get_output_ports(self) -> dict[str, Port]:
+        """Get turbine output ports (electrical output, shaft speed)."""
+        return {
+            "power_output_mw": Port("power_output_mw", "MW"),
+            "shaft_speed_rpm": Port("shaft_speed_rpm", "rpm"),
+        }
+
     # ----------------------------------------------------------------
     # State access
     # ----------------------------------------------------------------
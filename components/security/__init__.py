@@ -3,11 +3,18 @@
 Security components for ICS simulator.
 
 Modules:
+- alert_store: Indexed alert storage with incremental counters
+- audit_aggregator: Audit event coalescing and per-category rate limits
+- audit_store: Segmented on-disk audit trail with sparse indexes
 - authentication: User authentication and RBAC
+- change_point: Streaming change-point detectors (EWMA, CUSUM, Page-Hinkley)
+- correlation: Declarative streaming event correlation rules
 - anomaly_detector: Behavioral anomaly detection
 - encryption: Data encryption and key management
 - logging_system: Structured ICS logging with audit trail
 - opcua_user_manager: OPC UA authentication bridge
+- pattern_matcher: Aho-Corasick multi-pattern matching for signatures
+- sliding_window: Bounded sliding-window counters for detection rules
 """
 
 from components.security.authentication import (
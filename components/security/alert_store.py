@@ -0,0 +1,232 @@
+# components/security/alert_store.py
+"""
+Indexed alert storage for detection systems.
+
+IDS and SIEM keep thousands of alerts during an exercise and report on
+them every scan: how many are active, how many of each severity, which
+rule raised them, what state they are in. Recounting the whole history
+for each figure makes every scan O(alerts). AlertStore indexes alerts by
+ID and keeps those figures as counters and views that are adjusted when
+an alert is added, changes status or is evicted, so lookups, status
+updates and statistics are all O(1).
+
+Alerts are any objects with ``alert_id`` and ``status`` attributes plus
+the attributes named in ``fields``. Status must be changed through
+``set_status()`` so the indexes stay in step.
+"""
+
+from collections import Counter
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Any
+
+__all__ = ["AlertStore"]
+
+
+class AlertStore:
+    """
+    Alerts indexed by ID with incremental counters and active views.
+
+    Counters cover every retained alert per field value, both overall and
+    per status. Active alerts (status not in ``inactive_statuses``) are
+    also kept in per-field views so filtered active queries only touch
+    matching alerts.
+
+    Example:
+        >>> store = AlertStore(inactive_statuses={"closed"}, fields=("severity",))
+        >>> store.add(alert)
+        >>> store.count("severity", "high", status="new")
+        1
+        >>> store.set_status(alert, "closed")
+        >>> store.active_count()
+        0
+    """
+
+    def __init__(
+        self,
+        inactive_statuses: Iterable[Hashable],
+        fields: Iterable[str] = ("severity", "category"),
+    ):
+        """
+        Initialise empty store.
+
+        Args:
+            inactive_statuses: Statuses that take an alert out of the active view
+            fields: Alert attributes to count and index (status is always counted)
+        """
+        self.fields = tuple(fields)
+        self._inactive_statuses = frozenset(inactive_statuses)
+        self._alerts: dict[str, Any] = {}  # alert_id -> alert, oldest first
+        self._active: dict[str, Any] = {}
+        self._inactive: dict[str, Any] = {}  # longest-inactive first
+        self._active_by: dict[str, dict[Any, dict[str, Any]]] = {
+            name: {} for name in self.fields
+        }
+        self._totals: Counter[tuple[str, Any]] = Counter()
+        self._by_status: Counter[tuple[str, Any, Any]] = Counter()
+
+    # ----------------------------------------------------------------
+    # Collection interface
+    # ----------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate retained alerts, oldest first."""
+        return iter(list(self._alerts.values()))
+
+    def __contains__(self, alert_id: object) -> bool:
+        return alert_id in self._alerts
+
+    def get(self, alert_id: str) -> Any | None:
+        """Get alert by ID."""
+        return self._alerts.get(alert_id)
+
+    def add(self, alert: Any) -> None:
+        """
+        Add a new alert.
+
+        Raises:
+            ValueError: If an alert with the same ID is already stored
+        """
+        alert_id = alert.alert_id
+        if alert_id in self._alerts:
+            raise ValueError(f"Duplicate alert ID: {alert_id}")
+        self._alerts[alert_id] = alert
+        self._count(alert, alert.status, 1)
+        if self.is_active(alert):
+            self._activate(alert)
+        else:
+            self._inactive[alert_id] = alert
+
+    def remove(self, alert_id: str) -> Any | None:
+        """Remove alert by ID, returning it (None if not stored)."""
+        alert = self._alerts.pop(alert_id, None)
+        if alert is None:
+            return None
+        self._count(alert, alert.status, -1)
+        if alert_id in self._active:
+            self._deactivate(alert)
+        else:
+            del self._inactive[alert_id]
+        return alert
+
+    def set_status(self, alert: Any, status: Hashable) -> None:
+        """Change a stored alert's status, moving it between views."""
+        old_status = alert.status
+        if status == old_status:
+            return
+        was_active = self.is_active(alert)
+        self._count(alert, old_status, -1)
+        alert.status = status
+        self._count(alert, status, 1)
+
+        now_active = self.is_active(alert)
+        if was_active and not now_active:
+            self._deactivate(alert)
+            self._inactive[alert.alert_id] = alert
+        elif now_active and not was_active:
+            del self._inactive[alert.alert_id]
+            self._activate(alert)
+
+    def oldest(self) -> Any | None:
+        """Oldest retained alert."""
+        return next(iter(self._alerts.values()), None)
+
+    def oldest_inactive(self) -> Any | None:
+        """Alert that has been inactive the longest."""
+        return next(iter(self._inactive.values()), None)
+
+    # ----------------------------------------------------------------
+    # Queries
+    # ----------------------------------------------------------------
+
+    def is_active(self, alert: Any) -> bool:
+        """Check whether an alert's status counts as active."""
+        return alert.status not in self._inactive_statuses
+
+    def active(self, **filters: Any) -> list[Any]:
+        """
+        Active alerts, oldest first, optionally filtered by indexed fields.
+
+        Args:
+            **filters: field=value pairs (None values are ignored)
+
+        Returns:
+            Matching active alerts
+        """
+        filters = {k: v for k, v in filters.items() if v is not None}
+        if not filters:
+            return list(self._active.values())
+        # Start from the smallest matching view, check the rest per alert
+        views = [
+            self._active_by[name].get(value, {}) for name, value in filters.items()
+        ]
+        smallest = min(views, key=len)
+        return [
+            alert
+            for alert in smallest.values()
+            if all(getattr(alert, name) == value for name, value in filters.items())
+        ]
+
+    def active_count(self, field: str | None = None, value: Any = None) -> int:
+        """Number of active alerts, optionally with field == value."""
+        if field is None:
+            return len(self._active)
+        return len(self._active_by[field].get(value, ()))
+
+    def count(self, field: str, value: Any, status: Hashable | None = None) -> int:
+        """
+        Number of retained alerts with field == value.
+
+        Args:
+            field: Indexed field name, or "status"
+            value: Field value
+            status: Only count alerts in this status (optional)
+
+        Returns:
+            Alert count
+        """
+        if status is None:
+            return self._totals[(field, value)]
+        if field == "status":
+            return self._totals[(field, value)] if value == status else 0
+        return self._by_status[(field, value, status)]
+
+    # ----------------------------------------------------------------
+    # Internal helpers
+    # ----------------------------------------------------------------
+
+    def _count(self, alert: Any, status: Hashable, delta: int) -> None:
+        """Apply delta to every counter the alert contributes to."""
+        keys = [("status", status)]
+        for name in self.fields:
+            value = getattr(alert, name)
+            keys.append((name, value))
+            self._adjust(self._by_status, (name, value, status), delta)
+        for key in keys:
+            self._adjust(self._totals, key, delta)
+
+    @staticmethod
+    def _adjust(counter: Counter, key: tuple, delta: int) -> None:
+        value = counter[key] + delta
+        if value:
+            counter[key] = value
+        else:
+            del counter[key]
+
+    def _activate(self, alert: Any) -> None:
+        self._active[alert.alert_id] = alert
+        for name in self.fields:
+            self._active_by[name].setdefault(getattr(alert, name), {})[
+                alert.alert_id
+            ] = alert
+
+    def _deactivate(self, alert: Any) -> None:
+        del self._active[alert.alert_id]
+        for name in self.fields:
+            value = getattr(alert, name)
+            view = self._active_by[name][value]
+            del view[alert.alert_id]
+            if not view:
+                del self._active_by[name][value]
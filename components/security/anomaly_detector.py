@@ -5,6 +5,8 @@ Anomaly detection system for ICS simulator.
 Provides:
 - Behaviour baseline learning
 - Statistical anomaly detection
+- Change-point (slow drift) detection
+- Batched snapshot checking
 - Protocol anomaly detection
 - Process anomaly detection
 - Integration with IDS/SIEM systems
@@ -25,12 +27,17 @@ ICS-specific features:
 
 import asyncio
 import json
-import statistics
+import math
+import os
+import sys
 from collections import deque
+from collections.abc import Iterator, Mapping, MutableMapping
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
+from components.security.change_point import ChangePoint, create_detector
 from components.security.logging_system import (
     EventCategory,
     EventSeverity,
@@ -42,6 +49,14 @@ from components.state.system_state import SystemState
 from components.time.simulation_time import SimulationTime
 from config.config_loader import ConfigLoader
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 __all__ = [
     "AnomalyType",
     "AnomalySeverity",
@@ -50,6 +65,24 @@ __all__ = [
     "AnomalyDetector",
 ]
 
+# Version of the binary baseline file written by save_state()
+BASELINE_FILE_VERSION = 1
+
+# StatisticalBaseline fields stored per row, in column order
+_BASELINE_FIELDS = (
+    "mean",
+    "std",
+    "min_value",
+    "max_value",
+    "sample_count",
+    "learning_window",
+    "is_learned",
+    "_count",
+    "_mean",
+    "_m2",
+    "_since_renormalise",
+)
+
 # ----------------------------------------------------------------
 # Anomaly Classification
 # ----------------------------------------------------------------
@@ -66,6 +99,7 @@ class AnomalyType(Enum):
     COMMUNICATION = "communication"  # Network/comms anomaly
     ALARM_FLOOD = "alarm_flood"  # Excessive alarms
     CONTROL_LOGIC = "control_logic"  # Unexpected control behaviour
+    DRIFT = "drift"  # Sustained shift away from learned behaviour
 
 
 class AnomalySeverity(Enum):
@@ -91,9 +125,9 @@ ANOMALY_TO_EVENT_SEVERITY = {
 # ----------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AnomalyEvent:
-    """Detected anomaly event."""
+    """Detected anomaly event (immutable, slotted)."""
 
     timestamp: float  # Simulation time when detected
     anomaly_type: AnomalyType
@@ -116,6 +150,12 @@ class AnomalyEvent:
     # Additional data
     data: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        for name in ("device", "parameter"):
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -143,7 +183,15 @@ class AnomalyEvent:
 
 @dataclass
 class StatisticalBaseline:
-    """Statistical baseline for a parameter."""
+    """
+    Statistical baseline for a parameter.
+
+    Mean and standard deviation cover the most recent samples (up to
+    1000, or learning_window if larger). They are maintained with a
+    windowed Welford update: each sample is added and the evicted one
+    removed in O(1). The running figures are recomputed exactly once
+    per window of updates to shed floating-point drift.
+    """
 
     parameter: str
     device: str
@@ -162,25 +210,70 @@ class StatisticalBaseline:
     # History (for online learning)
     _values: deque = field(default_factory=lambda: deque(maxlen=1000))
 
+    # Running window statistics (Welford mean and sum of squared deviations)
+    _count: int = field(default=0, repr=False)
+    _mean: float = field(default=0.0, repr=False)
+    _m2: float = field(default=0.0, repr=False)
+    _since_renormalise: int = field(default=0, repr=False)
+
+    def __post_init__(self) -> None:
+        # A window larger than the history could never be learned
+        if self.learning_window > (self._values.maxlen or 0):
+            self._values = deque(self._values, maxlen=self.learning_window)
+
     def update(self, value: float) -> None:
         """Update baseline with new value."""
-        self._values.append(value)
+        values = self._values
+        if self._count != len(values):
+            # History was replaced from outside, resync running figures
+            self._renormalise()
+        if len(values) == values.maxlen:
+            self._remove(values[0])
+        values.append(value)
+        self._add(value)
         self.sample_count += 1
 
+        self._since_renormalise += 1
+        if self._since_renormalise >= values.maxlen:
+            self._renormalise()
+
         # Update min/max
         self.min_value = min(self.min_value, value)
         self.max_value = max(self.max_value, value)
 
-        # Recalculate statistics if enough samples
-        if len(self._values) >= min(100, self.learning_window):
-            self.mean = statistics.mean(self._values)
-            if len(self._values) > 1:
-                self.std = statistics.stdev(self._values)
+        # Publish statistics if enough samples
+        if self._count >= min(100, self.learning_window):
+            self.mean = self._mean
+            if self._count > 1:
+                self.std = math.sqrt(self._m2 / (self._count - 1))
 
             # Mark as learned when window is full
-            if len(self._values) >= self.learning_window:
+            if self._count >= self.learning_window:
                 self.is_learned = True
 
+    def _add(self, value: float) -> None:
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def _remove(self, value: float) -> None:
+        self._count -= 1
+        if self._count == 0:
+            self._mean = self._m2 = 0.0
+            return
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._m2 = max(0.0, self._m2 - delta * (value - self._mean))
+
+    def _renormalise(self) -> None:
+        """Recompute running figures exactly from the history."""
+        count = len(self._values)
+        self._count = count
+        self._mean = math.fsum(self._values) / count if count else 0.0
+        self._m2 = math.fsum((v - self._mean) ** 2 for v in self._values)
+        self._since_renormalise = 0
+
     def is_anomalous(self, value: float, sigma_threshold: float = 3.0) -> bool:
         """
         Check if value is anomalous (beyond sigma threshold).
@@ -213,6 +306,380 @@ class StatisticalBaseline:
         return abs(value - self.mean) / self.std
 
 
+# ----------------------------------------------------------------
+# Array-backed Detection State
+# ----------------------------------------------------------------
+
+
+class _ParameterTable:
+    """
+    Per-parameter detection state in NumPy arrays.
+
+    Every monitored (device, parameter) gets one index, and all of its
+    state sits at that index: range and rate-of-change limits, the last
+    value and time, presence masks, and the baseline's running window
+    statistics. A baseline's window is a ring buffer row of the 2-D
+    ``windows`` array. One dict lookup per snapshot value finds the index;
+    everything after that is array arithmetic over the whole snapshot.
+
+    The detector's public mappings (baselines, range_limits, roc_limits,
+    last_values, drift_detectors) are views onto this table.
+    """
+
+    def __init__(self) -> None:
+        self.index: dict[tuple[str, str], int] = {}
+        self.keys: list[tuple[str, str]] = []
+        self.baselines: list[StatisticalBaseline | None] = []
+        self.drift: list[dict[str, Any] | None] = []
+        self.to_object: set[int] = set()  # Baseline row newer than its object
+        self.to_row: set[int] = set()  # Baseline object newer than its row
+        self._allocate(16, 0)
+
+    def add(self, key: tuple[str, str]) -> int:
+        """Index of a parameter, adding it if new."""
+        index = self.index.get(key)
+        if index is None:
+            index = len(self.keys)
+            if index == len(self.has_baseline):
+                self._allocate(2 * index, self.windows.shape[1])
+            self.index[key] = index
+            self.keys.append(key)
+            self.baselines.append(None)
+            self.drift.append(None)
+        return index
+
+    # Baselines ------------------------------------------------------
+
+    def update_baselines(self, rows: Any, values: Any, sigma_threshold: float) -> Any:
+        """
+        Add one sample to each of several baselines.
+
+        Applies the windowed Welford update of StatisticalBaseline.update()
+        to every row at once (renormalisation sums with NumPy rather than
+        math.fsum, so it agrees with the object path to rounding).
+
+        Args:
+            rows: Parameter indices with a baseline (each at most once)
+            values: Sample per row
+            sigma_threshold: Anomaly threshold in standard deviations
+
+        Returns:
+            Boolean array, True where the sample is a statistical anomaly
+        """
+        for row in self.to_row:
+            self.push(row)
+        self.to_row.clear()
+
+        count = self.count[rows]
+        mean = self.running_mean[rows]
+        m2 = self.m2[rows]
+        capacity = self.capacity[rows]
+        head = self.head[rows]
+
+        # Evict the oldest sample from full windows
+        full = count == capacity
+        oldest = self.windows[rows, head]
+        remaining = count - full
+        delta = oldest - mean
+        evicted_mean = mean - delta / np.maximum(remaining, 1)
+        evicted_m2 = np.maximum(0.0, m2 - delta * (oldest - evicted_mean))
+        empty = remaining == 0
+        mean = np.where(full, np.where(empty, 0.0, evicted_mean), mean)
+        m2 = np.where(full, np.where(empty, 0.0, evicted_m2), m2)
+
+        # Add the new sample
+        count = remaining + 1
+        delta = values - mean
+        mean = mean + delta / count
+        m2 = m2 + delta * (values - mean)
+
+        self.windows[rows, head] = values
+        self.head[rows] = (head + 1) % capacity
+        self.count[rows] = count
+        self.running_mean[rows] = mean
+        self.m2[rows] = m2
+        self.sample_count[rows] += 1
+        self.since_renormalise[rows] += 1
+        self.min_value[rows] = np.minimum(self.min_value[rows], values)
+        self.max_value[rows] = np.maximum(self.max_value[rows], values)
+
+        stale = rows[self.since_renormalise[rows] >= capacity]
+        if len(stale):
+            self._renormalise(stale)
+
+        # Publish statistics once enough samples are in the window
+        count = self.count[rows]
+        learning_window = self.learning_window[rows]
+        publish = count >= np.minimum(100, learning_window)
+        published_mean = np.where(publish, self.running_mean[rows], self.mean[rows])
+        std = np.where(
+            publish & (count > 1),
+            np.sqrt(self.m2[rows] / np.maximum(count - 1, 1)),
+            self.std[rows],
+        )
+        learned = self.is_learned[rows] | (publish & (count >= learning_window))
+        self.mean[rows] = published_mean
+        self.std[rows] = std
+        self.is_learned[rows] = learned
+        self.to_object.update(rows.tolist())
+
+        return (
+            learned
+            & (std != 0)
+            & (np.abs(values - published_mean) > sigma_threshold * std)
+        )
+
+    def push(self, row: int) -> None:
+        """Load a baseline row from its StatisticalBaseline object."""
+        baseline = self.baselines[row]
+        assert baseline is not None
+        window = baseline._values
+        if baseline._count != len(window):
+            baseline._renormalise()
+        capacity = window.maxlen or len(window) or 1
+        if capacity > self.windows.shape[1]:
+            self._allocate(len(self.has_baseline), capacity)
+        self.windows[row, : len(window)] = window
+        self.head[row] = len(window) % capacity
+        self.capacity[row] = capacity
+        self.count[row] = baseline._count
+        self.running_mean[row] = baseline._mean
+        self.m2[row] = baseline._m2
+        self.since_renormalise[row] = baseline._since_renormalise
+        self.mean[row] = baseline.mean
+        self.std[row] = baseline.std
+        self.min_value[row] = baseline.min_value
+        self.max_value[row] = baseline.max_value
+        self.sample_count[row] = baseline.sample_count
+        self.learning_window[row] = baseline.learning_window
+        self.is_learned[row] = baseline.is_learned
+
+    def pull(self, row: int) -> None:
+        """Copy a baseline row's state back into its StatisticalBaseline."""
+        self.to_object.discard(row)
+        baseline = self.baselines[row]
+        assert baseline is not None
+        count = int(self.count[row])
+        capacity = int(self.capacity[row])
+        head = int(self.head[row])
+        window = self.windows[row]
+        if count == capacity:
+            ordered = np.concatenate((window[head:capacity], window[:head]))
+        else:
+            ordered = window[:count]
+        baseline._values = deque(ordered.tolist(), maxlen=capacity)
+        baseline._count = count
+        baseline._mean = float(self.running_mean[row])
+        baseline._m2 = float(self.m2[row])
+        baseline._since_renormalise = int(self.since_renormalise[row])
+        baseline.mean = float(self.mean[row])
+        baseline.std = float(self.std[row])
+        baseline.min_value = float(self.min_value[row])
+        baseline.max_value = float(self.max_value[row])
+        baseline.sample_count = int(self.sample_count[row])
+        baseline.is_learned = bool(self.is_learned[row])
+
+    # Internal helpers -----------------------------------------------
+
+    def _arrays(self) -> dict[str, Any]:
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if isinstance(value, np.ndarray)
+        }
+
+    def _allocate(self, rows: int, columns: int) -> None:
+        """(Re)allocate arrays for rows x window columns, keeping contents."""
+        old = self._arrays()
+        # Presence masks
+        self.has_baseline = np.zeros(rows, dtype=bool)
+        self.has_range = np.zeros(rows, dtype=bool)
+        self.has_roc = np.zeros(rows, dtype=bool)
+        self.has_last = np.zeros(rows, dtype=bool)
+        self.has_drift = np.zeros(rows, dtype=bool)
+        # Limits and last values
+        self.low = np.zeros(rows)
+        self.high = np.zeros(rows)
+        self.max_rate = np.zeros(rows)
+        self.last_value = np.zeros(rows)
+        self.last_time = np.zeros(rows)
+        # Baseline statistics
+        self.mean = np.zeros(rows)
+        self.std = np.zeros(rows)
+        self.min_value = np.full(rows, np.inf)
+        self.max_value = np.full(rows, -np.inf)
+        self.sample_count = np.zeros(rows, dtype=np.int64)
+        self.learning_window = np.ones(rows, dtype=np.int64)
+        self.is_learned = np.zeros(rows, dtype=bool)
+        self.count = np.zeros(rows, dtype=np.int64)
+        self.running_mean = np.zeros(rows)
+        self.m2 = np.zeros(rows)
+        self.since_renormalise = np.zeros(rows, dtype=np.int64)
+        self.capacity = np.ones(rows, dtype=np.int64)
+        self.head = np.zeros(rows, dtype=np.int64)
+        self.windows = np.zeros((rows, columns))
+
+        used = len(self.keys)
+        for name, previous in old.items():
+            array = getattr(self, name)
+            if array.ndim == 2:
+                array[:used, : previous.shape[1]] = previous[:used]
+            else:
+                array[:used] = previous[:used]
+
+    def _renormalise(self, rows: Any) -> None:
+        """Recompute running figures from the windows' contents."""
+        count = self.count[rows]
+        window = self.windows[rows]
+        in_window = np.arange(window.shape[1]) < count[:, None]
+        mean = np.where(in_window, window, 0.0).sum(axis=1) / np.maximum(count, 1)
+        deviation = np.where(in_window, window - mean[:, None], 0.0)
+        self.running_mean[rows] = mean
+        self.m2[rows] = (deviation * deviation).sum(axis=1)
+        self.since_renormalise[rows] = 0
+
+
+class _TableView(MutableMapping[tuple[str, str], Any]):
+    """Dict-like view of one kind of state in a _ParameterTable."""
+
+    def __init__(self, table: _ParameterTable, mask: str) -> None:
+        self._table = table
+        self._mask_name = mask
+
+    @property
+    def mask(self) -> Any:
+        # Arrays are replaced when the table grows
+        return getattr(self._table, self._mask_name)
+
+    def _get(self, index: int) -> Any:
+        raise NotImplementedError
+
+    def _set(self, index: int, value: Any) -> None:
+        raise NotImplementedError
+
+    def __getitem__(self, key: tuple[str, str]) -> Any:
+        index = self._table.index.get(key)
+        if index is None or not self.mask[index]:
+            raise KeyError(key)
+        return self._get(index)
+
+    def __setitem__(self, key: tuple[str, str], value: Any) -> None:
+        index = self._table.add(key)
+        self._set(index, value)
+        self.mask[index] = True
+
+    def __delitem__(self, key: tuple[str, str]) -> None:
+        index = self._table.index.get(key)
+        if index is None or not self.mask[index]:
+            raise KeyError(key)
+        self.mask[index] = False
+
+    def __contains__(self, key: object) -> bool:
+        index = self._table.index.get(key)  # type: ignore[call-overload]
+        return index is not None and bool(self.mask[index])
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        keys = self._table.keys
+        return iter([keys[i] for i in np.flatnonzero(self.mask[: len(keys)])])
+
+    def __len__(self) -> int:
+        return int(self.mask[: len(self._table.keys)].sum())
+
+
+class _RangeView(_TableView):
+    """range_limits: key -> (min_value, max_value)."""
+
+    def __init__(self, table: _ParameterTable) -> None:
+        super().__init__(table, "has_range")
+
+    def _get(self, index: int) -> tuple[float, float]:
+        return float(self._table.low[index]), float(self._table.high[index])
+
+    def _set(self, index: int, value: tuple[float, float]) -> None:
+        self._table.low[index], self._table.high[index] = value
+
+
+class _RateView(_TableView):
+    """roc_limits: key -> max_rate."""
+
+    def __init__(self, table: _ParameterTable) -> None:
+        super().__init__(table, "has_roc")
+
+    def _get(self, index: int) -> float:
+        return float(self._table.max_rate[index])
+
+    def _set(self, index: int, value: float) -> None:
+        self._table.max_rate[index] = value
+
+
+class _LastValueView(_TableView):
+    """last_values: key -> (value, timestamp)."""
+
+    def __init__(self, table: _ParameterTable) -> None:
+        super().__init__(table, "has_last")
+
+    def _get(self, index: int) -> tuple[float, float]:
+        return float(self._table.last_value[index]), float(self._table.last_time[index])
+
+    def _set(self, index: int, value: tuple[float, float]) -> None:
+        self._table.last_value[index], self._table.last_time[index] = value
+
+
+class _DriftView(_TableView):
+    """drift_detectors: key -> {method: detector}."""
+
+    def __init__(self, table: _ParameterTable) -> None:
+        super().__init__(table, "has_drift")
+
+    def _get(self, index: int) -> dict[str, Any]:
+        detectors = self._table.drift[index]
+        assert detectors is not None
+        return detectors
+
+    def _set(self, index: int, value: dict[str, Any]) -> None:
+        self._table.drift[index] = value
+
+    def __delitem__(self, key: tuple[str, str]) -> None:
+        super().__delitem__(key)
+        self._table.drift[self._table.index[key]] = None
+
+
+class _BaselineView(_TableView):
+    """
+    baselines: key -> StatisticalBaseline.
+
+    Objects and rows are synced lazily: an object is refreshed from its
+    row when looked up after a vectorised update, and a row is reloaded
+    from its object before the next update once the object has been
+    handed out (and so may have been changed by check_value()).
+    """
+
+    def __init__(self, table: _ParameterTable) -> None:
+        super().__init__(table, "has_baseline")
+
+    def _get(self, index: int) -> StatisticalBaseline:
+        table = self._table
+        if index in table.to_object:
+            table.pull(index)
+        table.to_row.add(index)
+        baseline = table.baselines[index]
+        assert baseline is not None
+        return baseline
+
+    def _set(self, index: int, value: StatisticalBaseline) -> None:
+        table = self._table
+        table.baselines[index] = value
+        table.to_object.discard(index)
+        table.to_row.add(index)
+
+    def __delitem__(self, key: tuple[str, str]) -> None:
+        super().__delitem__(key)
+        index = self._table.index[key]
+        self._table.baselines[index] = None
+        self._table.to_object.discard(index)
+        self._table.to_row.discard(index)
+
+
 # ----------------------------------------------------------------
 # Anomaly Detector
 # ----------------------------------------------------------------
@@ -251,22 +718,39 @@ class AnomalyDetector:
         self.config = ConfigLoader().load_all()
         self._load_config()
 
-        # Baselines (protected by _lock)
-        self.baselines: dict[tuple[str, str], StatisticalBaseline] = {}
+        # Per-parameter state (protected by _lock). With NumPy it lives in
+        # one array table and the mappings below are views onto it, so
+        # check_batch() runs as a single vectorised pass
+        self._table = _ParameterTable() if NUMPY_AVAILABLE else None
+        table = self._table
+
+        # Baselines
+        self.baselines: MutableMapping[tuple[str, str], StatisticalBaseline] = (
+            _BaselineView(table) if table is not None else {}
+        )
 
         # Anomaly history
         self.anomalies: deque[AnomalyEvent] = deque(maxlen=10000)
 
         # Range limits (from configuration)
-        self.range_limits: dict[tuple[str, str], tuple[float, float]] = {}
+        self.range_limits: MutableMapping[tuple[str, str], tuple[float, float]] = (
+            _RangeView(table) if table is not None else {}
+        )
 
         # Rate of change limits
-        self.roc_limits: dict[tuple[str, str], float] = {}
+        self.roc_limits: MutableMapping[tuple[str, str], float] = (
+            _RateView(table) if table is not None else {}
+        )
+
+        # Change-point detectors: key -> {method: detector}
+        self.drift_detectors: MutableMapping[tuple[str, str], dict[str, Any]] = (
+            _DriftView(table) if table is not None else {}
+        )
 
-        # Last values (for rate of change detection)
-        self.last_values: dict[tuple[str, str], tuple[float, float]] = (
-            {}
-        )  # (value, timestamp)
+        # Last values (for rate of change detection): key -> (value, timestamp)
+        self.last_values: MutableMapping[tuple[str, str], tuple[float, float]] = (
+            _LastValueView(table) if table is not None else {}
+        )
 
         # Alarm flood detection
         self.alarm_counts: dict[str, deque] = {}  # device -> timestamps
@@ -277,6 +761,16 @@ class AnomalyDetector:
         # Detection enabled flag
         self.enabled = True
 
+        # Warm start from saved state, so detection is live from the first tick
+        if self.baseline_file is not None and self.baseline_file.exists():
+            try:
+                count = self._read_state(self.baseline_file)
+                self.logger.info(f"Loaded {count} baselines from {self.baseline_file}")
+            except (OSError, ValueError, KeyError, RuntimeError) as e:
+                self.logger.warning(
+                    f"Could not load baselines from {self.baseline_file}: {e}"
+                )
+
         self.logger.info("AnomalyDetector initialised")
 
     def _load_config(self) -> None:
@@ -296,6 +790,10 @@ class AnomalyDetector:
         # Enable/disable
         self.enabled = anomaly_cfg.get("enabled", True)
 
+        # Binary baseline state (warm start), loaded at startup if present
+        baseline_file = self.config.get("anomaly_detection", {}).get("baseline_file")
+        self.baseline_file = Path(baseline_file) if baseline_file else None
+
     async def _log_anomaly(self, anomaly: AnomalyEvent) -> None:
         """Log anomaly to ICS logging system."""
         event_severity = ANOMALY_TO_EVENT_SEVERITY.get(
@@ -390,6 +888,34 @@ class AnomalyDetector:
             f"Set rate-of-change limit for {device}:{parameter}: {max_rate}/s"
         )
 
+    async def add_drift_detector(
+        self,
+        device: str,
+        parameter: str,
+        method: str = "cusum",
+        **params: float,
+    ) -> None:
+        """
+        Add a streaming change-point detector for a parameter.
+
+        Catches slow drifts that a re-learning baseline absorbs. Adding a
+        method the parameter already has replaces (and restarts) it.
+
+        Args:
+            device: Device name
+            parameter: Parameter name
+            method: "cusum", "ewma" or "page_hinkley"
+            **params: Detector parameters (see components.security.change_point)
+
+        Raises:
+            ValueError: If the method is unknown
+        """
+        detector = create_detector(method, **params)
+        key = (device, parameter)
+        async with self._lock:
+            self.drift_detectors.setdefault(key, {})[method] = detector
+        self.logger.debug(f"Added {method} drift detection for {device}:{parameter}")
+
     # ----------------------------------------------------------------
     # Anomaly Detection Methods
     # ----------------------------------------------------------------
@@ -414,123 +940,59 @@ class AnomalyDetector:
         if not self.enabled:
             return []
 
-        anomalies = []
         key = (device, parameter)
         current_time = self.sim_time.now()
 
         async with self._lock:
-            # 1. Statistical anomaly detection
-            if key in self.baselines:
-                baseline = self.baselines[key]
+            anomalies = self._check_one(key, value, current_time)
+            self.anomalies.extend(anomalies)
+
+        # Log anomalies outside the lock
+        for anomaly in anomalies:
+            await self._log_anomaly(anomaly)
 
-                # Update baseline
-                baseline.update(value)
+        return anomalies
 
-                # Check for anomaly (only if learned)
-                if baseline.is_learned and baseline.is_anomalous(
-                    value, self.sigma_threshold
-                ):
-                    deviation = baseline.get_deviation_magnitude(value)
-
-                    # Determine severity based on deviation magnitude
-                    if deviation > 6.0:
-                        severity = AnomalySeverity.CRITICAL
-                    elif deviation > 4.0:
-                        severity = AnomalySeverity.HIGH
-                    elif deviation > 3.0:
-                        severity = AnomalySeverity.MEDIUM
-                    else:
-                        severity = AnomalySeverity.LOW
-
-                    anomaly = AnomalyEvent(
-                        timestamp=current_time,
-                        anomaly_type=AnomalyType.STATISTICAL,
-                        severity=severity,
-                        device=device,
-                        parameter=parameter,
-                        observed_value=value,
-                        expected_value=baseline.mean,
-                        baseline_mean=baseline.mean,
-                        baseline_std=baseline.std,
-                        deviation_magnitude=deviation,
-                        description=f"{parameter} = {value:.2f} is {deviation:.1f}σ from baseline mean {baseline.mean:.2f}",
-                    )
-                    anomalies.append(anomaly)
-
-            # 2. Range violation detection
-            if key in self.range_limits:
-                min_val, max_val = self.range_limits[key]
-
-                if value < min_val or value > max_val:
-                    # Determine severity based on how far outside range
-                    range_span = max_val - min_val
-                    if value < min_val:
-                        violation = (min_val - value) / range_span
-                    else:
-                        violation = (value - max_val) / range_span
-
-                    if violation > 0.5:
-                        severity = AnomalySeverity.CRITICAL
-                    elif violation > 0.2:
-                        severity = AnomalySeverity.HIGH
-                    elif violation > 0.1:
-                        severity = AnomalySeverity.MEDIUM
-                    else:
-                        severity = AnomalySeverity.LOW
-
-                    anomaly = AnomalyEvent(
-                        timestamp=current_time,
-                        anomaly_type=AnomalyType.RANGE,
-                        severity=severity,
-                        device=device,
-                        parameter=parameter,
-                        observed_value=value,
-                        expected_value=None,
-                        description=f"{parameter} = {value:.2f} outside allowed range [{min_val:.2f}, {max_val:.2f}]",
-                        data={"min_limit": min_val, "max_limit": max_val},
-                    )
-                    anomalies.append(anomaly)
-
-            # 3. Rate of change detection
-            if key in self.roc_limits:
-                if key in self.last_values:
-                    last_value, last_time = self.last_values[key]
-                    time_delta = current_time - last_time
-
-                    if time_delta > 0:
-                        rate = abs(value - last_value) / time_delta
-                        max_rate = self.roc_limits[key]
-
-                        if rate > max_rate:
-                            severity = (
-                                AnomalySeverity.HIGH
-                                if rate > (max_rate * 2)
-                                else AnomalySeverity.MEDIUM
-                            )
+    async def check_batch(
+        self,
+        snapshot: Mapping[str, Mapping[str, Any]],
+    ) -> list[AnomalyEvent]:
+        """
+        Check a whole telemetry snapshot in one pass.
 
-                            anomaly = AnomalyEvent(
-                                timestamp=current_time,
-                                anomaly_type=AnomalyType.RATE_OF_CHANGE,
-                                severity=severity,
-                                device=device,
-                                parameter=parameter,
-                                observed_value=value,
-                                expected_value=None,
-                                description=f"{parameter} rate of change {rate:.2f}/s exceeds limit {max_rate:.2f}/s",
-                                data={
-                                    "rate": rate,
-                                    "max_rate": max_rate,
-                                    "time_delta": time_delta,
-                                },
-                            )
-                            anomalies.append(anomaly)
+        Equivalent to calling check_value() for every numeric value that has
+        a baseline, range limit or rate-of-change limit, but takes the lock
+        once for the whole snapshot. With NumPy, baseline updates and the
+        statistical, range and rate-of-change tests run as one vectorised
+        pass over the snapshot; only values that trip a test (and drift
+        detectors, which keep per-parameter state) are handled one by one.
 
-                # Update last value
-                self.last_values[key] = (value, current_time)
+        Args:
+            snapshot: device -> {parameter: value}, e.g. bulk_read_memory()
+                results keyed by device name. Non-numeric values are skipped.
 
-            # Store anomalies
-            for anomaly in anomalies:
-                self.anomalies.append(anomaly)
+        Returns:
+            List of detected anomalies, grouped by parameter in snapshot order
+        """
+        if not self.enabled:
+            return []
+
+        current_time = self.sim_time.now()
+
+        async with self._lock:
+            if self._table is not None:
+                anomalies = self._check_vectorised(self._table, snapshot, current_time)
+            else:
+                anomalies = [
+                    anomaly
+                    for device, values in snapshot.items()
+                    for parameter, value in values.items()
+                    if isinstance(value, int | float) and not isinstance(value, bool)
+                    for anomaly in self._check_one(
+                        (device, parameter), float(value), current_time
+                    )
+                ]
+            self.anomalies.extend(anomalies)
 
         # Log anomalies outside the lock
         for anomaly in anomalies:
@@ -538,6 +1000,280 @@ class AnomalyDetector:
 
         return anomalies
 
+    def _check_vectorised(
+        self,
+        table: _ParameterTable,
+        snapshot: Mapping[str, Mapping[str, Any]],
+        current_time: float,
+    ) -> list[AnomalyEvent]:
+        """Run all detection methods over a snapshot (caller holds the lock)."""
+        # One dict lookup per value; everything else is array arithmetic
+        index_of = table.index
+        keys, found, readings = [], [], []
+        for device, parameters in snapshot.items():
+            for parameter, value in parameters.items():
+                if isinstance(value, int | float) and not isinstance(value, bool):
+                    index = index_of.get((device, parameter))
+                    if index is not None:
+                        keys.append((device, parameter))
+                        found.append(index)
+                        readings.append(value)
+        if not found:
+            return []
+
+        rows = np.array(found)
+        values = np.array(readings, dtype=float)
+        has_baseline = table.has_baseline[rows]
+        has_range = table.has_range[rows]
+        has_roc = table.has_roc[rows]
+        has_drift = table.has_drift[rows]
+
+        # 1. Statistical: one windowed update of every baseline in the batch
+        statistical = np.zeros(len(rows), dtype=bool)
+        if has_baseline.any():
+            statistical[has_baseline] = table.update_baselines(
+                rows[has_baseline], values[has_baseline], self.sigma_threshold
+            )
+
+        # 2. Range violations
+        out_of_range = has_range & (
+            (values < table.low[rows]) | (values > table.high[rows])
+        )
+
+        # 3. Rate of change against the previous value, then record this one
+        time_delta = current_time - table.last_time[rows]
+        moving = has_roc & table.has_last[rows] & (time_delta > 0)
+        rate = np.abs(values - table.last_value[rows]) / np.where(
+            moving, time_delta, 1.0
+        )
+        too_fast = moving & (rate > table.max_rate[rows])
+        rate_rows = rows[has_roc]
+        table.last_value[rate_rows] = values[has_roc]
+        table.last_time[rate_rows] = current_time
+        table.has_last[rate_rows] = True
+
+        # Events, in the same order check_value() produces them
+        anomalies = []
+        for i in np.flatnonzero(statistical | out_of_range | too_fast | has_drift):
+            key, value, row = keys[i], float(values[i]), rows[i]
+            if statistical[i]:
+                anomalies.append(
+                    self._statistical_anomaly(
+                        key,
+                        value,
+                        float(table.mean[row]),
+                        float(table.std[row]),
+                        current_time,
+                    )
+                )
+            if out_of_range[i]:
+                anomalies.append(self._range_anomaly(key, value, current_time))
+            if too_fast[i]:
+                anomalies.append(
+                    self._roc_anomaly(
+                        key,
+                        value,
+                        float(rate[i]),
+                        float(time_delta[i]),
+                        current_time,
+                    )
+                )
+            for method, detector in (table.drift[row] or {}).items():
+                change = detector.update(value)
+                if change is not None:
+                    anomalies.append(
+                        self._drift_anomaly(key, value, method, change, current_time)
+                    )
+
+        return anomalies
+
+    def _check_one(
+        self, key: tuple[str, str], value: float, current_time: float
+    ) -> list[AnomalyEvent]:
+        """Run all detection methods for one value (caller holds the lock)."""
+        anomalies = []
+
+        # 1. Statistical anomaly detection
+        baseline = self.baselines.get(key)
+        if baseline is not None:
+            baseline.update(value)
+
+            # Check for anomaly (only if learned)
+            if baseline.is_learned and baseline.is_anomalous(
+                value, self.sigma_threshold
+            ):
+                anomalies.append(
+                    self._statistical_anomaly(
+                        key, value, baseline.mean, baseline.std, current_time
+                    )
+                )
+
+        # 2. Range violation detection
+        if key in self.range_limits:
+            min_val, max_val = self.range_limits[key]
+            if value < min_val or value > max_val:
+                anomalies.append(self._range_anomaly(key, value, current_time))
+
+        # 3. Rate of change detection
+        if key in self.roc_limits:
+            if key in self.last_values:
+                last_value, last_time = self.last_values[key]
+                time_delta = current_time - last_time
+
+                if time_delta > 0:
+                    rate = abs(value - last_value) / time_delta
+                    if rate > self.roc_limits[key]:
+                        anomalies.append(
+                            self._roc_anomaly(
+                                key, value, rate, time_delta, current_time
+                            )
+                        )
+
+            # Update last value
+            self.last_values[key] = (value, current_time)
+
+        # 4. Change-point (drift) detection
+        for method, detector in self.drift_detectors.get(key, {}).items():
+            change = detector.update(value)
+            if change is not None:
+                anomalies.append(
+                    self._drift_anomaly(key, value, method, change, current_time)
+                )
+
+        return anomalies
+
+    def _drift_anomaly(
+        self,
+        key: tuple[str, str],
+        value: float,
+        method: str,
+        change: ChangePoint,
+        current_time: float,
+    ) -> AnomalyEvent:
+        device, parameter = key
+        severity = (
+            AnomalySeverity.HIGH
+            if change.statistic > (change.threshold * 2)
+            else AnomalySeverity.MEDIUM
+        )
+
+        return AnomalyEvent(
+            timestamp=current_time,
+            anomaly_type=AnomalyType.DRIFT,
+            severity=severity,
+            device=device,
+            parameter=parameter,
+            observed_value=value,
+            expected_value=change.reference,
+            baseline_mean=change.reference,
+            description=f"{parameter} drifting {change.direction} from {change.reference:.2f} ({method} {change.statistic:.2f} > {change.threshold:.2f})",
+            data={
+                "method": method,
+                "direction": change.direction,
+                "statistic": change.statistic,
+                "threshold": change.threshold,
+            },
+        )
+
+    def _statistical_anomaly(
+        self,
+        key: tuple[str, str],
+        value: float,
+        mean: float,
+        std: float,
+        current_time: float,
+    ) -> AnomalyEvent:
+        device, parameter = key
+        deviation = abs(value - mean) / std if std else 0.0
+
+        # Determine severity based on deviation magnitude
+        if deviation > 6.0:
+            severity = AnomalySeverity.CRITICAL
+        elif deviation > 4.0:
+            severity = AnomalySeverity.HIGH
+        elif deviation > 3.0:
+            severity = AnomalySeverity.MEDIUM
+        else:
+            severity = AnomalySeverity.LOW
+
+        return AnomalyEvent(
+            timestamp=current_time,
+            anomaly_type=AnomalyType.STATISTICAL,
+            severity=severity,
+            device=device,
+            parameter=parameter,
+            observed_value=value,
+            expected_value=mean,
+            baseline_mean=mean,
+            baseline_std=std,
+            deviation_magnitude=deviation,
+            description=f"{parameter} = {value:.2f} is {deviation:.1f}σ from baseline mean {mean:.2f}",
+        )
+
+    def _range_anomaly(
+        self, key: tuple[str, str], value: float, current_time: float
+    ) -> AnomalyEvent:
+        device, parameter = key
+        min_val, max_val = self.range_limits[key]
+
+        # Determine severity based on how far outside range
+        range_span = max_val - min_val
+        if value < min_val:
+            violation = (min_val - value) / range_span
+        else:
+            violation = (value - max_val) / range_span
+
+        if violation > 0.5:
+            severity = AnomalySeverity.CRITICAL
+        elif violation > 0.2:
+            severity = AnomalySeverity.HIGH
+        elif violation > 0.1:
+            severity = AnomalySeverity.MEDIUM
+        else:
+            severity = AnomalySeverity.LOW
+
+        return AnomalyEvent(
+            timestamp=current_time,
+            anomaly_type=AnomalyType.RANGE,
+            severity=severity,
+            device=device,
+            parameter=parameter,
+            observed_value=value,
+            expected_value=None,
+            description=f"{parameter} = {value:.2f} outside allowed range [{min_val:.2f}, {max_val:.2f}]",
+            data={"min_limit": min_val, "max_limit": max_val},
+        )
+
+    def _roc_anomaly(
+        self,
+        key: tuple[str, str],
+        value: float,
+        rate: float,
+        time_delta: float,
+        current_time: float,
+    ) -> AnomalyEvent:
+        device, parameter = key
+        max_rate = self.roc_limits[key]
+        severity = (
+            AnomalySeverity.HIGH if rate > (max_rate * 2) else AnomalySeverity.MEDIUM
+        )
+
+        return AnomalyEvent(
+            timestamp=current_time,
+            anomaly_type=AnomalyType.RATE_OF_CHANGE,
+            severity=severity,
+            device=device,
+            parameter=parameter,
+            observed_value=value,
+            expected_value=None,
+            description=f"{parameter} rate of change {rate:.2f}/s exceeds limit {max_rate:.2f}/s",
+            data={
+                "rate": rate,
+                "max_rate": max_rate,
+                "time_delta": time_delta,
+            },
+        )
+
     async def check_alarm_flood(self, device: str) -> AnomalyEvent | None:
         """
         Check for alarm flooding on a device.
@@ -695,6 +1431,9 @@ class AnomalyDetector:
                     1 for b in self.baselines.values() if b.is_learned
                 ),
                 "total_baselines": len(self.baselines),
+                "drift_detectors": sum(
+                    len(methods) for methods in self.drift_detectors.values()
+                ),
             }
 
     async def clear_anomalies(self) -> int:
@@ -752,3 +1491,196 @@ class AnomalyDetector:
         )
 
         self.logger.info(f"Stored {len(baselines_data)} baselines to DataStore")
+
+    # ----------------------------------------------------------------
+    # Baseline Persistence (binary)
+    # ----------------------------------------------------------------
+
+    async def save_state(self, path: str | Path | None = None) -> Path:
+        """
+        Save full detection state to a NumPy .npz file.
+
+        Stores each baseline's window contents and running statistics,
+        change-point detector state, and range and rate-of-change limits,
+        so a restarted detector resumes without re-learning.
+
+        Args:
+            path: Target file (None = configured baseline_file)
+
+        Returns:
+            Path written
+
+        Raises:
+            ValueError: If no path is given or configured
+            RuntimeError: If NumPy is not installed
+        """
+        path = Path(path) if path is not None else self.baseline_file
+        if path is None:
+            raise ValueError("No baseline file configured")
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for baseline persistence")
+
+        async with self._lock:
+            arrays = self._state_arrays()
+
+        # Write then rename so a crash never leaves a truncated file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+        self.logger.info(f"Saved {len(self.baselines)} baselines to {path}")
+        return path
+
+    async def load_state(self, path: str | Path | None = None) -> int:
+        """
+        Load detection state saved by save_state().
+
+        Entries in the file replace existing ones for the same parameter;
+        other parameters are left alone.
+
+        Args:
+            path: Source file (None = configured baseline_file)
+
+        Returns:
+            Number of baselines loaded
+
+        Raises:
+            ValueError: If no path is given or the file version is unsupported
+            RuntimeError: If NumPy is not installed
+        """
+        path = Path(path) if path is not None else self.baseline_file
+        if path is None:
+            raise ValueError("No baseline file configured")
+
+        async with self._lock:
+            count = self._read_state(path)
+
+        self.logger.info(f"Loaded {count} baselines from {path}")
+        return count
+
+    def _state_arrays(self) -> dict[str, Any]:
+        """Flatten detection state into named arrays (caller holds the lock)."""
+        arrays: dict[str, Any] = {
+            "format_version": np.array(BASELINE_FILE_VERSION),
+        }
+
+        def table(
+            prefix: str, keys: list[tuple[str, str]], fields: tuple, rows: list
+        ) -> None:
+            arrays[f"{prefix}_device"] = np.array([d for d, _ in keys], dtype=str)
+            arrays[f"{prefix}_parameter"] = np.array([p for _, p in keys], dtype=str)
+            arrays[f"{prefix}_fields"] = np.array(fields, dtype=str)
+            arrays[f"{prefix}_data"] = np.array(rows, dtype=float).reshape(
+                len(keys), len(fields)
+            )
+
+        # Baselines: scalar state per row, window contents as one flat array
+        keys = list(self.baselines)
+        baselines = [self.baselines[key] for key in keys]
+        table(
+            "baseline",
+            keys,
+            _BASELINE_FIELDS + ("window",),
+            [
+                [float(getattr(b, name)) for name in _BASELINE_FIELDS]
+                + [b._values.maxlen]
+                for b in baselines
+            ],
+        )
+        lengths = [len(b._values) for b in baselines]
+        arrays["baseline_offsets"] = np.cumsum([0] + lengths)
+        arrays["baseline_values"] = np.fromiter(
+            (v for b in baselines for v in b._values), float, sum(lengths)
+        )
+
+        table(
+            "range",
+            list(self.range_limits),
+            ("min_value", "max_value"),
+            list(self.range_limits.values()),
+        )
+        table(
+            "roc",
+            list(self.roc_limits),
+            ("max_rate",),
+            [[rate] for rate in self.roc_limits.values()],
+        )
+
+        # Change-point detectors: one table per method, columns = slots
+        by_method: dict[str, list[tuple[tuple[str, str], Any]]] = {}
+        for key, detectors in self.drift_detectors.items():
+            for method, detector in detectors.items():
+                by_method.setdefault(method, []).append((key, detector))
+        arrays["drift_methods"] = np.array(sorted(by_method), dtype=str)
+        for method, entries in by_method.items():
+            fields = _slot_names(entries[0][1])
+            table(
+                f"drift_{method}",
+                [key for key, _ in entries],
+                fields,
+                [[float(getattr(d, name)) for name in fields] for _, d in entries],
+            )
+
+        return arrays
+
+    def _read_state(self, path: Path) -> int:
+        """Restore state from a saved file (caller holds the lock)."""
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for baseline persistence")
+
+        with np.load(path, allow_pickle=False) as data:
+            version = int(data["format_version"])
+            if version != BASELINE_FILE_VERSION:
+                raise ValueError(f"Unsupported baseline file version {version}")
+
+            def rows(prefix: str) -> Any:
+                fields = data[f"{prefix}_fields"].tolist()
+                for device, parameter, row in zip(
+                    data[f"{prefix}_device"].tolist(),
+                    data[f"{prefix}_parameter"].tolist(),
+                    data[f"{prefix}_data"].tolist(),
+                    strict=True,
+                ):
+                    yield (device, parameter), dict(zip(fields, row, strict=True))
+
+            offsets = data["baseline_offsets"].tolist()
+            values = data["baseline_values"]
+            count = 0
+            for index, (key, state) in enumerate(rows("baseline")):
+                window = values[offsets[index] : offsets[index + 1]].tolist()
+                baseline = StatisticalBaseline(
+                    parameter=key[1],
+                    device=key[0],
+                    learning_window=int(state["learning_window"]),
+                    _values=deque(window, maxlen=int(state["window"])),
+                )
+                for name in _BASELINE_FIELDS:
+                    default = getattr(baseline, name)
+                    setattr(baseline, name, type(default)(state[name]))
+                self.baselines[key] = baseline
+                count += 1
+
+            for key, state in rows("range"):
+                self.range_limits[key] = (state["min_value"], state["max_value"])
+            for key, state in rows("roc"):
+                self.roc_limits[key] = state["max_rate"]
+
+            for method in data["drift_methods"].tolist():
+                for key, state in rows(f"drift_{method}"):
+                    detector = create_detector(method)
+                    for name, value in state.items():
+                        setattr(detector, name, type(getattr(detector, name))(value))
+                    self.drift_detectors.setdefault(key, {})[method] = detector
+
+        return count
+
+
+def _slot_names(obj: Any) -> tuple[str, ...]:
+    """All __slots__ attributes of an object, base classes first."""
+    return tuple(
+        name
+        for cls in reversed(type(obj).__mro__)
+        for name in getattr(cls, "__slots__", ())
+    )
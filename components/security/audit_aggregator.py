@@ -0,0 +1,286 @@
+# components/security/audit_aggregator.py
+"""
+Audit event aggregation and storm suppression.
+
+A Modbus write flood or a port scan produces thousands of near-identical
+audit events per second (one per write, block or denial). Storing,
+serialising and analysing each of them makes the cost of an attack grow
+with its intensity. AuditAggregator coalesces repeats instead:
+
+- Events are grouped by (device, category, message template, user,
+  source IP, key data fields). The template is the message with numbers masked, so
+  "Memory write: holding_registers[0] = 42" and "... = 43" repeat.
+- The first event of a group passes through. Repeats inside ``window``
+  seconds are counted, and one summary record is emitted when the window
+  closes, carrying ``count`` (events it stands for), ``first_seen`` and
+  ``last_seen``. Records without ``count`` stand for one event. Its
+  ``simulation_time`` is when it was emitted, so readers polling the log
+  by time still see it.
+- Optional per-category token buckets cap how many events per second
+  pass through; events over the limit are counted into their group's
+  summary rather than dropped.
+
+Every event is still accounted for: a storm costs one record per group
+per window plus the counts.
+"""
+
+import json
+import re
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Mapping
+from typing import Any
+
+__all__ = ["AuditAggregator", "TokenBucket", "message_template"]
+
+DEFAULT_KEY_FIELDS = (
+    "address",
+    "source_ip",
+    "source_network",
+    "port",
+    "rule_id",
+    "action",
+    "result",
+)
+
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+
+def message_template(message: str) -> str:
+    """Message with numeric literals masked, e.g. "write [#] = #"."""
+    return _NUMBER.sub("#", message)
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter on simulation time.
+
+    Example:
+        >>> bucket = TokenBucket(rate=1.0, burst=2)
+        >>> [bucket.take(0.0) for _ in range(3)]
+        [True, True, False]
+        >>> bucket.take(1.0)
+        True
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float):
+        """
+        Initialise full bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+
+        Raises:
+            ValueError: If rate or burst is not positive
+        """
+        if rate <= 0 or burst <= 0:
+            raise ValueError("rate and burst must be positive")
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated: float | None = None
+
+    def take(self, now: float) -> bool:
+        """Take one token at time now; False if the bucket is empty."""
+        if self.updated is not None and now > self.updated:
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+        if self.updated is None or now > self.updated:
+            self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class _Group:
+    """Repeats of one event key within the current window."""
+
+    __slots__ = ("first_seen", "last_seen", "suppressed", "suppressed_since", "last")
+
+    def __init__(self, now: float):
+        self.first_seen = now
+        self.last_seen = now
+        self.suppressed = 0  # Repeats not passed through
+        self.suppressed_since = now
+        self.last: dict[str, Any] | None = None  # Latest suppressed event
+
+
+class AuditAggregator:
+    """
+    Coalesce repeated audit events into counted summary records.
+
+    Example:
+        >>> aggregator = AuditAggregator(window=5.0)
+        >>> len(aggregator.offer({"simulation_time": 0.0, "message": "write 1"}))
+        1
+        >>> aggregator.offer({"simulation_time": 1.0, "message": "write 2"})
+        []
+        >>> aggregator.flush()[0]["count"]
+        1
+    """
+
+    def __init__(
+        self,
+        window: float = 5.0,
+        key_fields: Iterable[str] = DEFAULT_KEY_FIELDS,
+        rate_limits: Mapping[str, Mapping[str, float]] | None = None,
+        max_groups: int = 10000,
+    ):
+        """
+        Initialise aggregator.
+
+        Args:
+            window: Seconds of simulation time repeats are coalesced over
+            key_fields: ``data`` fields that distinguish otherwise equal events
+            rate_limits: category -> {"rate": events/s, "burst": events}
+            max_groups: Open groups kept before the oldest is closed early
+
+        Raises:
+            ValueError: If a setting is invalid
+        """
+        if window < 0 or max_groups < 1:
+            raise ValueError("window must be >= 0 and max_groups >= 1")
+        self.window = window
+        self.key_fields = tuple(key_fields)
+        self.max_groups = max_groups
+        self._limits = {
+            category: (float(spec["rate"]), float(spec["burst"]))
+            for category, spec in (rate_limits or {}).items()
+        }
+        self._buckets: dict[str, TokenBucket] = {}
+        # Oldest window first, so closed groups are found at the front
+        self._groups: OrderedDict[tuple[Any, ...], _Group] = OrderedDict()
+        self.events_in = 0
+        self.events_passed = 0
+        self.events_suppressed = 0
+        self.summaries = 0
+
+    def offer(self, event: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Feed one event.
+
+        Args:
+            event: Audit event (``simulation_time`` is its timestamp)
+
+        Returns:
+            Records to keep now, oldest first: summaries of groups whose
+            window has closed, then the event itself unless suppressed
+        """
+        now = event.get("simulation_time") or 0.0
+        self.events_in += 1
+        records = self.expire(now)
+
+        key = self._key(event)
+        group = self._groups.get(key)
+        if group is not None and not 0 <= now - group.first_seen < self.window:
+            # Window over for this key (or the clock was reset)
+            records.extend(self._close(key, now))
+            group = None
+
+        if group is None:
+            group = self._groups[key] = _Group(now)
+            if len(self._groups) > self.max_groups:
+                records.extend(self._close(next(iter(self._groups)), now))
+            passed = self._allow(event, now)
+        else:
+            group.last_seen = now
+            passed = False
+
+        if passed:
+            self.events_passed += 1
+            records.append(event)
+        else:
+            self.events_suppressed += 1
+            if not group.suppressed:
+                group.suppressed_since = now
+            group.suppressed += 1
+            group.last = event
+        return records
+
+    def expire(self, now: float) -> list[dict[str, Any]]:
+        """Close groups whose window ended before now, returning their summaries."""
+        records = []
+        while self._groups:
+            key, group = next(iter(self._groups.items()))
+            if 0 <= now - group.first_seen < self.window:
+                break
+            records.extend(self._close(key, now))
+        return records
+
+    def flush(self, now: float | None = None) -> list[dict[str, Any]]:
+        """Close every open group, returning their summaries (stamped at now)."""
+        records = []
+        while self._groups:
+            records.extend(self._close(next(iter(self._groups)), now))
+        return records
+
+    def stats(self) -> dict[str, Any]:
+        """Aggregation counters."""
+        return {
+            "events_in": self.events_in,
+            "events_passed": self.events_passed,
+            "events_suppressed": self.events_suppressed,
+            "summaries": self.summaries,
+            "open_groups": len(self._groups),
+        }
+
+    # ----------------------------------------------------------------
+    # Internal helpers
+    # ----------------------------------------------------------------
+
+    def _key(self, event: Mapping[str, Any]) -> tuple[Any, ...]:
+        data = event.get("data")
+        if isinstance(data, str):
+            # LogEntry.to_dict stores data as a JSON string
+            try:
+                data = json.loads(data)
+            except ValueError:
+                data = None
+        if not isinstance(data, Mapping):
+            data = {}
+        return (
+            event.get("device"),
+            event.get("category"),
+            message_template(event.get("message", "")),
+            event.get("user"),
+            event.get("source_ip"),
+            tuple(_hashable(data.get(name)) for name in self.key_fields),
+        )
+
+    def _allow(self, event: Mapping[str, Any], now: float) -> bool:
+        """Apply the category's rate limit, if it has one."""
+        category = event.get("category")
+        if not isinstance(category, str):
+            return True
+        bucket = self._buckets.get(category)
+        if bucket is None:
+            limit = self._limits.get(category)
+            if limit is None:
+                return True
+            bucket = self._buckets[category] = TokenBucket(*limit)
+        return bucket.take(now)
+
+    def _close(self, key: tuple[Any, ...], now: float | None) -> list[dict[str, Any]]:
+        """Remove a group, returning its summary if it suppressed anything."""
+        group = self._groups.pop(key)
+        if not group.suppressed or group.last is None:
+            return []
+        self.summaries += 1
+        summary = dict(group.last)
+        summary.update(
+            simulation_time=group.last_seen if now is None else now,
+            count=group.suppressed,
+            first_seen=group.suppressed_since,
+            last_seen=group.last_seen,
+        )
+        return [summary]
+
+
+def _hashable(value: Any) -> Hashable:
+    return (
+        value if isinstance(value, (str, int, float, bool, type(None))) else repr(value)
+    )
@@ -0,0 +1,437 @@
+# components/security/audit_store.py
+"""
+Segmented append-only audit store on local disk.
+
+The in-memory audit trail keeps the last 10000 events of one process.
+AuditStore keeps the whole history of an exercise on disk and lets other
+processes (tools/blue_team.py) query it while the simulator is running.
+
+Layout:
+- Events are appended to segment files (``00000001.seg`` ...) as
+  length-prefixed compact JSON records (4-byte little-endian length).
+- A segment is sealed once it reaches ``segment_bytes`` and a new one is
+  started. Sealing writes a ``.idx`` sidecar holding its sparse index.
+- The sparse index splits a segment into blocks of ``block_records``
+  records and keeps, per block, its offset and simulation time range, and
+  per device, category and user value, the blocks containing it.
+
+Queries skip segments and blocks whose index rules them out and decode
+only the remaining blocks through a memory-mapped read. One process
+writes a directory; any number may open it read-only.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Iterable, Iterator
+from io import BufferedWriter
+from pathlib import Path
+from typing import Any
+
+__all__ = ["AuditStore", "INDEXED_FIELDS"]
+
+INDEXED_FIELDS = ("device", "category", "user")
+
+_LENGTH = struct.Struct("<I")
+_INDEX_VERSION = 1
+_SEGMENT_SUFFIX = ".seg"
+_INDEX_SUFFIX = ".idx"
+
+
+class _Segment:
+    """One segment file and its sparse index."""
+
+    __slots__ = ("path", "size", "count", "blocks", "values")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.size = 0
+        self.count = 0
+        # [offset, records, min_time, max_time] per block
+        self.blocks: list[list[Any]] = []
+        # field -> value -> ids of blocks containing it (ascending)
+        self.values: dict[str, dict[str, list[int]]] = {
+            name: {} for name in INDEXED_FIELDS
+        }
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_suffix(_INDEX_SUFFIX)
+
+    def add(
+        self, offset: int, length: int, event: dict[str, Any], block_records: int
+    ) -> None:
+        """Index a record written at offset."""
+        sim_time = _sim_time(event)
+        if self.count % block_records == 0:
+            self.blocks.append([offset, 0, sim_time, sim_time])
+        block = self.blocks[-1]
+        block[1] += 1
+        if sim_time < block[2]:
+            block[2] = sim_time
+        elif sim_time > block[3]:
+            block[3] = sim_time
+
+        block_id = len(self.blocks) - 1
+        for name in INDEXED_FIELDS:
+            value = event.get(name)
+            if isinstance(value, str) and value:
+                ids = self.values[name].setdefault(value, [])
+                if not ids or ids[-1] != block_id:
+                    ids.append(block_id)
+
+        self.count += 1
+        self.size = offset + _LENGTH.size + length
+
+    def candidate_blocks(
+        self,
+        fields: dict[str, str],
+        since: float | None,
+        until: float | None,
+    ) -> list[int]:
+        """Ids of blocks that may hold matching records, ascending."""
+        candidates: set[int] | None = None
+        for name, value in fields.items():
+            ids = self.values[name].get(value)
+            if not ids:
+                return []
+            candidates = set(ids) if candidates is None else candidates & set(ids)
+        block_ids: Iterable[int] = (
+            range(len(self.blocks)) if candidates is None else sorted(candidates)
+        )
+        return [
+            block_id
+            for block_id in block_ids
+            if (since is None or self.blocks[block_id][3] >= since)
+            and (until is None or self.blocks[block_id][2] <= until)
+        ]
+
+    def block_range(self, block_id: int) -> tuple[int, int]:
+        """Byte range of a block."""
+        start = self.blocks[block_id][0]
+        if block_id + 1 < len(self.blocks):
+            return start, self.blocks[block_id + 1][0]
+        return start, self.size
+
+    def save_index(self) -> None:
+        """Write the sidecar index atomically."""
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps(
+                {
+                    "version": _INDEX_VERSION,
+                    "size": self.size,
+                    "count": self.count,
+                    "blocks": self.blocks,
+                    "values": self.values,
+                },
+                separators=(",", ":"),
+            )
+        )
+        os.replace(tmp, self.index_path)
+
+    def load_index(self) -> bool:
+        """Load the sidecar index; False if missing or stale."""
+        try:
+            index = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return False
+        if (
+            index.get("version") != _INDEX_VERSION
+            or index.get("size") != self.path.stat().st_size
+        ):
+            return False
+        self.size = index["size"]
+        self.count = index["count"]
+        self.blocks = index["blocks"]
+        self.values = index["values"]
+        return True
+
+    def scan(self, block_records: int) -> None:
+        """Index records from the current size to the end of the file."""
+        file_size = self.path.stat().st_size
+        if file_size <= self.size:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self.size)
+            data = f.read(file_size - self.size)
+        base = self.size
+        for offset, record in _records(data):
+            event = json.loads(record)
+            self.add(base + offset, len(record), event, block_records)
+
+
+class AuditStore:
+    """
+    Append-only audit history in rolled, indexed segment files.
+
+    Example:
+        >>> store = AuditStore("logs/audit")
+        >>> store.append({"simulation_time": 12.5, "device": "plc_1", ...})
+        >>> store.query(device="plc_1", since=10.0, limit=50)
+        [{'simulation_time': 12.5, 'device': 'plc_1', ...}]
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        segment_bytes: int = 16 * 1024 * 1024,
+        block_records: int = 256,
+        max_segments: int | None = None,
+        read_only: bool = False,
+    ):
+        """
+        Open (or create) a store.
+
+        Args:
+            directory: Directory holding the segment files
+            segment_bytes: Size at which the active segment is sealed
+            block_records: Records per sparse index block
+            max_segments: Oldest segments are deleted beyond this (None = keep all)
+            read_only: Query a store another process writes to
+
+        Raises:
+            ValueError: If a size setting is invalid
+            FileNotFoundError: If a read-only directory does not exist
+        """
+        if segment_bytes <= 0 or block_records <= 0:
+            raise ValueError("segment_bytes and block_records must be positive")
+        if max_segments is not None and max_segments < 1:
+            raise ValueError("max_segments must be at least 1")
+
+        self.directory = Path(directory)
+        self.segment_bytes = segment_bytes
+        self.block_records = block_records
+        self.max_segments = max_segments
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        self._segments: list[_Segment] = []
+        self._file: BufferedWriter | None = None
+
+        if read_only:
+            if not self.directory.is_dir():
+                raise FileNotFoundError(f"Audit store not found: {self.directory}")
+        else:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._refresh()
+        if not read_only:
+            # Seal whatever a previous run left open; always write a new segment
+            if self._segments:
+                self._repair(self._segments[-1])
+                self._segments[-1].save_index()
+            self._start_segment()
+
+    # ----------------------------------------------------------------
+    # Writing
+    # ----------------------------------------------------------------
+
+    def append(self, event: dict[str, Any]) -> None:
+        """
+        Append an event.
+
+        Raises:
+            PermissionError: If the store is read-only
+            ValueError: If the store has been closed
+        """
+        if self.read_only:
+            raise PermissionError("Audit store opened read-only")
+        record = json.dumps(event, separators=(",", ":"), default=str).encode()
+        with self._lock:
+            if self._file is None:
+                raise ValueError("Audit store is closed")
+            segment = self._segments[-1]
+            offset = segment.size
+            self._file.write(_LENGTH.pack(len(record)))
+            self._file.write(record)
+            segment.add(offset, len(record), event, self.block_records)
+            if segment.size >= self.segment_bytes:
+                self._roll()
+
+    def flush(self) -> None:
+        """Push buffered records to the operating system."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Seal the active segment and close the store."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                self._segments[-1].save_index()
+
+    # ----------------------------------------------------------------
+    # Queries
+    # ----------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return sum(segment.count for segment in self._segments)
+
+    def query(
+        self,
+        limit: int | None = None,
+        device: str | None = None,
+        event_type: str | None = None,
+        category: str | None = None,
+        severity: str | None = None,
+        user: str | None = None,
+        action: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Query stored events with the same filters as SystemState.get_audit_log.
+
+        Returns:
+            Matching events (most recent first)
+        """
+        indexed = {
+            name: value
+            for name, value in (
+                ("device", device),
+                ("category", category),
+                ("user", user),
+            )
+            if value
+        }
+        results: list[dict[str, Any]] = []
+        with self._lock:
+            if self.read_only:
+                self._refresh()
+            elif self._file is not None:
+                self._file.flush()
+
+            for segment in reversed(self._segments):
+                blocks = segment.candidate_blocks(indexed, since, until)
+                if not blocks:
+                    continue
+                try:
+                    for event in self._read_blocks(segment, blocks):
+                        if _matches(
+                            event, device, event_type, category, severity, user, action
+                        ) and (
+                            (since is None or _sim_time(event) >= since)
+                            and (until is None or _sim_time(event) <= until)
+                        ):
+                            results.append(event)
+                            if limit and len(results) >= limit:
+                                return results
+                except FileNotFoundError:
+                    continue  # Removed by the writer's retention meanwhile
+        return results
+
+    def stats(self) -> dict[str, Any]:
+        """Store size and layout."""
+        with self._lock:
+            return {
+                "directory": str(self.directory),
+                "segments": len(self._segments),
+                "events": len(self),
+                "bytes": sum(segment.size for segment in self._segments),
+                "read_only": self.read_only,
+            }
+
+    # ----------------------------------------------------------------
+    # Internal helpers
+    # ----------------------------------------------------------------
+
+    def _read_blocks(
+        self, segment: _Segment, blocks: list[int]
+    ) -> Iterator[dict[str, Any]]:
+        """Decode blocks newest first, records newest first within a block."""
+        with (
+            open(segment.path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view,
+        ):
+            for block_id in reversed(blocks):
+                start, end = segment.block_range(block_id)
+                records = [record for _, record in _records(view[start:end])]
+                for record in reversed(records):
+                    yield json.loads(record)
+
+    def _refresh(self) -> None:
+        """Pick up segments and records written since the last look."""
+        paths = sorted(self.directory.glob(f"*{_SEGMENT_SUFFIX}"))
+        known = {segment.path: segment for segment in self._segments}
+        segments = []
+        for path in paths:
+            segment = known.get(path)
+            try:
+                if segment is None:
+                    segment = _Segment(path)
+                    if segment.load_index():
+                        segments.append(segment)
+                        continue
+                segment.scan(self.block_records)
+            except FileNotFoundError:
+                continue  # Removed by the writer's retention meanwhile
+            segments.append(segment)
+        self._segments = segments
+
+    def _repair(self, segment: _Segment) -> None:
+        """Drop a torn record left at the end of a segment by a crash."""
+        if segment.path.stat().st_size != segment.size:
+            with open(segment.path, "r+b") as f:
+                f.truncate(segment.size)
+
+    def _start_segment(self) -> None:
+        """Open the next segment for writing, deleting the oldest if over the limit."""
+        number = int(self._segments[-1].path.stem) + 1 if self._segments else 1
+        segment = _Segment(self.directory / f"{number:08d}{_SEGMENT_SUFFIX}")
+        self._file = open(segment.path, "ab")
+        self._segments.append(segment)
+        if self.max_segments is not None:
+            while len(self._segments) > self.max_segments:
+                old = self._segments.pop(0)
+                old.path.unlink(missing_ok=True)
+                old.index_path.unlink(missing_ok=True)
+
+    def _roll(self) -> None:
+        """Seal the active segment and start a new one."""
+        if self._file is not None:
+            self._file.close()
+        self._segments[-1].save_index()
+        self._start_segment()
+
+
+def _sim_time(event: dict[str, Any]) -> float:
+    try:
+        return float(event.get("simulation_time") or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _matches(
+    event: dict[str, Any],
+    device: str | None,
+    event_type: str | None,
+    category: str | None,
+    severity: str | None,
+    user: str | None,
+    action: str | None,
+) -> bool:
+    """Apply the non-time filters of a query (empty filters match)."""
+    return (
+        (not device or event.get("device") == device)
+        and (not event_type or event.get("message", "").startswith(event_type))
+        and (not category or event.get("category") == category)
+        and (not severity or event.get("severity") == severity)
+        and (not user or event.get("user") == user)
+        and (not action or (event.get("data") or {}).get("action") == action)
+    )
+
+
+def _records(data: bytes | memoryview) -> Iterator[tuple[int, bytes]]:
+    """Yield (offset, record) pairs; stops at a torn trailing record."""
+    offset = 0
+    end = len(data)
+    while offset + _LENGTH.size <= end:
+        (length,) = _LENGTH.unpack_from(data, offset)
+        start = offset + _LENGTH.size
+        if start + length > end:
+            return
+        yield offset, bytes(data[start : start + length])
+        offset = start + length
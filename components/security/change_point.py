@@ -0,0 +1,300 @@
+# components/security/change_point.py
+"""
+Streaming change-point detectors for process values.
+
+A windowed z-score keeps re-learning its baseline, so a slow drift
+(a setpoint nudged a little every cycle) can stay inside 3 sigma
+forever. These detectors accumulate evidence of a sustained shift
+instead. Each holds a few floats per parameter and is updated in O(1)
+per sample, with no history.
+
+- EWMAChart: exponentially weighted moving average control chart
+- CUSUMDetector: two-sided tabular CUSUM
+- PageHinkleyDetector: two-sided Page-Hinkley test
+
+EWMA and CUSUM learn an in-control mean and standard deviation from
+their first ``warmup`` samples and then keep that reference fixed, so
+manipulated values are never absorbed into the baseline. Page-Hinkley
+tracks the running mean and needs no reference. Every detector restarts
+its statistic after an alarm.
+"""
+
+import math
+from typing import Any, NamedTuple
+
+__all__ = [
+    "ChangePoint",
+    "CUSUMDetector",
+    "EWMAChart",
+    "PageHinkleyDetector",
+    "create_detector",
+]
+
+
+class ChangePoint(NamedTuple):
+    """A detected sustained shift."""
+
+    direction: str  # "up" or "down"
+    statistic: float  # Detector statistic when the alarm fired
+    threshold: float  # Limit the statistic crossed
+    reference: float  # Mean the shift is measured from
+
+
+class _ReferenceDetector:
+    """Learns a fixed in-control mean and standard deviation (Welford)."""
+
+    __slots__ = ("warmup", "count", "mean", "_m2")
+
+    method = ""
+
+    def __init__(self, warmup: int):
+        if warmup < 2:
+            raise ValueError("warmup must be at least 2 samples")
+        self.warmup = warmup
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    @property
+    def learned(self) -> bool:
+        return self.count >= self.warmup
+
+    @property
+    def std(self) -> float:
+        """Reference standard deviation (floored so flat signals still work)."""
+        std = math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+        return max(std, 1e-6 * abs(self.mean), 1e-12)
+
+    def _learn(self, value: float) -> bool:
+        """Feed a warm-up sample; False once the reference is fixed."""
+        if self.count >= self.warmup:
+            return False
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        return True
+
+    def reset(self) -> None:
+        """Forget the reference and relearn it."""
+        self.count = 0
+        self.mean = self._m2 = 0.0
+
+
+class EWMAChart(_ReferenceDetector):
+    """
+    EWMA control chart.
+
+    z = lam * x + (1 - lam) * z, alarming when z leaves
+    mean +/- width * std * sqrt(lam / (2 - lam) * (1 - (1 - lam)^(2t))).
+    Small lam weights history heavily and catches small shifts.
+
+    Example:
+        >>> chart = EWMAChart(lam=0.2, width=3.0, warmup=4)
+        >>> [chart.update(v) for v in (10.0, 10.2, 9.8, 10.0)]
+        [None, None, None, None]
+        >>> chart.update(13.0).direction
+        'up'
+    """
+
+    __slots__ = ("lam", "width", "z", "_decay")
+
+    method = "ewma"
+
+    def __init__(self, lam: float = 0.1, width: float = 3.5, warmup: int = 100):
+        """
+        Initialise chart.
+
+        Args:
+            lam: Smoothing weight of the newest sample (0 < lam <= 1)
+            width: Control limit in standard errors of the EWMA
+            warmup: Samples used to learn the in-control reference
+        """
+        if not 0 < lam <= 1:
+            raise ValueError("lam must be in (0, 1]")
+        super().__init__(warmup)
+        self.lam = lam
+        self.width = width
+        self.z = 0.0
+        self._decay = 1.0  # (1 - lam)^(2t) since the chart (re)started
+
+    def update(self, value: float) -> ChangePoint | None:
+        """Add a sample; returns a ChangePoint when the chart alarms."""
+        if self._learn(value):
+            self.z = self.mean
+            return None
+        lam = self.lam
+        self.z = lam * value + (1 - lam) * self.z
+        self._decay *= (1 - lam) ** 2
+        limit = self.width * self.std * math.sqrt(lam / (2 - lam) * (1 - self._decay))
+        offset = self.z - self.mean
+        if abs(offset) <= limit:
+            return None
+        change = ChangePoint(
+            "up" if offset > 0 else "down", abs(offset), limit, self.mean
+        )
+        self.z, self._decay = self.mean, 1.0
+        return change
+
+    def reset(self) -> None:
+        super().reset()
+        self.z, self._decay = 0.0, 1.0
+
+
+class CUSUMDetector(_ReferenceDetector):
+    """
+    Two-sided tabular CUSUM on standardised samples.
+
+    high = max(0, high + (x - mean) / std - k), low likewise downwards;
+    alarms when either exceeds h. k is half the shift (in sigma) to detect
+    quickly. The defaults (k=0.5, h=8) target a 1 sigma shift with a long
+    in-control run between false alarms, suiting many monitored parameters.
+
+    Example:
+        >>> cusum = CUSUMDetector(k=0.5, h=4.0, warmup=4)
+        >>> [cusum.update(v) for v in (10.0, 10.2, 9.8, 10.0)]
+        [None, None, None, None]
+        >>> [cusum.update(9.7) for _ in range(3)][-1].direction
+        'down'
+    """
+
+    __slots__ = ("k", "h", "high", "low")
+
+    method = "cusum"
+
+    def __init__(self, k: float = 0.5, h: float = 8.0, warmup: int = 100):
+        """
+        Initialise detector.
+
+        Args:
+            k: Allowance per sample in standard deviations
+            h: Decision threshold in standard deviations
+            warmup: Samples used to learn the in-control reference
+        """
+        super().__init__(warmup)
+        self.k = k
+        self.h = h
+        self.high = 0.0
+        self.low = 0.0
+
+    def update(self, value: float) -> ChangePoint | None:
+        """Add a sample; returns a ChangePoint when either sum alarms."""
+        if self._learn(value):
+            return None
+        score = (value - self.mean) / self.std
+        self.high = max(0.0, self.high + score - self.k)
+        self.low = max(0.0, self.low - score - self.k)
+        if self.high > self.h:
+            change = ChangePoint("up", self.high, self.h, self.mean)
+        elif self.low > self.h:
+            change = ChangePoint("down", self.low, self.h, self.mean)
+        else:
+            return None
+        self.high = self.low = 0.0
+        return change
+
+    def reset(self) -> None:
+        super().reset()
+        self.high = self.low = 0.0
+
+
+class PageHinkleyDetector:
+    """
+    Two-sided Page-Hinkley test against the running mean.
+
+    Accumulates x - mean - delta (and x - mean + delta downwards) and
+    alarms when the sum rises more than ``threshold`` above its minimum
+    (or falls below its maximum). Units are those of the parameter.
+
+    Example:
+        >>> ph = PageHinkleyDetector(delta=0.1, threshold=5.0, min_samples=3)
+        >>> [ph.update(10.0) for _ in range(5)]
+        [None, None, None, None, None]
+        >>> next(c for c in (ph.update(12.0) for _ in range(10)) if c).direction
+        'up'
+    """
+
+    __slots__ = (
+        "delta",
+        "threshold",
+        "min_samples",
+        "count",
+        "mean",
+        "up",
+        "up_min",
+        "down",
+        "down_max",
+    )
+
+    method = "page_hinkley"
+
+    def __init__(
+        self, delta: float = 0.005, threshold: float = 50.0, min_samples: int = 30
+    ):
+        """
+        Initialise detector.
+
+        Args:
+            delta: Tolerated drift per sample (parameter units)
+            threshold: Alarm threshold on the cumulative deviation
+            min_samples: Samples before alarms are raised
+        """
+        self.delta = delta
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.count = 0
+        self.mean = 0.0
+        self.up = self.up_min = 0.0
+        self.down = self.down_max = 0.0
+
+    def update(self, value: float) -> ChangePoint | None:
+        """Add a sample; returns a ChangePoint when the test alarms."""
+        self.count += 1
+        self.mean += (value - self.mean) / self.count
+        self.up += value - self.mean - self.delta
+        self.up_min = min(self.up_min, self.up)
+        self.down += value - self.mean + self.delta
+        self.down_max = max(self.down_max, self.down)
+        if self.count < self.min_samples:
+            return None
+        if self.up - self.up_min > self.threshold:
+            change = ChangePoint("up", self.up - self.up_min, self.threshold, self.mean)
+        elif self.down_max - self.down > self.threshold:
+            change = ChangePoint(
+                "down", self.down_max - self.down, self.threshold, self.mean
+            )
+        else:
+            return None
+        self.reset()
+        return change
+
+    def reset(self) -> None:
+        """Restart the test."""
+        self.count = 0
+        self.mean = 0.0
+        self.up = self.up_min = 0.0
+        self.down = self.down_max = 0.0
+
+
+_DETECTORS = {
+    cls.method: cls for cls in (EWMAChart, CUSUMDetector, PageHinkleyDetector)
+}
+
+
+def create_detector(
+    method: str, **params: Any
+) -> EWMAChart | CUSUMDetector | PageHinkleyDetector:
+    """
+    Create a detector by method name ("ewma", "cusum" or "page_hinkley").
+
+    Raises:
+        ValueError: If the method is unknown
+    """
+    try:
+        cls = _DETECTORS[method]
+    except KeyError:
+        raise ValueError(
+            f"Unknown change-point method '{method}' "
+            f"(expected one of {sorted(_DETECTORS)})"
+        ) from None
+    return cls(**params)
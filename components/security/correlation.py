@@ -0,0 +1,437 @@
+# components/security/correlation.py
+"""
+Streaming event correlation engine.
+
+Correlation rules are declared as data (normally YAML) rather than code:
+
+    - name: failed_auth
+      filter:
+        data.action: [authorize, login, authenticate]
+        data.result: FAILED
+        user: {exists: true}
+      group_by: [user]
+      window: 60
+      threshold: 3
+
+    - name: auth_then_bypass
+      sequence:
+        - {data.result: FAILED, data.action: authenticate}
+        - {data.action: activate_safety_bypass}
+      group_by: [user]
+      window: 300
+
+A threshold rule fires when ``threshold`` matching events share a group
+key within ``window`` seconds. Aggregated summary records count as the
+number of events in their ``count`` field. A sequence rule fires when its steps
+match in order for one key, with the whole sequence inside ``window``.
+
+Filters map a dotted field path to a condition. A scalar means equals
+and a list means any of. A one-key dict selects an operator:
+``equals``, ``in``, ``contains``, ``icontains`` or ``exists``.
+
+Rules compile to per-key deques of timestamps. Expiry pops from the
+front, so it is amortised O(1) per event, and keys that go idle are
+evicted oldest first. A dispatch table indexes every rule by one
+condition, either an exact value or a substring (via the Aho-Corasick
+matcher). Each event is therefore checked only against rules that can
+match it, rather than against every rule.
+"""
+
+import json
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from components.security.pattern_matcher import PatternMatcher
+
+__all__ = [
+    "CorrelationEngine",
+    "CorrelationMatch",
+    "CorrelationRule",
+    "decode_event",
+]
+
+_OPERATORS = frozenset({"equals", "in", "contains", "icontains", "exists"})
+
+
+def decode_event(event: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Return the event with a JSON-string ``data`` field decoded.
+
+    LogEntry.to_dict stores ``data`` as a JSON string, which ``data.*``
+    paths cannot see into. Undecodable or non-dict data becomes ``{}``.
+    Events whose data is already a mapping are returned unchanged.
+    """
+    data = event.get("data")
+    if data is None or isinstance(data, Mapping):
+        return event
+    if isinstance(data, str):
+        try:
+            data = json.loads(data)
+        except ValueError:
+            data = None
+    return {**event, "data": data if isinstance(data, Mapping) else {}}
+
+
+def resolve(event: Mapping[str, Any], path: tuple[str, ...]) -> Any:
+    """Look up a dotted field path in an event (None if absent)."""
+    value: Any = event
+    for part in path:
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(part)
+    return value
+
+
+class _Condition:
+    """One compiled field condition."""
+
+    __slots__ = ("path", "op", "operand")
+
+    def __init__(self, path: str, spec: Any):
+        self.path = tuple(path.split("."))
+        if isinstance(spec, Mapping):
+            if len(spec) != 1 or next(iter(spec)) not in _OPERATORS:
+                raise ValueError(
+                    f"Condition on '{path}' must be a value, a list or one of "
+                    f"{sorted(_OPERATORS)}"
+                )
+            self.op, operand = next(iter(spec.items()))
+        elif isinstance(spec, list | tuple | set | frozenset):
+            self.op, operand = "in", spec
+        else:
+            self.op, operand = "equals", spec
+
+        if self.op == "in":
+            operand = frozenset(operand)
+        elif self.op == "icontains":
+            operand = str(operand).lower()
+        elif self.op == "contains":
+            operand = str(operand)
+        elif self.op == "exists":
+            operand = bool(operand)
+        self.operand = operand
+
+    def test(self, event: Mapping[str, Any]) -> bool:
+        value = resolve(event, self.path)
+        op = self.op
+        if op == "equals":
+            return value == self.operand
+        if op == "in":
+            try:
+                return value in self.operand
+            except TypeError:  # Unhashable value
+                return False
+        if op == "contains":
+            return isinstance(value, str) and self.operand in value
+        if op == "icontains":
+            return isinstance(value, str) and self.operand in value.lower()
+        return bool(value) == self.operand  # exists
+
+
+class _Filter:
+    """Conjunction of conditions."""
+
+    __slots__ = ("conditions",)
+
+    def __init__(self, spec: Mapping[str, Any] | None):
+        self.conditions = tuple(_Condition(p, s) for p, s in (spec or {}).items())
+
+    def matches(self, event: Mapping[str, Any]) -> bool:
+        return all(c.test(event) for c in self.conditions)
+
+    def dispatch_key(self) -> _Condition | None:
+        """Pick the condition used to index this filter (exact beats substring)."""
+        for ops in (("equals", "in"), ("contains", "icontains")):
+            for condition in self.conditions:
+                if condition.op in ops:
+                    return condition
+        return None
+
+
+@dataclass
+class CorrelationRule:
+    """Compiled correlation rule."""
+
+    name: str
+    steps: list[_Filter]  # One step for threshold rules
+    group_by: tuple[tuple[str, ...], ...]
+    window: float
+    threshold: int
+    reset_on_fire: bool
+    alert: dict[str, Any]
+    spec: dict[str, Any] = field(repr=False)
+
+    @property
+    def is_sequence(self) -> bool:
+        return len(self.steps) > 1
+
+    @classmethod
+    def from_dict(cls, spec: Mapping[str, Any]) -> "CorrelationRule":
+        """
+        Compile a rule declaration.
+
+        Raises:
+            ValueError: If the declaration is invalid
+        """
+        name = spec.get("name")
+        if not name:
+            raise ValueError("Correlation rule needs a name")
+        if "sequence" in spec and "filter" in spec:
+            raise ValueError(f"Rule '{name}': use either filter or sequence, not both")
+
+        steps = [_Filter(step) for step in spec.get("sequence") or [spec.get("filter")]]
+        threshold = int(spec.get("threshold", 1))
+        window = float(spec.get("window", 60.0))
+        if threshold < 1 or window < 0:
+            raise ValueError(f"Rule '{name}': threshold >= 1 and window >= 0 required")
+        if len(steps) > 1 and threshold != 1:
+            raise ValueError(f"Rule '{name}': sequence rules do not take a threshold")
+
+        group_by = spec.get("group_by") or []
+        if isinstance(group_by, str):
+            group_by = [group_by]
+
+        return cls(
+            name=name,
+            steps=steps,
+            group_by=tuple(tuple(p.split(".")) for p in group_by),
+            window=window,
+            threshold=threshold,
+            reset_on_fire=bool(spec.get("reset_on_fire", True)),
+            alert=dict(spec.get("alert") or {}),
+            spec=dict(spec),
+        )
+
+    def group_key(self, event: Mapping[str, Any]) -> tuple:
+        return tuple(resolve(event, path) for path in self.group_by)
+
+
+@dataclass
+class CorrelationMatch:
+    """A rule firing for one group key."""
+
+    rule: CorrelationRule
+    key: tuple
+    count: int  # Events in the window (threshold) or steps (sequence)
+    first_seen: float
+    last_seen: float
+    event: dict[str, Any]  # Event that completed the match
+
+    @property
+    def group(self) -> dict[str, Any]:
+        """Group-by values keyed by the last component of their field path."""
+        return {
+            path[-1]: value
+            for path, value in zip(self.rule.group_by, self.key, strict=True)
+        }
+
+
+class _KeyState:
+    """Per-key window state."""
+
+    __slots__ = ("times", "total", "partials", "last_seen")
+
+    def __init__(self, steps: int):
+        # Threshold rules: (timestamp, event count) of matching records
+        self.times: deque[tuple[float, int]] = deque()
+        self.total = 0
+        # Sequence rules: partials[i] = start times of runs waiting for step i
+        self.partials: list[deque[float]] = [deque() for _ in range(steps)]
+        self.last_seen = 0.0
+
+
+class CorrelationEngine:
+    """
+    Evaluate declarative correlation rules over an event stream.
+
+    Example:
+        >>> engine = CorrelationEngine([{
+        ...     "name": "scram", "filter": {"data.action": {"icontains": "scram"}}
+        ... }])
+        >>> [m.rule.name for m in engine.process(
+        ...     {"simulation_time": 1.0, "data": {"action": "reactor_scram"}}
+        ... )]
+        ['scram']
+    """
+
+    def __init__(self, rules: Iterable[Mapping[str, Any]] = ()):
+        """
+        Initialise engine.
+
+        Args:
+            rules: Rule declarations (see module docstring)
+        """
+        self.rules: list[CorrelationRule] = []
+        self._state: list[OrderedDict[tuple, _KeyState]] = []
+        self._exact: dict[tuple[str, ...], dict[Any, list[tuple[int, int]]]] = {}
+        self._patterns: dict[tuple[str, ...], PatternMatcher] = {}
+        self._always: list[tuple[int, int]] = []
+        self.load(rules)
+
+    def load(self, rules: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Replace all rules, discarding window state.
+
+        Raises:
+            ValueError: If a declaration is invalid or names are duplicated
+        """
+        compiled = [CorrelationRule.from_dict(spec) for spec in rules]
+        names = [rule.name for rule in compiled]
+        if len(set(names)) != len(names):
+            raise ValueError("Correlation rule names must be unique")
+
+        self.rules = compiled
+        self._state = [OrderedDict() for _ in compiled]
+        self._exact = {}
+        self._patterns = {}
+        self._always = []
+        for rule_index, rule in enumerate(compiled):
+            for step_index, step in enumerate(rule.steps):
+                self._index((rule_index, step_index), step.dispatch_key())
+
+    def reset(self) -> None:
+        """Discard all window state, keeping the rules."""
+        self._state = [OrderedDict() for _ in self.rules]
+
+    def expire(self, now: float) -> None:
+        """Drop idle keys for every rule (call periodically, not per event)."""
+        for rule_index, rule in enumerate(self.rules):
+            self._evict_idle(rule_index, rule, now)
+
+    def tracked_keys(self, rule_name: str) -> int:
+        """Number of group keys a rule currently holds state for."""
+        for rule, state in zip(self.rules, self._state, strict=True):
+            if rule.name == rule_name:
+                return len(state)
+        return 0
+
+    def process(self, event: Mapping[str, Any]) -> list[CorrelationMatch]:
+        """
+        Feed one event to every rule that can match it.
+
+        Args:
+            event: Audit event (uses ``simulation_time`` as its timestamp)
+
+        Returns:
+            Matches fired by this event, in rule order
+        """
+        now = event.get("simulation_time", 0.0)
+        matches = []
+        for rule_index, steps in sorted(self._candidates(event).items()):
+            rule = self.rules[rule_index]
+            # Latest step first so one event cannot advance a run twice
+            hit_steps = [
+                s for s in sorted(steps, reverse=True) if rule.steps[s].matches(event)
+            ]
+            if hit_steps:
+                match = self._feed(rule_index, rule, event, now, hit_steps)
+                if match is not None:
+                    matches.append(match)
+            self._evict_idle(rule_index, rule, now)
+        return matches
+
+    # ----------------------------------------------------------------
+    # Internal helpers
+    # ----------------------------------------------------------------
+
+    def _index(self, target: tuple[int, int], condition: _Condition | None) -> None:
+        if condition is None:
+            self._always.append(target)
+        elif condition.op in ("equals", "in"):
+            values = condition.operand if condition.op == "in" else [condition.operand]
+            table = self._exact.setdefault(condition.path, {})
+            for value in values:
+                table.setdefault(value, []).append(target)
+        else:
+            matcher = self._patterns.setdefault(condition.path, PatternMatcher())
+            matcher.add(condition.operand, target)
+
+    def _candidates(self, event: Mapping[str, Any]) -> dict[int, set[int]]:
+        """Rule -> steps whose dispatch condition this event satisfies."""
+        candidates: dict[int, set[int]] = {}
+
+        def add(target: tuple[int, int]) -> None:
+            candidates.setdefault(target[0], set()).add(target[1])
+
+        for path, table in self._exact.items():
+            value = resolve(event, path)
+            try:
+                targets = table.get(value, ())
+            except TypeError:  # Unhashable value
+                continue
+            for target in targets:
+                add(target)
+        for path, matcher in self._patterns.items():
+            value = resolve(event, path)
+            if isinstance(value, str):
+                for match in matcher.find(value):
+                    add(match.label)
+        for target in self._always:
+            add(target)
+        return candidates
+
+    def _feed(
+        self,
+        rule_index: int,
+        rule: CorrelationRule,
+        event: Mapping[str, Any],
+        now: float,
+        hit_steps: list[int],
+    ) -> CorrelationMatch | None:
+        states = self._state[rule_index]
+        key = rule.group_key(event)
+        state = states.get(key)
+        if state is None:
+            state = states[key] = _KeyState(len(rule.steps))
+        else:
+            states.move_to_end(key)
+        state.last_seen = now
+
+        if not rule.is_sequence:
+            times = state.times
+            while times and now - times[0][0] >= rule.window:
+                state.total -= times.popleft()[1]
+            weight = event.get("count", 1)
+            times.append((now, weight))
+            state.total += weight
+            if state.total < rule.threshold:
+                return None
+            match = CorrelationMatch(
+                rule, key, state.total, times[0][0], now, dict(event)
+            )
+            if rule.reset_on_fire:
+                times.clear()
+                state.total = 0
+            return match
+
+        last = len(rule.steps) - 1
+        for step in hit_steps:
+            if step == 0:
+                state.partials[1].append(now)
+                continue
+            waiting = state.partials[step]
+            while waiting and now - waiting[0] >= rule.window:
+                waiting.popleft()
+            if not waiting:
+                continue
+            start = waiting.popleft()
+            if step == last:
+                match = CorrelationMatch(
+                    rule, key, len(rule.steps), start, now, dict(event)
+                )
+                if rule.reset_on_fire:
+                    for partial in state.partials:
+                        partial.clear()
+                return match
+            state.partials[step + 1].append(start)
+        return None
+
+    def _evict_idle(self, rule_index: int, rule: CorrelationRule, now: float) -> None:
+        """Drop keys not seen for a whole window (least recently seen first)."""
+        states = self._state[rule_index]
+        while states:
+            key, state = next(iter(states.items()))
+            if now - state.last_seen < rule.window:
+                break
+            del states[key]
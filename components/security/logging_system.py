@@ -7,6 +7,8 @@ Provides:
 - Audit trail management
 - Alarm and event classification
 - Log rotation and retention
+- Non-blocking output (background writer thread)
+- Per-module runtime levels with cached enabled checks
 - Security event logging
 - Integration with SimulationTime and DataStore
 
@@ -19,10 +21,14 @@ ICS-specific features:
 """
 
 import asyncio
+import atexit
 import json
 import logging
 import logging.handlers
+import queue
+import sys
 import threading
+import time
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
@@ -41,9 +47,14 @@ __all__ = [
     "LogEntry",
     "SimTimeFormatter",
     "JSONFormatter",
+    "LogPipeline",
     "ICSLogger",
     "configure_logging",
+    "configure_log_pipeline",
+    "flush_logging",
+    "get_log_levels",
     "get_logger",
+    "set_log_level",
 ]
 
 # ----------------------------------------------------------------
@@ -113,9 +124,15 @@ LOGGING_TO_SEVERITY = {
 # ----------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LogEntry:
-    """Structured log entry for ICS events."""
+    """
+    Structured log entry for ICS events.
+
+    Immutable and slotted: audit trails hold many thousands of entries.
+    Device, component and user names are interned, and the serialised
+    forms are built once on first use.
+    """
 
     simulation_time: float  # Simulation time when event occurred
     wall_time: float  # Wall clock time
@@ -140,8 +157,25 @@ class LogEntry:
     alarm_priority: AlarmPriority | None = None
     alarm_state: AlarmState | None = None
 
+    # Serialised forms, built on first use
+    _dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _json: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for name in ("device", "component", "user"):
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialisation."""
+        if self._dict is None:
+            object.__setattr__(self, "_dict", self._build_dict())
+        return dict(self._dict)
+
+    def _build_dict(self) -> dict[str, Any]:
         entry_dict = {
             "simulation_time": self.simulation_time,
             "wall_time": self.wall_time,
@@ -175,7 +209,9 @@ class LogEntry:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        if self._json is None:
+            object.__setattr__(self, "_json", json.dumps(self.to_dict()))
+        return self._json
 
     def to_human_readable(self) -> str:
         """Convert to human-readable format."""
@@ -204,8 +240,9 @@ class SimTimeFormatter(logging.Formatter):
         self.sim_time = sim_time
 
     def format(self, record: logging.LogRecord) -> str:
-        """Format with simulation time."""
-        record.sim_time = self.sim_time.now()
+        """Format with simulation time (as captured when logged, if it was)."""
+        if not hasattr(record, "sim_time"):
+            record.sim_time = self.sim_time.now()
         return super().format(record)
 
 
@@ -224,7 +261,7 @@ class JSONFormatter(logging.Formatter):
         severity = LOGGING_TO_SEVERITY.get(record.levelno, EventSeverity.INFO)
 
         log_entry = LogEntry(
-            simulation_time=self.sim_time.now(),
+            simulation_time=getattr(record, "sim_time", None) or self.sim_time.now(),
             wall_time=record.created,
             severity=severity,
             category=EventCategory.SYSTEM,  # Default
@@ -240,10 +277,259 @@ class JSONFormatter(logging.Formatter):
         return log_entry.to_json()
 
 
+# ----------------------------------------------------------------
+# Log Pipeline - formatting and I/O off the event loop
+# ----------------------------------------------------------------
+
+
+class _DeferredFlush:
+    """Handler mixin that leaves stream flushing to the pipeline (per batch)."""
+
+    def flush(self) -> None:
+        pass
+
+    def flush_batch(self) -> None:
+        super().flush()  # type: ignore[misc]
+
+
+class _BatchStreamHandler(_DeferredFlush, logging.StreamHandler):
+    """Console handler flushed once per pipeline batch."""
+
+
+class _BatchRotatingFileHandler(_DeferredFlush, logging.handlers.RotatingFileHandler):
+    """Rotating file handler flushed once per pipeline batch."""
+
+
+class LogPipeline:
+    """
+    Background writer for log records.
+
+    Loggers enqueue records (a cheap, non-blocking put); one daemon thread
+    drains the queue in batches, formats and writes each record to its
+    handlers, and flushes every touched stream once per batch. Logging
+    volume therefore costs the event loop a queue put, not JSON encoding
+    and file I/O.
+
+    When the queue is full the drop policy decides:
+    - drop_oldest: discard the oldest queued record (default)
+    - drop_new: discard the incoming record
+    - block: wait for space (back-pressure on the caller)
+
+    Dropped records are counted and reported in a warning record.
+    """
+
+    DROP_POLICIES = ("drop_oldest", "drop_new", "block")
+
+    def __init__(
+        self,
+        queue_size: int = 10000,
+        batch_size: int = 256,
+        drop_policy: str = "drop_oldest",
+    ):
+        """
+        Initialise pipeline (the writer thread starts on first use).
+
+        Args:
+            queue_size: Maximum queued records
+            batch_size: Maximum records written per batch
+            drop_policy: One of DROP_POLICIES
+
+        Raises:
+            ValueError: If drop_policy is unknown or sizes are not positive
+        """
+        if drop_policy not in self.DROP_POLICIES:
+            raise ValueError(
+                f"drop_policy must be one of {self.DROP_POLICIES}, got '{drop_policy}'"
+            )
+        if queue_size < 1 or batch_size < 1:
+            raise ValueError("queue_size and batch_size must be positive")
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.drop_policy = drop_policy
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._stopped = False
+        self.written = 0
+        self.dropped = 0
+        self._dropped_reported = 0
+
+    def submit(
+        self, record: logging.LogRecord, handlers: tuple[logging.Handler, ...]
+    ) -> bool:
+        """
+        Queue a record for the given handlers.
+
+        Returns:
+            False if the record was dropped
+        """
+        if self._stopped:
+            self._write(record, handlers)  # Late records at shutdown
+            return True
+        if self._thread is None:
+            self._start()
+
+        item = (record, handlers)
+        if self.drop_policy == "block":
+            self._queue.put(item)
+            return True
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+        self.dropped += 1
+        if self.drop_policy == "drop_new":
+            return False
+        try:
+            self._queue.get_nowait()
+            self._queue.task_done()
+        except queue.Empty:
+            pass
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            return False
+        return True
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """
+        Wait until every queued record has been written.
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        if self._thread is None or threading.current_thread() is self._thread:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Drain the queue and stop the writer; later records are written inline."""
+        self.flush(timeout)
+        self._stopped = True
+        if self._thread is not None:
+            self._queue.put((None, ()))
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict[str, Any]:
+        """Pipeline counters."""
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "drop_policy": self.drop_policy,
+        }
+
+    # ----------------------------------------------------------------
+    # Writer thread
+    # ----------------------------------------------------------------
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ics-log-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        get, get_nowait = self._queue.get, self._queue.get_nowait
+        while True:
+            batch = [get()]
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(get_nowait())
+            except queue.Empty:
+                pass
+
+            touched: set[logging.Handler] = set()
+            stop = False
+            for record, handlers in batch:
+                if record is None:
+                    stop = True
+                    continue
+                if self.dropped != self._dropped_reported:
+                    self._report_drops(handlers)
+                self._write(record, handlers)
+                touched.update(handlers)
+            for handler in touched:
+                try:
+                    handler.flush_batch()  # type: ignore[attr-defined]
+                except OSError:
+                    pass  # Surfaces on the handler's next write
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write(
+        self, record: logging.LogRecord, handlers: tuple[logging.Handler, ...]
+    ) -> None:
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        self.written += 1
+
+    def _report_drops(self, handlers: tuple[logging.Handler, ...]) -> None:
+        dropped = self.dropped - self._dropped_reported
+        self._dropped_reported = self.dropped
+        notice = logging.makeLogRecord(
+            {
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"Log queue full: {dropped} records dropped "
+                f"({self.drop_policy})",
+            }
+        )
+        self._write(notice, handlers)
+
+
+class _PipelineHandler(logging.Handler):
+    """Logger-side handler: stamps simulation time and queues the record."""
+
+    def __init__(self, sinks: tuple[logging.Handler, ...], sim_time: "SimulationTime"):
+        # Records no sink would write are never queued
+        super().__init__(min(h.level for h in sinks))
+        self.sinks = sinks
+        self.sim_time = sim_time
+
+    def emit(self, record: logging.LogRecord) -> None:
+        record.sim_time = self.sim_time.now()
+        if record.args:
+            # Resolve %-style arguments now, before they can change
+            record.msg = record.getMessage()
+            record.args = None
+        _get_pipeline().submit(record, self.sinks)
+
+    def flush(self) -> None:
+        """Wait for queued records to be written."""
+        _get_pipeline().flush()
+
+
 # ----------------------------------------------------------------
 # ICS Logger - Enhanced logging with structured output
 # ----------------------------------------------------------------
 
+_SEVERITY_LEVELS = {
+    EventSeverity.CRITICAL: logging.CRITICAL,
+    EventSeverity.ALERT: logging.CRITICAL,
+    EventSeverity.ERROR: logging.ERROR,
+    EventSeverity.WARNING: logging.WARNING,
+    EventSeverity.NOTICE: logging.INFO,
+    EventSeverity.INFO: logging.INFO,
+    EventSeverity.DEBUG: logging.DEBUG,
+}
+
 
 class ICSLogger:
     """
@@ -298,13 +584,24 @@ class ICSLogger:
         # Remove existing handlers
         self.logger.handlers.clear()
 
-        # Add handlers based on configuration
+        # Output handlers run on the pipeline's writer thread; the logger
+        # itself only carries the handler that queues records
+        self._sinks: list[logging.Handler] = []
         if enable_console:
             self._add_console_handler()
 
         if enable_json and log_dir:
             self._add_json_handler()
 
+        if self._sinks:
+            self.logger.addHandler(_PipelineHandler(tuple(self._sinks), self.sim_time))
+
+        # Level checks are cached; the handlers of any logger sharing this
+        # name just changed, so make every logger recompute
+        self._threshold = logging.DEBUG
+        self._level_generation = -1
+        _invalidate_levels()
+
         # Audit trail storage (in-memory)
         self.audit_trail: list[LogEntry] = []
         self._audit_lock = asyncio.Lock()
@@ -312,10 +609,10 @@ class ICSLogger:
 
     def _add_console_handler(self) -> None:
         """Add console handler with simulation time."""
-        handler = logging.StreamHandler()
+        handler = _BatchStreamHandler()
         handler.setLevel(logging.INFO)  # Hide DEBUG messages to reduce clutter
         handler.setFormatter(SimTimeFormatter(self.sim_time))
-        self.logger.addHandler(handler)
+        self._sinks.append(handler)
 
     def _add_json_handler(self) -> None:
         """Add JSON file handler with rotation."""
@@ -326,42 +623,81 @@ class ICSLogger:
         log_file = self.log_dir / f"{self.device or 'system'}.json.log"
 
         # Rotating file handler (10MB max, 5 backups)
-        handler = logging.handlers.RotatingFileHandler(
+        handler = _BatchRotatingFileHandler(
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5,
         )
         handler.setLevel(logging.DEBUG)
         handler.setFormatter(JSONFormatter(device=self.device))
-        self.logger.addHandler(handler)
+        self._sinks.append(handler)
 
     # ----------------------------------------------------------------
     # Standard logging methods
     # ----------------------------------------------------------------
 
-    def debug(self, message: str, **kwargs) -> None:
+    def is_enabled(self, level: int) -> bool:
+        """
+        Check whether a record at this level would be written.
+
+        Cached per logger and refreshed only after set_log_level(), so a
+        disabled debug call costs one comparison. Guard expensive
+        argument construction with it.
+        """
+        if self._level_generation != _level_generation:
+            self._refresh_level()
+        return level >= self._threshold
+
+    def set_level(self, level: int | str | None) -> None:
+        """Set this logger's module level (None restores the inherited one)."""
+        set_log_level(level, self.name)
+
+    def _refresh_level(self) -> None:
+        """Apply the effective module level and recompute the threshold."""
+        generation = _level_generation
+        level = _effective_level(self.name)
+        self.logger.setLevel(level)
+        handlers = self.logger.handlers
+        if handlers:
+            # Nothing below the most verbose handler is written either
+            level = max(level, min(h.level for h in handlers))
+        self._threshold = max(level, logging.root.manager.disable + 1)
+        self._level_generation = generation
+
+    def log(self, level: int, message: str, *args: Any, **kwargs) -> None:
+        """Log message at level (%-style args are formatted only if enabled)."""
+        if self.is_enabled(level):
+            self.logger.log(level, message, *args, **kwargs)
+
+    def debug(self, message: str, *args: Any, **kwargs) -> None:
         """Log debug message."""
-        self.logger.debug(message, **kwargs)
+        if self.is_enabled(logging.DEBUG):
+            self.logger.debug(message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args: Any, **kwargs) -> None:
         """Log info message."""
-        self.logger.info(message, **kwargs)
+        if self.is_enabled(logging.INFO):
+            self.logger.info(message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args: Any, **kwargs) -> None:
         """Log warning message."""
-        self.logger.warning(message, **kwargs)
+        if self.is_enabled(logging.WARNING):
+            self.logger.warning(message, *args, **kwargs)
 
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, *args: Any, **kwargs) -> None:
         """Log error message."""
-        self.logger.error(message, **kwargs)
+        if self.is_enabled(logging.ERROR):
+            self.logger.error(message, *args, **kwargs)
 
-    def critical(self, message: str, **kwargs) -> None:
+    def critical(self, message: str, *args: Any, **kwargs) -> None:
         """Log critical message."""
-        self.logger.critical(message, **kwargs)
+        if self.is_enabled(logging.CRITICAL):
+            self.logger.critical(message, *args, **kwargs)
 
-    def exception(self, message: str, **kwargs) -> None:
+    def exception(self, message: str, *args: Any, **kwargs) -> None:
         """Log exception with traceback."""
-        self.logger.exception(message, **kwargs)
+        if self.is_enabled(logging.ERROR):
+            self.logger.exception(message, *args, **kwargs)
 
     # ----------------------------------------------------------------
     # ICS-specific logging methods
@@ -401,18 +737,10 @@ class ICSLogger:
             **kwargs,
         )
 
-        # Log to Python logger
-        level_map = {
-            EventSeverity.CRITICAL: logging.CRITICAL,
-            EventSeverity.ALERT: logging.CRITICAL,
-            EventSeverity.ERROR: logging.ERROR,
-            EventSeverity.WARNING: logging.WARNING,
-            EventSeverity.NOTICE: logging.INFO,
-            EventSeverity.INFO: logging.INFO,
-            EventSeverity.DEBUG: logging.DEBUG,
-        }
-        log_level = level_map.get(severity, logging.INFO)
-        self.logger.log(log_level, entry.to_human_readable())
+        # Log to Python logger (skip formatting if nothing would write it)
+        log_level = _SEVERITY_LEVELS.get(severity, logging.INFO)
+        if self.is_enabled(log_level):
+            self.logger.log(log_level, entry.to_human_readable())
 
         # Store in audit trail if audit category
         if category == EventCategory.AUDIT or category == EventCategory.SECURITY:
@@ -583,6 +911,114 @@ _loggers: dict[str, ICSLogger] = {}
 _loggers_lock = threading.Lock()
 _default_log_dir: Path | None = None
 _default_data_store: "DataStore | None" = None
+_pipeline: LogPipeline | None = None
+_pipeline_lock = threading.Lock()
+_module_levels: dict[str, int] = {}  # module prefix ("" = default) -> level
+_level_generation = 0  # Bumped whenever cached logger levels go stale
+_levels_lock = threading.Lock()
+
+
+def _invalidate_levels() -> None:
+    global _level_generation
+    with _levels_lock:
+        _level_generation += 1
+
+
+def _effective_level(name: str) -> int:
+    """Level for the closest configured prefix of a dotted logger name."""
+    while True:
+        level = _module_levels.get(name)
+        if level is not None:
+            return level
+        if not name:
+            return logging.DEBUG
+        name = name.rpartition(".")[0]
+
+
+def set_log_level(level: int | str | None, module: str = "") -> None:
+    """
+    Set the runtime log level for a module and its submodules.
+
+    Applies to existing loggers and ones created later. The closest
+    configured prefix wins, so "components.network" at INFO can coexist
+    with "components.network.tcp_proxy" at DEBUG.
+
+    Args:
+        level: Level number or name ("DEBUG", "INFO", ...); None removes
+            the module's override
+        module: Dotted module prefix ("" = default for every logger)
+
+    Raises:
+        ValueError: If the level name is unknown
+    """
+    global _level_generation
+    if isinstance(level, str):
+        name = level.upper()
+        level = logging.getLevelNamesMapping().get(name)
+        if level is None:
+            raise ValueError(f"Unknown log level: {name}")
+    with _levels_lock:
+        if level is None:
+            _module_levels.pop(module, None)
+        else:
+            _module_levels[module] = level
+        _level_generation += 1
+
+
+def get_log_levels() -> dict[str, int]:
+    """Configured module levels (module prefix -> level)."""
+    with _levels_lock:
+        return dict(_module_levels)
+
+
+def _get_pipeline() -> LogPipeline:
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = LogPipeline()
+                atexit.register(_pipeline.stop)
+    return _pipeline
+
+
+def configure_log_pipeline(
+    queue_size: int = 10000,
+    batch_size: int = 256,
+    drop_policy: str = "drop_oldest",
+) -> LogPipeline:
+    """
+    Replace the shared log pipeline (drains the old one first).
+
+    Args:
+        queue_size: Maximum queued records
+        batch_size: Maximum records written per batch
+        drop_policy: "drop_oldest", "drop_new" or "block"
+
+    Returns:
+        The new pipeline
+
+    Raises:
+        ValueError: If a setting is invalid
+    """
+    global _pipeline
+    pipeline = LogPipeline(queue_size, batch_size, drop_policy)
+    with _pipeline_lock:
+        old, _pipeline = _pipeline, pipeline
+    atexit.register(pipeline.stop)
+    if old is not None:
+        old.stop()
+        atexit.unregister(old.stop)
+    return pipeline
+
+
+def flush_logging(timeout: float | None = 5.0) -> bool:
+    """
+    Wait for all queued log records to be written.
+
+    Returns:
+        True if everything was written within the timeout
+    """
+    return _pipeline.flush(timeout) if _pipeline is not None else True
 
 
 def configure_logging(
@@ -0,0 +1,133 @@
+# components/security/pattern_matcher.py
+"""
+Multi-pattern string matching (Aho-Corasick).
+
+Signature detection asks which of many known patterns occur in a piece of
+text. Testing each pattern separately costs O(patterns x text); an
+Aho-Corasick automaton finds every occurrence of every pattern in one
+pass, so cost depends on the text length and number of matches, not on
+how many signatures are loaded.
+
+Matching is case-insensitive.
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, NamedTuple
+
+__all__ = ["PatternMatch", "PatternMatcher"]
+
+
+class PatternMatch(NamedTuple):
+    """One occurrence of a pattern in the scanned text."""
+
+    offset: int  # Index of the first character of the match
+    pattern: str  # Pattern as originally given
+    label: Any  # Label the pattern was registered with
+
+
+class PatternMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of labelled patterns.
+
+    Patterns are added with ``add()`` and the automaton is built lazily on
+    the first search (or explicitly with ``build()``). Adding patterns
+    after a search rebuilds on the next one.
+
+    Example:
+        >>> matcher = PatternMatcher.from_groups(
+        ...     {"triton": ["TRISTATION", "inject.bin"]}
+        ... )
+        >>> list(matcher.find("Loaded inject.bin via TriStation"))
+        [PatternMatch(offset=7, pattern='inject.bin', label='triton'), \
+PatternMatch(offset=22, pattern='TRISTATION', label='triton')]
+    """
+
+    def __init__(self, patterns: Iterable[tuple[str, Any]] = ()):
+        """
+        Initialise matcher.
+
+        Args:
+            patterns: Optional (pattern, label) pairs to add
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._terminal: list[list[tuple[str, Any, int]]] = [[]]
+        self._fail: list[int] = [0]
+        self._output: list[list[tuple[str, Any, int]]] = [[]]
+        self._built = True
+        self._count = 0
+        for pattern, label in patterns:
+            self.add(pattern, label)
+
+    @classmethod
+    def from_groups(cls, groups: Mapping[Any, Iterable[str]]) -> "PatternMatcher":
+        """Build a matcher labelling each pattern with its group key."""
+        return cls(
+            (pattern, label) for label, items in groups.items() for pattern in items
+        )
+
+    def __len__(self) -> int:
+        """Number of patterns added."""
+        return self._count
+
+    def add(self, pattern: str, label: Any = None) -> None:
+        """
+        Add a pattern.
+
+        Raises:
+            ValueError: If pattern is empty
+        """
+        if not pattern:
+            raise ValueError("Pattern must not be empty")
+        folded = pattern.lower()
+        state = 0
+        for char in folded:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._terminal.append([])
+            state = next_state
+        self._terminal[state].append((pattern, label, len(folded)))
+        self._count += 1
+        self._built = False
+
+    def build(self) -> None:
+        """Compute failure links (breadth-first over the trie)."""
+        fail = [0] * len(self._goto)
+        output = [list(out) for out in self._terminal]
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                link = fail[state]
+                while link and char not in self._goto[link]:
+                    link = fail[link]
+                fail[child] = self._goto[link].get(char, 0)
+                output[child].extend(output[fail[child]])
+        self._fail = fail
+        self._output = output
+        self._built = True
+
+    def find(self, text: str) -> Iterator[PatternMatch]:
+        """
+        Yield every pattern occurrence in text, in order of match end.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            PatternMatch for each occurrence (overlaps included)
+        """
+        if not self._built:
+            self.build()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, char in enumerate(text.lower()):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern, label, length in output[state]:
+                yield PatternMatch(index - length + 1, pattern, label)
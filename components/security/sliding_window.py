@@ -0,0 +1,307 @@
+# components/security/sliding_window.py
+"""
+Bounded sliding-window counters for detection rules.
+
+Detection rules ask "how many distinct X did this source touch in the last
+N seconds?" and "which sources are the loudest?" for every event they see.
+Rebuilding lists per event makes both questions quadratic under a fast
+scan. The structures here answer them incrementally: time is cut into
+fixed-width buckets, each event touches only the current bucket, and whole
+buckets are retired as the window slides past them.
+
+- SlidingCounter: exact per-key event counts in the window, with top-n
+- SlidingDistinctCounter: exact distinct count of keys in the window
+- SlidingCountMinSketch: approximate per-key counts in fixed memory,
+  with heavy-hitter tracking across all keys
+"""
+
+from collections import Counter, deque
+from collections.abc import Hashable, Iterator
+from typing import Any
+
+__all__ = ["SlidingCountMinSketch", "SlidingCounter", "SlidingDistinctCounter"]
+
+
+class SlidingCounter:
+    """
+    Exact per-key event counts over a sliding time window.
+
+    Events land in the current bucket's Counter and in a running total per
+    key; retiring a bucket subtracts its counts. Adding an event and reading
+    a count are amortised O(1). Memory grows with the keys seen in the
+    window, so use SlidingCountMinSketch where keys are unbounded.
+
+    Example:
+        >>> blocks = SlidingCounter(window=60.0)
+        >>> blocks.add(0.0, "rule_10")
+        >>> blocks.add(1.0, "rule_10")
+        >>> blocks.top(1.0, 1)
+        [('rule_10', 2)]
+        >>> blocks.count(120.0)
+        0
+    """
+
+    def __init__(self, window: float, bucket_width: float = 1.0):
+        """
+        Initialise counter.
+
+        Args:
+            window: Window length in seconds
+            bucket_width: Expiry granularity in seconds
+        """
+        self.window = window
+        self.bucket_width = bucket_width
+        self._span = max(1, int(round(window / bucket_width)))
+        self._buckets: deque[tuple[int, Counter[Hashable]]] = deque()
+        self._totals: Counter[Hashable] = Counter()
+        self.total = 0
+
+    def add(self, now: float, key: Hashable, count: int = 1) -> None:
+        """Record count events for key at time now."""
+        index = self._advance(now)
+        if not self._buckets or self._buckets[-1][0] != index:
+            self._buckets.append((index, Counter()))
+        self._buckets[-1][1][key] += count
+        self._totals[key] += count
+        self.total += count
+
+    def count(self, now: float, key: Hashable | None = None) -> int:
+        """Events in the window for key, or for all keys if key is None."""
+        self._advance(now)
+        if key is None:
+            return self.total
+        return self._totals.get(key, 0)
+
+    def top(self, now: float, n: int | None = None) -> list[tuple[Any, int]]:
+        """Keys with the most events in the window, loudest first."""
+        self._advance(now)
+        return self._totals.most_common(n)
+
+    def clear(self) -> None:
+        """Forget all counts."""
+        self._buckets.clear()
+        self._totals.clear()
+        self.total = 0
+
+    def _advance(self, now: float) -> int:
+        """Retire buckets that have left the window; return current index."""
+        index = int(now // self.bucket_width)
+        if self._buckets and index < self._buckets[-1][0]:
+            self.clear()  # Clock went backwards (simulation reset)
+        oldest = index - self._span + 1
+        while self._buckets and self._buckets[0][0] < oldest:
+            _, expired = self._buckets.popleft()
+            for key, count in expired.items():
+                remaining = self._totals[key] - count
+                if remaining > 0:
+                    self._totals[key] = remaining
+                else:
+                    del self._totals[key]
+                self.total -= count
+        return index
+
+
+class SlidingDistinctCounter:
+    """
+    Exact count of distinct keys seen within a sliding time window.
+
+    Each key remembers the last bucket it was seen in, and each bucket
+    lists the keys first touched (or refreshed) there. Retiring a bucket
+    drops only the keys whose last sighting was in it, so adding a key
+    and reading the count are both amortised O(1).
+
+    Example:
+        >>> targets = SlidingDistinctCounter(window=60.0)
+        >>> targets.add(0.0, "plc_1")
+        1
+        >>> targets.add(1.0, "plc_2")
+        2
+        >>> targets.count(120.0)
+        0
+    """
+
+    def __init__(self, window: float, bucket_width: float = 1.0):
+        """
+        Initialise counter.
+
+        Args:
+            window: Window length in seconds
+            bucket_width: Expiry granularity in seconds
+        """
+        self.window = window
+        self.bucket_width = bucket_width
+        self._span = max(1, int(round(window / bucket_width)))
+        self._last_seen: dict[Hashable, int] = {}
+        self._buckets: deque[tuple[int, list[Hashable]]] = deque()
+
+    def add(self, now: float, key: Hashable) -> int:
+        """Record key at time now and return the distinct count."""
+        index = self._advance(now)
+        if self._last_seen.get(key) != index:
+            self._last_seen[key] = index
+            if not self._buckets or self._buckets[-1][0] != index:
+                self._buckets.append((index, []))
+            self._buckets[-1][1].append(key)
+        return len(self._last_seen)
+
+    def count(self, now: float) -> int:
+        """Distinct keys seen within the window ending at now."""
+        self._advance(now)
+        return len(self._last_seen)
+
+    def keys(self, now: float) -> list[Hashable]:
+        """Distinct keys seen within the window ending at now."""
+        self._advance(now)
+        return list(self._last_seen)
+
+    def clear(self) -> None:
+        """Forget all keys."""
+        self._last_seen.clear()
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._last_seen)
+
+    def _advance(self, now: float) -> int:
+        """Retire buckets that have left the window; return current index."""
+        index = int(now // self.bucket_width)
+        if self._buckets and index < self._buckets[-1][0]:
+            self.clear()  # Clock went backwards (simulation reset)
+        oldest = index - self._span + 1
+        while self._buckets and self._buckets[0][0] < oldest:
+            expired, keys = self._buckets.popleft()
+            for key in keys:
+                if self._last_seen.get(key) == expired:
+                    del self._last_seen[key]
+        return index
+
+
+class SlidingCountMinSketch:
+    """
+    Approximate per-key event counts over a sliding time window.
+
+    A count-min sketch of ``depth`` rows by ``width`` counters is kept per
+    time bucket, together with the running sum of all live buckets.
+    Estimates never undercount and overcount by at most
+    ``e * total / width`` with probability ``1 - exp(-depth)``, while
+    memory stays fixed no matter how many distinct keys appear.
+
+    Keys whose estimate reaches ``heavy_threshold`` are remembered as heavy
+    hitters; ``heavy_hitters()`` re-checks them against the live window, so
+    finding the loudest sources never touches quiet ones.
+
+    Example:
+        >>> sketch = SlidingCountMinSketch(window=60.0, heavy_threshold=100)
+        >>> for _ in range(150):
+        ...     _ = sketch.add(0.0, "enterprise_network")
+        >>> sketch.heavy_hitters(0.0)
+        [('enterprise_network', 150)]
+    """
+
+    def __init__(
+        self,
+        window: float,
+        bucket_width: float = 5.0,
+        width: int = 512,
+        depth: int = 4,
+        heavy_threshold: int = 100,
+    ):
+        """
+        Initialise sketch.
+
+        Args:
+            window: Window length in seconds
+            bucket_width: Expiry granularity in seconds
+            width: Counters per row (accuracy)
+            depth: Number of rows (confidence)
+            heavy_threshold: Estimated count at which a key is a heavy hitter
+        """
+        self.window = window
+        self.bucket_width = bucket_width
+        self.width = width
+        self.depth = depth
+        self.heavy_threshold = heavy_threshold
+        self._span = max(1, int(round(window / bucket_width)))
+        self._buckets: deque[tuple[int, list[list[int]]]] = deque()
+        self._totals = self._empty()
+        self.total = 0
+        self._heavy: set[Hashable] = set()
+
+    def add(self, now: float, key: Hashable, count: int = 1) -> int:
+        """Record count events for key at time now and return its estimate."""
+        index = self._advance(now)
+        if not self._buckets or self._buckets[-1][0] != index:
+            self._buckets.append((index, self._empty()))
+        bucket = self._buckets[-1][1]
+        estimate = None
+        for row, column in enumerate(self._columns(key)):
+            bucket[row][column] += count
+            self._totals[row][column] += count
+            cell = self._totals[row][column]
+            if estimate is None or cell < estimate:
+                estimate = cell
+        self.total += count
+        if estimate >= self.heavy_threshold:
+            self._heavy.add(key)
+        return estimate
+
+    def estimate(self, now: float, key: Hashable) -> int:
+        """Estimated events for key within the window ending at now."""
+        self._advance(now)
+        return self._estimate(key)
+
+    def heavy_hitters(self, now: float, n: int | None = None) -> list[tuple[Any, int]]:
+        """
+        Keys at or above the heavy-hitter threshold, loudest first.
+
+        Args:
+            now: Current time
+            n: Maximum number of keys to return (None = all)
+
+        Returns:
+            List of (key, estimated_count) tuples
+        """
+        self._advance(now)
+        hitters = []
+        for key in list(self._heavy):
+            estimate = self._estimate(key)
+            if estimate >= self.heavy_threshold:
+                hitters.append((key, estimate))
+            else:
+                self._heavy.discard(key)
+        hitters.sort(key=lambda item: item[1], reverse=True)
+        return hitters[:n] if n is not None else hitters
+
+    def clear(self) -> None:
+        """Forget all counts."""
+        self._buckets.clear()
+        self._totals = self._empty()
+        self.total = 0
+        self._heavy.clear()
+
+    def _empty(self) -> list[list[int]]:
+        return [[0] * self.width for _ in range(self.depth)]
+
+    def _columns(self, key: Hashable) -> Iterator[int]:
+        for row in range(self.depth):
+            yield hash((row, key)) % self.width
+
+    def _estimate(self, key: Hashable) -> int:
+        return min(
+            self._totals[row][column] for row, column in enumerate(self._columns(key))
+        )
+
+    def _advance(self, now: float) -> int:
+        """Retire buckets that have left the window; return current index."""
+        index = int(now // self.bucket_width)
+        if self._buckets and index < self._buckets[-1][0]:
+            self.clear()  # Clock went backwards (simulation reset)
+        oldest = index - self._span + 1
+        while self._buckets and self._buckets[0][0] < oldest:
+            _, bucket = self._buckets.popleft()
+            self.total -= sum(bucket[0])
+            for totals, counts in zip(self._totals, bucket, strict=True):
+                for column, value in enumerate(counts):
+                    if value:
+                        totals[column] -= value
+        return index
@@ -8,6 +8,7 @@ Integrates with SystemState for centralised state tracking.
 
 from __future__ import annotations
 
+import logging
 import re
 from typing import TYPE_CHECKING, Any
 
@@ -292,11 +293,11 @@ class DataStore:
 
         device = await self.system_state.get_device(device_name)
         if device is None:
-            logger.debug(f"Read from non-existent device: {device_name}")
+            logger.debug("Read from non-existent device: %s", device_name)
             return None
 
         value = device.memory_map.get(address)
-        logger.debug(f"Read {device_name}[{address}] = {value}")
+        logger.debug("Read %s[%s] = %s", device_name, address, value)
         return value
 
     async def write_memory(
@@ -364,7 +365,7 @@ class DataStore:
         )
 
         if success:
-            logger.debug(f"Wrote {device_name}[{address}] = {value}")
+            logger.debug("Wrote %s[%s] = %s", device_name, address, value)
 
         return success
 
@@ -385,10 +386,10 @@ class DataStore:
 
         device = await self.system_state.get_device(device_name)
         if device is None:
-            logger.debug(f"Bulk read from non-existent device: {device_name}")
+            logger.debug("Bulk read from non-existent device: %s", device_name)
             return None
 
-        logger.debug(f"Bulk read {device_name}: {len(device.memory_map)} addresses")
+        logger.debug("Bulk read %s: %d addresses", device_name, len(device.memory_map))
         return device.memory_map.copy()
 
     async def bulk_write_memory(
@@ -460,7 +461,7 @@ class DataStore:
         )
 
         if success:
-            logger.debug(f"Bulk wrote {device_name}: {len(values)} addresses")
+            logger.debug("Bulk wrote %s: %d addresses", device_name, len(values))
 
         return success
 
@@ -486,8 +487,9 @@ class DataStore:
 
         # Allow custom patterns but log warning
         logger.debug(
-            f"Address '{address}' doesn't match standard patterns "
-            "(Modbus, OPC UA, IEC 104, Siemens S7, Internal, Config). Proceeding anyway."
+            "Address '%s' doesn't match standard patterns "
+            "(Modbus, OPC UA, IEC 104, Siemens S7, Internal, Config). Proceeding anyway.",
+            address,
         )
 
     # ----------------------------------------------------------------
@@ -567,7 +569,8 @@ class DataStore:
         success = await self.system_state.update_device(device_name, metadata=metadata)
 
         if success:
-            logger.debug(f"Updated metadata on {device_name}: {list(metadata.keys())}")
+            if logger.is_enabled(logging.DEBUG):
+                logger.debug("Updated metadata on %s: %s", device_name, list(metadata))
 
         return success
 
@@ -588,7 +591,7 @@ class DataStore:
 
         device = await self.system_state.get_device(device_name)
         if device is None:
-            logger.debug(f"Read metadata from non-existent device: {device_name}")
+            logger.debug("Read metadata from non-existent device: %s", device_name)
             return None
 
         return device.metadata.copy()
@@ -689,6 +692,7 @@ class DataStore:
         action: str | None = None,
         since: float | None = None,
         until: float | None = None,
+        history: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Query central audit log.
@@ -703,6 +707,7 @@ class DataStore:
             action: Filter by action (write_memory, config_change, etc.)
             since: Filter events after this simulation time
             until: Filter events before this simulation time
+            history: Query the on-disk audit history instead of the live log
 
         Returns:
             List of audit events (most recent first)
@@ -722,4 +727,5 @@ class DataStore:
             action=action,
             since=since,
             until=until,
+            history=history,
         )
@@ -9,11 +9,15 @@ Provides unified interface for monitoring and control.
 import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from components.security.logging_system import get_logger
 from components.time.simulation_time import SimulationTime
 
+if TYPE_CHECKING:
+    from components.security.audit_aggregator import AuditAggregator
+    from components.security.audit_store import AuditStore
+
 # Configure logging
 logger = get_logger(__name__)
 
@@ -82,12 +86,32 @@ class SystemState:
         ... )
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        audit_store: "AuditStore | None" = None,
+        audit_aggregator: "AuditAggregator | None" = None,
+    ):
+        """
+        Initialise empty state.
+
+        Args:
+            audit_store: Optional on-disk audit history. When set, audit
+                events are also appended to it, and get_audit_log(history=True)
+                queries it to reach beyond the in-memory log.
+            audit_aggregator: Optional storm suppression. When set, repeated
+                audit events are coalesced into counted summary records
+                before they are stored.
+        """
         self.devices: dict[str, DeviceState] = {}
         self.simulation = SimulationState()
         self._lock = asyncio.Lock()
         self._sim_time = SimulationTime()
         self.audit_log: list[dict[str, Any]] = []  # Centralised audit trail
+        self.audit_store = audit_store
+        self.audit_aggregator = audit_aggregator
+        # Append sequence stamped on each kept record; never reset, so
+        # pollers can resume after it even across reset()
+        self._audit_sequence = 0
 
     # ----------------------------------------------------------------
     # Device registration
@@ -383,7 +407,7 @@ class SystemState:
             device_count = len(self.devices)
             self.devices.clear()
             self.simulation = SimulationState()
-            self.audit_log.clear()  # Clear audit log on reset
+            self.audit_log.clear()  # Clear audit log on reset (disk history is kept)
             logger.info(f"System state reset: cleared {device_count} devices")
 
     # ----------------------------------------------------------------
@@ -399,13 +423,53 @@ class SystemState:
 
         Note:
             Automatically trims log to last 10000 events to prevent unbounded growth.
+            Stored records are copies carrying a monotonically increasing
+            ``sequence`` number, which pollers use to resume.
+            The audit store (if any) keeps the full history. With an
+            aggregator, repeats may be held back and stored later as one
+            summary record.
         """
         async with self._lock:
-            self.audit_log.append(event)
+            if self.audit_aggregator is None:
+                self._keep_audit_records([event])
+            else:
+                self._keep_audit_records(self.audit_aggregator.offer(event))
 
-            # Trim if too long (keep last 10000 events)
-            if len(self.audit_log) > 10000:
-                self.audit_log = self.audit_log[-10000:]
+    async def flush_audit_aggregation(self, final: bool = False) -> None:
+        """
+        Store summaries of aggregation windows that have closed.
+
+        Args:
+            final: Close every open window (e.g. on shutdown)
+        """
+        if self.audit_aggregator is None:
+            return
+        async with self._lock:
+            if final:
+                records = self.audit_aggregator.flush(self._sim_time.now())
+            else:
+                records = self.audit_aggregator.expire(self._sim_time.now())
+            self._keep_audit_records(records)
+
+    def _keep_audit_records(self, records: list[dict[str, Any]]) -> None:
+        """Stamp records with their sequence and append them to the log and store."""
+        if not records:
+            return
+        sequence = self._audit_sequence
+        records = [
+            {**record, "sequence": sequence + i}
+            for i, record in enumerate(records, start=1)
+        ]
+        self._audit_sequence = sequence + len(records)
+        self.audit_log.extend(records)
+
+        # Trim if too long (keep last 10000 events)
+        if len(self.audit_log) > 10000:
+            self.audit_log = self.audit_log[-10000:]
+
+        if self.audit_store is not None and not self.audit_store.read_only:
+            for record in records:
+                self.audit_store.append(record)
 
     async def get_audit_log(
         self,
@@ -418,6 +482,7 @@ class SystemState:
         action: str | None = None,
         since: float | None = None,
         until: float | None = None,
+        history: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Query audit log with optional filters.
@@ -432,10 +497,28 @@ class SystemState:
             action: Filter by action (write_memory, config_change, etc.)
             since: Filter events after this simulation time
             until: Filter events before this simulation time
+            history: Query the audit store's full on-disk history (all
+                runs) instead of the live in-memory log, if a store is
+                attached. For reporting tools, not per-cycle detectors.
 
         Returns:
             List of audit events (most recent first)
         """
+        await self.flush_audit_aggregation()
+
+        if history and self.audit_store is not None:
+            return self.audit_store.query(
+                limit=limit,
+                device=device,
+                event_type=event_type,
+                category=category,
+                severity=severity,
+                user=user,
+                action=action,
+                since=since,
+                until=until,
+            )
+
         async with self._lock:
             events = self.audit_log.copy()
 
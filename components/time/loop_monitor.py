@@ -0,0 +1,341 @@
+# components/time/loop_monitor.py
+"""
+Event-loop health monitor.
+
+Every PLC scan, protocol response and physics update shares one asyncio
+event loop, so any step that runs too long (a heavy physics update,
+synchronous I/O, a blocking library call) delays all of them. This
+module makes that visible:
+
+- Scheduling lag: a probe task sleeps for ``probe_interval`` and
+  measures with ``time.perf_counter`` how late it wakes up. Lag goes
+  into a fixed-bucket histogram (p50/p95/p99, max).
+- Attribution: a task factory wraps each new task's coroutine and times
+  every step (each resume between awaits). Steps longer than
+  ``slow_step`` are charged to the task: its name if one was given,
+  otherwise the coroutine plus the owning object's device name, e.g.
+  ``BaseDevice._scan_loop[turbine_plc_1]``.
+- Phases: ``with monitor.phase("physics"):`` times a section of a task
+  (e.g. one stage of the simulation cycle) on every pass, so a slow
+  cycle can be split into its parts.
+
+asyncio's own slow-callback report needs loop debug mode, which slows
+the whole simulator, so it is not used here. Timing a step costs two
+``perf_counter`` calls.
+"""
+
+import asyncio
+import bisect
+import collections.abc
+import time
+from collections.abc import Callable, Coroutine, Generator, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from components.security.logging_system import get_logger
+
+__all__ = ["LagHistogram", "LoopMonitor"]
+
+logger = get_logger(__name__)
+
+# Task factory signature, as installed with loop.set_task_factory()
+_TaskFactory = Callable[..., asyncio.Future[Any]]
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open)
+LAG_BUCKETS_MS = (0.1, 0.5, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+
+
+class LagHistogram:
+    """
+    Fixed-bucket histogram of durations in milliseconds.
+
+    Example:
+        >>> hist = LagHistogram()
+        >>> for ms in (0.2, 0.3, 15.0):
+        ...     hist.add(ms)
+        >>> hist.percentile(50)
+        0.5
+    """
+
+    __slots__ = ("edges", "counts", "count", "total", "max")
+
+    def __init__(self, edges: tuple[float, ...] = LAG_BUCKETS_MS):
+        self.edges = edges
+        self.counts = [0] * (len(edges) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.edges, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile (max if open)."""
+        if not self.count:
+            return 0.0
+        rank = q / 100.0 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return self.edges[index] if index < len(self.edges) else self.max
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        labels = [f"<={edge}ms" for edge in self.edges] + [f">{self.edges[-1]}ms"]
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "max_ms": self.max,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+class _Offender:
+    """Duration totals for one task label or phase."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class _TimedCoroutine(collections.abc.Coroutine[Any, Any, Any]):
+    """Coroutine wrapper that times each step and reports slow ones."""
+
+    __slots__ = ("_coro", "_label", "_monitor")
+
+    def __init__(
+        self, coro: Coroutine[Any, Any, Any], label: str, monitor: "LoopMonitor"
+    ):
+        self._coro = coro
+        self._label = label
+        self._monitor = monitor
+
+    def send(self, value: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return self._coro.send(value)
+        finally:
+            self._timed(time.perf_counter() - start)
+
+    def throw(self, *args: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return self._coro.throw(*args)
+        finally:
+            self._timed(time.perf_counter() - start)
+
+    def close(self) -> None:
+        self._coro.close()
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return self._coro.__await__()
+
+    def __getattr__(self, name: str) -> Any:
+        # cr_frame, __qualname__ etc. for task reprs and introspection
+        return getattr(self._coro, name)
+
+    def __repr__(self) -> str:
+        return repr(self._coro)
+
+    def _timed(self, duration: float) -> None:
+        if duration >= self._monitor.slow_step:
+            task = asyncio.current_task()
+            name = task.get_name() if task is not None else ""
+            label = self._label if not name or name.startswith("Task-") else name
+            self._monitor.record_slow_step(label, duration)
+
+
+def _task_label(coro: Any) -> str:
+    """Coroutine qualname plus the owning object's device name, if any."""
+    label = getattr(coro, "__qualname__", type(coro).__name__)
+    frame = getattr(coro, "cr_frame", None)
+    owner = frame.f_locals.get("self") if frame is not None else None
+    name = getattr(owner, "device_name", None) or getattr(owner, "name", None)
+    return f"{label}[{name}]" if isinstance(name, str) and name else label
+
+
+class LoopMonitor:
+    """
+    Measure event-loop lag and attribute slow task steps.
+
+    Example:
+        >>> monitor = LoopMonitor(probe_interval=0.05, slow_step=0.02)
+        >>> await monitor.start()
+        >>> ...
+        >>> monitor.get_status()["lag"]["p99_ms"]
+        1.0
+        >>> await monitor.stop()
+    """
+
+    def __init__(
+        self,
+        probe_interval: float = 0.05,
+        slow_step: float = 0.02,
+        attribute_tasks: bool = True,
+        top_n: int = 10,
+    ):
+        """
+        Initialise monitor.
+
+        Args:
+            probe_interval: Seconds (wall clock) between lag probes
+            slow_step: Task steps at least this long (seconds) are attributed
+            attribute_tasks: Time the steps of tasks created after start()
+            top_n: Offenders listed in get_status()
+
+        Raises:
+            ValueError: If an interval is not positive
+        """
+        if probe_interval <= 0 or slow_step <= 0:
+            raise ValueError("probe_interval and slow_step must be positive")
+        self.probe_interval = probe_interval
+        self.slow_step = slow_step
+        self.attribute_tasks = attribute_tasks
+        self.top_n = top_n
+        self.lag = LagHistogram()
+        self.slow_steps = LagHistogram()
+        self.offenders: dict[str, _Offender] = {}
+        self.phases: dict[str, _Offender] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._previous_factory: _TaskFactory | None = None
+        self._probe_task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._probe_task is not None
+
+    async def start(self) -> None:
+        """Start probing and (optionally) instrument new tasks on this loop."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        if self.attribute_tasks:
+            self._previous_factory = self._loop.get_task_factory()
+            self._loop.set_task_factory(self._task_factory)
+        self._probe_task = asyncio.create_task(self._probe(), name="loop_monitor")
+        logger.info(
+            f"Loop monitor started (probe {self.probe_interval * 1000:.0f}ms, "
+            f"slow step {self.slow_step * 1000:.0f}ms)"
+        )
+
+    async def stop(self) -> None:
+        """Stop probing and restore the previous task factory."""
+        task, self._probe_task = self._probe_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        loop = self._loop
+        if (
+            self.attribute_tasks
+            and loop is not None
+            and loop.get_task_factory() == self._task_factory
+        ):
+            loop.set_task_factory(self._previous_factory)
+        self._previous_factory = None
+
+    def record_slow_step(self, label: str, duration: float) -> None:
+        """Charge a slow step (seconds) to a task label."""
+        duration_ms = duration * 1000.0
+        self.slow_steps.add(duration_ms)
+        offender = self.offenders.get(label)
+        if offender is None:
+            offender = self.offenders[label] = _Offender()
+        offender.count += 1
+        offender.total += duration_ms
+        if duration_ms > offender.max:
+            offender.max = duration_ms
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block (including awaits) as a named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000.0
+            stats = self.phases.get(name)
+            if stats is None:
+                stats = self.phases[name] = _Offender()
+            stats.count += 1
+            stats.total += duration_ms
+            if duration_ms > stats.max:
+                stats.max = duration_ms
+
+    def top_offenders(self, n: int | None = None) -> list[dict[str, Any]]:
+        """Task labels by total slow-step time, worst first."""
+        ranked = sorted(
+            self.offenders.items(), key=lambda item: item[1].total, reverse=True
+        )
+        return [
+            {
+                "task": label,
+                "slow_steps": offender.count,
+                "total_ms": round(offender.total, 3),
+                "max_ms": round(offender.max, 3),
+            }
+            for label, offender in ranked[: self.top_n if n is None else n]
+        ]
+
+    def get_status(self) -> dict[str, Any]:
+        """Lag histogram, slow-step histogram, top offenders and phases."""
+        return {
+            "running": self.running,
+            "probe_interval_ms": self.probe_interval * 1000.0,
+            "slow_step_ms": self.slow_step * 1000.0,
+            "lag": self.lag.to_dict(),
+            "slow_steps": self.slow_steps.to_dict(),
+            "top_offenders": self.top_offenders(),
+            "phases": {
+                name: {
+                    "count": stats.count,
+                    "mean_ms": round(stats.total / stats.count, 3),
+                    "max_ms": round(stats.max, 3),
+                }
+                for name, stats in self.phases.items()
+            },
+        }
+
+    def reset(self) -> None:
+        """Clear all measurements."""
+        self.lag = LagHistogram()
+        self.slow_steps = LagHistogram()
+        self.offenders.clear()
+        self.phases.clear()
+
+    # ----------------------------------------------------------------
+    # Internal helpers
+    # ----------------------------------------------------------------
+
+    async def _probe(self) -> None:
+        interval = self.probe_interval
+        while True:
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            self.lag.add(max(0.0, time.perf_counter() - expected) * 1000.0)
+
+    def _task_factory(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        coro: Coroutine[Any, Any, Any],
+        **kwargs: Any,
+    ) -> asyncio.Future[Any]:
+        if asyncio.iscoroutine(coro) and not isinstance(coro, _TimedCoroutine):
+            coro = _TimedCoroutine(coro, _task_label(coro), self)
+        if self._previous_factory is not None:
+            return self._previous_factory(loop, coro, **kwargs)
+        return asyncio.Task(coro, loop=loop, **kwargs)
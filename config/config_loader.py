@@ -103,11 +103,13 @@ class ConfigLoader:
                 config["firewall"] = {
                     "default_action": firewall_data.get("default_action", "allow"),
                     "baseline_rules": firewall_data.get("baseline_rules", []),
+                    "connection_tracking": firewall_data.get("connection_tracking", {}),
                 }
         else:
             config["firewall"] = {
                 "default_action": "allow",
                 "baseline_rules": [],
+                "connection_tracking": {},
             }
 
         # Load IDS/IPS config
@@ -120,16 +122,32 @@ class ConfigLoader:
                     "auto_block_on_critical": ids_data.get(
                         "auto_block_on_critical", True
                     ),
+                    "auto_block_ttl": ids_data.get("auto_block_ttl", 3600.0),
                     "permanent_blocked_ips": ids_data.get("permanent_blocked_ips", []),
                     "detection_thresholds": ids_data.get("detection_thresholds", {}),
+                    "malware_signatures": ids_data.get("malware_signatures") or {},
                 }
         else:
             config["ids_ips"] = {
                 "prevention_mode": False,
                 "auto_block_on_critical": True,
+                "auto_block_ttl": 3600.0,
                 "permanent_blocked_ips": [],
                 "detection_thresholds": {},
+                "malware_signatures": {},
             }
+
+        # Load SIEM correlation rules (None keeps the built-in rules)
+        siem_path = self.config_dir / "siem_correlation.yml"
+        if siem_path.exists():
+            with open(siem_path) as f:
+                siem_data = yaml.safe_load(f) or {}
+                config["siem_correlation"] = {
+                    "rules": siem_data.get("rules") or None,
+                }
+        else:
+            config["siem_correlation"] = {"rules": None}
+
         # Load RBAC config
         rbac_path = self.config_dir / "rbac.yml"
         if rbac_path.exists():
@@ -202,6 +220,7 @@ class ConfigLoader:
                     "rate_limits": anomaly_data.get("rate_limits", []),
                     "severity_mapping": anomaly_data.get("severity_mapping", {}),
                     "integration": anomaly_data.get("integration", {}),
+                    "baseline_file": anomaly_data.get("baseline_file"),
                 }
         else:
             config["anomaly_detection"] = {
@@ -215,6 +234,7 @@ class ConfigLoader:
                 "rate_limits": [],
                 "severity_mapping": {},
                 "integration": {},
+                "baseline_file": None,
             }
 
         # Load OPC UA security config
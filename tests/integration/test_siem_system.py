@@ -16,6 +16,7 @@ from components.devices.enterprise_zone.siem_system import (
     IncidentStatus,
     SIEMSystem,
 )
+from components.security.logging_system import EventSeverity, ICSLogger
 from components.state.data_store import DataStore
 from components.state.system_state import SystemState
 from components.time.simulation_time import SimulationTime
@@ -474,7 +475,7 @@ class TestAuditTrailIntegration:
         """Test SIEM correctly consumes audit trail from DataStore."""
         siem, system_state, sim_time = siem_system
 
-        initial_index = siem._last_processed_event_index
+        initial_sequence = siem._last_sequence
 
         # Add events via SystemState
         for i in range(5):
@@ -492,7 +493,7 @@ class TestAuditTrailIntegration:
         await asyncio.sleep(1.0)
 
         # SIEM should have processed new events
-        assert siem._last_processed_event_index > initial_index
+        assert siem._last_sequence > initial_sequence
         assert siem.total_events_analyzed > 0
 
     @pytest.mark.asyncio
@@ -515,7 +516,7 @@ class TestAuditTrailIntegration:
 
         await asyncio.sleep(1.0)
         count_after_batch1 = siem.total_events_analyzed
-        index_after_batch1 = siem._last_processed_event_index
+        sequence_after_batch1 = siem._last_sequence
 
         # Add second batch
         for i in range(3):
@@ -534,4 +535,127 @@ class TestAuditTrailIntegration:
 
         # Should have processed 3 more events
         assert siem.total_events_analyzed == count_after_batch1 + 3
-        assert siem._last_processed_event_index == index_after_batch1 + 3
+        assert siem._last_sequence == sequence_after_batch1 + 3
+
+    @pytest.mark.asyncio
+    async def test_processing_continues_once_log_is_capped(self, siem_system):
+        """Test new events are still seen after the log hits its cap.
+
+        WHY: The audit log keeps only the last 10000 events, so its length
+        stops growing; a positional cursor would then see nothing new.
+        """
+        siem, system_state, sim_time = siem_system
+        event = {
+            "simulation_time": sim_time.now(),
+            "wall_time": time.time(),
+            "message": "Routine event",
+            "device": "test",
+            "user": "test",
+            "data": {"action": "test", "result": "SUCCESS"},
+        }
+        for _ in range(10000):
+            await system_state.append_audit_event(event)
+        await asyncio.sleep(1.0)
+        analysed = siem.total_events_analyzed
+
+        for _ in range(3):
+            await system_state.append_audit_event(event)
+        await asyncio.sleep(1.0)
+
+        assert len(system_state.audit_log) == 10000
+        assert siem.total_events_analyzed == analysed + 3
+
+
+class TestICSLoggerPipeline:
+    """Test events logged through ICSLogger, whose data is a JSON string."""
+
+    @pytest.mark.asyncio
+    async def test_data_fields_reach_rules_and_templates(self, siem_system):
+        """Test data.* filters and alert templates see logged data fields.
+
+        WHY: LogEntry.to_dict stores data as a JSON string; unless the SIEM
+        decodes it, no data.* rule can ever fire on real audit events.
+        """
+        siem, _, _ = siem_system
+        logger = ICSLogger(
+            "auth_system",
+            device="auth_system",
+            enable_console=False,
+            data_store=siem.data_store,
+        )
+
+        for i in range(3):
+            await logger.log_audit(
+                f"Login attempt {i + 1} rejected",
+                user="attacker",
+                action="authenticate",
+                result="FAILED",
+            )
+        for _ in range(5):
+            await logger.log_security(
+                "Connection denied by network segmentation: 10.0.0.5 "
+                "(corporate_network) -> plc_1:502",
+                severity=EventSeverity.WARNING,
+                data={"source_network": "corporate_network"},
+            )
+
+        await asyncio.sleep(1.0)
+
+        titles = {a.category: a.title for a in siem.get_all_alerts()}
+        assert titles["authentication"] == (
+            "Multiple failed authentication attempts: attacker"
+        )
+        assert titles["network_security"] == (
+            "Network segmentation violations: corporate_network -> auth_system"
+        )
+
+
+class TestCorrelationRules:
+    """Test SIEM correlation rules loaded from config."""
+
+    @pytest.mark.asyncio
+    async def test_loaded_rules_replace_defaults(self, siem_system):
+        """Test rules from config drive detection."""
+        siem, system_state, sim_time = siem_system
+
+        await siem.load_config(
+            {
+                "rules": [
+                    {
+                        "name": "auth_then_bypass",
+                        "sequence": [
+                            {"data.result": "FAILED"},
+                            {"data.action": "activate_safety_bypass"},
+                        ],
+                        "group_by": ["user"],
+                        "window": 300,
+                        "alert": {
+                            "severity": "CRITICAL",
+                            "category": "safety",
+                            "title": "Bypass after failed login: {user}",
+                        },
+                    }
+                ]
+            }
+        )
+        for action, result in [
+            ("login", "FAILED"),
+            ("activate_safety_bypass", "SUCCESS"),
+        ]:
+            await system_state.append_audit_event(
+                {
+                    "simulation_time": sim_time.now(),
+                    "wall_time": time.time(),
+                    "message": f"{action} {result}",
+                    "device": "reactor_safety_1",
+                    "user": "supervisor1",
+                    "data": {"action": action, "result": result},
+                }
+            )
+
+        await asyncio.sleep(1.0)
+
+        alerts = siem.get_all_alerts()
+        assert [a.title for a in alerts] == ["Bypass after failed login: supervisor1"]
+        assert alerts[0].severity == AlertSeverity.CRITICAL
+        assert list(siem.get_statistics()["detection_rules"]) == ["auth_then_bypass"]
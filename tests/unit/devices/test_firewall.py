@@ -0,0 +1,361 @@
+# tests/unit/devices/test_firewall.py
+"""Tests for the industrial Firewall.
+
+Level 4 dependency - uses REAL DataStore, SystemState and SimulationTime.
+
+Test Coverage:
+- First-match-by-priority rule evaluation
+- CIDR source/destination matching
+- Zone, network, protocol and port criteria
+- Index maintenance on add/remove/enable/disable
+- Hit counters and default policy
+- Connection tracking (reuse, flush, idle expiry, LRU eviction)
+- Rolling block counters and bounded block history
+"""
+
+import pytest
+
+from components.devices.enterprise_zone.firewall import (
+    Firewall,
+    RuleAction,
+    RuleProtocol,
+)
+from components.state.data_store import DataStore
+from components.state.system_state import SystemState
+from components.time.simulation_time import SimulationTime
+
+
+# ================================================================
+# FIXTURES
+# ================================================================
+@pytest.fixture
+async def firewall():
+    """Create a Firewall (not started) with a clean simulation clock."""
+    sim_time = SimulationTime()
+    await sim_time.reset()
+    fw = Firewall(
+        device_name="firewall_primary",
+        device_id=500,
+        data_store=DataStore(SystemState()),
+    )
+    yield fw
+    await sim_time.reset()
+
+
+async def _check(fw: Firewall, source_ip: str = "192.168.1.100", **kwargs):
+    """Check a connection with sensible defaults."""
+    kwargs.setdefault("dest_ip", "10.10.1.5")
+    kwargs.setdefault("dest_port", 502)
+    kwargs.setdefault("protocol", "modbus_tcp")
+    return await fw.check_connection(source_ip=source_ip, **kwargs)
+
+
+# ================================================================
+# RULE MATCHING TESTS
+# ================================================================
+class TestFirewallRuleMatching:
+    """Test rule evaluation."""
+
+    async def test_default_policy_when_no_rule_matches(self, firewall):
+        """Test the default action applies when nothing matches."""
+        allowed, reason = await _check(firewall)
+
+        assert allowed is True
+        assert reason == "Allowed by default policy"
+
+    async def test_first_match_by_priority(self, firewall):
+        """Test the lowest priority number wins regardless of insertion order."""
+        await firewall.add_rule(
+            "Block modbus", RuleAction.DENY, priority=100, dest_port=502
+        )
+        allow_id = await firewall.add_rule(
+            "Allow SCADA host",
+            RuleAction.ALLOW,
+            priority=10,
+            source_ip="192.168.1.100",
+        )
+
+        allowed, reason = await _check(firewall)
+
+        assert allowed is True
+        assert allow_id in reason
+        assert firewall.get_rule(allow_id).hit_count == 1
+
+    async def test_equal_priority_keeps_insertion_order(self, firewall):
+        """Test ties are broken by the order rules were added."""
+        first = await firewall.add_rule(
+            "First", RuleAction.DENY, protocol=RuleProtocol.MODBUS_TCP
+        )
+        await firewall.add_rule(
+            "Second", RuleAction.ALLOW, source_zone="enterprise_zone"
+        )
+
+        allowed, reason = await _check(firewall, source_zone="enterprise_zone")
+
+        assert allowed is False
+        assert first in reason
+
+    async def test_cidr_source_match(self, firewall):
+        """Test source_ip accepts CIDR prefixes."""
+        await firewall.add_rule(
+            "Block attacker subnet", RuleAction.DROP, source_ip="192.168.1.0/24"
+        )
+
+        assert (await _check(firewall, "192.168.1.77"))[0] is False
+        assert (await _check(firewall, "192.168.2.77"))[0] is True
+        assert (await _check(firewall, "unknown"))[0] is True
+
+    async def test_cidr_destination_and_non_ip_dest(self, firewall):
+        """Test dest_ip matches CIDRs and falls back to exact device names."""
+        await firewall.add_rule(
+            "Protect control subnet", RuleAction.DENY, dest_ip="10.10.0.0/16"
+        )
+        await firewall.add_rule(
+            "Protect PLC by name", RuleAction.DENY, dest_ip="hex_turbine_plc"
+        )
+
+        assert (await _check(firewall, dest_ip="10.10.3.9"))[0] is False
+        assert (await _check(firewall, dest_ip="hex_turbine_plc"))[0] is False
+        assert (await _check(firewall, dest_ip="reactor_plc"))[0] is True
+
+    async def test_all_criteria_must_match(self, firewall):
+        """Test a rule indexed on one field still checks every other field."""
+        await firewall.add_rule(
+            "Block enterprise modbus to control",
+            RuleAction.DENY,
+            source_ip="192.168.0.0/16",
+            dest_zone="control_zone",
+            dest_port=502,
+            protocol=RuleProtocol.MODBUS_TCP,
+        )
+
+        assert (await _check(firewall, dest_zone="control_zone"))[0] is False
+        assert (await _check(firewall, dest_zone="operations_zone"))[0] is True
+        assert (await _check(firewall, dest_zone="control_zone", protocol="dnp3"))[
+            0
+        ] is True
+
+    async def test_large_blocklist(self, firewall):
+        """Test thousands of host rules resolve to the right rule."""
+        for i in range(2000):
+            await firewall.add_rule(
+                f"Block host {i}",
+                RuleAction.DROP,
+                source_ip=f"172.16.{i // 256}.{i % 256}",
+            )
+
+        allowed, reason = await _check(firewall, "172.16.3.200")
+
+        assert allowed is False
+        assert "Block host 968" in reason
+        assert (await _check(firewall, "172.16.9.1"))[0] is True
+
+
+# ================================================================
+# RULE MANAGEMENT TESTS
+# ================================================================
+class TestFirewallRuleManagement:
+    """Test index maintenance as rules change."""
+
+    async def test_disable_and_enable(self, firewall):
+        """Test disabled rules stop matching until re-enabled."""
+        rule_id = await firewall.add_rule(
+            "Block attacker", RuleAction.DROP, source_ip="192.168.1.100"
+        )
+
+        await firewall.disable_rule(rule_id)
+        assert (await _check(firewall))[0] is True
+
+        await firewall.enable_rule(rule_id)
+        assert (await _check(firewall))[0] is False
+
+    async def test_reenabled_rule_keeps_its_position(self, firewall):
+        """Test re-enabling does not move a rule behind later equal-priority rules."""
+        first = await firewall.add_rule("First", RuleAction.DENY, dest_port=502)
+        await firewall.add_rule("Second", RuleAction.ALLOW, dest_port=502)
+
+        await firewall.disable_rule(first)
+        await firewall.enable_rule(first)
+
+        assert first in (await _check(firewall))[1]
+
+    async def test_remove_rule(self, firewall):
+        """Test removed rules no longer match."""
+        rule_id = await firewall.add_rule(
+            "Block attacker", RuleAction.DROP, source_ip="192.168.1.100"
+        )
+
+        assert await firewall.remove_rule(rule_id) is True
+        assert (await _check(firewall))[0] is True
+        assert await firewall.remove_rule(rule_id) is False
+
+    async def test_baseline_rules_from_config(self, firewall):
+        """Test baseline rules loaded from config are indexed."""
+        await firewall.load_config(
+            {
+                "default_action": "deny",
+                "baseline_rules": [
+                    {
+                        "name": "Allow SCADA",
+                        "action": "ALLOW",
+                        "priority": 50,
+                        "source_zone": "operations_zone",
+                        "protocol": "modbus_tcp",
+                    },
+                    {"name": "Disabled", "action": "DENY", "enabled": False},
+                ],
+            }
+        )
+
+        assert (await _check(firewall, source_zone="operations_zone"))[0] is True
+        allowed, reason = await _check(firewall, source_zone="enterprise_zone")
+        assert allowed is False
+        assert reason == "Blocked by default policy"
+
+
+# ================================================================
+# CONNECTION TRACKING TESTS
+# ================================================================
+class TestFirewallConnectionTracking:
+    """Test the connection-tracking fast path."""
+
+    async def test_repeat_flow_skips_rule_evaluation(self, firewall):
+        """Test repeat flows reuse the tracked decision but still count hits."""
+        rule_id = await firewall.add_rule(
+            "Allow SCADA", RuleAction.ALLOW, dest_port=502
+        )
+
+        for _ in range(5):
+            assert (await _check(firewall))[0] is True
+
+        stats = firewall.get_statistics()["connection_tracking"]
+        assert stats["misses"] == 1
+        assert stats["hits"] == 4
+        assert firewall.get_rule(rule_id).hit_count == 5
+        assert firewall.total_connections_allowed == 5
+
+    async def test_repeat_deny_still_recorded(self, firewall):
+        """Test tracked denials are still logged as blocked connections."""
+        await firewall.add_rule(
+            "Block attacker", RuleAction.DROP, source_ip="192.168.1.100"
+        )
+
+        for _ in range(3):
+            assert (await _check(firewall))[0] is False
+
+        assert len(firewall.blocked_connections) == 3
+        assert firewall.get_statistics()["connection_tracking"]["hits"] == 2
+
+    async def test_rule_change_flushes_tracked_flows(self, firewall):
+        """Test a new block rule applies to an already-tracked flow."""
+        assert (await _check(firewall))[0] is True
+
+        await firewall.add_rule(
+            "Block attacker", RuleAction.DROP, source_ip="192.168.1.100"
+        )
+
+        assert (await _check(firewall))[0] is False
+
+    async def test_default_action_change_applies_to_tracked_flow(self, firewall):
+        """Test flows decided by the default policy follow its current value."""
+        assert (await _check(firewall))[0] is True
+
+        firewall.default_action = RuleAction.DENY
+
+        assert (await _check(firewall))[0] is False
+
+    async def test_idle_flow_is_reevaluated(self, firewall):
+        """Test flows idle past the timeout miss and are expired by the scan."""
+        firewall.conntrack_idle_timeout = 10.0
+        await _check(firewall)
+
+        SimulationTime().state.simulation_time += 11.0
+        await _check(firewall, "192.168.1.101")
+        await _check(firewall)
+        assert firewall.get_statistics()["connection_tracking"]["misses"] == 3
+
+        SimulationTime().state.simulation_time += 11.0
+        assert firewall._expire_conntrack() == 2
+        assert firewall.get_statistics()["connection_tracking"]["entries"] == 0
+
+    async def test_lru_eviction(self, firewall):
+        """Test the table is bounded by evicting the least recently used flow."""
+        firewall.conntrack_max_entries = 2
+        await _check(firewall, "192.168.1.1")
+        await _check(firewall, "192.168.1.2")
+        await _check(firewall, "192.168.1.1")
+        await _check(firewall, "192.168.1.3")
+
+        tracked = {key[0] for key in firewall._conntrack}
+        assert tracked == {"192.168.1.1", "192.168.1.3"}
+
+
+# ================================================================
+# BLOCK RATE AND HISTORY TESTS
+# ================================================================
+class TestFirewallBlockCounters:
+    """Test rolling block counters and bounded history."""
+
+    async def test_history_is_bounded(self, firewall):
+        """Test block history keeps only the most recent entries."""
+        firewall = Firewall(
+            device_name="firewall_small",
+            device_id=501,
+            data_store=DataStore(SystemState()),
+            block_history_limit=3,
+        )
+        await firewall.add_rule("Block all", RuleAction.DENY)
+
+        for i in range(5):
+            await _check(firewall, f"192.168.1.{i}")
+
+        assert [c.source_ip for c in firewall.blocked_connections] == [
+            "192.168.1.2",
+            "192.168.1.3",
+            "192.168.1.4",
+        ]
+        assert len(firewall.get_blocked_connections(limit=2)) == 2
+        assert firewall.get_blocked_connections(source_ip="192.168.1.4")[
+            0
+        ].source_ip == ("192.168.1.4")
+
+    async def test_rate_per_rule_and_source(self, firewall):
+        """Test block rates are broken down by rule and source."""
+        scan_rule = await firewall.add_rule(
+            "Block scanners", RuleAction.DROP, source_ip="192.168.1.0/24"
+        )
+        telnet_rule = await firewall.add_rule(
+            "Block telnet", RuleAction.DENY, dest_port=23
+        )
+
+        for _ in range(3):
+            await _check(firewall, "192.168.1.50")
+        await _check(firewall, "192.168.1.51")
+        await _check(firewall, "172.16.0.1", dest_port=23)
+
+        assert firewall.get_block_rate() == 5
+        assert firewall.get_block_rate(rule_id=scan_rule) == 4
+        assert firewall.get_block_rate(rule_id=telnet_rule) == 1
+        assert firewall.get_block_rate(source_ip="192.168.1.50") == 3
+        assert firewall.get_top_blocked_sources(2) == [
+            ("192.168.1.50", 3),
+            ("192.168.1.51", 1),
+        ]
+
+    async def test_rate_window_slides(self, firewall):
+        """Test blocks older than a minute drop out of the rate."""
+        await firewall.add_rule("Block all", RuleAction.DENY)
+        sim_time = SimulationTime()
+
+        await _check(firewall, "192.168.1.1")
+        sim_time.state.simulation_time += 30.0
+        await _check(firewall, "192.168.1.2")
+        assert firewall.get_block_rate() == 2
+
+        sim_time.state.simulation_time += 31.0
+        assert firewall.get_block_rate() == 1
+        assert firewall.get_top_blocked_sources() == [("192.168.1.2", 1)]
+
+        sim_time.state.simulation_time += 60.0
+        assert firewall.get_block_rate() == 0
+        assert firewall.get_top_blocked_sources() == []
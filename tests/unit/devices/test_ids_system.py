@@ -0,0 +1,401 @@
+# tests/unit/devices/test_ids_system.py
+"""Tests for the IDS/IPS system.
+
+Level 4 dependency - uses REAL DataStore, SystemState and SimulationTime.
+
+Test Coverage:
+- Exact and CIDR blocklist matching
+- Temporary blocks and heap-driven expiry
+- Auto-block TTL from config
+- Incremental sliding-window scan detection
+- Single-pass malware signature matching
+- Indexed alert store (status updates, statistics, history trim)
+"""
+
+import pytest
+
+from components.devices.enterprise_zone.ids_system import (
+    AlertSeverity,
+    AlertStatus,
+    IDSAlert,
+    IDSSystem,
+)
+from components.state.data_store import DataStore
+from components.state.system_state import SystemState
+from components.time.simulation_time import SimulationTime
+
+
+# ================================================================
+# FIXTURES
+# ================================================================
+@pytest.fixture
+async def ids():
+    """Create an IDSSystem (not started) with a clean simulation clock."""
+    sim_time = SimulationTime()
+    await sim_time.reset()
+    system = IDSSystem(
+        device_name="ids_primary",
+        device_id=400,
+        data_store=DataStore(SystemState()),
+    )
+    yield system
+    await sim_time.reset()
+
+
+def _critical_alert(source_ip: str) -> IDSAlert:
+    return IDSAlert(
+        alert_id="test-alert",
+        timestamp=0.0,
+        severity=AlertSeverity.CRITICAL,
+        status=AlertStatus.NEW,
+        rule_name="malware_signature",
+        category="malware",
+        title="Malware detected",
+        description="",
+        source_ip=source_ip,
+        destination_ip="unknown",
+        protocol="unknown",
+    )
+
+
+async def _denied(ids: IDSSystem, source: str, device: str, port: int = 502):
+    """Append a denied network_access event to the central audit log."""
+    await ids.data_store.system_state.append_audit_event(
+        {
+            "message": f"network_access DENIED {source} -> {device}:{port}",
+            "device": device,
+            "simulation_time": SimulationTime().now(),
+            "data": {"result": "DENIED", "source_network": source, "port": port},
+        }
+    )
+
+
+# ================================================================
+# BLOCKLIST TESTS
+# ================================================================
+class TestIDSBlocklist:
+    """Test IPS blocklist matching and expiry."""
+
+    async def test_exact_block(self, ids):
+        """Test a blocked address is refused and neighbours are not."""
+        assert await ids.block_ip("192.168.1.100", reason="test")
+        assert not await ids.block_ip("192.168.1.100", reason="again")
+
+        assert ids.is_blocked("192.168.1.100")
+        assert not ids.is_blocked("192.168.1.101")
+        assert ids.total_ips_blocked == 1
+
+    async def test_cidr_block_covers_range(self, ids):
+        """Test a CIDR block matches every address inside it."""
+        await ids.block_ip("10.99.7.3/16", reason="rogue subnet")
+
+        assert ids.is_blocked("10.99.0.1")
+        assert ids.is_blocked("10.99.255.254")
+        assert not ids.is_blocked("10.98.0.1")
+        assert ids.get_blocked_ips() == ["10.99.0.0/16"]
+
+    async def test_unblock_range_only_by_exact_entry(self, ids):
+        """Test unblocking an address inside a range leaves the range."""
+        await ids.block_ip("10.99.0.0/16", reason="rogue subnet")
+
+        assert not await ids.unblock_ip("10.99.0.1")
+        assert ids.is_blocked("10.99.0.1")
+        assert await ids.unblock_ip("10.99.0.0/16")
+        assert not ids.is_blocked("10.99.0.1")
+
+    async def test_non_ip_entries_match_exactly(self, ids):
+        """Test non-IP block targets still work as plain strings."""
+        await ids.block_ip("attacker-host", reason="test")
+
+        assert ids.is_blocked("attacker-host")
+        assert not ids.is_blocked("10.0.0.1")
+
+    async def test_temporary_block_expires(self, ids):
+        """Test a TTL block lapses and is purged from the heap.
+
+        WHY: Temporary blocks must age out without a full scan so
+        long-running IPS deployments do not accumulate state.
+        """
+        sim_time = SimulationTime()
+        await ids.block_ip("192.168.1.50", reason="test", ttl=60.0)
+        await ids.block_ip("192.168.1.51", reason="test")
+
+        sim_time.state.simulation_time += 59.0
+        assert ids.is_blocked("192.168.1.50")
+
+        sim_time.state.simulation_time += 1.0
+        assert not ids.is_blocked("192.168.1.50")
+        assert ids.get_blocked_ips() == ["192.168.1.51"]
+        assert ids.get_statistics()["ips"]["blocked_ips"] == 1
+
+    async def test_reblock_after_unblock_ignores_stale_expiry(self, ids):
+        """Test an old heap entry does not lift a newer permanent block."""
+        sim_time = SimulationTime()
+        await ids.block_ip("192.168.1.50", reason="test", ttl=10.0)
+        await ids.unblock_ip("192.168.1.50")
+        await ids.block_ip("192.168.1.50", reason="permanent")
+
+        sim_time.state.simulation_time += 20.0
+        ids._expire_blocks()
+
+        assert ids.is_blocked("192.168.1.50")
+
+    async def test_auto_block_uses_configured_ttl(self, ids):
+        """Test auto-blocks take the TTL from config and expire."""
+        sim_time = SimulationTime()
+        await ids.load_config(
+            {
+                "prevention_mode": True,
+                "auto_block_ttl": 300,
+                "permanent_blocked_ips": ["10.66.0.0/24"],
+            }
+        )
+
+        await ids._auto_block_on_alert(_critical_alert("192.168.1.200"))
+        assert ids.is_blocked("192.168.1.200")
+        assert ids.get_statistics()["ips"]["temporary_blocks"] == 1
+
+        sim_time.state.simulation_time += 300.0
+        assert not ids.is_blocked("192.168.1.200")
+        assert ids.is_blocked("10.66.0.9")
+
+
+# ================================================================
+# SCAN DETECTION TESTS
+# ================================================================
+class TestIDSScanDetection:
+    """Test sliding-window scan detection."""
+
+    def _scan_alerts(self, ids):
+        return [a for a in ids.alerts if a.rule_name == "network_scanning"]
+
+    async def test_scan_alert_at_threshold(self, ids):
+        """Test distinct targets from one source raise a single alert."""
+        for i in range(5):
+            await _denied(ids, "enterprise_network", f"plc_{i}")
+
+        await ids._detect_network_scanning()
+
+        alerts = self._scan_alerts(ids)
+        assert len(alerts) == 1
+        assert alerts[0].indicators["targets_scanned"] == 5
+        assert sorted(alerts[0].affected_devices) == [f"plc_{i}" for i in range(5)]
+
+    async def test_port_sweep_on_one_target(self, ids):
+        """Test many ports on a single device count as a scan."""
+        for port in range(500, 505):
+            await _denied(ids, "enterprise_network", "plc_1", port=port)
+
+        await ids._detect_network_scanning()
+
+        alerts = self._scan_alerts(ids)
+        assert len(alerts) == 1
+        assert alerts[0].indicators["endpoints_scanned"] == 5
+
+    async def test_events_counted_once_across_cycles(self, ids):
+        """Test re-polling the audit log does not recount old events.
+
+        WHY: Each cycle queries the same recent audit events; counting them
+        again would inflate volumes and repeat alerts.
+        """
+        sim_time = SimulationTime()
+        for i in range(3):
+            await _denied(ids, "enterprise_network", f"plc_{i}")
+        await ids._detect_network_scanning()
+        await ids._detect_network_scanning()
+
+        assert ids.denied_volume.estimate(sim_time.now(), "enterprise_network") == 3
+        assert self._scan_alerts(ids) == []
+
+        for i in range(3, 5):
+            await _denied(ids, "enterprise_network", f"plc_{i}")
+        await ids._detect_network_scanning()
+
+        assert len(self._scan_alerts(ids)) == 1
+
+    async def test_copied_events_counted_once(self, ids):
+        """Test the cursor follows append sequence, not object identity.
+
+        WHY: Sources that copy or deserialise events return new dicts on
+        every poll.
+        """
+        sim_time = SimulationTime()
+        get_audit_log = ids.data_store.get_audit_log
+
+        async def copying_get_audit_log(**kwargs):
+            return [dict(event) for event in await get_audit_log(**kwargs)]
+
+        ids.data_store.get_audit_log = copying_get_audit_log
+        for i in range(3):
+            await _denied(ids, "enterprise_network", f"plc_{i}")
+        for _ in range(4):
+            await ids._detect_network_scanning()
+
+        assert ids.denied_volume.estimate(sim_time.now(), "enterprise_network") == 3
+
+    async def test_clock_rewind_does_not_replay(self, ids):
+        """Test events from before a clock reset are not processed again."""
+        sim_time = SimulationTime()
+        sim_time.state.simulation_time = 100.0
+        for i in range(3):
+            await _denied(ids, "enterprise_network", f"plc_{i}")
+        await ids._detect_network_scanning()
+
+        sim_time.state.simulation_time = 0.0
+        await _denied(ids, "enterprise_network", "plc_9")
+        await ids._detect_network_scanning()
+        await ids._detect_network_scanning()
+
+        assert ids.denied_volume.estimate(0.0, "enterprise_network") == 1
+        assert len(ids.scan_tracker["enterprise_network"].targets) == 1
+
+    async def test_slow_scan_outside_window(self, ids):
+        """Test targets spread beyond the window do not alert."""
+        sim_time = SimulationTime()
+        for i in range(5):
+            await _denied(ids, "enterprise_network", f"plc_{i}")
+            await ids._detect_network_scanning()
+            sim_time.state.simulation_time += 20.0
+
+        assert self._scan_alerts(ids) == []
+        assert len(ids.scan_tracker["enterprise_network"].targets) <= 3
+
+    async def test_heavy_hitters_reported(self, ids):
+        """Test loud sources appear in statistics."""
+        await ids.load_config({"detection_thresholds": {"heavy_hitter_threshold": 4}})
+        for _ in range(4):
+            await _denied(ids, "dmz_network", "plc_1")
+        await _denied(ids, "enterprise_network", "plc_1")
+
+        await ids._detect_network_scanning()
+
+        stats = ids.get_statistics()["detections"]
+        assert stats["top_denied_sources"] == [("dmz_network", 4)]
+
+
+# ================================================================
+# MALWARE SIGNATURE TESTS
+# ================================================================
+class TestIDSMalwareDetection:
+    """Test malware signature matching over audit events."""
+
+    def _malware_alerts(self, ids):
+        return [a for a in ids.alerts if a.rule_name == "malware_detection"]
+
+    async def _event(self, ids, message, data=None, device="plc_1"):
+        await ids.data_store.system_state.append_audit_event(
+            {
+                "message": message,
+                "device": device,
+                "simulation_time": SimulationTime().now(),
+                "data": data or {},
+            }
+        )
+
+    async def test_matches_message_and_data(self, ids):
+        """Test patterns in message and serialised data combine with offsets."""
+        await self._event(ids, "Block upload DB890", {"function": "FC1869"})
+
+        await ids._detect_malware_signatures()
+
+        alerts = self._malware_alerts(ids)
+        assert len(alerts) == 1
+        indicators = alerts[0].indicators
+        assert indicators["malware_family"] == "stuxnet"
+        assert indicators["matched_patterns"] == ["db890", "fc1869"]
+        assert {"pattern": "DB890", "field": "message", "offset": 13} in (
+            indicators["matches"]
+        )
+        assert any(m["field"] == "data" for m in indicators["matches"])
+
+    async def test_single_pattern_does_not_alert(self, ids):
+        """Test one matched pattern is below the confidence threshold."""
+        await self._event(ids, "lighttpd restarted")
+
+        await ids._detect_malware_signatures()
+
+        assert self._malware_alerts(ids) == []
+
+    async def test_event_scanned_once(self, ids):
+        """Test an event is not re-alerted on later scan cycles."""
+        await self._event(ids, "TRISTATION upload inject.bin")
+
+        await ids._detect_malware_signatures()
+        await ids._detect_malware_signatures()
+
+        assert len(self._malware_alerts(ids)) == 1
+
+    async def test_configured_signatures_loaded(self, ids):
+        """Test threat-intel families from config are matched."""
+        await ids.load_config(
+            {"malware_signatures": {"pipedream": ["OMSHELL", "CODESYS-EXPLOIT"]}}
+        )
+        await self._event(ids, "omshell session via codesys-exploit")
+
+        await ids._detect_malware_signatures()
+
+        alerts = self._malware_alerts(ids)
+        assert [a.indicators["malware_family"] for a in alerts] == ["pipedream"]
+
+
+# ================================================================
+# ALERT MANAGEMENT TESTS
+# ================================================================
+class TestIDSAlertManagement:
+    """Test indexed alert storage."""
+
+    async def _alert(self, ids, severity=AlertSeverity.HIGH, rule="network_scanning"):
+        return await ids._generate_alert(
+            severity=severity,
+            rule_name=rule,
+            category="reconnaissance",
+            title="Test alert",
+            description="",
+            source_ip="unknown",
+            destination_ip="unknown",
+            protocol="modbus",
+            affected_devices=[],
+            indicators={},
+        )
+
+    async def test_status_update_moves_counts(self, ids):
+        """Test closing an alert updates active and status counts."""
+        alert = await self._alert(ids)
+        await self._alert(ids, severity=AlertSeverity.LOW)
+
+        assert await ids.update_alert_status(alert.alert_id, AlertStatus.CLOSED)
+        assert not await ids.update_alert_status("missing", AlertStatus.CLOSED)
+
+        stats = ids.get_statistics()
+        assert stats["alerts"]["active"] == 1
+        assert stats["alerts"]["by_severity"]["high"] == 0
+        assert stats["alerts"]["by_status"]["closed"] == 1
+        assert stats["detections"]["scan_detections"] == 2
+        assert ids.get_active_alerts(severity=AlertSeverity.LOW)[0].status == (
+            AlertStatus.NEW
+        )
+
+    async def test_trim_keeps_active_alerts(self, ids):
+        """Test history trimming drops closed alerts first."""
+        ids.alert_history_limit = 3
+        alerts = [await self._alert(ids) for _ in range(5)]
+        for alert in alerts[:2]:
+            await ids.update_alert_status(alert.alert_id, AlertStatus.CLOSED)
+        await ids._update_statistics()
+
+        ids._trim_alert_history()
+
+        assert len(ids.alerts) == 3
+        assert {a.alert_id for a in ids.alerts} == {a.alert_id for a in alerts[2:]}
+        assert ids.memory_map["active_alerts"] == 3
+
+    async def test_critical_alarm_uses_new_count(self, ids):
+        """Test the critical alarm raises and clears with NEW criticals."""
+        alert = await self._alert(ids, severity=AlertSeverity.CRITICAL, rule="x")
+
+        await ids._check_alarm_conditions()
+        assert ids.critical_alerts_alarm_raised
+
+        await ids.update_alert_status(alert.alert_id, AlertStatus.ACKNOWLEDGED)
+        await ids._check_alarm_conditions()
+        assert not ids.critical_alerts_alarm_raised
@@ -526,3 +526,167 @@ class TestNetworkSimulatorEdgeCases:
         await net_sim.expose_service("plc_3", "modbus", 502)
 
         assert len(net_sim.services) == 3
+
+
+# ================================================================
+# DECISION CACHE TESTS
+# ================================================================
+class TestNetworkSimulatorDecisionCache:
+    """Test cached reachability decisions."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_decision_is_cache_hit(self, simple_network_config):
+        """Test repeat checks are served from the decision table.
+
+        WHY: Connection storms must not re-evaluate topology per connection.
+        """
+        net_sim = NetworkSimulator(config_loader=simple_network_config)
+        await net_sim.load()
+        await net_sim.expose_service("plc_1", "modbus", 502)
+
+        for _ in range(3):
+            assert await net_sim.can_reach("control_network", "plc_1", "modbus", 502)
+
+        cache = (await net_sim.get_summary())["reachability_cache"]
+        assert cache == {"entries": 1, "hits": 2, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_expose_and_unexpose_invalidate(self, simple_network_config):
+        """Test service changes are reflected in later decisions.
+
+        WHY: A stale cached denial would hide a newly exposed service.
+        """
+        net_sim = NetworkSimulator(config_loader=simple_network_config)
+        await net_sim.load()
+
+        assert not await net_sim.can_reach("control_network", "plc_1", "modbus", 502)
+        await net_sim.expose_service("plc_1", "modbus", 502)
+        assert await net_sim.can_reach("control_network", "plc_1", "modbus", 502)
+        await net_sim.unexpose_service("plc_1", 502)
+        assert not await net_sim.can_reach("control_network", "plc_1", "modbus", 502)
+
+    @pytest.mark.asyncio
+    async def test_segmentation_change_invalidates(self, segmented_network_config):
+        """Test toggling segmentation re-evaluates cached decisions.
+
+        WHY: Segmentation settings are plain attributes and may change live.
+        """
+        net_sim = NetworkSimulator(config_loader=segmented_network_config)
+        await net_sim.load()
+        await net_sim.expose_service("plc_1", "modbus", 502)
+        assert not await net_sim.can_reach("corporate_network", "plc_1", "modbus", 502)
+
+        net_sim.segmentation_enabled = False
+
+        assert await net_sim.can_reach("corporate_network", "plc_1", "modbus", 502)
+
+    @pytest.mark.asyncio
+    async def test_zone_policies_compiled_at_load(self, temp_config_dir):
+        """Test policies are indexed by zone pair with normalised protocols.
+
+        WHY: Policy evaluation must not scan every policy per connection.
+        """
+        config = {
+            "segmentation": {"enabled": True, "mode": "strict"},
+            "zones": [
+                {"name": "control_zone", "networks": [{"name": "plant"}]},
+                {"name": "operations_zone", "networks": [{"name": "scada"}]},
+            ],
+            "connections": {"plant": ["plc_1"], "scada": ["hmi_1"]},
+            "inter_zone_routing": [
+                {
+                    "from_zone": "control_zone",
+                    "to_zone": "operations_zone",
+                    "allowed_protocols": ["modbus_tcp"],
+                    "direction": "bidirectional",
+                    "firewall_rules": [{"allow": "modbus_tcp", "ports": [10502]}],
+                }
+            ],
+        }
+        (temp_config_dir / "network.yml").write_text(yaml.dump(config))
+        (temp_config_dir / "devices.yml").write_text(yaml.dump({"devices": []}))
+        net_sim = NetworkSimulator(ConfigLoader(config_dir=str(temp_config_dir)))
+        await net_sim.load()
+        await net_sim.expose_service("plc_1", "modbus", 10502)
+        await net_sim.expose_service("plc_1", "modbus", 502)
+
+        assert net_sim._check_zone_policy(
+            "operations_zone", "control_zone", "modbus", 10502
+        ) == (True, "bidirectional_policy_allows_reverse")
+        assert await net_sim.can_reach("scada", "plc_1", "modbus", 10502)
+        assert not await net_sim.can_reach("scada", "plc_1", "modbus", 502)
+
+
+# ================================================================
+# ADDRESS MAPPING TESTS
+# ================================================================
+@pytest.fixture
+def subnet_network_config(temp_config_dir):
+    """Create configuration with nested subnets and loopback aliases."""
+    config = {
+        "zones": [
+            {
+                "name": "control_zone",
+                "networks": [
+                    {"name": "control_wide", "subnet": "10.10.0.0/16"},
+                    {
+                        "name": "turbine_network",
+                        "subnet": "10.10.1.0/24",
+                        "client_subnets": ["127.10.1.0/24"],
+                    },
+                ],
+            },
+        ],
+        "networks": [{"name": "corporate_network", "subnet": "not-a-subnet"}],
+        "connections": {},
+    }
+
+    (temp_config_dir / "network.yml").write_text(yaml.dump(config))
+    (temp_config_dir / "devices.yml").write_text(yaml.dump({"devices": []}))
+
+    return ConfigLoader(config_dir=str(temp_config_dir))
+
+
+class TestNetworkSimulatorAddressMapping:
+    """Test client address to network mapping."""
+
+    @pytest.mark.asyncio
+    async def test_longest_prefix_wins(self, subnet_network_config):
+        """Test the most specific declared subnet is chosen.
+
+        WHY: Nested subnets must resolve to the narrowest segment.
+        """
+        net_sim = NetworkSimulator(config_loader=subnet_network_config)
+        await net_sim.load()
+
+        assert net_sim.network_for_address("10.10.1.5") == "turbine_network"
+        assert net_sim.network_for_address("10.10.7.5") == "control_wide"
+        assert net_sim.network_for_address("192.168.1.100") is None
+
+    @pytest.mark.asyncio
+    async def test_loopback_aliases_and_mapped_ipv4(self, subnet_network_config):
+        """Test client_subnets and IPv4-mapped IPv6 peers are mapped.
+
+        WHY: Local multi-segment testing connects from loopback aliases.
+        """
+        net_sim = NetworkSimulator(config_loader=subnet_network_config)
+        await net_sim.load()
+
+        assert net_sim.network_for_address("127.10.1.20") == "turbine_network"
+        assert net_sim.network_for_address("::ffff:10.10.1.5") == "turbine_network"
+        assert net_sim.network_for_address("127.0.0.1") is None
+        assert net_sim.network_for_address(None) is None
+
+    @pytest.mark.asyncio
+    async def test_cache_cleared_on_reset(self, subnet_network_config):
+        """Test cached lookups do not survive a reset.
+
+        WHY: Mappings must follow the loaded configuration.
+        """
+        net_sim = NetworkSimulator(config_loader=subnet_network_config)
+        await net_sim.load()
+        assert net_sim.network_for_address("10.10.1.5") == "turbine_network"
+
+        await net_sim.reset()
+
+        assert net_sim.network_for_address("10.10.1.5") is None
@@ -0,0 +1,105 @@
+# tests/unit/network/test_prefix_trie.py
+"""Tests for the CIDR prefix trie.
+
+Level 0 - no dependencies.
+
+Test Coverage:
+- Exact prefix storage, replacement and removal
+- Longest-prefix and all-prefix matching
+- IPv4/IPv6 separation
+- Non-IP input handling
+"""
+
+import ipaddress
+
+import pytest
+
+from components.network.prefix_trie import PrefixTrie, parse_address, parse_network
+
+
+class TestPrefixTrieMapping:
+    """Test exact-prefix mapping operations."""
+
+    def test_set_get_and_replace(self):
+        """Test values are stored per prefix and replaced on reassignment."""
+        trie = PrefixTrie()
+        trie["10.10.1.0/24"] = "turbine"
+        trie["10.10.1.0/24"] = "turbine_network"
+
+        assert trie["10.10.1.0/24"] == "turbine_network"
+        assert len(trie) == 1
+        assert "10.10.1.0/24" in trie
+        assert "10.10.2.0/24" not in trie
+
+    def test_host_bits_ignored(self):
+        """Test a prefix with host bits set is normalised to its network."""
+        trie = PrefixTrie()
+        trie["10.10.1.7/24"] = "turbine_network"
+
+        assert trie.get("10.10.1.0/24") == "turbine_network"
+
+    def test_delete_prunes_and_keeps_siblings(self):
+        """Test removing a prefix leaves other prefixes on the path intact."""
+        trie = PrefixTrie()
+        trie["10.0.0.0/8"] = "wide"
+        trie["10.10.1.0/24"] = "narrow"
+
+        del trie["10.10.1.0/24"]
+
+        assert len(trie) == 1
+        assert trie.longest_match("10.10.1.5")[1] == "wide"
+        with pytest.raises(KeyError):
+            del trie["10.10.1.0/24"]
+
+    def test_invalid_prefix_rejected(self):
+        """Test storing a non-IP key raises ValueError."""
+        trie = PrefixTrie()
+
+        with pytest.raises(ValueError):
+            trie["scada_server"] = 1
+        assert "scada_server" not in trie
+        assert trie.get("scada_server") is None
+
+
+class TestPrefixTrieLookups:
+    """Test address lookups."""
+
+    def test_longest_match_prefers_most_specific(self):
+        """Test the narrowest containing prefix wins."""
+        trie = PrefixTrie()
+        trie["0.0.0.0/0"] = "default"
+        trie["10.10.0.0/16"] = "control_zone"
+        trie["10.10.1.0/24"] = "turbine_network"
+
+        assert trie.longest_match("10.10.1.5") == (
+            ipaddress.ip_network("10.10.1.0/24"),
+            "turbine_network",
+        )
+        assert trie.longest_match("10.10.9.1")[1] == "control_zone"
+        assert trie.longest_match("192.168.1.1")[1] == "default"
+
+    def test_matches_yields_every_containing_prefix(self):
+        """Test all containing prefixes are yielded, shortest first."""
+        trie = PrefixTrie()
+        trie["10.10.1.5/32"] = "host"
+        trie["10.0.0.0/8"] = "wide"
+
+        assert [v for _, v in trie.matches("10.10.1.5")] == ["wide", "host"]
+        assert list(trie.matches("10.10.1.6"))[-1][1] == "wide"
+
+    def test_ipv6_kept_separate(self):
+        """Test IPv6 prefixes never match IPv4 addresses."""
+        trie = PrefixTrie()
+        trie["::/0"] = "v6"
+
+        assert trie.longest_match("::1")[1] == "v6"
+        assert trie.longest_match("127.0.0.1") is None
+
+    def test_non_ip_address_matches_nothing(self):
+        """Test device names and 'unknown' are not treated as addresses."""
+        trie = PrefixTrie()
+        trie["0.0.0.0/0"] = "default"
+
+        assert trie.longest_match("unknown") is None
+        assert parse_address("hex_turbine_plc") is None
+        assert parse_network("10.10.1.5") == ipaddress.ip_network("10.10.1.5/32")
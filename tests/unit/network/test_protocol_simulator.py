@@ -534,6 +534,58 @@ class TestProtocolSimulatorNetworkEnforcement:
         finally:
             await proto_sim.stop()
 
+    @pytest.mark.asyncio
+    async def test_client_mapped_by_declared_subnet(
+        self, temp_config_dir, mock_handler_factory
+    ):
+        """Test a client inside a declared subnet is placed on that network.
+
+        WHY: Zone enforcement depends on where the client really is.
+        """
+        config = {
+            "segmentation": {"enabled": True, "mode": "strict"},
+            "networks": [
+                {
+                    "name": "control_network",
+                    "subnet": "10.10.1.0/24",
+                    "client_subnets": ["127.0.0.0/8"],
+                }
+            ],
+            "connections": {"control_network": ["plc_1"]},
+        }
+        (temp_config_dir / "network.yml").write_text(yaml.dump(config))
+        (temp_config_dir / "devices.yml").write_text(yaml.dump({"devices": []}))
+        net_sim = NetworkSimulator(ConfigLoader(config_dir=str(temp_config_dir)))
+        await net_sim.load()
+
+        served = asyncio.Event()
+
+        def factory():
+            handler = MagicMock(spec=ProtocolHandler)
+            handler.serve = AsyncMock(side_effect=lambda r, w: served.set())
+            return handler
+
+        proto_sim = ProtocolSimulator(net_sim)
+        await proto_sim.register(
+            node="plc_1",
+            network="control_network",
+            port=15521,
+            protocol="modbus",
+            handler_factory=factory,
+        )
+        await proto_sim.start()
+
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", 15521)
+            await asyncio.wait_for(served.wait(), timeout=2.0)
+
+            assert proto_sim.listeners[0].denied_connections == 0
+
+            writer.close()
+            await writer.wait_closed()
+        finally:
+            await proto_sim.stop()
+
 
 # ================================================================
 # CONCURRENT REGISTRATION TESTS
@@ -0,0 +1,265 @@
+# tests/unit/physics/test_coupling.py
+"""Tests for PhysicsCouplingGraph direct engine-to-engine coupling.
+
+Level 3 in our dependency tree - the coupling graph connects:
+- TurbinePhysics, GridPhysics, PowerFlow (Level 3)
+- DataStore (Level 2) - uses REAL DataStore for engine construction
+
+Test Coverage:
+- Port declarations on engines
+- Connection validation (unknown ports, unit mismatch, cycles)
+- Topological update order
+- Fan-in summation and full-precision transfer
+- Skipping engines updated elsewhere
+"""
+
+import pytest
+
+from components.physics.coupling import PhysicsCouplingGraph, Port
+from components.physics.grid_physics import GridPhysics
+from components.physics.power_flow import BusState, PowerFlow, PowerFlowParameters
+from components.physics.reactor_physics import ReactorPhysics
+from components.physics.turbine_physics import TurbinePhysics
+from components.state.data_store import DataStore
+from components.state.system_state import SystemState
+
+
+# ================================================================
+# FIXTURES
+# ================================================================
+@pytest.fixture
+async def engines():
+    """Create two turbines, a reactor, grid and power flow."""
+    data_store = DataStore(SystemState())
+    for name, device_type in [
+        ("turbine_plc_1", "turbine_plc"),
+        ("turbine_plc_2", "turbine_plc"),
+        ("reactor_plc_1", "reactor_plc"),
+    ]:
+        await data_store.register_device(
+            device_name=name, device_type=device_type, device_id=1, protocols=[]
+        )
+
+    turbine_1 = TurbinePhysics("turbine_plc_1", data_store)
+    turbine_2 = TurbinePhysics("turbine_plc_2", data_store)
+    reactor = ReactorPhysics("reactor_plc_1", data_store)
+    grid = GridPhysics(data_store)
+    power_flow = PowerFlow(
+        data_store,
+        params=PowerFlowParameters(
+            buses={"bus_turbine_plc_1": BusState(), "bus_load": BusState()},
+            lines={},
+        ),
+    )
+    for engine in (turbine_1, turbine_2, reactor, grid, power_flow):
+        await engine.initialise()
+
+    return {
+        "turbine_plc_1": turbine_1,
+        "turbine_plc_2": turbine_2,
+        "reactor_plc_1": reactor,
+        "grid": grid,
+        "power_flow": power_flow,
+    }
+
+
+class _RelayEngine:
+    """Minimal engine with one input and one output port."""
+
+    def __init__(self):
+        self.value = 0.0
+
+    def get_input_ports(self):
+        return {"in": Port("in", "MW")}
+
+    def get_output_ports(self):
+        return {"out": Port("out", "MW")}
+
+    def read_output(self, port):
+        return self.value
+
+    def write_input(self, port, value):
+        self.value = value
+
+    def update(self, dt):
+        pass
+
+
+def _graph(engines):
+    graph = PhysicsCouplingGraph()
+    for name, engine in engines.items():
+        graph.add_engine(name, engine)
+    return graph
+
+
+# ================================================================
+# PORT TESTS
+# ================================================================
+class TestEnginePorts:
+    """Test port declarations on engines."""
+
+    def test_turbine_declares_power_output(self, engines):
+        """Test turbine publishes electrical output in MW."""
+        ports = engines["turbine_plc_1"].get_output_ports()
+
+        assert ports["power_output_mw"] == Port("power_output_mw", "MW")
+
+    def test_reactor_power_is_thermal(self, engines):
+        """Test reactor power uses a distinct unit from electrical MW."""
+        ports = engines["reactor_plc_1"].get_output_ports()
+
+        assert ports["power_output_mw"].unit == "MWth"
+
+    def test_power_flow_declares_bus_ports(self, engines):
+        """Test power flow declares generation and load ports per bus."""
+        ports = engines["power_flow"].get_input_ports()
+
+        assert "bus_turbine_plc_1.gen_mw" in ports
+        assert "bus_load.load_mw" in ports
+
+    def test_undeclared_output_raises(self, engines):
+        """Test reading an undeclared output raises KeyError."""
+        with pytest.raises(KeyError):
+            engines["turbine_plc_1"].read_output("damage_level")
+
+    def test_undeclared_input_raises(self, engines):
+        """Test writing an undeclared input raises KeyError."""
+        with pytest.raises(KeyError):
+            engines["turbine_plc_1"].write_input("speed", 1.0)
+
+
+# ================================================================
+# CONNECTION TESTS
+# ================================================================
+class TestCouplingConnections:
+    """Test connection validation."""
+
+    def test_duplicate_engine_rejected(self, engines):
+        """Test adding an engine name twice raises ValueError."""
+        graph = _graph(engines)
+
+        with pytest.raises(ValueError, match="already"):
+            graph.add_engine("grid", engines["grid"])
+
+    def test_unknown_port_rejected(self, engines):
+        """Test connecting an unknown port raises KeyError."""
+        graph = _graph(engines)
+
+        with pytest.raises(KeyError, match="no output"):
+            graph.connect("turbine_plc_1", "torque", "grid", "generation_mw")
+
+    def test_unit_mismatch_rejected(self, engines):
+        """Test thermal MW cannot feed electrical generation."""
+        graph = _graph(engines)
+
+        with pytest.raises(ValueError, match="port types differ"):
+            graph.connect("reactor_plc_1", "power_output_mw", "grid", "generation_mw")
+
+    def test_cycle_rejected(self):
+        """Test a connection closing a cycle is rejected and rolled back."""
+        graph = PhysicsCouplingGraph()
+        graph.add_engine("a", _RelayEngine())
+        graph.add_engine("b", _RelayEngine())
+        graph.connect("a", "out", "b", "in")
+
+        with pytest.raises(ValueError, match="cycle"):
+            graph.connect("b", "out", "a", "in")
+
+        assert len(graph.get_connections()) == 1
+        assert graph.order() == ["a", "b"]
+
+    def test_rejected_connection_leaves_input_alone(self):
+        """Test a rolled-back input is not overwritten on step.
+
+        WHY: An empty fan-in would sum to 0.0 and override the engine's
+        own control value every tick.
+        """
+        a, b = _RelayEngine(), _RelayEngine()
+        graph = PhysicsCouplingGraph()
+        graph.add_engine("a", a)
+        graph.add_engine("b", b)
+        graph.connect("a", "out", "b", "in")
+        with pytest.raises(ValueError, match="cycle"):
+            graph.connect("b", "out", "a", "in")
+
+        a.value = 42.0
+        graph.step(0.1)
+
+        assert a.value == 42.0
+        assert b.value == 42.0
+
+    def test_order_places_sources_first(self, engines):
+        """Test topological order updates turbines before the grid."""
+        graph = PhysicsCouplingGraph()
+        graph.add_engine("grid", engines["grid"])
+        graph.add_engine("turbine_plc_1", engines["turbine_plc_1"])
+        graph.connect("turbine_plc_1", "power_output_mw", "grid", "generation_mw")
+
+        assert graph.order() == ["turbine_plc_1", "grid"]
+
+
+# ================================================================
+# STEPPING TESTS
+# ================================================================
+class TestCouplingStep:
+    """Test value transfer during step()."""
+
+    async def test_generation_summed_without_truncation(self, engines):
+        """Test grid receives the exact sum of turbine outputs."""
+        graph = _graph(engines)
+        graph.connect("turbine_plc_1", "power_output_mw", "grid", "generation_mw")
+        graph.connect("turbine_plc_2", "power_output_mw", "grid", "generation_mw")
+        engines["turbine_plc_1"].state.shaft_speed_rpm = 1800.0
+        engines["turbine_plc_2"].state.shaft_speed_rpm = 1000.0
+
+        graph.step(0.1)
+
+        expected = (
+            engines["turbine_plc_1"].state.power_output_mw
+            + engines["turbine_plc_2"].state.power_output_mw
+        )
+        assert engines["grid"].state.total_gen_mw == pytest.approx(expected)
+        assert expected != int(expected)
+
+    async def test_bus_injection_written(self, engines):
+        """Test turbine output reaches its power flow generator bus."""
+        graph = _graph(engines)
+        graph.connect(
+            "turbine_plc_1", "power_output_mw", "power_flow", "bus_turbine_plc_1.gen_mw"
+        )
+        engines["turbine_plc_1"].state.shaft_speed_rpm = 3600.0
+
+        graph.step(0.1)
+
+        bus = engines["power_flow"].get_bus_states()["bus_turbine_plc_1"]
+        assert bus.gen_mw == pytest.approx(
+            engines["turbine_plc_1"].state.power_output_mw
+        )
+        assert bus.gen_mvar == pytest.approx(bus.gen_mw * 0.484)
+
+    async def test_skip_still_propagates(self, engines):
+        """Test skipped engines are not updated but still feed targets."""
+        graph = _graph(engines)
+        graph.connect("turbine_plc_1", "power_output_mw", "grid", "generation_mw")
+        turbine = engines["turbine_plc_1"]
+        turbine.state.shaft_speed_rpm = 3600.0
+        turbine.state.power_output_mw = 42.5
+
+        graph.step(0.1, skip={"turbine_plc_1"})
+
+        assert turbine.state.power_output_mw == 42.5
+        assert engines["grid"].state.total_gen_mw == 42.5
+
+    async def test_status_reports_transfers(self, engines):
+        """Test status lists connections and counts transfers."""
+        graph = _graph(engines)
+        graph.connect("turbine_plc_1", "power_output_mw", "grid", "generation_mw")
+
+        graph.step(0.1)
+        status = graph.get_status()
+
+        assert status["steps"] == 1
+        assert status["transfers"] == 1
+        assert status["connections"] == [
+            "turbine_plc_1.power_output_mw -> grid.generation_mw"
+        ]
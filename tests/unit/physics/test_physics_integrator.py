@@ -0,0 +1,199 @@
+# tests/unit/physics/test_physics_integrator.py
+"""Tests for the adaptive sub-stepping integrator in BaseDevicePhysicsEngine.
+
+Level 3 in our dependency tree - device physics engines depend on:
+- DataStore (Level 2) - uses REAL DataStore
+- SystemState (Level 1) - uses REAL SystemState (via DataStore)
+- SimulationTime (Level 0) - uses REAL SimulationTime
+
+Test Coverage:
+- Default single-step behaviour is unchanged
+- Configuration validation
+- Error-controlled sub-stepping and step counts
+- Accuracy of large outer ticks against a fine-step reference
+- Rollback of integrated private attributes on rejected steps
+"""
+
+import pytest
+
+from components.physics.base_physics_engine import IntegratorConfig
+from components.physics.hvac_physics import HVACPhysics
+from components.physics.reactor_physics import ReactorPhysics
+from components.physics.turbine_physics import TurbinePhysics
+from components.state.data_store import DataStore
+from components.state.system_state import SystemState
+
+
+# ================================================================
+# FIXTURES
+# ================================================================
+@pytest.fixture
+async def data_store():
+    """Create DataStore with turbine, reactor and HVAC devices registered."""
+    system_state = SystemState()
+    store = DataStore(system_state)
+
+    for name, device_type in [
+        ("turbine_plc_1", "turbine_plc"),
+        ("reactor_plc_1", "reactor_plc"),
+        ("hvac_plc_1", "hvac_plc"),
+    ]:
+        await store.register_device(
+            device_name=name,
+            device_type=device_type,
+            device_id=1,
+            protocols=["modbus"],
+        )
+
+    return store
+
+
+async def _hvac(data_store, **integrator):
+    hvac = HVACPhysics("hvac_plc_1", data_store)
+    if integrator:
+        hvac.configure_integrator(**integrator)
+    await hvac.initialise()
+    hvac.set_system_enable(True)
+    hvac.set_operating_mode(HVACPhysics.MODE_HEAT)
+    hvac.set_fan_speed(100.0)
+    hvac.set_temperature_setpoint(22.0)
+    return hvac
+
+
+# ================================================================
+# CONFIGURATION TESTS
+# ================================================================
+class TestIntegratorConfiguration:
+    """Test integrator configuration and validation."""
+
+    async def test_disabled_by_default(self, data_store):
+        """Test engines default to one Euler step per update."""
+        turbine = TurbinePhysics("turbine_plc_1", data_store)
+        await turbine.initialise()
+
+        turbine.update(1.0)
+
+        assert turbine.integrator == IntegratorConfig()
+        stats = turbine.get_integrator_stats()
+        assert stats["adaptive"] is False
+        assert stats["updates"] == 1
+        assert stats["last_substeps"] == 1
+
+    async def test_configure_overrides_fields(self, data_store):
+        """Test configure_integrator updates only the given settings."""
+        turbine = TurbinePhysics("turbine_plc_1", data_store)
+
+        turbine.configure_integrator(adaptive=True, max_substep=0.5)
+
+        assert turbine.integrator.adaptive is True
+        assert turbine.integrator.max_substep == 0.5
+        assert turbine.integrator.min_substep == IntegratorConfig().min_substep
+
+    async def test_configure_rejects_unknown_setting(self, data_store):
+        """Test unknown integrator settings raise ValueError."""
+        turbine = TurbinePhysics("turbine_plc_1", data_store)
+
+        with pytest.raises(ValueError, match="Unknown integrator settings"):
+            turbine.configure_integrator(order=4)
+
+    async def test_configure_rejects_invalid_substeps(self, data_store):
+        """Test min_substep above max_substep raises ValueError."""
+        turbine = TurbinePhysics("turbine_plc_1", data_store)
+
+        with pytest.raises(ValueError, match="min_substep"):
+            turbine.configure_integrator(min_substep=1.0, max_substep=0.1)
+
+
+# ================================================================
+# SUB-STEPPING TESTS
+# ================================================================
+class TestAdaptiveSubStepping:
+    """Test error-controlled adaptive sub-stepping."""
+
+    async def test_large_tick_is_split(self, data_store):
+        """Test a large tick is integrated in multiple sub-steps."""
+        hvac = await _hvac(data_store, adaptive=True, max_substep=0.25)
+
+        hvac.update(10.0)
+
+        stats = hvac.get_integrator_stats()
+        assert stats["last_substeps"] >= 40
+        assert stats["accepted_steps"] == stats["last_substeps"]
+
+    async def test_large_ticks_track_fine_reference(self, data_store):
+        """Test adaptive 10 s ticks stay close to a 0.01 s Euler reference."""
+        reference = await _hvac(data_store)
+        for _ in range(6000):
+            reference.update(0.01)
+
+        adaptive = await _hvac(data_store, adaptive=True)
+        for _ in range(6):
+            adaptive.update(10.0)
+
+        coarse = await _hvac(data_store)
+        for _ in range(6):
+            coarse.update(10.0)
+
+        ref_temp = reference.state.zone_temperature_c
+        adaptive_error = abs(adaptive.state.zone_temperature_c - ref_temp)
+        coarse_error = abs(coarse.state.zone_temperature_c - ref_temp)
+
+        assert adaptive_error < 0.05
+        assert adaptive_error < coarse_error
+
+    async def test_rejected_steps_counted(self, data_store):
+        """Test tight tolerances cause rejected trial steps."""
+        hvac = await _hvac(
+            data_store,
+            adaptive=True,
+            max_substep=5.0,
+            rel_tolerance=1e-6,
+            abs_tolerance=1e-6,
+        )
+
+        hvac.update(5.0)
+
+        assert hvac.get_integrator_stats()["rejected_steps"] > 0
+
+    async def test_budget_exhaustion_finishes_update(self, data_store):
+        """Test hitting max_substeps still advances the full dt."""
+        turbine = TurbinePhysics("turbine_plc_1", data_store)
+        turbine.configure_integrator(
+            adaptive=True, max_substep=0.01, min_substep=0.01, max_substeps=5
+        )
+        await turbine.initialise()
+        turbine.set_governor_enabled(True)
+        turbine._control_cache["holding_registers[10]"] = 3600.0
+        turbine._control_cache["coils[10]"] = True
+
+        turbine.update(1.0)
+
+        stats = turbine.get_integrator_stats()
+        assert stats["budget_exhausted"] == 1
+        assert stats["last_substeps"] == 6
+        # 0.05 s of sub-steps + one 0.95 s step at 100 RPM/s
+        assert turbine.state.shaft_speed_rpm == pytest.approx(100.0)
+
+    async def test_scram_latch_rolled_back_on_rejection(self, data_store):
+        """Test the reactor SCRAM latch is part of the integrated state."""
+        reactor = ReactorPhysics("reactor_plc_1", data_store)
+        reactor.configure_integrator(adaptive=True)
+        await reactor.initialise()
+
+        snapshot = reactor._snapshot_integrated_state()
+        reactor._scram_active = True
+        reactor.state.core_temperature_c = 500.0
+
+        reactor._restore_integrated_state(snapshot)
+
+        assert reactor._scram_active is False
+        assert reactor.state.core_temperature_c == 25.0
+
+    async def test_restore_keeps_state_identity(self, data_store):
+        """Test rollback updates the state object in place."""
+        hvac = await _hvac(data_store, adaptive=True)
+        state = hvac.get_state()
+
+        hvac.update(10.0)
+
+        assert hvac.get_state() is state
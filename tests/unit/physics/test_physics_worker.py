@@ -0,0 +1,208 @@
+# tests/unit/physics/test_physics_worker.py
+"""Tests for PhysicsWorker out-of-process physics execution.
+
+Level 3 in our dependency tree - PhysicsWorker depends on:
+- Device physics engines (Level 3)
+- DataStore (Level 2) - uses REAL DataStore
+- SimulationTime (Level 0) - uses REAL SimulationTime
+
+Test Coverage:
+- Lifecycle (start, stop, double start)
+- Worker results match in-process stepping
+- Control inputs and integrated attributes cross the process boundary
+- State and param changes made on the simulator side reach the worker
+- Error handling
+"""
+
+import pytest
+
+from components.physics.hvac_physics import HVACPhysics
+from components.physics.physics_worker import PhysicsWorker
+from components.physics.reactor_physics import ReactorPhysics
+from components.physics.turbine_physics import TurbinePhysics
+from components.state.data_store import DataStore
+from components.state.system_state import SystemState
+
+
+# ================================================================
+# FIXTURES
+# ================================================================
+async def _engines():
+    """Create initialised turbine, reactor and HVAC engines."""
+    data_store = DataStore(SystemState())
+    for name, device_type in [
+        ("turbine_plc_1", "turbine_plc"),
+        ("reactor_plc_1", "reactor_plc"),
+        ("hvac_plc_1", "hvac_plc"),
+    ]:
+        await data_store.register_device(
+            device_name=name, device_type=device_type, device_id=1, protocols=[]
+        )
+
+    turbine = TurbinePhysics("turbine_plc_1", data_store)
+    reactor = ReactorPhysics("reactor_plc_1", data_store)
+    hvac = HVACPhysics("hvac_plc_1", data_store)
+    for engine in (turbine, reactor, hvac):
+        await engine.initialise()
+
+    turbine._control_cache["holding_registers[10]"] = 3600.0
+    turbine._control_cache["coils[10]"] = True
+    reactor.set_power_setpoint(80.0)
+    reactor.set_coolant_pump_speed(60.0)
+    hvac.set_system_enable(True)
+    hvac.set_operating_mode(HVACPhysics.MODE_AUTO)
+    hvac.set_fan_speed(70.0)
+
+    return {"turbine_plc_1": turbine, "reactor_plc_1": reactor, "hvac_plc_1": hvac}
+
+
+@pytest.fixture
+async def worker():
+    """Create and start a PhysicsWorker; stop it after the test."""
+    engines = await _engines()
+    physics_worker = PhysicsWorker(engines)
+    await physics_worker.start()
+    yield physics_worker, engines
+    await physics_worker.stop()
+
+
+# ================================================================
+# LIFECYCLE TESTS
+# ================================================================
+class TestPhysicsWorkerLifecycle:
+    """Test worker process lifecycle."""
+
+    def test_requires_engines(self):
+        """Test creating a worker without engines raises ValueError."""
+        with pytest.raises(ValueError, match="at least one engine"):
+            PhysicsWorker({})
+
+    async def test_step_before_start_raises(self):
+        """Test stepping a stopped worker raises RuntimeError."""
+        physics_worker = PhysicsWorker(await _engines())
+
+        with pytest.raises(RuntimeError, match="not running"):
+            await physics_worker.step(1.0)
+
+    async def test_start_and_stop(self, worker):
+        """Test worker reports running state and releases resources."""
+        physics_worker, _ = worker
+
+        assert physics_worker.is_running()
+        status = physics_worker.get_status()
+        assert status["running"] is True
+        assert status["pid"] is not None
+        assert status["shared_memory_bytes"] > 0
+
+        await physics_worker.stop()
+
+        assert not physics_worker.is_running()
+
+    async def test_double_start_raises(self, worker):
+        """Test starting a running worker raises RuntimeError."""
+        physics_worker, _ = worker
+
+        with pytest.raises(RuntimeError, match="already running"):
+            await physics_worker.start()
+
+
+# ================================================================
+# STEPPING TESTS
+# ================================================================
+class TestPhysicsWorkerStepping:
+    """Test stepping engines in the worker process."""
+
+    async def test_matches_in_process_update(self, worker):
+        """Test worker results equal in-process updates."""
+        physics_worker, engines = worker
+        reference = await _engines()
+
+        for _ in range(20):
+            await physics_worker.step(0.5, simulation_time=0.0)
+            for engine in reference.values():
+                engine.update(0.5)
+
+        for name, engine in engines.items():
+            assert engine.get_state() == reference[name].get_state()
+
+        assert physics_worker.get_status()["steps"] == 20
+
+    async def test_control_changes_reach_worker(self, worker):
+        """Test control cache updates are sent with each step."""
+        physics_worker, engines = worker
+        turbine = engines["turbine_plc_1"]
+
+        await physics_worker.step(1.0)
+        assert turbine.state.shaft_speed_rpm > 0
+
+        turbine._control_cache["coils[11]"] = True  # Emergency trip
+        speed_before = turbine.state.shaft_speed_rpm
+        await physics_worker.step(1.0)
+
+        assert turbine.state.shaft_speed_rpm < speed_before
+
+    async def test_integrated_attributes_returned(self, worker):
+        """Test private integrated attributes keep their types."""
+        physics_worker, engines = worker
+        reactor = engines["reactor_plc_1"]
+
+        reactor.trigger_scram()
+        await physics_worker.step(1.0)
+
+        assert reactor.is_scram_active() is True
+
+    async def test_scram_reset_survives_step(self, worker):
+        """Test a simulator-side SCRAM reset is not undone by the worker.
+
+        WHY: An operator must be able to clear a SCRAM in worker mode.
+        """
+        physics_worker, engines = worker
+        reactor = engines["reactor_plc_1"]
+        reactor.trigger_scram()
+        await physics_worker.step(1.0)
+
+        reactor._control_cache["emergency_shutdown"] = False
+        assert reactor.reset_scram() is True
+        await physics_worker.step(1.0)
+
+        assert reactor.is_scram_active() is False
+
+    async def test_param_changes_reach_worker(self, worker):
+        """Test params changed on the simulator side are used by the worker."""
+        physics_worker, engines = worker
+        reference = await _engines()
+        for hvac in (engines["hvac_plc_1"], reference["hvac_plc_1"]):
+            hvac.set_outside_conditions(-20.0, 80.0)
+
+        for _ in range(5):
+            await physics_worker.step(1.0, simulation_time=0.0)
+            reference["hvac_plc_1"].update(1.0)
+
+        assert engines["hvac_plc_1"].get_state() == reference["hvac_plc_1"].get_state()
+
+    async def test_integrator_stats_returned(self, worker):
+        """Test step counters come back from the worker."""
+        physics_worker, engines = worker
+
+        await physics_worker.step(1.0)
+
+        assert engines["hvac_plc_1"].get_integrator_stats()["updates"] == 1
+
+    async def test_sync_pushes_local_state(self, worker):
+        """Test sync() loads simulator-side state into the worker."""
+        physics_worker, engines = worker
+        turbine = engines["turbine_plc_1"]
+
+        turbine.state.shaft_speed_rpm = 3000.0
+        await physics_worker.sync()
+        await physics_worker.step(1.0)
+
+        assert turbine.state.shaft_speed_rpm == pytest.approx(3100.0)
+
+    async def test_non_numeric_control_rejected(self, worker):
+        """Test controls that do not fit the float64 layout are rejected."""
+        physics_worker, engines = worker
+        engines["turbine_plc_1"]._control_cache["holding_registers[10]"] = "fast"
+
+        with pytest.raises(ValueError):
+            await physics_worker.step(1.0)
@@ -0,0 +1,260 @@
+# tests/unit/physics/test_steady_state.py
+"""Tests for steady-state initialisation of physics engines.
+
+Level 3 in our dependency tree - physics engines depend on:
+- DataStore (Level 2) - uses REAL DataStore
+- SystemState (Level 1) - uses REAL SystemState (via DataStore)
+- SimulationTime (Level 0) - uses REAL SimulationTime
+
+Test Coverage:
+- Default initialise() still starts from cold defaults
+- Analytic equilibria (turbine, reactor, grid)
+- Fixed-point solve (HVAC PI loops, tripped turbine)
+- Solved states stay put under normal update()
+- Accumulated history is not advanced by the solve
+"""
+
+import pytest
+
+from components.physics.grid_physics import GridParameters, GridPhysics
+from components.physics.hvac_physics import HVACPhysics
+from components.physics.reactor_physics import ReactorPhysics
+from components.physics.turbine_physics import TurbinePhysics
+from components.state.data_store import DataStore
+from components.state.system_state import SystemState
+
+
+# ================================================================
+# FIXTURES
+# ================================================================
+@pytest.fixture
+async def data_store():
+    """Create DataStore with turbine, reactor and HVAC devices registered."""
+    store = DataStore(SystemState())
+    for name, device_type in [
+        ("turbine_plc_1", "turbine_plc"),
+        ("reactor_plc_1", "reactor_plc"),
+        ("hvac_plc_1", "hvac_plc"),
+    ]:
+        await store.register_device(
+            device_name=name, device_type=device_type, device_id=1, protocols=[]
+        )
+    return store
+
+
+async def _turbine(data_store, setpoint=3600, governor=True, trip=False):
+    await data_store.bulk_write_memory(
+        "turbine_plc_1",
+        {
+            "holding_registers[10]": setpoint,
+            "coils[10]": governor,
+            "coils[11]": trip,
+        },
+    )
+    turbine = TurbinePhysics("turbine_plc_1", data_store)
+    await turbine.initialise(steady_state=True)
+    return turbine
+
+
+# ================================================================
+# TURBINE TESTS
+# ================================================================
+class TestTurbineSteadyState:
+    """Test turbine steady-state initialisation."""
+
+    async def test_default_initialise_is_cold(self, data_store):
+        """Test initialise() without steady_state keeps standstill."""
+        await data_store.write_memory("turbine_plc_1", "holding_registers[10]", 3600)
+        turbine = TurbinePhysics("turbine_plc_1", data_store)
+
+        await turbine.initialise()
+
+        assert turbine.state.shaft_speed_rpm == 0.0
+
+    async def test_starts_at_rated_operation(self, data_store):
+        """Test governed turbine starts at setpoint with settled temperatures."""
+        turbine = await _turbine(data_store)
+
+        assert turbine.state.shaft_speed_rpm == 3600
+        assert turbine.state.power_output_mw == pytest.approx(100.0)
+        assert turbine.state.steam_pressure_psi == pytest.approx(1800.0)
+
+        # Telemetry written at equilibrium
+        speed = await data_store.read_memory("turbine_plc_1", "holding_registers[0]")
+        assert speed == 3600
+
+    async def test_state_holds_under_update(self, data_store):
+        """Test the solved state does not drift when simulated."""
+        turbine = await _turbine(data_store)
+        before = turbine.get_telemetry()
+
+        for _ in range(60):
+            turbine.update(1.0)
+
+        assert turbine.get_telemetry() == before
+
+    async def test_analytic_solve_needs_one_iteration(self, data_store):
+        """Test an exact analytic equilibrium is confirmed immediately."""
+        turbine = await _turbine(data_store)
+
+        result = turbine.solve_steady_state()
+
+        assert result.converged
+        assert result.analytic
+        assert result.iterations == 1
+
+    async def test_tripped_turbine_uses_fixed_point(self, data_store):
+        """Test a tripped turbine converges without an analytic start."""
+        turbine = await _turbine(data_store, trip=True)
+
+        result = turbine.solve_steady_state()
+
+        assert result.converged
+        assert not result.analytic
+        assert turbine.state.shaft_speed_rpm == 0.0
+
+    async def test_overspeed_history_not_accumulated(self, data_store):
+        """Test the solve does not add overspeed time or damage."""
+        turbine = await _turbine(data_store, setpoint=4200)
+
+        assert turbine.state.shaft_speed_rpm == 4200
+        assert turbine.state.cumulative_overspeed_time == 0.0
+        assert turbine.state.damage_level == 0.0
+
+
+# ================================================================
+# REACTOR TESTS
+# ================================================================
+class TestReactorSteadyState:
+    """Test reactor steady-state initialisation."""
+
+    async def test_heat_balance(self, data_store):
+        """Test core temperature satisfies the coolant heat balance."""
+        await data_store.bulk_write_memory(
+            "reactor_plc_1",
+            {"holding_registers[10]": 80, "holding_registers[11]": 60},
+        )
+        reactor = ReactorPhysics("reactor_plc_1", data_store)
+
+        await reactor.initialise(steady_state=True)
+
+        state = reactor.state
+        heat_removed = (
+            state.coolant_flow_rate
+            * reactor.params.coolant_capacity
+            * (state.core_temperature_c - state.coolant_temperature_c)
+        )
+        assert state.reaction_rate == pytest.approx(0.8)
+        assert heat_removed == pytest.approx(0.8 * reactor.params.rated_power_mw)
+
+        core_temp = state.core_temperature_c
+        for _ in range(60):
+            reactor.update(1.0)
+        assert reactor.state.core_temperature_c == pytest.approx(core_temp)
+
+    async def test_no_coolant_flow_falls_back(self, data_store):
+        """Test running without coolant is left to the fixed-point solve."""
+        await data_store.write_memory("reactor_plc_1", "holding_registers[10]", 50)
+        reactor = ReactorPhysics("reactor_plc_1", data_store)
+        await reactor.initialise()
+        await reactor.read_control_inputs()
+
+        assert reactor._analytic_steady_state() is False
+
+
+# ================================================================
+# HVAC TESTS
+# ================================================================
+class TestHVACSteadyState:
+    """Test HVAC steady-state initialisation."""
+
+    async def test_pi_loop_settles_on_setpoint(self, data_store):
+        """Test auto mode starts with zone at setpoint and actuators on command."""
+        await data_store.bulk_write_memory(
+            "hvac_plc_1",
+            {
+                "holding_registers[10]": 21,
+                "holding_registers[12]": 70,
+                "holding_registers[13]": HVACPhysics.MODE_AUTO,
+                "holding_registers[14]": 20,
+                "coils[10]": True,
+            },
+        )
+        hvac = HVACPhysics("hvac_plc_1", data_store)
+
+        await hvac.initialise(steady_state=True)
+
+        assert hvac.state.zone_temperature_c == pytest.approx(21.0, abs=1e-3)
+        assert hvac.state.fan_speed_percent == 70.0
+        assert hvac.state.damper_position_percent == 20.0
+
+        zone_temp = hvac.state.zone_temperature_c
+        for _ in range(600):
+            hvac.update(1.0)
+        assert hvac.state.zone_temperature_c == pytest.approx(zone_temp, abs=1e-3)
+
+    async def test_integrator_stats_untouched(self, data_store):
+        """Test the solve does not count as integrated updates."""
+        await data_store.write_memory("hvac_plc_1", "coils[10]", True)
+        hvac = HVACPhysics("hvac_plc_1", data_store)
+
+        await hvac.initialise(steady_state=True)
+
+        assert hvac.get_integrator_stats()["updates"] == 0
+
+
+# ================================================================
+# GRID TESTS
+# ================================================================
+class TestGridSteadyState:
+    """Test grid steady-state initialisation."""
+
+    async def test_frequency_offset_from_imbalance(self, data_store):
+        """Test frequency settles at f_nom + imbalance / damping."""
+        turbine = await _turbine(data_store, setpoint=3600)
+        assert turbine.state.power_output_mw == pytest.approx(100.0)
+        grid = GridPhysics(data_store, GridParameters(damping=100.0))
+
+        await grid.initialise(steady_state=True)
+
+        # 100 MW generation, 80 MW fixed load
+        assert grid.state.frequency_hz == pytest.approx(50.2)
+        frequency = grid.state.frequency_hz
+        grid.update(1.0)
+        assert grid.state.frequency_hz == pytest.approx(frequency)
+
+    async def test_manager_grid_does_not_trip(self, data_store):
+        """Test the simulator's grid parameters start untripped.
+
+        WHY: With 1 MW/Hz damping a 20 MW imbalance solves to 30 Hz, which
+        would latch an under-frequency trip before the first tick.
+        """
+        await _turbine(data_store, setpoint=3600)
+        grid = GridPhysics(
+            data_store,
+            GridParameters(
+                nominal_frequency_hz=50.0,
+                inertia_constant=5000.0,
+                min_frequency_hz=49.0,
+                max_frequency_hz=51.0,
+            ),
+        )
+        await grid.initialise()
+
+        result = grid.solve_steady_state()
+
+        assert not result.converged
+        assert grid.state.frequency_hz == 50.0
+        assert grid.state.voltage_pu == 1.0
+        assert not grid.state.under_frequency_trip
+        assert not grid.state.over_frequency_trip
+
+    async def test_no_damping_without_balance(self, data_store):
+        """Test an undamped, imbalanced grid reports no steady state."""
+        grid = GridPhysics(data_store, GridParameters(damping=0.0))
+        await grid.initialise()
+
+        result = grid.solve_steady_state()
+
+        assert not result.converged
+        assert grid.state.frequency_hz == 50.0
@@ -0,0 +1,102 @@
+# tests/unit/security/test_alert_store.py
+"""Tests for the indexed alert store.
+
+Level 0 - no dependencies.
+
+Test Coverage:
+- Lookup by ID and insertion order
+- Counters by field and status
+- Incremental active views
+- Eviction helpers
+"""
+
+from dataclasses import dataclass
+
+import pytest
+
+from components.security.alert_store import AlertStore
+
+
+@dataclass
+class FakeAlert:
+    """Minimal alert with the attributes AlertStore indexes."""
+
+    alert_id: str
+    severity: str
+    category: str
+    status: str = "new"
+
+
+def _store(*alerts):
+    store = AlertStore(inactive_statuses={"closed"}, fields=("severity", "category"))
+    for alert in alerts:
+        store.add(alert)
+    return store
+
+
+class TestAlertStore:
+    """Test alert indexing."""
+
+    def test_lookup_and_order(self):
+        """Test alerts are found by ID and iterated oldest first."""
+        a, b = FakeAlert("a", "high", "scan"), FakeAlert("b", "low", "auth")
+        store = _store(a, b)
+
+        assert store.get("b") is b
+        assert store.get("missing") is None
+        assert list(store) == [a, b]
+        assert store.oldest() is a
+        assert "a" in store and len(store) == 2
+
+    def test_duplicate_id_rejected(self):
+        """Test adding an ID twice raises ValueError."""
+        store = _store(FakeAlert("a", "high", "scan"))
+
+        with pytest.raises(ValueError, match="Duplicate alert ID"):
+            store.add(FakeAlert("a", "low", "scan"))
+
+    def test_counters_follow_status_changes(self):
+        """Test per-field and per-status counts track set_status."""
+        a = FakeAlert("a", "high", "scan")
+        store = _store(a, FakeAlert("b", "high", "auth"))
+
+        assert store.count("severity", "high") == 2
+        assert store.count("severity", "high", status="new") == 2
+
+        store.set_status(a, "investigating")
+
+        assert store.count("severity", "high", status="new") == 1
+        assert store.count("category", "scan", status="investigating") == 1
+        assert store.count("status", "investigating") == 1
+        assert store.count("status", "new") == 1
+
+    def test_active_views(self):
+        """Test closing and reopening moves alerts between views."""
+        a = FakeAlert("a", "high", "scan")
+        b = FakeAlert("b", "high", "auth")
+        store = _store(a, b, FakeAlert("c", "low", "scan"))
+
+        store.set_status(a, "closed")
+
+        assert store.active_count() == 2
+        assert store.active_count("severity", "high") == 1
+        assert store.active(severity="high") == [b]
+        assert store.active(severity="low", category="scan")[0].alert_id == "c"
+        assert store.active(severity="critical") == []
+        assert store.oldest_inactive() is a
+
+        store.set_status(a, "new")
+
+        assert store.active_count("category", "scan") == 2
+        assert store.oldest_inactive() is None
+
+    def test_remove_updates_indexes(self):
+        """Test removal drops the alert from counters and views."""
+        a = FakeAlert("a", "high", "scan")
+        store = _store(a)
+
+        assert store.remove("a") is a
+        assert store.remove("a") is None
+        assert store.count("severity", "high") == 0
+        assert store.active_count() == 0
+        assert store.active(severity="high") == []
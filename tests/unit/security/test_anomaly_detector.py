@@ -9,6 +9,7 @@ Test Coverage:
 - Statistical anomaly detection
 - Range violation detection
 - Rate of change detection
+- Batched (array-backed) checking
 - Alarm flood detection
 - Anomaly retrieval and filtering
 - Baseline export/import
@@ -16,11 +17,14 @@ Test Coverage:
 """
 
 import asyncio
+import random
+import statistics
 from collections import deque
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from components.security import anomaly_detector
 from components.security.anomaly_detector import (
     ANOMALY_TO_EVENT_SEVERITY,
     AnomalyDetector,
@@ -31,6 +35,10 @@ from components.security.anomaly_detector import (
 )
 from components.security.logging_system import EventSeverity
 
+requires_numpy = pytest.mark.skipif(
+    not anomaly_detector.NUMPY_AVAILABLE, reason="NumPy not installed"
+)
+
 
 # ================================================================
 # ENUM TESTS
@@ -53,6 +61,7 @@ class TestAnomalyType:
             "communication",
             "alarm_flood",
             "control_logic",
+            "drift",
         }
         assert expected == types
 
@@ -311,6 +320,36 @@ class TestStatisticalBaseline:
 
         assert magnitude == 3.0  # (130-100)/10
 
+    def test_windowed_statistics_match_exact(self):
+        """Test running statistics track the last 1000 samples exactly.
+
+        WHY: O(1) updates must give the same baseline as a full recompute.
+        """
+        baseline = StatisticalBaseline(parameter="temp", device="dev")
+        rng = random.Random(7)
+        samples = [rng.gauss(1e6, 5.0) for _ in range(2500)]
+
+        for v in samples:
+            baseline.update(v)
+
+        window = samples[-1000:]
+        assert baseline.mean == pytest.approx(statistics.mean(window), rel=1e-12)
+        assert baseline.std == pytest.approx(statistics.stdev(window), rel=1e-9)
+
+    def test_large_learning_window_can_be_learned(self):
+        """Test learning windows above 1000 samples still complete.
+
+        WHY: History must be at least as long as the learning window.
+        """
+        baseline = StatisticalBaseline(
+            parameter="temp", device="dev", learning_window=1500
+        )
+
+        for i in range(1500):
+            baseline.update(float(i % 10))
+
+        assert baseline.is_learned is True
+
 
 # ================================================================
 # ANOMALY DETECTOR TESTS
@@ -484,6 +523,39 @@ class TestAnomalyDetection:
         assert len(anomalies) >= 1
         assert any(a.anomaly_type == AnomalyType.RATE_OF_CHANGE for a in anomalies)
 
+    @pytest.mark.asyncio
+    async def test_check_value_slow_drift(self, detector):
+        """Test a drift that stays within 3 sigma is caught by CUSUM.
+
+        WHY: Slow setpoint manipulation is absorbed by re-learning baselines.
+        """
+        await detector.add_baseline("plc_1", "setpoint", learning_window=100)
+        await detector.add_drift_detector("plc_1", "setpoint", "cusum", warmup=100)
+        rng = random.Random(5)
+
+        for _ in range(100):
+            await detector.check_value("plc_1", "setpoint", rng.gauss(1500.0, 2.0))
+        found = []
+        for step in range(200):
+            value = rng.gauss(1500.0 - 0.05 * step, 2.0)
+            found += await detector.check_value("plc_1", "setpoint", value)
+
+        types = {a.anomaly_type for a in found}
+        assert AnomalyType.DRIFT in types
+        assert AnomalyType.STATISTICAL not in types
+        drift = next(a for a in found if a.anomaly_type == AnomalyType.DRIFT)
+        assert drift.data["direction"] == "down"
+        assert drift.data["method"] == "cusum"
+
+    @pytest.mark.asyncio
+    async def test_add_drift_detector_unknown_method(self, detector):
+        """Test unknown change-point methods are rejected.
+
+        WHY: Typos in detector config should fail loudly.
+        """
+        with pytest.raises(ValueError):
+            await detector.add_drift_detector("plc_1", "temp", "arima")
+
     @pytest.mark.asyncio
     async def test_check_value_disabled(self, detector):
         """Test that disabled detector returns no anomalies.
@@ -499,7 +571,169 @@ class TestAnomalyDetection:
 
 
 # ================================================================
-# ALARM FLOOD TESTS
+# BATCH DETECTION TESTS
+# ================================================================
+class TestBatchDetection:
+    """Test check_batch against per-value checking."""
+
+    @pytest.fixture
+    def make_detector(self):
+        """Build detectors with baselines, range and rate limits configured."""
+
+        async def make():
+            data_store = MagicMock()
+            system_state = MagicMock()
+            detector = AnomalyDetector(data_store, system_state)
+            for device in ("plc_1", "plc_2"):
+                await detector.add_baseline(device, "temp", learning_window=10)
+                await detector.set_range_limit(device, "pressure", 0.0, 100.0)
+                await detector.set_rate_of_change_limit(device, "flow", 1.0)
+                for i in range(10):
+                    await detector.check_value(device, "temp", 100.0 + i % 3)
+                detector.last_values[(device, "flow")] = (
+                    50.0,
+                    detector.sim_time.now() - 1.0,
+                )
+            return detector
+
+        return make
+
+    SNAPSHOT = {
+        "plc_1": {"temp": 130.0, "pressure": 150.0, "flow": 55.0, "mode": "auto"},
+        "plc_2": {"temp": 101.0, "pressure": 50.0, "flow": 50.5, "alarm": True},
+    }
+
+    @staticmethod
+    def _summary(anomalies):
+        return [
+            (a.device, a.parameter, a.anomaly_type, a.severity, a.description)
+            for a in anomalies
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_check_value(self, make_detector):
+        """Test one batch finds the same anomalies as per-value checks.
+
+        WHY: Batching is an optimisation and must not change detections.
+        """
+        single, batched = await make_detector(), await make_detector()
+
+        expected = []
+        for device, values in self.SNAPSHOT.items():
+            for parameter, value in values.items():
+                if isinstance(value, float):
+                    expected += await single.check_value(device, parameter, value)
+        anomalies = await batched.check_batch(self.SNAPSHOT)
+
+        assert self._summary(anomalies) == self._summary(expected)
+        assert {a.anomaly_type for a in anomalies} == {
+            AnomalyType.STATISTICAL,
+            AnomalyType.RANGE,
+            AnomalyType.RATE_OF_CHANGE,
+        }
+        assert batched.last_values == single.last_values
+        assert len(batched.anomalies) == len(single.anomalies)
+
+    @pytest.mark.asyncio
+    async def test_batch_skips_unmonitored_values(self, make_detector):
+        """Test values without any detection configured are ignored.
+
+        WHY: Snapshots carry whole memory maps, most of it unmonitored.
+        """
+        detector = await make_detector()
+
+        anomalies = await detector.check_batch({"plc_3": {"temp": 1e9}})
+
+        assert anomalies == []
+        assert ("plc_3", "temp") not in detector.baselines
+
+    @staticmethod
+    def _baseline_state(baseline):
+        return (
+            baseline.sample_count,
+            baseline.is_learned,
+            baseline.min_value,
+            baseline.max_value,
+            baseline._count,
+            baseline._since_renormalise,
+            list(baseline._values),
+        )
+
+    @requires_numpy
+    @pytest.mark.asyncio
+    async def test_vectorised_baselines_match_objects(self):
+        """Test array-backed updates track StatisticalBaseline.update().
+
+        WHY: The vectorised pass reimplements the windowed Welford update;
+        window eviction and renormalisation must agree with the object path.
+        """
+        single = AnomalyDetector(MagicMock(), MagicMock())
+        batched = AnomalyDetector(MagicMock(), MagicMock())
+        for detector in (single, batched):
+            await detector.add_baseline("plc_1", "temp", learning_window=10)
+            await detector.add_baseline("plc_1", "flow", learning_window=1200)
+            await detector.add_baseline("plc_2", "temp", learning_window=150)
+            await detector.set_range_limit("plc_2", "temp", 0.0, 110.0)
+            await detector.set_rate_of_change_limit("plc_1", "flow", 5.0)
+        rng = random.Random(7)
+
+        expected, anomalies = [], []
+        for tick in range(2500):
+            snapshot = {
+                "plc_1": {"temp": rng.gauss(100, 2), "flow": rng.gauss(50, 1)},
+                "plc_2": {"temp": rng.gauss(80, 5) + (40 if tick % 97 == 0 else 0)},
+            }
+            for device, values in snapshot.items():
+                for parameter, value in values.items():
+                    expected += await single.check_value(device, parameter, value)
+            anomalies += await batched.check_batch(snapshot)
+
+        assert self._summary(anomalies) == self._summary(expected)
+        assert any(a.anomaly_type == AnomalyType.STATISTICAL for a in anomalies)
+        assert any(a.anomaly_type == AnomalyType.RANGE for a in anomalies)
+        assert batched.last_values == single.last_values
+        for key, baseline in single.baselines.items():
+            vectorised = batched.baselines[key]
+            assert self._baseline_state(vectorised) == self._baseline_state(baseline)
+            assert vectorised.mean == pytest.approx(baseline.mean, rel=1e-12)
+            assert vectorised.std == pytest.approx(baseline.std, rel=1e-9)
+
+    @requires_numpy
+    @pytest.mark.asyncio
+    async def test_check_value_and_batch_share_baselines(self):
+        """Test per-value and batched updates of one baseline interleave.
+
+        WHY: check_value() updates the StatisticalBaseline object while
+        check_batch() updates its array row; neither may lose samples.
+        """
+        single = AnomalyDetector(MagicMock(), MagicMock())
+        mixed = AnomalyDetector(MagicMock(), MagicMock())
+        for detector in (single, mixed):
+            await detector.add_baseline("plc_1", "temp", learning_window=10)
+            await detector.add_baseline("plc_2", "temp", learning_window=10)
+
+        for i in range(300):
+            value = 100.0 + i % 7
+            for device in ("plc_1", "plc_2"):
+                await single.check_value(device, "temp", value)
+            if i % 3:
+                await mixed.check_batch(
+                    {"plc_1": {"temp": value}, "plc_2": {"temp": value}}
+                )
+            else:
+                await mixed.check_value("plc_1", "temp", value)
+                await mixed.check_value("plc_2", "temp", value)
+            if i == 150:
+                del mixed.baselines[("plc_1", "temp")]
+                del single.baselines[("plc_1", "temp")]
+
+        assert list(mixed.baselines) == [("plc_2", "temp")]
+        baseline = single.baselines[("plc_2", "temp")]
+        shared = mixed.baselines[("plc_2", "temp")]
+        assert self._baseline_state(shared) == self._baseline_state(baseline)
+        assert shared.mean == pytest.approx(baseline.mean)
+
+
 # ================================================================
 class TestAlarmFloodDetection:
     """Test alarm flood detection."""
@@ -782,6 +1016,78 @@ class TestBaselineExport:
 
         data_store.update_metadata.assert_called()
 
+    @requires_numpy
+    @pytest.mark.asyncio
+    async def test_save_and_load_state(self, detector, mock_dependencies, tmp_path):
+        """Test a restarted detector resumes exactly where it left off.
+
+        WHY: Warm start avoids re-learning after every restart.
+        """
+        await detector.add_baseline("plc_1", "temp", learning_window=20)
+        await detector.add_drift_detector("plc_1", "temp", "cusum", warmup=10)
+        await detector.set_range_limit("plc_1", "pressure", 0.0, 100.0)
+        await detector.set_rate_of_change_limit("plc_1", "flow", 5.0)
+        for i in range(30):
+            await detector.check_value("plc_1", "temp", 100.0 + i % 4)
+
+        path = await detector.save_state(tmp_path / "baselines.npz")
+        restored = AnomalyDetector(*mock_dependencies)
+        assert await restored.load_state(path) == 1
+
+        before = detector.baselines[("plc_1", "temp")]
+        after = restored.baselines[("plc_1", "temp")]
+        assert after.is_learned is True
+        assert list(after._values) == list(before._values)
+        assert (after.mean, after.std) == (before.mean, before.std)
+        assert restored.range_limits == detector.range_limits
+        assert restored.roc_limits == detector.roc_limits
+        cusum = restored.drift_detectors[("plc_1", "temp")]["cusum"]
+        assert cusum.mean == detector.drift_detectors[("plc_1", "temp")]["cusum"].mean
+        assert isinstance(cusum.count, int)
+
+        # Both continue identically
+        for value in (150.0, 101.0):
+            assert [
+                a.description
+                for a in await restored.check_value("plc_1", "temp", value)
+            ] == [
+                a.description
+                for a in await detector.check_value("plc_1", "temp", value)
+            ]
+
+    @requires_numpy
+    @pytest.mark.asyncio
+    async def test_state_loaded_at_startup(
+        self, detector, mock_dependencies, tmp_path, monkeypatch
+    ):
+        """Test the configured baseline file is loaded on construction.
+
+        WHY: Detection should be live from the first tick after restart.
+        """
+        await detector.add_baseline("plc_1", "temp", learning_window=5)
+        for _ in range(5):
+            await detector.check_value("plc_1", "temp", 100.0)
+        path = await detector.save_state(tmp_path / "baselines.npz")
+
+        config = {"anomaly_detection": {"baseline_file": str(path)}}
+        monkeypatch.setattr(
+            anomaly_detector.ConfigLoader, "load_all", lambda self: config
+        )
+        restored = AnomalyDetector(*mock_dependencies)
+
+        assert restored.baselines[("plc_1", "temp")].is_learned is True
+
+    @requires_numpy
+    @pytest.mark.asyncio
+    async def test_load_rejects_other_versions(self, detector, tmp_path):
+        """Test files from another format version are refused."""
+        np = pytest.importorskip("numpy")
+        path = tmp_path / "baselines.npz"
+        np.savez(path, format_version=np.array(99))
+
+        with pytest.raises(ValueError):
+            await detector.load_state(path)
+
 
 # ================================================================
 # LOGGING INTEGRATION TESTS
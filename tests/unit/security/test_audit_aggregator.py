@@ -0,0 +1,215 @@
+# tests/unit/security/test_audit_aggregator.py
+"""Tests for audit event aggregation and storm suppression.
+
+Level 0 - no dependencies.
+
+Test Coverage:
+- Message templates and token buckets
+- Coalescing repeats into counted summaries
+- Per-category rate limits
+- Group bounds and clock resets
+- SystemState, IDS and correlation integration
+"""
+
+import json
+
+import pytest
+
+from components.devices.enterprise_zone.ids_system import IDSSystem
+from components.security.audit_aggregator import (
+    AuditAggregator,
+    TokenBucket,
+    message_template,
+)
+from components.security.correlation import CorrelationEngine
+from components.state.data_store import DataStore
+from components.state.system_state import SystemState
+from components.time.simulation_time import SimulationTime
+
+
+def _write(t, value, address="holding_registers[0]", device="plc_1"):
+    return {
+        "simulation_time": t,
+        "category": "security",
+        "device": device,
+        "message": f"Memory write: {address} = {value}",
+        "data": {"address": address, "new_value": value},
+    }
+
+
+class TestBuildingBlocks:
+    """Test templates and token buckets."""
+
+    def test_message_template_masks_numbers(self):
+        """Test values do not split otherwise identical messages."""
+        assert message_template("Memory write: coil[3] = 1.5") == (
+            "Memory write: coil[#] = #"
+        )
+
+    def test_token_bucket_refills_with_time(self):
+        """Test tokens are spent and refilled at the configured rate."""
+        bucket = TokenBucket(rate=2.0, burst=2)
+
+        assert [bucket.take(0.0) for _ in range(3)] == [True, True, False]
+        assert bucket.take(0.5) is True
+        assert bucket.take(0.5) is False
+
+    def test_token_bucket_rejects_bad_settings(self):
+        """Test non-positive rates raise ValueError."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, burst=1)
+
+
+class TestAuditAggregator:
+    """Test coalescing and suppression."""
+
+    def test_write_flood_becomes_one_summary(self):
+        """Test repeats in the window are counted into one summary record.
+
+        WHY: Event volume must not grow with attack intensity.
+        """
+        aggregator = AuditAggregator(window=5.0)
+        kept = []
+        for i in range(1000):
+            kept += aggregator.offer(_write(i * 0.004, i))
+        kept += aggregator.offer(_write(6.0, 1))  # Next window
+
+        assert len(kept) == 3
+        first, summary, restart = kept
+        assert "count" not in first and first["data"]["new_value"] == 0
+        assert summary["count"] == 999
+        assert summary["first_seen"] == pytest.approx(0.004)
+        assert summary["last_seen"] == pytest.approx(3.996)
+        assert summary["data"]["new_value"] == 999
+        assert restart["simulation_time"] == 6.0
+        assert aggregator.stats()["events_suppressed"] == 999
+
+    def test_key_fields_keep_distinct_targets_apart(self):
+        """Test writes to different addresses or devices are not merged."""
+        aggregator = AuditAggregator(window=5.0)
+        kept = []
+        for address in ("coil[0]", "coil[1]"):
+            for device in ("plc_1", "plc_2"):
+                kept += aggregator.offer(_write(0.0, 1, address, device))
+
+        assert len(kept) == 4
+        assert aggregator.flush() == []
+
+    def test_key_fields_read_from_serialised_data(self):
+        """Test key fields work on LogEntry.to_dict records (data as JSON)."""
+        aggregator = AuditAggregator(window=5.0)
+        kept = []
+        for address in ("coil[0]", "coil[1]"):
+            event = _write(0.0, 1, address)
+            event["data"] = json.dumps(event["data"])
+            kept += aggregator.offer(event)
+
+        assert len(kept) == 2
+
+    def test_rate_limit_counts_instead_of_dropping(self):
+        """Test events over the category limit end up in summary counts."""
+        aggregator = AuditAggregator(
+            window=5.0, rate_limits={"security": {"rate": 1.0, "burst": 2}}
+        )
+        kept = []
+        for i in range(10):
+            kept += aggregator.offer(_write(0.0, 0, address=f"coil[{i}]"))
+        kept += aggregator.flush()
+
+        passed = [r for r in kept if "count" not in r]
+        assert len(passed) == 2
+        assert sum(r.get("count", 1) for r in kept) == 10
+
+    def test_max_groups_closes_oldest(self):
+        """Test open groups are bounded."""
+        aggregator = AuditAggregator(window=60.0, max_groups=2)
+        aggregator.offer(_write(0.0, 0, "coil[0]"))
+        aggregator.offer(_write(0.1, 0, "coil[0]"))
+
+        kept = aggregator.offer(_write(0.2, 0, "coil[1]"))
+        kept += aggregator.offer(_write(0.3, 0, "coil[2]"))
+
+        assert kept[1]["count"] == 1 and kept[1]["data"]["address"] == "coil[0]"
+        assert aggregator.stats()["open_groups"] == 2
+
+    def test_clock_reset_closes_windows(self):
+        """Test a simulation time reset does not hold groups open."""
+        aggregator = AuditAggregator(window=5.0)
+        aggregator.offer(_write(100.0, 0))
+        aggregator.offer(_write(101.0, 1))
+
+        kept = aggregator.offer(_write(0.0, 2))
+
+        assert [r.get("count", 1) for r in kept] == [1, 1]
+
+    def test_summary_stamped_when_emitted(self):
+        """Test summaries carry the time they are emitted.
+
+        WHY: Readers polling the log by time have moved past last_seen by
+        the time the window closes.
+        """
+        aggregator = AuditAggregator(window=5.0)
+        aggregator.offer(_write(0.0, 0))
+        aggregator.offer(_write(1.0, 1))
+
+        (summary,) = aggregator.expire(7.5)
+
+        assert summary["simulation_time"] == 7.5
+        assert (summary["first_seen"], summary["last_seen"]) == (1.0, 1.0)
+        assert aggregator.flush() == []
+
+
+class TestAggregationIntegration:
+    """Test aggregation through SystemState and correlation."""
+
+    async def test_system_state_stores_summaries(self):
+        """Test SystemState keeps summaries once their window closes."""
+        state = SystemState(audit_aggregator=AuditAggregator(window=5.0))
+        for i in range(500):
+            await state.append_audit_event(_write(i * 0.001, i))
+        assert len(state.audit_log) == 1
+
+        await state.flush_audit_aggregation(final=True)
+        events = await state.get_audit_log()
+
+        assert [e.get("count", 1) for e in events] == [499, 1]
+
+    async def test_ids_sees_every_denied_attempt(self):
+        """Test an aggregated denial burst reaches IDS volume in full."""
+        sim_time = SimulationTime()
+        await sim_time.reset()
+        state = SystemState(audit_aggregator=AuditAggregator(window=5.0))
+        ids = IDSSystem("ids_primary", 400, DataStore(state))
+        denied = {
+            "category": "security",
+            "device": "plc_1",
+            "message": "network_access DENIED dmz_network -> plc_1:502",
+            "data": {"result": "DENIED", "source_network": "dmz_network"},
+        }
+        try:
+            for i in range(20):
+                sim_time.state.simulation_time = i * 0.1
+                await state.append_audit_event({**denied, "simulation_time": i * 0.1})
+                await ids._detect_network_scanning()
+            sim_time.state.simulation_time = 10.0
+            await state.append_audit_event({**denied, "simulation_time": 10.0})
+            await ids._detect_network_scanning()
+
+            assert ids.denied_volume.estimate(10.0, "dmz_network") == 21
+        finally:
+            await sim_time.reset()
+
+    def test_correlation_counts_summary_events(self):
+        """Test threshold rules weigh summaries by their count.
+
+        WHY: Aggregation must not hide a flood from SIEM thresholds.
+        """
+        engine = CorrelationEngine(
+            [{"name": "writes", "filter": {"category": "security"}, "threshold": 51}]
+        )
+        assert engine.process(_write(0.0, 0)) == []
+
+        summary = {**_write(1.0, 1), "count": 60}
+        matches = engine.process(summary)
+
+        assert [m.count for m in matches] == [61]
@@ -0,0 +1,190 @@
+# tests/unit/security/test_audit_store.py
+"""Tests for the segmented on-disk audit store.
+
+Level 0 - no dependencies (uses pytest tmp_path).
+
+Test Coverage:
+- Append and filtered queries (most recent first)
+- Segment rolling, sealed indexes and retention
+- Reopening after a clean close and after a torn write
+- Read-only access while another store writes
+- SystemState integration
+"""
+
+import pytest
+
+from components.security.audit_store import AuditStore
+from components.state.system_state import SystemState
+
+
+def _event(i, device="plc_1", category="security", user="", **extra):
+    return {
+        "simulation_time": float(i),
+        "severity": "WARNING" if i % 2 else "INFO",
+        "category": category,
+        "device": device,
+        "user": user,
+        "message": f"Memory write {i}",
+        "data": {"action": "write_memory" if i % 3 == 0 else "read"},
+        **extra,
+    }
+
+
+def _fill(store, count):
+    devices = ["plc_1", "plc_2", "rtu_1"]
+    for i in range(count):
+        store.append(
+            _event(i, device=devices[i % 3], user="operator" if i % 5 == 0 else "")
+        )
+
+
+def _expected(count, **filters):
+    devices = ["plc_1", "plc_2", "rtu_1"]
+    events = [
+        _event(i, device=devices[i % 3], user="operator" if i % 5 == 0 else "")
+        for i in range(count)
+    ]
+    return [
+        e for e in reversed(events) if all(e.get(k) == v for k, v in filters.items())
+    ]
+
+
+class TestAuditStore:
+    """Test append, query and segment management."""
+
+    def test_query_filters_match_full_scan(self, tmp_path):
+        """Test indexed queries return what a linear scan would.
+
+        WHY: Index pruning must never drop a matching event.
+        """
+        store = AuditStore(tmp_path, segment_bytes=4096, block_records=16)
+        _fill(store, 500)
+
+        assert len(store) == 500
+        assert store.stats()["segments"] > 1
+        assert store.query() == _expected(500)
+        assert store.query(device="rtu_1") == _expected(500, device="rtu_1")
+        assert store.query(user="operator", device="plc_2") == _expected(
+            500, user="operator", device="plc_2"
+        )
+        assert store.query(device="unknown") == []
+
+        window = store.query(since=100.0, until=120.0, severity="WARNING")
+        assert [e["simulation_time"] for e in window] == [
+            float(t) for t in range(119, 99, -1) if t % 2
+        ]
+        assert [e["simulation_time"] for e in store.query(limit=3)] == [
+            499.0,
+            498.0,
+            497.0,
+        ]
+        assert all(
+            e["data"]["action"] == "write_memory"
+            for e in store.query(action="write_memory", event_type="Memory write")
+        )
+
+    def test_reopen_uses_sealed_indexes(self, tmp_path):
+        """Test a reopened store sees all events and keeps appending."""
+        store = AuditStore(tmp_path, segment_bytes=4096, block_records=16)
+        _fill(store, 200)
+        store.close()
+        assert list(tmp_path.glob("*.idx"))
+
+        reopened = AuditStore(tmp_path, segment_bytes=4096, block_records=16)
+        reopened.append(_event(200, device="rtu_9"))
+
+        assert len(reopened) == 201
+        assert reopened.query(limit=1)[0]["device"] == "rtu_9"
+        assert reopened.query(device="plc_1") == _expected(200, device="plc_1")
+
+    def test_torn_record_is_dropped(self, tmp_path):
+        """Test a partial record from a crash is ignored and truncated.
+
+        WHY: The simulator can be killed mid-write.
+        """
+        store = AuditStore(tmp_path)
+        _fill(store, 10)
+        store.flush()
+        segment = next(tmp_path.glob("*.seg"))
+        with open(segment, "ab") as f:
+            f.write(b"\xff\x00\x00\x00{partial")
+        del store
+
+        reopened = AuditStore(tmp_path)
+
+        assert len(reopened) == 10
+        assert reopened.query() == _expected(10)
+
+    def test_retention_deletes_oldest_segments(self, tmp_path):
+        """Test max_segments bounds disk use."""
+        store = AuditStore(tmp_path, segment_bytes=2048, max_segments=3)
+        _fill(store, 500)
+
+        assert len(list(tmp_path.glob("*.seg"))) == 3
+        events = store.query()
+        assert len(events) == len(store) < 500
+        assert events[0]["simulation_time"] == 499.0
+
+    def test_read_only_follows_writer(self, tmp_path):
+        """Test a read-only store sees events appended after it was opened.
+
+        WHY: blue_team.py queries the running simulator's audit trail.
+        """
+        writer = AuditStore(tmp_path, segment_bytes=4096)
+        _fill(writer, 50)
+        writer.flush()
+        reader = AuditStore(tmp_path, read_only=True)
+        assert len(reader.query()) == 50
+
+        writer.append(_event(50, device="late_plc"))
+        _fill(writer, 150)
+        writer.flush()
+
+        assert reader.query(device="late_plc")[0]["simulation_time"] == 50.0
+        assert len(reader.query()) == 201
+        with pytest.raises(PermissionError):
+            reader.append(_event(0))
+
+    def test_invalid_settings(self, tmp_path):
+        """Test bad sizes and missing read-only directories are rejected."""
+        with pytest.raises(ValueError):
+            AuditStore(tmp_path, segment_bytes=0)
+        with pytest.raises(ValueError):
+            AuditStore(tmp_path, max_segments=0)
+        with pytest.raises(FileNotFoundError):
+            AuditStore(tmp_path / "missing", read_only=True)
+
+
+class TestSystemStateAuditStore:
+    """Test SystemState with an on-disk audit store."""
+
+    async def test_history_beyond_memory_limit(self, tmp_path):
+        """Test queries reach events trimmed from the in-memory log."""
+        state = SystemState(audit_store=AuditStore(tmp_path, segment_bytes=65536))
+        for i in range(10050):
+            await state.append_audit_event(_event(i))
+
+        assert len(state.audit_log) == 10000
+        oldest = await state.get_audit_log(until=10.0, history=True)
+        assert [e["simulation_time"] for e in oldest][-1] == 0.0
+        assert len(await state.get_audit_log(limit=None, history=True)) == 10050
+
+    async def test_live_queries_use_memory_log(self, tmp_path):
+        """Test detectors polling the live log never see earlier runs.
+
+        WHY: The store outlives the process; replaying it would re-raise
+        old alerts, and decoding it every cycle would stall the loop.
+        """
+        previous_run = AuditStore(tmp_path)
+        _fill(previous_run, 100)
+        previous_run.close()
+
+        state = SystemState(audit_store=AuditStore(tmp_path))
+        await state.append_audit_event(_event(0, device="new_plc"))
+        live = await state.get_audit_log(limit=None)
+
+        assert [e["device"] for e in live] == ["new_plc"]
+        assert live[0] is state.audit_log[0]
+        assert len(await state.get_audit_log(limit=None, history=True)) == 101
+        await state.reset()
+        assert await state.get_audit_log() == []
@@ -0,0 +1,120 @@
+# tests/unit/security/test_change_point.py
+"""Tests for streaming change-point detectors.
+
+Level 0 - no dependencies.
+
+Test Coverage:
+- Reference learning during warm-up
+- Detection of small sustained shifts in both directions
+- Quiet behaviour on in-control data
+- Restart after an alarm
+- Detector factory
+"""
+
+import random
+
+import pytest
+
+from components.security.change_point import (
+    CUSUMDetector,
+    EWMAChart,
+    PageHinkleyDetector,
+    create_detector,
+)
+
+
+def _first_alarm(detector, values):
+    for index, value in enumerate(values):
+        change = detector.update(value)
+        if change is not None:
+            return index, change
+    return None, None
+
+
+def _stream(shift, seed=11, before=200, after=300):
+    """Unit-variance noise around 100 that shifts by `shift` sigma."""
+    rng = random.Random(seed)
+    return [rng.gauss(100.0, 1.0) for _ in range(before)] + [
+        rng.gauss(100.0 + shift, 1.0) for _ in range(after)
+    ]
+
+
+DETECTORS = [
+    lambda: EWMAChart(warmup=100),
+    lambda: CUSUMDetector(warmup=100),
+    lambda: PageHinkleyDetector(delta=0.25, threshold=25.0, min_samples=100),
+]
+
+
+class TestChangePointDetectors:
+    """Test behaviour shared by all detectors."""
+
+    @pytest.mark.parametrize("make", DETECTORS)
+    @pytest.mark.parametrize("shift,direction", [(1.5, "up"), (-1.5, "down")])
+    def test_detects_small_shift(self, make, shift, direction):
+        """Test a 1.5 sigma shift is flagged soon after it starts.
+
+        WHY: Such shifts never cross a 3 sigma z-score limit.
+        """
+        index, change = _first_alarm(make(), _stream(shift))
+
+        assert index is not None and 200 <= index < 260
+        assert change.direction == direction
+        assert change.statistic > change.threshold
+
+    @pytest.mark.parametrize(
+        "make",
+        [
+            lambda: EWMAChart(width=4.5, warmup=200),
+            lambda: CUSUMDetector(h=12.0, warmup=200),
+            lambda: PageHinkleyDetector(delta=0.25, threshold=25.0, min_samples=200),
+        ],
+    )
+    def test_quiet_in_control(self, make):
+        """Test in-control noise raises no alarm over a long run.
+
+        WHY: False alarms multiply across thousands of monitored parameters.
+        """
+        index, _ = _first_alarm(make(), _stream(0.0, after=1000))
+
+        assert index is None
+
+    def test_reference_stays_fixed(self):
+        """Test the reference is not re-learned after warm-up.
+
+        WHY: Re-learning would absorb manipulated values.
+        """
+        cusum = CUSUMDetector(warmup=10)
+        for value in [10.0, 11.0] * 5:
+            cusum.update(value)
+        for _ in range(50):
+            cusum.update(10.5)
+
+        assert cusum.mean == pytest.approx(10.5)
+        assert cusum.count == 10
+
+    def test_restarts_after_alarm(self):
+        """Test sums restart after an alarm so one shift is reported in bursts."""
+        cusum = CUSUMDetector(h=4.0, warmup=4)
+        for value in (10.0, 10.2, 9.8, 10.0):
+            cusum.update(value)
+
+        assert cusum.update(20.0) is not None
+        assert (cusum.high, cusum.low) == (0.0, 0.0)
+
+
+class TestCreateDetector:
+    """Test the detector factory."""
+
+    def test_creates_by_method(self):
+        """Test method names map to detector classes with parameters."""
+        chart = create_detector("ewma", lam=0.3)
+
+        assert isinstance(chart, EWMAChart)
+        assert chart.lam == 0.3
+        assert isinstance(create_detector("page_hinkley"), PageHinkleyDetector)
+
+    def test_unknown_method(self):
+        """Test unknown methods raise ValueError."""
+        with pytest.raises(ValueError):
+            create_detector("arima")
@@ -0,0 +1,210 @@
+# tests/unit/security/test_correlation.py
+"""Tests for the declarative correlation engine.
+
+Level 0 - no dependencies.
+
+Test Coverage:
+- Filter operators
+- Threshold rules over sliding windows
+- Sequence rules (ordering and window)
+- Dispatch to candidate rules only
+- Idle key eviction
+- Rule validation
+- Decoding JSON-string event data
+"""
+
+import pytest
+
+from components.security.correlation import CorrelationEngine, decode_event
+
+
+def _event(t, action="login", result="FAILED", user="operator1", **extra):
+    return {
+        "simulation_time": t,
+        "message": extra.pop("message", f"{action} {result}"),
+        "user": user,
+        "device": extra.pop("device", "hmi_1"),
+        "data": {"action": action, "result": result, **extra},
+    }
+
+
+FAILED_AUTH = {
+    "name": "failed_auth",
+    "filter": {"data.action": ["login", "authenticate"], "data.result": "FAILED"},
+    "group_by": ["user"],
+    "window": 60,
+    "threshold": 3,
+}
+
+
+class TestFilters:
+    """Test filter conditions."""
+
+    @pytest.mark.parametrize(
+        "condition,matches",
+        [
+            ({"data.action": "login"}, True),
+            ({"data.action": ["logout", "login"]}, True),
+            ({"data.action": {"in": ["logout"]}}, False),
+            ({"message": {"contains": "login FA"}}, True),
+            ({"message": {"contains": "LOGIN"}}, False),
+            ({"message": {"icontains": "LOGIN"}}, True),
+            ({"data.port": {"exists": True}}, False),
+            ({"data.port": {"exists": False}}, True),
+        ],
+    )
+    def test_operators(self, condition, matches):
+        """Test each operator against one event."""
+        engine = CorrelationEngine([{"name": "r", "filter": condition}])
+
+        fired = engine.process(_event(0.0))
+
+        assert bool(fired) is matches
+
+
+class TestThresholdRules:
+    """Test counting rules."""
+
+    def test_fires_at_threshold_per_key(self):
+        """Test the rule fires on the third failure for one user only.
+
+        WHY: Failures from different users must not add up.
+        """
+        engine = CorrelationEngine([FAILED_AUTH])
+
+        assert engine.process(_event(1.0)) == []
+        assert engine.process(_event(2.0, user="operator2")) == []
+        assert engine.process(_event(3.0)) == []
+        fired = engine.process(_event(4.0))
+
+        assert len(fired) == 1
+        assert fired[0].count == 3
+        assert fired[0].group == {"user": "operator1"}
+        assert (fired[0].first_seen, fired[0].last_seen) == (1.0, 4.0)
+
+    def test_old_events_leave_window(self):
+        """Test events older than the window no longer count."""
+        engine = CorrelationEngine([FAILED_AUTH])
+        engine.process(_event(0.0))
+        engine.process(_event(30.0))
+
+        assert engine.process(_event(60.0)) == []
+        assert len(engine.process(_event(61.0))) == 1
+
+    def test_reset_on_fire(self):
+        """Test the window restarts after firing unless disabled."""
+        engine = CorrelationEngine(
+            [FAILED_AUTH, {**FAILED_AUTH, "name": "keep", "reset_on_fire": False}]
+        )
+        for t in range(3):
+            engine.process(_event(float(t)))
+
+        fired = engine.process(_event(3.0))
+
+        assert [m.rule.name for m in fired] == ["keep"]
+
+
+class TestSequenceRules:
+    """Test ordered sequence rules."""
+
+    RULE = {
+        "name": "auth_then_bypass",
+        "sequence": [
+            {"data.result": "FAILED"},
+            {"data.action": "activate_safety_bypass"},
+        ],
+        "group_by": ["user"],
+        "window": 300,
+    }
+
+    def test_fires_in_order(self):
+        """Test the sequence fires only when steps arrive in order."""
+        engine = CorrelationEngine([self.RULE])
+
+        assert engine.process(_event(0.0, "activate_safety_bypass", "SUCCESS")) == []
+        assert engine.process(_event(10.0)) == []
+        fired = engine.process(_event(20.0, "activate_safety_bypass", "SUCCESS"))
+
+        assert len(fired) == 1
+        assert (fired[0].first_seen, fired[0].last_seen) == (10.0, 20.0)
+
+    def test_sequence_must_fit_window(self):
+        """Test a final step after the window does not complete the sequence."""
+        engine = CorrelationEngine([self.RULE])
+        engine.process(_event(0.0))
+
+        assert engine.process(_event(300.0, "activate_safety_bypass", "SUCCESS")) == []
+
+
+class TestEngine:
+    """Test dispatch, state management and validation."""
+
+    def test_dispatch_skips_unrelated_rules(self):
+        """Test an event is only evaluated against rules that can match it.
+
+        WHY: Scan cost must not grow with the number of loaded rules.
+        """
+        rules = [
+            {"name": f"action_{i}", "filter": {"data.action": f"action_{i}"}}
+            for i in range(50)
+        ]
+        rules.append(
+            {"name": "scram", "filter": {"data.action": {"icontains": "scram"}}}
+        )
+        engine = CorrelationEngine(rules)
+
+        assert set(engine._candidates(_event(0.0, "action_7"))) == {7}
+        assert set(engine._candidates(_event(0.0, "reactor_SCRAM"))) == {50}
+        assert engine._candidates(_event(0.0, "read")) == {}
+
+    def test_idle_keys_are_evicted(self):
+        """Test keys with no events for a whole window are dropped."""
+        engine = CorrelationEngine([FAILED_AUTH])
+        engine.process(_event(0.0, user="a"))
+        engine.process(_event(30.0, user="b"))
+
+        engine.expire(70.0)
+
+        assert engine.tracked_keys("failed_auth") == 1
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            {"filter": {}},
+            {"name": "r", "filter": {"x": {"like": "y"}}},
+            {"name": "r", "filter": {}, "threshold": 0},
+            {"name": "r", "sequence": [{}, {}], "threshold": 2},
+            {"name": "r", "filter": {}, "sequence": [{}]},
+        ],
+    )
+    def test_invalid_rules_rejected(self, rule):
+        """Test malformed declarations raise ValueError."""
+        with pytest.raises(ValueError):
+            CorrelationEngine([rule])
+
+    def test_duplicate_names_rejected(self):
+        """Test rule names must be unique."""
+        with pytest.raises(ValueError):
+            CorrelationEngine([FAILED_AUTH, FAILED_AUTH])
+
+
+class TestDecodeEvent:
+    """Test decoding of JSON-string event data."""
+
+    def test_json_string_decoded(self):
+        """Test LogEntry-style string data becomes a dict."""
+        event = {"user": "u", "data": '{"action": "login"}'}
+
+        assert decode_event(event)["data"] == {"action": "login"}
+        assert event["data"] == '{"action": "login"}'
+
+    @pytest.mark.parametrize("data", ["not json", "[1, 2]"])
+    def test_unusable_data_becomes_empty(self, data):
+        """Test undecodable or non-dict data is replaced by {}."""
+        assert decode_event({"data": data})["data"] == {}
+
+    def test_mapping_returned_unchanged(self):
+        """Test events with dict data are passed through."""
+        event = {"data": {"action": "login"}}
+
+        assert decode_event(event) is event
@@ -10,6 +10,8 @@ Test Coverage:
 - Audit trail management
 - Logger factory (get_logger, configure_logging)
 - Thread safety
+- Background log pipeline (batching, drop policies)
+- Runtime module levels and lazy message arguments
 """
 
 import asyncio
@@ -29,9 +31,13 @@ from components.security.logging_system import (
     ICSLogger,
     JSONFormatter,
     LogEntry,
+    LogPipeline,
     SimTimeFormatter,
     configure_logging,
+    flush_logging,
+    get_log_levels,
     get_logger,
+    set_log_level,
 )
 
 
@@ -659,3 +665,218 @@ class TestFileLogging:
             )
 
             assert log_dir.exists()
+
+
+# ================================================================
+# LOG PIPELINE TESTS
+# ================================================================
+class _GatedHandler(logging.Handler):
+    """Sink that records messages and can stall the writer thread."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+        self.messages = []
+        self.flushes = 0
+
+    def emit(self, record):
+        self.gate.wait(5.0)
+        self.messages.append(record.getMessage())
+
+    def flush_batch(self):
+        self.flushes += 1
+
+
+def _record(message, level=logging.INFO):
+    return logging.makeLogRecord(
+        {"name": "test", "levelno": level, "levelname": "INFO", "msg": message}
+    )
+
+
+class TestLogPipeline:
+    """Test the background log writer."""
+
+    def test_logger_writes_off_thread(self):
+        """Test records reach the file once the pipeline is flushed.
+
+        WHY: Formatting and I/O must happen on the writer thread.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = ICSLogger(
+                "test_pipeline",
+                device="pipeline_device",
+                log_dir=Path(tmpdir),
+                enable_console=False,
+            )
+
+            for i in range(100):
+                logger.debug(f"reading {i}")
+            assert flush_logging()
+
+            lines = (Path(tmpdir) / "pipeline_device.json.log").read_text()
+            messages = [json.loads(line)["message"] for line in lines.splitlines()]
+            assert messages == [f"reading {i}" for i in range(100)]
+
+    def test_batches_share_one_flush(self):
+        """Test a burst of records is flushed once per batch, not per record."""
+        pipeline = LogPipeline(batch_size=50)
+        sink = _GatedHandler()
+
+        pipeline.submit(_record("first"), (sink,))
+        for i in range(40):
+            pipeline.submit(_record(f"burst {i}"), (sink,))
+        sink.gate.set()
+        pipeline.flush()
+
+        assert len(sink.messages) == 41
+        assert sink.flushes <= 2
+        pipeline.stop()
+
+    @pytest.mark.parametrize(
+        "policy,kept",
+        [("drop_new", ["first", "a", "b"]), ("drop_oldest", ["first", "c", "d"])],
+    )
+    def test_drop_policies(self, policy, kept):
+        """Test a full queue drops records according to policy and reports it.
+
+        WHY: A log burst must never stall the event loop.
+        """
+        pipeline = LogPipeline(queue_size=2, drop_policy=policy)
+        sink = _GatedHandler()
+        pipeline.submit(_record("first"), (sink,))
+        while pipeline.stats()["queued"]:  # Writer has taken "first" and stalls
+            threading.Event().wait(0.001)
+
+        for message in ["a", "b", "c", "d"]:
+            pipeline.submit(_record(message), (sink,))
+        sink.gate.set()
+        pipeline.flush()
+
+        assert pipeline.dropped == 2
+        assert [m for m in sink.messages if "dropped" not in m] == kept
+        assert any("2 records dropped" in m for m in sink.messages)
+        pipeline.stop()
+
+    def test_invalid_drop_policy(self):
+        """Test unknown drop policies are rejected."""
+        with pytest.raises(ValueError):
+            LogPipeline(drop_policy="discard_all")
+
+    def test_stopped_pipeline_writes_inline(self):
+        """Test records logged after shutdown are still written."""
+        pipeline = LogPipeline()
+        sink = _GatedHandler()
+        sink.gate.set()
+        pipeline.stop()
+
+        pipeline.submit(_record("late"), (sink,))
+
+        assert sink.messages == ["late"]
+
+
+# ================================================================
+# LEVEL CONTROL TESTS
+# ================================================================
+class _Probe:
+    """Argument that counts how often it is formatted."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "probe"
+
+
+@pytest.fixture
+def module_levels():
+    """Restore module levels changed by a test."""
+    before = get_log_levels()
+    yield
+    for module in get_log_levels():
+        set_log_level(before.get(module), module)
+
+
+class TestLogLevels:
+    """Test runtime level control and lazy formatting."""
+
+    def test_module_level_applies_to_submodules(self, module_levels):
+        """Test a module prefix level covers existing and new loggers.
+
+        WHY: Debug instrumentation is switched per subsystem at runtime.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            existing = ICSLogger(
+                "levels.net.proxy", log_dir=Path(tmpdir), enable_console=False
+            )
+            other = ICSLogger(
+                "levels.state", log_dir=Path(tmpdir), enable_console=False
+            )
+            assert existing.is_enabled(logging.DEBUG)
+
+            set_log_level("INFO", "levels.net")
+            later = ICSLogger(
+                "levels.net.firewall", log_dir=Path(tmpdir), enable_console=False
+            )
+
+            assert not existing.is_enabled(logging.DEBUG)
+            assert existing.is_enabled(logging.INFO)
+            assert not later.is_enabled(logging.DEBUG)
+            assert other.is_enabled(logging.DEBUG)
+
+            # Closest prefix wins; clearing restores the default
+            existing.set_level(logging.DEBUG)
+            assert existing.is_enabled(logging.DEBUG)
+            set_log_level(None, "levels.net")
+            assert later.is_enabled(logging.DEBUG)
+
+    def test_disabled_debug_is_not_formatted(self, module_levels):
+        """Test lazy arguments are never formatted when debug is off.
+
+        WHY: Hot paths (DataStore reads, proxy pipes) log at debug level.
+        """
+        probe = _Probe()
+        console_only = ICSLogger("levels.console", enable_console=True)
+        console_only.debug("value %s", probe)  # Console sink starts at INFO
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = ICSLogger(
+                "levels.lazy", device="lazy", log_dir=Path(tmpdir), enable_console=False
+            )
+            set_log_level(logging.INFO, "levels.lazy")
+            logger.debug("value %s", probe)
+            assert probe.formatted == 0
+
+            set_log_level(None, "levels.lazy")
+            logger.debug("Read %s[%s] = %s", "plc_1", "holding_registers[0]", probe)
+            assert flush_logging()
+
+            lines = (Path(tmpdir) / "lazy.json.log").read_text().splitlines()
+            assert json.loads(lines[-1])["message"] == (
+                "Read plc_1[holding_registers[0]] = probe"
+            )
+            assert probe.formatted == 1
+
+    async def test_log_event_skips_disabled_formatting(
+        self, module_levels, monkeypatch
+    ):
+        """Test log_event still records the entry without rendering it."""
+        rendered = []
+        monkeypatch.setattr(
+            LogEntry, "to_human_readable", lambda entry: rendered.append(entry) or ""
+        )
+        logger = ICSLogger("levels.events", enable_console=False)
+        logger.set_level("WARNING")
+
+        entry = await logger.log_event(
+            EventSeverity.INFO, EventCategory.AUDIT, "setpoint changed"
+        )
+
+        assert entry.message == "setpoint changed"
+        assert logger.audit_trail == [entry]
+        assert rendered == []
+
+    def test_unknown_level_name_rejected(self):
+        """Test invalid level names raise ValueError."""
+        with pytest.raises(ValueError):
+            set_log_level("VERBOSE", "levels")
@@ -0,0 +1,63 @@
+# tests/unit/security/test_pattern_matcher.py
+"""Tests for the Aho-Corasick pattern matcher.
+
+Level 0 - no dependencies.
+
+Test Coverage:
+- Single-pass multi-pattern matching with offsets
+- Overlapping and nested patterns
+- Case-insensitive matching
+- Rebuild after adding patterns
+"""
+
+import pytest
+
+from components.security.pattern_matcher import PatternMatch, PatternMatcher
+
+
+class TestPatternMatcher:
+    """Test pattern matching."""
+
+    def test_finds_all_patterns_with_offsets(self):
+        """Test every occurrence is reported with its start offset."""
+        matcher = PatternMatcher([("DB890", "stuxnet"), ("FC1869", "stuxnet")])
+
+        matches = list(matcher.find("write DB890 then call FC1869 and DB890"))
+
+        assert matches == [
+            PatternMatch(6, "DB890", "stuxnet"),
+            PatternMatch(22, "FC1869", "stuxnet"),
+            PatternMatch(33, "DB890", "stuxnet"),
+        ]
+
+    def test_overlapping_and_nested_patterns(self):
+        """Test suffix patterns are found through failure links."""
+        matcher = PatternMatcher.from_groups({"a": ["he", "she", "hers"], "b": ["his"]})
+
+        found = {(m.offset, m.pattern) for m in matcher.find("ushers")}
+
+        assert found == {(1, "she"), (2, "he"), (2, "hers")}
+
+    def test_case_insensitive(self):
+        """Test text and patterns are compared case-insensitively."""
+        matcher = PatternMatcher.from_groups({"triton": ["TRISTATION"]})
+
+        assert [m.offset for m in matcher.find("tristation on TriStation")] == [0, 14]
+
+    def test_patterns_added_after_search(self):
+        """Test the automaton is rebuilt when new patterns arrive."""
+        matcher = PatternMatcher([("lighttpd", "havex")])
+        assert [m.label for m in matcher.find("OPC-Proxy lighttpd")] == ["havex"]
+
+        matcher.add("OPC-Proxy", "havex")
+
+        assert [m.pattern for m in matcher.find("OPC-Proxy lighttpd")] == [
+            "OPC-Proxy",
+            "lighttpd",
+        ]
+        assert len(matcher) == 2
+
+    def test_empty_pattern_rejected(self):
+        """Test an empty pattern raises ValueError."""
+        with pytest.raises(ValueError, match="must not be empty"):
+            PatternMatcher().add("")
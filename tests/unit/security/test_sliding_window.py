@@ -0,0 +1,127 @@
+# tests/unit/security/test_sliding_window.py
+"""Tests for sliding-window detection counters.
+
+Level 0 - no dependencies.
+
+Test Coverage:
+- Exact per-key counts and top keys
+- Exact distinct counts with bucketed expiry
+- Count-min estimates over a sliding window
+- Heavy-hitter tracking
+- Clock resets
+"""
+
+from components.security.sliding_window import (
+    SlidingCounter,
+    SlidingCountMinSketch,
+    SlidingDistinctCounter,
+)
+
+
+class TestSlidingCounter:
+    """Test exact per-key counting."""
+
+    def test_counts_per_key_and_total(self):
+        """Test per-key counts, the total and the loudest keys."""
+        counter = SlidingCounter(window=60.0)
+        for key in ["10.0.0.1", "10.0.0.2", "10.0.0.1", "10.0.0.1"]:
+            counter.add(5.0, key)
+
+        assert counter.count(5.0, "10.0.0.1") == 3
+        assert counter.count(5.0, "10.0.0.9") == 0
+        assert counter.count(5.0) == 4
+        assert counter.top(5.0, 1) == [("10.0.0.1", 3)]
+
+    def test_counts_slide_out(self):
+        """Test events leave the window bucket by bucket."""
+        counter = SlidingCounter(window=10.0)
+        counter.add(0.0, "rule_1", count=2)
+        counter.add(5.0, "rule_1")
+
+        assert counter.count(9.0, "rule_1") == 3
+        assert counter.count(10.0, "rule_1") == 1
+        assert counter.count(15.0) == 0
+        assert counter.top(15.0) == []
+
+    def test_clock_reset_clears(self):
+        """Test moving the clock backwards starts afresh."""
+        counter = SlidingCounter(window=60.0)
+        counter.add(100.0, "rule_1")
+        counter.add(0.0, "rule_2")
+
+        assert counter.top(0.0) == [("rule_2", 1)]
+
+
+class TestSlidingDistinctCounter:
+    """Test distinct-key counting."""
+
+    def test_counts_distinct_keys(self):
+        """Test repeated keys are counted once."""
+        counter = SlidingDistinctCounter(window=60.0)
+
+        for key in ["plc_1", "plc_2", "plc_1", "plc_3", "plc_2"]:
+            counter.add(10.0, key)
+
+        assert counter.count(10.0) == 3
+        assert sorted(counter.keys(10.0)) == ["plc_1", "plc_2", "plc_3"]
+
+    def test_keys_expire_with_window(self):
+        """Test keys drop out once their last sighting leaves the window."""
+        counter = SlidingDistinctCounter(window=10.0)
+        counter.add(0.0, "plc_1")
+        counter.add(5.0, "plc_2")
+
+        assert counter.count(9.0) == 2
+        assert counter.count(10.0) == 1
+        assert counter.count(15.0) == 0
+
+    def test_refresh_keeps_key_alive(self):
+        """Test seeing a key again restarts its window."""
+        counter = SlidingDistinctCounter(window=10.0)
+        counter.add(0.0, "plc_1")
+        counter.add(8.0, "plc_1")
+
+        assert counter.count(12.0) == 1
+        assert counter.count(18.0) == 0
+
+    def test_clock_reset_clears(self):
+        """Test moving the clock backwards starts afresh."""
+        counter = SlidingDistinctCounter(window=60.0)
+        counter.add(100.0, "plc_1")
+
+        assert counter.add(0.0, "plc_2") == 1
+
+
+class TestSlidingCountMinSketch:
+    """Test windowed count-min estimates."""
+
+    def test_estimates_never_undercount(self):
+        """Test every key's estimate is at least its true count."""
+        sketch = SlidingCountMinSketch(window=60.0, width=64, depth=4)
+        truth = {f"net_{i}": i + 1 for i in range(200)}
+        for key, count in truth.items():
+            sketch.add(0.0, key, count)
+
+        assert all(sketch.estimate(0.0, k) >= v for k, v in truth.items())
+        assert sketch.total == sum(truth.values())
+
+    def test_counts_slide_out(self):
+        """Test counts from expired buckets are subtracted."""
+        sketch = SlidingCountMinSketch(window=10.0, bucket_width=5.0)
+        sketch.add(0.0, "enterprise", 30)
+        sketch.add(6.0, "enterprise", 5)
+
+        assert sketch.estimate(9.0, "enterprise") == 35
+        assert sketch.estimate(10.0, "enterprise") == 5
+        assert sketch.total == 5
+
+    def test_heavy_hitters(self):
+        """Test only keys over the threshold are reported, loudest first."""
+        sketch = SlidingCountMinSketch(window=60.0, heavy_threshold=10)
+        sketch.add(0.0, "enterprise", 25)
+        sketch.add(0.0, "dmz", 12)
+        sketch.add(0.0, "quiet", 3)
+
+        assert sketch.heavy_hitters(0.0) == [("enterprise", 25), ("dmz", 12)]
+        assert sketch.heavy_hitters(0.0, n=1) == [("enterprise", 25)]
+        assert sketch.heavy_hitters(120.0) == []
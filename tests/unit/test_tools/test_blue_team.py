@@ -16,6 +16,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from components.devices.enterprise_zone.firewall import RuleAction
 from tools.blue_team import BlueTeamCLI, create_parser
 
 # ================================================================
@@ -236,6 +237,24 @@ class TestCreateParser:
         assert args.min == 800.0
         assert args.max == 1800.0
 
+    def test_anomaly_add_drift_args(self):
+        """Anomaly add-drift accepts device, parameter and method."""
+        parser = create_parser()
+        args = parser.parse_args(
+            [
+                "anomaly",
+                "add-drift",
+                "--device",
+                "reactor_plc_1",
+                "--parameter",
+                "coolant_pressure",
+                "--method",
+                "ewma",
+            ]
+        )
+        assert args.device == "reactor_plc_1"
+        assert args.method == "ewma"
+
     def test_opcua_subcommands(self):
         """OPC UA parser has expected subcommands."""
         parser = create_parser()
@@ -466,6 +485,31 @@ class TestFirewallCommands:
         captured = capsys.readouterr()
         assert "Rule disabled" in captured.out
 
+    @pytest.mark.asyncio
+    async def test_top_sources_empty(self, cli, capsys):
+        """Top sources with no blocks prints a notice."""
+        result = await cli.firewall_top_sources(make_args(limit=10))
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "No blocked connections" in captured.out
+
+    @pytest.mark.asyncio
+    async def test_top_sources_lists_blocked_ips(self, cli, capsys):
+        """Top sources lists source IPs by block count."""
+        await cli.firewall.add_rule(
+            "Block scanners", RuleAction.DROP, source_ip="10.66.0.0/16"
+        )
+        for ip in ["10.66.0.5", "10.66.0.5", "10.66.0.9"]:
+            await cli.firewall.check_connection(source_ip=ip, dest_port=502)
+        capsys.readouterr()
+
+        result = await cli.firewall_top_sources(make_args(limit=10))
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "3 blocks" in captured.out
+        assert captured.out.index("10.66.0.5") < captured.out.index("10.66.0.9")
+        assert "Block scanners" in captured.out
+
 
 # ================================================================
 # IDS/IPS COMMAND TESTS
@@ -1164,6 +1208,19 @@ class TestAnomalyCommands:
         assert "Rate limit set" in captured.out
         assert "10.0" in captured.out
 
+    @pytest.mark.asyncio
+    async def test_anomaly_add_drift(self, cli, capsys):
+        """Add drift returns 0 and registers the detector."""
+        result = await cli.anomaly_add_drift(
+            make_args(device="turbine_plc_1", parameter="speed", method="cusum")
+        )
+        assert result == 0
+        assert (
+            "cusum" in cli.anomaly_detector.drift_detectors[("turbine_plc_1", "speed")]
+        )
+        captured = capsys.readouterr()
+        assert "Drift detection added" in captured.out
+
     @pytest.mark.asyncio
     async def test_anomaly_list_empty(self, cli, capsys):
         """No anomalies prints message."""
@@ -1275,6 +1332,29 @@ class TestAnomalyCommands:
         captured = capsys.readouterr()
         assert "Cleared 5" in captured.out
 
+    @pytest.mark.asyncio
+    async def test_anomaly_save_baselines(self, cli, capsys, tmp_path):
+        """Save writes a state file the detector can load back."""
+        await cli.anomaly_detector.add_baseline("turbine_plc_1", "speed")
+        path = tmp_path / "baselines.npz"
+
+        result = await cli.anomaly_save_baselines(make_args(file=str(path)))
+
+        assert result == 0
+        assert "Saved 1 baselines" in capsys.readouterr().out
+        cli.anomaly_detector.baselines.clear()
+        assert await cli.anomaly_detector.load_state(path) == 1
+
+    @pytest.mark.asyncio
+    async def test_anomaly_save_baselines_needs_file(self, cli, capsys):
+        """Save without --file or a configured baseline_file returns 1."""
+        cli.anomaly_detector.baseline_file = None
+
+        result = await cli.anomaly_save_baselines(make_args(file=None))
+
+        assert result == 1
+        assert "baseline_file" in capsys.readouterr().out
+
 
 # ================================================================
 # OPC UA COMMAND TESTS
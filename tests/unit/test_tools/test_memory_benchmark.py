@@ -0,0 +1,62 @@
+# tests/unit/test_tools/test_memory_benchmark.py
+"""Unit tests for the record memory benchmark and slotted record types."""
+
+import dataclasses
+import sys
+
+import pytest
+
+from components.security.logging_system import EventCategory, EventSeverity, LogEntry
+from tools.memory_benchmark import RECORDS, dict_backed_twin, run_benchmark
+
+
+class TestRecordTypes:
+    """Tests for the compact record types themselves."""
+
+    @pytest.mark.parametrize("name", sorted(RECORDS))
+    def test_records_have_no_instance_dict(self, name):
+        """Test every high-volume record type is slotted."""
+        cls, make = RECORDS[name]
+        record = cls(**make(7))
+
+        assert not hasattr(record, "__dict__")
+
+    def test_log_entry_is_frozen_and_caches_serialisation(self):
+        """Test LogEntry serialises once and hands out independent dicts."""
+        entry = LogEntry(
+            simulation_time=1.0,
+            wall_time=1.0,
+            severity=EventSeverity.INFO,
+            category=EventCategory.AUDIT,
+            message="Setpoint changed",
+            device="".join(["turbine_", "plc_1"]),
+            data={"address": "holding_registers[10]"},
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.message = "changed"
+        first = entry.to_dict()
+        first["message"] = "mutated by caller"
+
+        assert entry.to_dict()["message"] == "Setpoint changed"
+        assert entry.to_json() is entry.to_json()
+        assert entry.device is sys.intern("turbine_plc_1")
+
+
+class TestMemoryBenchmark:
+    """Tests for the benchmark itself."""
+
+    def test_twin_is_dict_backed(self):
+        """Test the comparison type keeps a per-instance __dict__."""
+        cls, make = RECORDS["DataPoint"]
+        twin = dict_backed_twin(cls)
+
+        assert hasattr(twin(**make(1)), "__dict__")
+
+    def test_slotted_records_use_less_memory(self):
+        """Test every record type is smaller than its dict-backed twin."""
+        rows = run_benchmark(count=2000)
+
+        assert [row["record"] for row in rows] == list(RECORDS)
+        for row in rows:
+            assert row["after_bytes"] < row["before_bytes"], row["record"]
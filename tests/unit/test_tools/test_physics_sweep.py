@@ -0,0 +1,169 @@
+# tests/unit/test_tools/test_physics_sweep.py
+"""Unit tests for the headless physics sweep runner."""
+
+import json
+
+import pytest
+
+from tools.physics_sweep import (
+    SweepCase,
+    build_cases,
+    iter_results,
+    run_case,
+    run_sweep,
+)
+
+OVERSPEED_ATTACK = {
+    "engine": "turbine",
+    "duration": 20,
+    "dt": 0.1,
+    "steady_state": True,
+    "controls": {"holding_registers[10]": 3600, "coils[10]": True},
+    "events": [{"time": 2, "address": "holding_registers[10]", "value": 4500}],
+}
+
+
+class TestBuildCases:
+    """Tests for sweep spec expansion."""
+
+    def test_grid_is_cartesian_product(self):
+        """Test grid values expand to every combination."""
+        cases = build_cases(
+            {
+                "engine": "turbine",
+                "grid": {"governor_gain": [1, 10], "inertia": [4000, 5000, 6000]},
+            }
+        )
+
+        assert len(cases) == 6
+        assert [c.case_id for c in cases] == list(range(6))
+        assert {"governor_gain": 10, "inertia": 6000} in [c.params for c in cases]
+
+    def test_random_samples_are_seeded(self):
+        """Test Monte Carlo draws are reproducible and within range."""
+        spec = {
+            "engine": "reactor",
+            "random": {"samples": 5, "seed": 7, "ranges": {"thermal_mass": [40, 60]}},
+        }
+
+        first = [c.params["thermal_mass"] for c in build_cases(spec)]
+        second = [c.params["thermal_mass"] for c in build_cases(spec)]
+
+        assert first == second
+        assert len(first) == 5
+        assert all(40 <= v <= 60 for v in first)
+
+    def test_events_sorted_by_time(self):
+        """Test scheduled memory writes are ordered by time."""
+        cases = build_cases(
+            {
+                "events": [
+                    {"time": 5, "address": "coils[11]", "value": True},
+                    {"time": 1, "address": "coils[10]", "value": True},
+                ]
+            }
+        )
+
+        assert cases[0].events == [(1.0, "coils[10]", True), (5.0, "coils[11]", True)]
+
+    def test_unknown_engine_rejected(self):
+        """Test an unknown engine raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown engine"):
+            build_cases({"engine": "boiler"})
+
+    def test_unknown_parameter_rejected(self):
+        """Test sweeping a field the parameter class lacks raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown hvac parameters"):
+            build_cases({"engine": "hvac", "grid": {"rated_power_mw": [1, 2]}})
+
+
+class TestRunCase:
+    """Tests for single headless runs."""
+
+    def test_overspeed_attack_trips(self):
+        """Test a setpoint attack records trip time, peak speed and damage."""
+        case = build_cases(OVERSPEED_ATTACK)[0]
+
+        result = run_case(case)
+
+        assert result.error is None
+        assert result.trip_time is not None and result.trip_time > 2.0
+        assert result.peak_metric == "shaft_speed_rpm"
+        assert result.peak_value > 3960
+        assert result.damage > 0
+        assert result.sim_time == pytest.approx(20.0)
+
+    def test_stop_on_trip_ends_run(self):
+        """Test stop_on_trip ends the run at the first trip."""
+        case = build_cases({**OVERSPEED_ATTACK, "stop_on_trip": True})[0]
+
+        result = run_case(case)
+
+        assert result.sim_time == pytest.approx(result.trip_time)
+
+    def test_no_trip_at_rated_speed(self):
+        """Test a steady turbine without an attack never trips."""
+        case = build_cases({**OVERSPEED_ATTACK, "events": []})[0]
+
+        result = run_case(case)
+
+        assert result.trip_time is None
+        assert result.peak_value == pytest.approx(3600)
+        assert result.damage == 0.0
+
+    def test_runs_with_plc_logic(self):
+        """Test the turbine PLC scan cycle runs alongside physics."""
+        case = SweepCase(
+            case_id=0,
+            engine="turbine",
+            params={},
+            duration=5.0,
+            dt=0.5,
+            controls={"holding_registers[10]": 3600, "coils[10]": True},
+            plc=True,
+        )
+
+        result = run_case(case)
+
+        assert result.error is None
+        assert result.peak_value > 0
+
+    def test_failure_reported_in_result(self):
+        """Test an invalid parameter is reported rather than raised."""
+        case = SweepCase(case_id=3, engine="turbine", params={"rated_power": 1.0})
+
+        result = run_case(case)
+
+        assert result.case_id == 3
+        assert "TypeError" in result.error
+
+
+class TestRunSweep:
+    """Tests for sweep execution and result streaming."""
+
+    def test_streams_json_lines(self, tmp_path):
+        """Test each result is written as one JSON line."""
+        cases = build_cases({**OVERSPEED_ATTACK, "grid": {"governor_gain": [0.05, 10]}})
+        output = tmp_path / "results.jsonl"
+
+        summary = run_sweep(cases, output, workers=1)
+
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert summary["runs"] == 2
+        assert summary["trips"] == 2
+        assert summary["errors"] == 0
+        assert sorted(r["params"]["governor_gain"] for r in records) == [0.05, 10]
+        assert set(records[0]) >= {"trip_time", "peak_value", "damage"}
+
+    def test_process_pool_matches_in_process(self):
+        """Test pooled runs produce the same records as in-process runs."""
+        cases = build_cases(
+            {**OVERSPEED_ATTACK, "duration": 10, "grid": {"governor_gain": [1, 5]}}
+        )
+
+        local = {r.case_id: r for r in iter_results(cases, workers=1)}
+        pooled = {r.case_id: r for r in iter_results(cases, workers=2)}
+
+        for case_id, result in local.items():
+            assert pooled[case_id].trip_time == result.trip_time
+            assert pooled[case_id].peak_value == result.peak_value
@@ -169,6 +169,40 @@ class TestDeviceRegistration:
             assert mock_register.call_count == 0
 
 
+# ================================================================
+# DEVICE CREATION TESTS
+# ================================================================
+
+
+class TestDeviceCreation:
+    """Test device instance creation."""
+
+    @pytest.mark.asyncio
+    async def test_siem_loads_correlation_rules(self, manager):
+        """Test the SIEM is created with rules from siem_correlation.yml."""
+        config = {
+            "devices": [
+                {"name": "siem_main", "type": "siem_system", "device_id": 1000}
+            ],
+            "siem_correlation": {
+                "rules": [
+                    {
+                        "name": "safety_bypass",
+                        "filter": {"data.action": "activate_safety_bypass"},
+                    }
+                ]
+            },
+        }
+
+        await manager._create_devices(config)
+        siem = manager.device_instances["siem_main"]
+        try:
+            rules = siem.get_statistics()["detection_rules"]
+            assert list(rules) == ["safety_bypass"]
+        finally:
+            await siem.stop()
+
+
 # ================================================================
 # PHYSICS ENGINE TESTS
 # ================================================================
@@ -275,6 +309,49 @@ class TestPhysicsEngineCreation:
             mock_grid.initialise.assert_called_once()
             mock_pf.initialise.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_steady_state_solved_after_devices(self, manager):
+        """Test steady-state init uses the setpoints devices write at start.
+
+        WHY: Engines are created before devices; solving then would read an
+        empty memory map and start every engine at standstill.
+        """
+        config = {
+            "simulation": {"runtime": {"steady_state_init": True}},
+            "devices": [],
+        }
+
+        async def register_devices(config):
+            await manager.data_store.register_device(
+                device_name="turbine_plc_1",
+                device_type="turbine_plc",
+                device_id=1,
+                protocols=[],
+            )
+
+        async def create_devices(config):
+            await manager.data_store.bulk_write_memory(
+                "turbine_plc_1",
+                {"holding_registers[10]": 3600, "coils[10]": True},
+            )
+
+        with (
+            patch.object(manager.config_loader, "load_all", return_value=config),
+            patch.object(manager, "_register_devices", side_effect=register_devices),
+            patch.object(manager.network_sim, "load", new=AsyncMock()),
+            patch.object(manager, "_create_devices", side_effect=create_devices),
+            patch.object(manager, "_configure_scada_servers", new=AsyncMock()),
+            patch.object(manager, "_configure_hmi_workstations", new=AsyncMock()),
+            patch.object(manager, "_expose_services", new=AsyncMock()),
+            patch.object(manager, "_log_summary", new=AsyncMock()),
+        ):
+            await manager.initialise()
+
+        turbine = manager.turbine_physics["turbine_plc_1"]
+        assert turbine.state.shaft_speed_rpm == pytest.approx(3600, rel=1e-3)
+        assert not manager.grid_physics.state.under_frequency_trip
+        assert not manager.grid_physics.state.over_frequency_trip
+
 
 # ================================================================
 # LIFECYCLE TESTS
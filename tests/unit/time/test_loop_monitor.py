@@ -0,0 +1,140 @@
+# tests/unit/time/test_loop_monitor.py
+"""Tests for the event-loop health monitor.
+
+Level 0 - no simulator dependencies.
+
+Test Coverage:
+- Lag histogram buckets and percentiles
+- Scheduling lag detection
+- Slow-step attribution to task names and device names
+- Phase timing
+- Task factory installation and restore
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from components.time.loop_monitor import LagHistogram, LoopMonitor
+
+
+class _Device:
+    """Stand-in for a device whose scan loop blocks the event loop."""
+
+    device_name = "turbine_plc_1"
+
+    async def _scan_loop(self, cycles: int, block: float):
+        for _ in range(cycles):
+            time.sleep(block)
+            await asyncio.sleep(0)
+
+
+@pytest.fixture
+async def monitor():
+    monitor = LoopMonitor(probe_interval=0.005, slow_step=0.01)
+    await monitor.start()
+    yield monitor
+    await monitor.stop()
+
+
+class TestLagHistogram:
+    """Test the fixed-bucket histogram."""
+
+    def test_percentiles_use_bucket_bounds(self):
+        """Test percentiles report the upper bound of their bucket."""
+        hist = LagHistogram()
+        for ms in [0.2] * 98 + [15.0, 700.0]:
+            hist.add(ms)
+
+        assert hist.percentile(50) == 0.5
+        assert hist.percentile(99) == 20
+        assert hist.percentile(100) == 1000
+        assert hist.max == 700.0
+
+    def test_open_bucket_reports_max(self):
+        """Test values beyond the last bound report the observed maximum."""
+        hist = LagHistogram()
+        hist.add(2500.0)
+
+        status = hist.to_dict()
+
+        assert status["p99_ms"] == 2500.0
+        assert status["buckets"][">1000ms"] == 1
+
+    def test_empty_histogram(self):
+        """Test an empty histogram reports zeros."""
+        assert LagHistogram().to_dict()["p50_ms"] == 0.0
+
+
+class TestLoopMonitor:
+    """Test lag measurement and slow-step attribution."""
+
+    def test_rejects_bad_settings(self):
+        """Test non-positive intervals raise ValueError."""
+        with pytest.raises(ValueError):
+            LoopMonitor(probe_interval=0)
+
+    async def test_blocking_call_shows_as_lag(self, monitor):
+        """Test a blocked loop delays the probe.
+
+        WHY: Lag is what every PLC scan and protocol response experiences.
+        """
+        await asyncio.sleep(0.02)
+        time.sleep(0.05)
+        await asyncio.sleep(0.02)
+
+        assert monitor.lag.count > 0
+        assert monitor.lag.max >= 30.0
+
+    async def test_slow_steps_attributed_to_device(self, monitor):
+        """Test unnamed tasks are labelled by coroutine and device name."""
+        await asyncio.create_task(_Device()._scan_loop(cycles=3, block=0.015))
+        await asyncio.create_task(_Device()._scan_loop(cycles=3, block=0.0))
+
+        offenders = monitor.top_offenders()
+
+        assert [o["task"] for o in offenders] == ["_Device._scan_loop[turbine_plc_1]"]
+        assert offenders[0]["slow_steps"] == 3
+        assert offenders[0]["max_ms"] >= 15.0
+
+    async def test_task_name_takes_precedence(self, monitor):
+        """Test an explicit task name is used as the label."""
+        await asyncio.create_task(
+            _Device()._scan_loop(cycles=1, block=0.015), name="modbus_tcp_server"
+        )
+
+        assert monitor.top_offenders()[0]["task"] == "modbus_tcp_server"
+
+    async def test_phase_timing(self, monitor):
+        """Test phases record every pass, including awaited time."""
+        for _ in range(2):
+            with monitor.phase("physics"):
+                await asyncio.sleep(0.01)
+
+        phase = monitor.get_status()["phases"]["physics"]
+
+        assert phase["count"] == 2
+        assert phase["mean_ms"] >= 9.0
+
+    async def test_stop_restores_task_factory(self):
+        """Test the previous task factory is chained and put back."""
+        loop = asyncio.get_running_loop()
+        created = []
+
+        def factory(loop, coro, **kwargs):
+            created.append(coro)
+            return asyncio.Task(coro, loop=loop, **kwargs)
+
+        loop.set_task_factory(factory)
+        try:
+            monitor = LoopMonitor(probe_interval=0.005, slow_step=0.01)
+            await monitor.start()
+            await asyncio.create_task(asyncio.sleep(0))
+            await monitor.stop()
+
+            assert loop.get_task_factory() is factory
+            assert len(created) == 2  # Probe task and the task above
+            assert not monitor.get_status()["running"]
+        finally:
+            loop.set_task_factory(None)
@@ -36,6 +36,7 @@ from components.devices.enterprise_zone import (
     PolicyMode,
     RuleAction,
 )
+from components.security.audit_store import AuditStore
 from components.security.authentication import AuthenticationManager, UserRole
 from components.state.data_store import DataStore
 from components.state.system_state import SystemState
@@ -55,7 +56,10 @@ class BlueTeamCLI:
 
     async def initialize(self):
         """Initialize simulation components."""
-        self.system_state = SystemState()
+        from config.config_loader import ConfigLoader
+
+        config = ConfigLoader().load_all()
+        self.system_state = SystemState(audit_store=self._open_audit_store(config))
         self.auth_mgr = AuthenticationManager()
         self.data_store = DataStore(
             system_state=self.system_state, auth_mgr=self.auth_mgr
@@ -101,9 +105,6 @@ class BlueTeamCLI:
                 data_store=self.data_store,
             )
             # Load config if available
-            from config.config_loader import ConfigLoader
-
-            config = ConfigLoader().load_all()
             if "modbus_filtering" in config and config["modbus_filtering"]:
                 try:
                     await self.modbus_filter.load_config(config["modbus_filtering"])
@@ -118,6 +119,17 @@ class BlueTeamCLI:
             system_state=self.system_state,
         )
 
+    @staticmethod
+    def _open_audit_store(config: dict) -> AuditStore | None:
+        """Open the simulator's on-disk audit trail read-only, if it exists."""
+        audit_cfg = config.get("simulation", {}).get("logging", {}).get("audit_store")
+        if not audit_cfg or not audit_cfg.get("enabled"):
+            return None
+        directory = Path(audit_cfg.get("directory", "logs/audit"))
+        if not directory.is_dir():
+            return None
+        return AuditStore(directory, read_only=True)
+
     # ================================================================
     # Firewall Commands
     # ================================================================
@@ -241,6 +253,32 @@ class BlueTeamCLI:
             print(f"❌ Rule not found: {args.rule_id}")
             return 1
 
+    async def firewall_top_sources(self, args):
+        """Show source IPs blocked most often in the last minute."""
+        sources = self.firewall.get_top_blocked_sources(args.limit)
+
+        if not sources:
+            print("No blocked connections in the last minute.")
+            return 0
+
+        print(
+            f"Top Blocked Sources (last 60s, {self.firewall.get_block_rate()} blocks):"
+        )
+        print()
+        print(f"{'Source IP':<40} {'Blocks':<8}")
+        print("-" * 50)
+        for source_ip, count in sources:
+            print(f"{source_ip:<40} {count:<8}")
+
+        rules = self.firewall.get_top_blocking_rules(args.limit)
+        print()
+        print("Top Blocking Rules:")
+        for rule_id, count in rules:
+            rule = self.firewall.get_rule(rule_id)
+            name = rule.name if rule else "(removed)"
+            print(f"  {rule_id:<15} {name:<30} {count}")
+        return 0
+
     # ================================================================
     # IDS/IPS Commands
     # ================================================================
@@ -269,15 +307,19 @@ class BlueTeamCLI:
 
     async def ids_block_ip(self, args):
         """Block IP address (IPS action)."""
+        ttl = getattr(args, "ttl", None)
         success = await self.ids_system.block_ip(
             ip_address=args.ip,
             reason=args.reason,
             user=args.user,
+            ttl=ttl,
         )
 
         if success:
             print(f"✓ IP address blocked: {args.ip}")
             print(f"  Reason: {args.reason}")
+            if ttl:
+                print(f"  Expires: in {ttl:.0f}s")
             print()
             print("All connection attempts from this IP will be DROPPED.")
             print()
@@ -766,6 +808,7 @@ class BlueTeamCLI:
             action=action,
             since=since,
             until=until,
+            history=True,
         )
 
         if not events:
@@ -808,7 +851,7 @@ class BlueTeamCLI:
     async def audit_stats(self, args):
         """Show audit log statistics."""
         # Get all events (no limit)
-        events = await self.data_store.get_audit_log(limit=None)
+        events = await self.data_store.get_audit_log(limit=None, history=True)
 
         if not events:
             print("No audit log entries found.")
@@ -901,7 +944,7 @@ class BlueTeamCLI:
 
         # Query events
         events = await self.data_store.get_audit_log(
-            limit=limit, device=device, category=category
+            limit=limit, device=device, category=category, history=True
         )
 
         if not events:
@@ -984,7 +1027,7 @@ class BlueTeamCLI:
         limit = getattr(args, "limit", 100)
 
         # Get events
-        events = await self.data_store.get_audit_log(limit=limit)
+        events = await self.data_store.get_audit_log(limit=limit, history=True)
 
         if not events:
             print("No audit log entries found.")
@@ -1153,6 +1196,31 @@ class BlueTeamCLI:
 
         return 0
 
+    async def anomaly_add_drift(self, args):
+        """Add change-point (slow drift) detection for parameter (runtime)."""
+        device = args.device
+        parameter = args.parameter
+        method = getattr(args, "method", "cusum")
+
+        try:
+            await self.anomaly_detector.add_drift_detector(
+                device=device,
+                parameter=parameter,
+                method=method,
+            )
+        except ValueError as e:
+            print(f"✗ {e}")
+            return 1
+
+        print(f"✓ Drift detection added: {device}/{parameter}")
+        print(f"  Method: {method}")
+        print()
+        print("The detector learns a fixed reference from the first samples,")
+        print("then flags sustained shifts that stay within normal limits.")
+        print()
+
+        return 0
+
     async def anomaly_list(self, args):
         """List recent anomalies."""
         limit = getattr(args, "limit", 50)
@@ -1271,6 +1339,25 @@ class BlueTeamCLI:
         print("=" * 70)
         return 0
 
+    async def anomaly_save_baselines(self, args):
+        """Save baselines and detection state to the baseline file."""
+        path = getattr(args, "file", None)
+
+        try:
+            written = await self.anomaly_detector.save_state(path)
+        except (ValueError, RuntimeError) as e:
+            print(f"✗ {e}")
+            print("  Pass --file or set baseline_file in config/anomaly_detection.yml")
+            return 1
+
+        print(f"✓ Saved {len(self.anomaly_detector.baselines)} baselines to {written}")
+        print()
+        print("The detector loads this file at startup when it is configured as")
+        print("baseline_file in config/anomaly_detection.yml.")
+        print()
+
+        return 0
+
     async def anomaly_clear(self, args):
         """Clear anomaly history."""
         count = await self.anomaly_detector.clear_anomalies()
@@ -1913,6 +2000,14 @@ To make permanent, edit config/*.yml and restart simulator.
     )
     disable_rule_parser.add_argument("rule_id", help="Rule ID to disable")
 
+    # firewall top-sources
+    top_sources_parser = fw_subparsers.add_parser(
+        "top-sources", help="Show most-blocked source IPs (last minute)"
+    )
+    top_sources_parser.add_argument(
+        "--limit", type=int, default=10, help="Number of sources to show"
+    )
+
     # ================================================================
     # IDS/IPS Commands
     # ================================================================
@@ -1933,8 +2028,11 @@ To make permanent, edit config/*.yml and restart simulator.
 
     # ids block-ip
     block_ip_parser = ids_subparsers.add_parser("block-ip", help="Block IP address")
-    block_ip_parser.add_argument("ip", help="IP address to block")
+    block_ip_parser.add_argument("ip", help="IP address or CIDR range to block")
     block_ip_parser.add_argument("reason", help="Reason for blocking")
+    block_ip_parser.add_argument(
+        "--ttl", type=float, help="Lift the block after this many seconds"
+    )
 
     # ids unblock-ip
     unblock_ip_parser = ids_subparsers.add_parser(
@@ -2113,6 +2211,19 @@ To make permanent, edit config/*.yml and restart simulator.
         help="Maximum rate of change per second",
     )
 
+    # anomaly add-drift
+    add_drift_parser = anomaly_subparsers.add_parser(
+        "add-drift", help="Add change-point (slow drift) detection for parameter"
+    )
+    add_drift_parser.add_argument("--device", required=True, help="Device name")
+    add_drift_parser.add_argument("--parameter", required=True, help="Parameter name")
+    add_drift_parser.add_argument(
+        "--method",
+        choices=["cusum", "ewma", "page_hinkley"],
+        default="cusum",
+        help="Detection method (default: cusum)",
+    )
+
     # anomaly list
     list_anomalies_parser = anomaly_subparsers.add_parser(
         "list", help="List recent anomalies"
@@ -2127,6 +2238,14 @@ To make permanent, edit config/*.yml and restart simulator.
     # anomaly clear
     anomaly_subparsers.add_parser("clear", help="Clear anomaly history")
 
+    # anomaly save-baselines
+    save_baselines_parser = anomaly_subparsers.add_parser(
+        "save-baselines", help="Save baselines and limits to the baseline file"
+    )
+    save_baselines_parser.add_argument(
+        "--file", help="Target .npz file (default: configured baseline_file)"
+    )
+
     # ================================================================
     # Modbus Commands
     # ================================================================
@@ -2337,6 +2456,8 @@ async def main():
                 return await cli.firewall_enable_rule(args)
             elif args.subcommand == "disable-rule":
                 return await cli.firewall_disable_rule(args)
+            elif args.subcommand == "top-sources":
+                return await cli.firewall_top_sources(args)
             else:
                 parser.parse_args(["firewall", "--help"])
 
@@ -2415,12 +2536,16 @@ async def main():
                 return await cli.anomaly_set_range(args)
             elif args.subcommand == "set-rate":
                 return await cli.anomaly_set_rate(args)
+            elif args.subcommand == "add-drift":
+                return await cli.anomaly_add_drift(args)
             elif args.subcommand == "list":
                 return await cli.anomaly_list(args)
             elif args.subcommand == "stats":
                 return await cli.anomaly_stats(args)
             elif args.subcommand == "clear":
                 return await cli.anomaly_clear(args)
+            elif args.subcommand == "save-baselines":
+                return await cli.anomaly_save_baselines(args)
             else:
                 parser.parse_args(["anomaly", "--help"])
 
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for high-volume record types.
+
+The historian, audit trails and alert stores retain tens to hundreds of
+thousands of small records. This measures the bytes each retained record
+costs (tracemalloc, including the strings and containers it owns) for
+the slotted record types and for a dict-backed twin with the same fields,
+i.e. the plain dataclass the type used to be.
+
+Records are built the way the simulator builds them: device and tag
+names are formatted per event, so interning shows up in the figures.
+
+Usage:
+  python tools/memory_benchmark.py
+  python tools/memory_benchmark.py --count 100000 --json
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from components.devices.enterprise_zone.firewall import BlockedConnection
+from components.devices.enterprise_zone.historian import DataPoint
+from components.devices.enterprise_zone.ids_system import (
+    AlertSeverity as IDSSeverity,
+)
+from components.devices.enterprise_zone.ids_system import (
+    AlertStatus,
+    IDSAlert,
+)
+from components.devices.enterprise_zone.siem_system import (
+    AlertSeverity as SIEMSeverity,
+)
+from components.devices.enterprise_zone.siem_system import SIEMAlert
+from components.devices.operations_zone.scada_server import Alarm
+from components.security.anomaly_detector import (
+    AnomalyEvent,
+    AnomalySeverity,
+    AnomalyType,
+)
+from components.security.logging_system import EventCategory, EventSeverity, LogEntry
+
+
+def _log_entry(i: int) -> dict[str, Any]:
+    return {
+        "simulation_time": i * 0.1,
+        "wall_time": i * 0.1,
+        "severity": EventSeverity.INFO,
+        "category": EventCategory.SECURITY,
+        "message": f"Memory write: holding_registers[{i % 64}] = {i}",
+        "device": f"turbine_plc_{i % 4}",
+        "component": "memory",
+        "data": {"address": f"holding_registers[{i % 64}]", "new_value": i},
+    }
+
+
+def _data_point(i: int) -> dict[str, Any]:
+    return {
+        "tag_name": f"turbine_plc_{i % 4}.speed",
+        "timestamp": i * 0.1,
+        "value": 3600.0 + i % 10,
+    }
+
+
+def _anomaly_event(i: int) -> dict[str, Any]:
+    return {
+        "timestamp": i * 0.1,
+        "anomaly_type": AnomalyType.STATISTICAL,
+        "severity": AnomalySeverity.MEDIUM,
+        "device": f"turbine_plc_{i % 4}",
+        "parameter": "speed",
+        "observed_value": 3900.0 + i % 10,
+        "baseline_mean": 3600.0,
+        "baseline_std": 12.5,
+        "deviation_magnitude": 4.2,
+    }
+
+
+def _ids_alert(i: int) -> dict[str, Any]:
+    return {
+        "alert_id": f"IDS-{i:08d}",
+        "timestamp": i * 0.1,
+        "severity": IDSSeverity.HIGH,
+        "status": AlertStatus.NEW,
+        "rule_name": "modbus_write_flood",
+        "category": "protocol_anomaly",
+        "title": "Excessive Modbus writes",
+        "description": f"{i % 500} writes in 10s window",
+        "source_ip": f"10.0.{i % 4}.{i % 250}",
+        "destination_ip": f"192.168.1.{i % 4 + 10}",
+        "protocol": "modbus",
+    }
+
+
+def _siem_alert(i: int) -> dict[str, Any]:
+    return {
+        "alert_id": f"SIEM-{i:08d}",
+        "severity": SIEMSeverity.HIGH,
+        "category": "intrusion",
+        "title": "Unusual write activity",
+        "description": f"{i % 500} writes from one source",
+        "detection_time": i * 0.1,
+        "wall_time": i * 0.1,
+    }
+
+
+def _blocked_connection(i: int) -> dict[str, Any]:
+    return {
+        "timestamp": i * 0.1,
+        "source_ip": f"10.0.{i % 4}.{i % 250}",
+        "dest_ip": f"192.168.1.{i % 4 + 10}",
+        "dest_port": 502,
+        "protocol": "modbus",
+        "rule_id": "deny_enterprise_to_control",
+        "reason": "Zone boundary",
+    }
+
+
+def _alarm(i: int) -> dict[str, Any]:
+    return {
+        "tag_name": f"turbine_plc_{i % 4}.speed",
+        "alarm_type": "high",
+        "triggered_at": i * 0.1,
+        "value": 3900.0,
+        "message": "Speed high",
+    }
+
+
+RECORDS: dict[str, tuple[type, Callable[[int], dict[str, Any]]]] = {
+    "LogEntry": (LogEntry, _log_entry),
+    "DataPoint": (DataPoint, _data_point),
+    "AnomalyEvent": (AnomalyEvent, _anomaly_event),
+    "IDSAlert": (IDSAlert, _ids_alert),
+    "SIEMAlert": (SIEMAlert, _siem_alert),
+    "BlockedConnection": (BlockedConnection, _blocked_connection),
+    "Alarm": (Alarm, _alarm),
+}
+
+
+def dict_backed_twin(cls: type) -> type:
+    """Plain (``__dict__``) dataclass with the same init fields as cls."""
+    specs = []
+    for f in dataclasses.fields(cls):
+        if not f.init:
+            continue
+        if f.default_factory is not dataclasses.MISSING:
+            spec = dataclasses.field(default_factory=f.default_factory)
+        elif f.default is not dataclasses.MISSING:
+            spec = dataclasses.field(default=f.default)
+        else:
+            spec = dataclasses.field()
+        specs.append((f.name, Any, spec))
+    return dataclasses.make_dataclass(f"Plain{cls.__name__}", specs)
+
+
+def bytes_per_record(
+    cls: type, make: Callable[[int], dict[str, Any]], count: int
+) -> float:
+    """Retained bytes per record for count records held in a list."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        records = [cls(**make(i)) for i in range(count)]
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    del records
+    return used / count
+
+
+def run_benchmark(count: int = 20000) -> list[dict[str, Any]]:
+    """
+    Measure every record type.
+
+    Returns:
+        One row per type: name, before/after bytes per record, saving (%)
+    """
+    rows = []
+    for name, (cls, make) in RECORDS.items():
+        before = bytes_per_record(dict_backed_twin(cls), make, count)
+        after = bytes_per_record(cls, make, count)
+        rows.append(
+            {
+                "record": name,
+                "before_bytes": round(before, 1),
+                "after_bytes": round(after, 1),
+                "saving_percent": round(100.0 * (before - after) / before, 1),
+            }
+        )
+    return rows
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Bytes per retained record, dict-backed vs slotted",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--count", type=int, default=20000, help="Records per type (default 20000)"
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON rows")
+    args = parser.parse_args()
+
+    rows = run_benchmark(args.count)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+
+    print(f"{'Record':20s} {'Before (B)':>11s} {'After (B)':>10s} {'Saving':>8s}")
+    print("-" * 52)
+    for row in rows:
+        print(
+            f"{row['record']:20s} {row['before_bytes']:11.1f} "
+            f"{row['after_bytes']:10.1f} {row['saving_percent']:7.1f}%"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+Physics sweep runner - headless Monte Carlo and parameter sweeps.
+
+Builds device physics engines (and optionally their PLC logic) without
+protocol servers, runs many parameter variations across a process pool,
+and streams one compact JSON record per run to a results file.
+
+Answers questions such as "at which governor gain does an overspeed attack
+trip the turbine within 30 s?" without a full SimulatorManager run per case.
+
+Sweep spec (YAML or JSON):
+
+    engine: turbine            # turbine | reactor | hvac
+    duration: 60               # simulated seconds per run
+    dt: 0.1                    # physics tick
+    plc: false                 # also run the device PLC scan cycle
+    steady_state: true         # start at equilibrium for the controls
+    integrator: {adaptive: true}
+    stop_on_trip: false        # end a run at its first trip
+    controls:                  # memory map writes before initialisation
+      holding_registers[10]: 3600
+      coils[10]: true
+    events:                    # memory map writes during the run
+      - {time: 10, address: "holding_registers[10]", value: 4500}
+    grid:                      # cartesian product of parameter values
+      governor_gain: [2, 5, 10, 20]
+    random:                    # Monte Carlo samples, uniform in range
+      samples: 100
+      seed: 1
+      ranges:
+        acceleration_rate: [50, 150]
+
+Usage:
+  python tools/physics_sweep.py sweep.yml --output results.jsonl
+  python tools/physics_sweep.py sweep.yml -o results.jsonl --workers 8
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import itertools
+import json
+import logging
+import multiprocessing
+import random
+import sys
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from components.devices.control_zone.plc.vendor_specific import (  # noqa: E402
+    HVACPLC,
+    ReactorPLC,
+    TurbinePLC,
+)
+from components.physics.hvac_physics import (  # noqa: E402
+    HVACParameters,
+    HVACPhysics,
+)
+from components.physics.reactor_physics import (  # noqa: E402
+    ReactorParameters,
+    ReactorPhysics,
+)
+from components.physics.turbine_physics import (  # noqa: E402
+    TurbineParameters,
+    TurbinePhysics,
+)
+from components.state.data_store import DataStore  # noqa: E402
+from components.state.system_state import SystemState  # noqa: E402
+from components.time.simulation_time import SimulationTime  # noqa: E402
+
+
+@dataclass(frozen=True)
+class EngineSpec:
+    """How to build, judge and measure one engine type.
+
+    Attributes:
+        engine_class: Physics engine class
+        params_class: Parameter dataclass swept over
+        device_type: DataStore device type
+        plc_class: PLC class run when a case enables PLC logic
+        peak_metric: State field whose maximum is recorded
+        tripped: Predicate for the trip condition
+        damage: Damage measure (None if the engine has none)
+    """
+
+    engine_class: type
+    params_class: type
+    device_type: str
+    plc_class: type
+    peak_metric: str
+    tripped: Callable[[Any], bool]
+    damage: Callable[[Any], float | None]
+
+
+ENGINES: dict[str, EngineSpec] = {
+    "turbine": EngineSpec(
+        engine_class=TurbinePhysics,
+        params_class=TurbineParameters,
+        device_type="turbine_plc",
+        plc_class=TurbinePLC,
+        peak_metric="shaft_speed_rpm",
+        tripped=lambda e: e.state.shaft_speed_rpm > e.params.max_safe_speed_rpm,
+        damage=lambda e: e.state.damage_level,
+    ),
+    "reactor": EngineSpec(
+        engine_class=ReactorPhysics,
+        params_class=ReactorParameters,
+        device_type="reactor_plc",
+        plc_class=ReactorPLC,
+        peak_metric="core_temperature_c",
+        tripped=lambda e: e.is_scram_active(),
+        damage=lambda e: e.state.damage_level,
+    ),
+    "hvac": EngineSpec(
+        engine_class=HVACPhysics,
+        params_class=HVACParameters,
+        device_type="hvac_plc",
+        plc_class=HVACPLC,
+        peak_metric="zone_temperature_c",
+        tripped=lambda e: e.state.lspace_stability < 0.3,
+        damage=lambda e: None,
+    ),
+}
+
+
+@dataclass
+class SweepCase:
+    """One run of a sweep.
+
+    Attributes:
+        case_id: Sequential case number
+        engine: Engine type key in ENGINES
+        params: Parameter dataclass overrides for this run
+        duration: Simulated seconds to run
+        dt: Physics tick in seconds
+        controls: Memory map values written before initialisation
+        events: (time, address, value) memory map writes during the run
+        plc: Run the device PLC scan cycle alongside physics
+        steady_state: Initialise at equilibrium for the controls
+        stop_on_trip: End the run at the first trip
+        pace: Wall seconds per simulated second (0 = as fast as possible)
+        integrator: IntegratorConfig overrides for the engine
+    """
+
+    case_id: int
+    engine: str
+    params: dict[str, Any]
+    duration: float = 60.0
+    dt: float = 0.1
+    controls: dict[str, Any] = field(default_factory=dict)
+    events: list[tuple[float, str, Any]] = field(default_factory=list)
+    plc: bool = False
+    steady_state: bool = False
+    stop_on_trip: bool = False
+    pace: float = 0.0
+    integrator: dict[str, Any] = field(default_factory=lambda: {"adaptive": True})
+
+
+@dataclass
+class SweepResult:
+    """Compact outcome of one run.
+
+    Attributes:
+        case_id: Case number
+        engine: Engine type
+        params: Parameter overrides used
+        trip_time: Simulated time of the first trip (None if no trip)
+        peak_metric: State field tracked for peak_value
+        peak_value: Maximum of peak_metric over the run
+        damage: Final damage level (None if the engine has none)
+        sim_time: Simulated seconds actually run
+        wall_time: Wall-clock seconds for the run
+        error: Exception text if the run failed
+    """
+
+    case_id: int
+    engine: str
+    params: dict[str, Any]
+    trip_time: float | None = None
+    peak_metric: str = ""
+    peak_value: float | None = None
+    damage: float | None = None
+    sim_time: float = 0.0
+    wall_time: float = 0.0
+    error: str | None = None
+
+
+# ----------------------------------------------------------------
+# Spec expansion
+# ----------------------------------------------------------------
+
+
+def build_cases(spec: dict[str, Any]) -> list[SweepCase]:
+    """Expand a sweep spec into individual cases.
+
+    Grid values form a cartesian product. Random ranges add `samples`
+    uniform draws per grid point (seeded for reproducibility).
+
+    Args:
+        spec: Sweep specification (see module docstring)
+
+    Returns:
+        Cases in a stable order
+
+    Raises:
+        ValueError: If the engine or a parameter name is unknown
+    """
+    engine = spec.get("engine", "turbine")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}', expected one of {list(ENGINES)}")
+
+    known = {f.name for f in dataclasses.fields(ENGINES[engine].params_class)}
+    grid: dict[str, list[Any]] = spec.get("grid", {}) or {}
+    random_cfg: dict[str, Any] = spec.get("random", {}) or {}
+    ranges: dict[str, list[float]] = random_cfg.get("ranges", {}) or {}
+
+    unknown = (set(grid) | set(ranges) | set(spec.get("params", {}))) - known
+    if unknown:
+        raise ValueError(f"Unknown {engine} parameters: {sorted(unknown)}")
+
+    events = [
+        (float(e["time"]), str(e["address"]), e["value"])
+        for e in spec.get("events", [])
+    ]
+    base = {
+        "engine": engine,
+        "duration": float(spec.get("duration", 60.0)),
+        "dt": float(spec.get("dt", 0.1)),
+        "controls": dict(spec.get("controls", {})),
+        "events": sorted(events, key=lambda e: e[0]),
+        "plc": bool(spec.get("plc", False)),
+        "steady_state": bool(spec.get("steady_state", False)),
+        "stop_on_trip": bool(spec.get("stop_on_trip", False)),
+        "pace": float(spec.get("pace", 0.0)),
+        "integrator": dict(spec.get("integrator", {"adaptive": True})),
+    }
+
+    names = list(grid)
+    grid_points = [
+        dict(zip(names, values, strict=True))
+        for values in itertools.product(*(grid[n] for n in names))
+    ]
+
+    rng = random.Random(random_cfg.get("seed"))
+    samples = int(random_cfg.get("samples", 1 if ranges else 0)) or 1
+
+    cases: list[SweepCase] = []
+    for point in grid_points:
+        for _ in range(samples):
+            params = dict(spec.get("params", {}))
+            params.update(point)
+            for name, (low, high) in ranges.items():
+                params[name] = rng.uniform(low, high)
+            cases.append(SweepCase(case_id=len(cases), params=params, **base))
+    return cases
+
+
+# ----------------------------------------------------------------
+# Single run
+# ----------------------------------------------------------------
+
+
+def run_case(case: SweepCase) -> SweepResult:
+    """Run one case to completion (blocking).
+
+    Args:
+        case: Case to run
+
+    Returns:
+        SweepResult; failures are reported in SweepResult.error
+    """
+    start = time.perf_counter()
+    sim_time = SimulationTime()
+    saved_time = sim_time.state.simulation_time
+    try:
+        result = asyncio.run(_run_case(case))
+    except Exception as e:
+        result = SweepResult(case.case_id, case.engine, case.params)
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        sim_time.state.simulation_time = saved_time
+    result.wall_time = round(time.perf_counter() - start, 4)
+    return result
+
+
+async def _run_case(case: SweepCase) -> SweepResult:
+    """Build an isolated engine, run it and collect the result."""
+    spec = ENGINES[case.engine]
+    device_name = f"{case.engine}_sweep_{case.case_id}"
+
+    # Runs advance simulation time themselves (stepped, no time loop)
+    sim_time = SimulationTime()
+    sim_time.state.simulation_time = 0.0
+
+    data_store = DataStore(SystemState())
+    await data_store.register_device(
+        device_name=device_name,
+        device_type=spec.device_type,
+        device_id=1,
+        protocols=[],
+    )
+
+    engine = spec.engine_class(
+        device_name, data_store, spec.params_class(**case.params)
+    )
+    engine.configure_integrator(**case.integrator)
+
+    plc = None
+    if case.plc:
+        plc = spec.plc_class(
+            device_name=device_name,
+            device_id=1,
+            data_store=data_store,
+            **{f"{case.engine}_physics": engine},
+        )
+        await plc._initialise_memory_map()
+        await data_store.bulk_write_memory(device_name, plc.memory_map)
+
+    if case.controls:
+        await data_store.bulk_write_memory(device_name, case.controls)
+    await engine.initialise(steady_state=case.steady_state)
+
+    result = SweepResult(
+        case.case_id, case.engine, case.params, peak_metric=spec.peak_metric
+    )
+    peak = getattr(engine.state, spec.peak_metric)
+    events = list(case.events)
+    next_scan = 0.0
+    now = 0.0
+    steps = round(case.duration / case.dt)
+
+    for step in range(1, steps + 1):
+        while events and events[0][0] <= now:
+            _, address, value = events.pop(0)
+            await data_store.write_memory(device_name, address, value)
+
+        if plc and now >= next_scan:
+            await _scan_plc(plc)
+            next_scan += plc.scan_interval
+
+        await engine.read_control_inputs()
+        engine.update(case.dt)
+        await engine.write_telemetry()
+
+        now = step * case.dt
+        sim_time.state.simulation_time = now
+        peak = max(peak, getattr(engine.state, spec.peak_metric))
+
+        if result.trip_time is None and spec.tripped(engine):
+            result.trip_time = round(now, 6)
+            if case.stop_on_trip:
+                break
+
+        if case.pace > 0:
+            await asyncio.sleep(case.dt * case.pace)
+
+    result.peak_value = round(float(peak), 6)
+    damage = spec.damage(engine)
+    result.damage = None if damage is None else round(float(damage), 6)
+    result.sim_time = round(now, 6)
+    return result
+
+
+async def _scan_plc(plc: Any) -> None:
+    """Run one PLC scan with the memory sync BaseDevice._scan_loop performs."""
+    memory = await plc.data_store.bulk_read_memory(plc.device_name)
+    if memory:
+        plc.memory_map.update(memory)
+    await plc._scan_cycle()
+    await plc.data_store.bulk_write_memory(plc.device_name, plc.memory_map)
+
+
+# ----------------------------------------------------------------
+# Sweep execution
+# ----------------------------------------------------------------
+
+
+def _init_worker(log_level: int) -> None:
+    """Quieten per-step engine logging in pool workers."""
+    logging.disable(log_level)
+
+
+def iter_results(
+    cases: list[SweepCase], workers: int | None = None, log_level: int = logging.INFO
+) -> Iterator[SweepResult]:
+    """Run cases and yield results as they complete.
+
+    Args:
+        cases: Cases to run
+        workers: Worker processes (None = CPU count, 1 = in this process)
+        log_level: Disable log records at or below this level during runs
+
+    Yields:
+        SweepResult per case, in completion order
+    """
+    if workers == 1:
+        previous = logging.root.manager.disable
+        _init_worker(log_level)
+        try:
+            for case in cases:
+                yield run_case(case)
+        finally:
+            logging.disable(previous)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(log_level,),
+    ) as pool:
+        futures = [pool.submit(run_case, case) for case in cases]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_sweep(
+    cases: list[SweepCase],
+    output: Path,
+    workers: int | None = None,
+    log_level: int = logging.INFO,
+) -> dict[str, Any]:
+    """Run cases and stream one JSON line per result to a file.
+
+    Each line is flushed as soon as its run finishes, so partial results
+    survive an interrupted sweep.
+
+    Args:
+        cases: Cases to run
+        output: JSON-lines results file (overwritten)
+        workers: Worker processes (None = CPU count, 1 = in this process)
+        log_level: Disable log records at or below this level during runs
+
+    Returns:
+        Summary with run, trip and error counts and wall time
+    """
+    start = time.perf_counter()
+    summary = {"runs": 0, "trips": 0, "errors": 0}
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", encoding="utf-8") as f:
+        for result in iter_results(cases, workers, log_level):
+            f.write(json.dumps(dataclasses.asdict(result)) + "\n")
+            f.flush()
+            summary["runs"] += 1
+            summary["trips"] += result.trip_time is not None
+            summary["errors"] += result.error is not None
+
+    summary["wall_time"] = round(time.perf_counter() - start, 3)
+    return summary
+
+
+def load_spec(path: Path) -> dict[str, Any]:
+    """Load a sweep spec from YAML or JSON."""
+    with path.open(encoding="utf-8") as f:
+        if path.suffix == ".json":
+            return json.load(f)
+        return yaml.safe_load(f) or {}
+
+
+def main() -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Run headless physics parameter sweeps across a process pool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("spec", type=Path, help="Sweep spec (YAML or JSON)")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("logs/physics_sweep.jsonl"),
+        help="JSON-lines results file (default: logs/physics_sweep.jsonl)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count, 1 = no pool)",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Keep engine INFO logging in workers",
+    )
+    args = parser.parse_args()
+
+    try:
+        cases = build_cases(load_spec(args.spec))
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        print(f"Invalid sweep spec: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Running {len(cases)} cases -> {args.output}")
+    log_level = logging.NOTSET if args.verbose else logging.INFO
+    summary = run_sweep(cases, args.output, args.workers, log_level)
+    print(
+        f"Done: {summary['runs']} runs, {summary['trips']} tripped, "
+        f"{summary['errors']} errors in {summary['wall_time']}s"
+    )
+    return 0 if summary["errors"] == 0 else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
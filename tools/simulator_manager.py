@@ -20,6 +20,7 @@ Integrates:
 """
 
 import asyncio
+import contextlib
 import logging
 import signal
 import sys
@@ -28,14 +29,24 @@ from typing import Any
 
 from components.devices import DEVICE_REGISTRY
 from components.network.network_simulator import NetworkSimulator
+from components.physics.base_physics_engine import BaseDevicePhysicsEngine
+from components.physics.coupling import PhysicsCouplingGraph
 from components.physics.grid_physics import GridParameters, GridPhysics
 from components.physics.hvac_physics import HVACParameters, HVACPhysics
+from components.physics.physics_worker import PhysicsWorker
 from components.physics.power_flow import PowerFlow
 from components.physics.reactor_physics import ReactorParameters, ReactorPhysics
 from components.physics.turbine_physics import TurbineParameters, TurbinePhysics
-from components.security.logging_system import configure_logging
+from components.security.audit_aggregator import AuditAggregator
+from components.security.audit_store import AuditStore
+from components.security.logging_system import (
+    configure_log_pipeline,
+    configure_logging,
+    set_log_level,
+)
 from components.state.data_store import DataStore
 from components.state.system_state import SystemState
+from components.time.loop_monitor import LoopMonitor
 from components.time.simulation_time import SimulationTime, wait_simulation_time
 from config.config_loader import ConfigLoader
 
@@ -101,6 +112,9 @@ class SimulatorManager:
         self.reactor_physics: dict[str, ReactorPhysics] = {}
         self.grid_physics: GridPhysics | None = None
         self.power_flow: PowerFlow | None = None
+        self.physics_worker: PhysicsWorker | None = None
+        self._steady_state_init = False
+        self.physics_coupling: PhysicsCouplingGraph | None = None
 
         # Device instances (PLCs, RTUs, etc.)
         self.device_instances: dict[str, Any] = {}
@@ -113,6 +127,7 @@ class SimulatorManager:
         self._paused = False
         self._simulation_task: asyncio.Task | None = None
         self._initialised = False
+        self.loop_monitor: LoopMonitor | None = None
 
         # Statistics
         self._update_count = 0
@@ -150,6 +165,21 @@ class SimulatorManager:
             # 1. Load configuration
             logger.info("Loading configuration...")
             config = self.config_loader.load_all()
+            logging_cfg = config.get("simulation", {}).get("logging", {})
+            configure_log_pipeline(**logging_cfg.get("pipeline", {}))
+            for module, level in (logging_cfg.get("levels") or {}).items():
+                set_log_level(level, module)
+            audit_cfg = logging_cfg.get("audit_store") or {}
+            if audit_cfg.get("enabled"):
+                self.system_state.audit_store = AuditStore(
+                    audit_cfg.get("directory", "logs/audit"),
+                    segment_bytes=int(audit_cfg.get("segment_mb", 16) * 1024 * 1024),
+                    max_segments=audit_cfg.get("max_segments"),
+                )
+            aggregation_cfg = dict(logging_cfg.get("audit_aggregation") or {})
+            if aggregation_cfg.pop("enabled", False):
+                self.system_state.audit_aggregator = AuditAggregator(**aggregation_cfg)
+            await self._start_loop_monitor(config)
 
             # 2. Register devices
             logger.info("Registering devices...")
@@ -167,6 +197,11 @@ class SimulatorManager:
             logger.info("Creating device instances...")
             await self._create_devices(config)
 
+            # Devices have written their memory maps; solve for equilibrium
+            if self._steady_state_init:
+                logger.info("Solving physics steady state...")
+                await self._solve_steady_state()
+
             # 6. Configure SCADA servers with poll targets and tags
             logger.info("Configuring SCADA servers...")
             await self._configure_scada_servers(config)
@@ -241,6 +276,14 @@ class SimulatorManager:
         Args:
             config: Loaded configuration dictionary
         """
+        # Integrator settings shared by all device physics engines
+        runtime_cfg = config.get("simulation", {}).get("runtime", {})
+        integrator_cfg = runtime_cfg.get("integrator", {})
+
+        # Start engines at equilibrium for their configured setpoints; the
+        # solve runs once devices exist (see _solve_steady_state)
+        self._steady_state_init = bool(runtime_cfg.get("steady_state_init", False))
+
         # Create turbine physics for each turbine PLC
         turbines = await self.data_store.get_devices_by_type("turbine_plc")
 
@@ -255,6 +298,7 @@ class SimulatorManager:
 
             # Create physics engine
             turbine = TurbinePhysics(device_name, self.data_store, params)
+            self._configure_integrator(turbine, integrator_cfg)
             await turbine.initialise()
 
             self.turbine_physics[device_name] = turbine
@@ -278,6 +322,7 @@ class SimulatorManager:
 
             # Create physics engine
             hvac = HVACPhysics(device_name, self.data_store, params)
+            self._configure_integrator(hvac, integrator_cfg)
             await hvac.initialise()
 
             self.hvac_physics[device_name] = hvac
@@ -301,6 +346,7 @@ class SimulatorManager:
 
             # Create physics engine
             reactor = ReactorPhysics(device_name, self.data_store, params)
+            self._configure_integrator(reactor, integrator_cfg)
             await reactor.initialise()
 
             self.reactor_physics[device_name] = reactor
@@ -322,8 +368,99 @@ class SimulatorManager:
             # Create power flow
             self.power_flow = PowerFlow(self.data_store, self.config_loader)
             await self.power_flow.initialise()
+            # Seed fixed bus loads once; generation then arrives through ports
+            await self.power_flow.update_from_devices()
             logger.info("Created power flow engine")
 
+        self._build_physics_coupling()
+
+    async def _solve_steady_state(self) -> None:
+        """Move physics engines to equilibrium for the current setpoints.
+
+        Runs after the devices have written their memory maps; before that
+        every control input reads as zero and engines solve to standstill.
+        Device engines write their solved telemetry so the grid aggregates
+        the resulting generation.
+        """
+        for engines in (
+            self.turbine_physics,
+            self.hvac_physics,
+            self.reactor_physics,
+        ):
+            for engine in engines.values():
+                await engine.read_control_inputs()
+                engine.solve_steady_state()
+                await engine.write_telemetry()
+
+        if self.grid_physics:
+            await self.grid_physics.update_from_devices()
+            self.grid_physics.solve_steady_state()
+
+    def _build_physics_coupling(self) -> None:
+        """Connect physics engines through typed ports.
+
+        Turbine electrical output feeds grid generation and the turbine's
+        generator bus ("bus_<device_name>") directly, so engines exchange
+        full-precision values each tick instead of reading truncated
+        registers back from the DataStore.
+        """
+        graph = PhysicsCouplingGraph()
+        try:
+            for engines in (
+                self.turbine_physics,
+                self.hvac_physics,
+                self.reactor_physics,
+            ):
+                for name, engine in engines.items():
+                    graph.add_engine(name, engine)
+
+            bus_ports: dict[str, Any] = {}
+            if self.grid_physics:
+                graph.add_engine("grid", self.grid_physics)
+            if self.power_flow:
+                graph.add_engine("power_flow", self.power_flow)
+                bus_ports = self.power_flow.get_input_ports()
+
+            for name in self.turbine_physics:
+                if self.grid_physics:
+                    graph.connect(name, "power_output_mw", "grid", "generation_mw")
+                if f"bus_{name}.gen_mw" in bus_ports:
+                    graph.connect(
+                        name, "power_output_mw", "power_flow", f"bus_{name}.gen_mw"
+                    )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(
+                f"Physics coupling unavailable, using DataStore updates: {e}"
+            )
+            self.physics_coupling = None
+            return
+
+        self.physics_coupling = graph
+        logger.info(
+            f"Physics coupling: {len(graph.get_connections())} connections, "
+            f"order={graph.order()}"
+        )
+
+    def _configure_integrator(
+        self, engine: BaseDevicePhysicsEngine, settings: dict[str, Any]
+    ) -> None:
+        """Apply runtime integrator settings to a device physics engine.
+
+        Args:
+            engine: Device physics engine to configure
+            settings: IntegratorConfig overrides from simulation.runtime.integrator
+        """
+        if not settings:
+            return
+
+        try:
+            engine.configure_integrator(**settings)
+        except ValueError as e:
+            logger.warning(
+                f"Invalid integrator settings for {engine.device_name}: {e}, "
+                "using single-step integration"
+            )
+
     async def _create_devices(self, config: dict[str, Any]) -> None:
         """Create device instances (PLCs, RTUs, etc.) using config-driven registry.
 
@@ -446,6 +583,16 @@ class SimulatorManager:
                         description=device_cfg.get("description", ""),
                         scan_interval=scan_interval,
                     )
+                elif device_type == "siem_system":
+                    # SIEM with correlation rules from siem_correlation.yml
+                    device = device_class(
+                        device_name=device_name,
+                        device_id=device_id,
+                        data_store=self.data_store,
+                        description=device_cfg.get("description", "SIEM System"),
+                        analysis_interval=device_cfg.get("analysis_interval", 5.0),
+                    )
+                    await device.load_config(config.get("siem_correlation", {}))
                 else:
                     # Generic device creation (adjust as needed for other device types)
                     device = device_class(
@@ -1028,6 +1175,13 @@ class SimulatorManager:
         # Start simulation time
         await self.sim_time.start()
 
+        # Resume loop health monitoring after a stop
+        if self.loop_monitor:
+            await self.loop_monitor.start()
+
+        # Optionally move device physics into a worker process
+        await self._start_physics_worker()
+
         # Mark system as running
         await self.data_store.mark_simulation_running(True)
 
@@ -1035,7 +1189,9 @@ class SimulatorManager:
         self._start_time = self.sim_time.now()
 
         # Start main simulation loop
-        self._simulation_task = asyncio.create_task(self._simulation_loop())
+        self._simulation_task = asyncio.create_task(
+            self._simulation_loop(), name="simulator.loop"
+        )
 
         logger.info("Simulation started - physics engines and protocol servers active")
         if self.protocol_servers:
@@ -1066,6 +1222,11 @@ class SimulatorManager:
             except asyncio.CancelledError:
                 pass
 
+        # Stop physics worker (engines keep the last stepped state)
+        if self.physics_worker:
+            await self.physics_worker.stop()
+            self.physics_worker = None
+
         # Stop all protocol servers
         for server_key, server in self.protocol_servers.items():
             try:
@@ -1089,9 +1250,18 @@ class SimulatorManager:
         # Mark system as stopped
         await self.data_store.mark_simulation_running(False)
 
+        # Store pending aggregation summaries, then make the on-disk audit
+        # trail complete for readers (it stays open for a restart)
+        await self.system_state.flush_audit_aggregation(final=True)
+        if self.system_state.audit_store is not None:
+            self.system_state.audit_store.flush()
+
         # Log final statistics
         await self._log_final_statistics()
 
+        if self.loop_monitor:
+            await self.loop_monitor.stop()
+
         logger.info("Simulation stopped")
 
     async def pause(self) -> None:
@@ -1154,6 +1324,9 @@ class SimulatorManager:
         if self.power_flow:
             await self.power_flow.initialise()
 
+        if self._steady_state_init:
+            await self._solve_steady_state()
+
         self._update_count = 0
         self._initialised = False
 
@@ -1215,45 +1388,132 @@ class SimulatorManager:
         Args:
             dt: Time delta in simulation seconds
         """
-        # 1. Update device aggregations for grid/power flow
-        if self.grid_physics:
-            await self.grid_physics.update_from_devices()
+        with self._phase("physics"):
+            worker_stepped = await self._step_physics_worker(dt)
+
+            if self.physics_coupling:
+                # 1-2. Engines exchange port values and update in topological order
+                skip: set[str] = set()
+                if worker_stepped and self.physics_worker:
+                    skip = set(self.physics_worker.engines)
+                self.physics_coupling.step(dt, skip=skip)
+            else:
+                # 1. Update device aggregations for grid/power flow
+                if self.grid_physics:
+                    await self.grid_physics.update_from_devices()
 
-        if self.power_flow:
-            await self.power_flow.update_from_devices()
+                if self.power_flow:
+                    await self.power_flow.update_from_devices()
 
-        # 2. Update all physics engines (synchronous, deterministic order)
-        for turbine in self.turbine_physics.values():
-            turbine.update(dt)
+                # 2. Update all physics engines (synchronous, deterministic order)
+                if not worker_stepped:
+                    for turbine in self.turbine_physics.values():
+                        turbine.update(dt)
 
-        for hvac in self.hvac_physics.values():
-            hvac.update(dt)
+                    for hvac in self.hvac_physics.values():
+                        hvac.update(dt)
 
-        for reactor in self.reactor_physics.values():
-            reactor.update(dt)
+                    for reactor in self.reactor_physics.values():
+                        reactor.update(dt)
 
-        if self.grid_physics:
-            self.grid_physics.update(dt)
+                if self.grid_physics:
+                    self.grid_physics.update(dt)
 
-        if self.power_flow:
-            self.power_flow.update(dt)
+                if self.power_flow:
+                    self.power_flow.update(dt)
 
         # 3. Write telemetry back to device memory maps
-        for turbine in self.turbine_physics.values():
-            await turbine.write_telemetry()
+        with self._phase("telemetry"):
+            for turbine in self.turbine_physics.values():
+                await turbine.write_telemetry()
 
-        for hvac in self.hvac_physics.values():
-            await hvac.write_telemetry()
+            for hvac in self.hvac_physics.values():
+                await hvac.write_telemetry()
 
-        for reactor in self.reactor_physics.values():
-            await reactor.write_telemetry()
+            for reactor in self.reactor_physics.values():
+                await reactor.write_telemetry()
 
         # 4. Sync protocol servers with device registers
-        await self._sync_protocol_servers()
+        with self._phase("protocol_sync"):
+            await self._sync_protocol_servers()
 
         # 5. Increment system update counter
         await self.data_store.increment_update_cycle()
 
+    async def _start_loop_monitor(self, config: dict[str, Any]) -> None:
+        """Start the event-loop health monitor if enabled in config.
+
+        Started before devices and servers so their tasks are attributed.
+        Controlled by simulation.monitoring.loop_health.
+        """
+        monitoring_cfg = config.get("simulation", {}).get("monitoring", {})
+        loop_cfg = monitoring_cfg.get("loop_health") or {}
+        if not loop_cfg.get("enabled", False):
+            return
+
+        self.loop_monitor = LoopMonitor(
+            probe_interval=loop_cfg.get("probe_interval", 0.05),
+            slow_step=loop_cfg.get("slow_step_ms", 20) / 1000.0,
+            attribute_tasks=loop_cfg.get("attribute_tasks", True),
+        )
+        await self.loop_monitor.start()
+
+    def _phase(self, name: str) -> contextlib.AbstractContextManager:
+        """Time a simulation cycle phase when loop monitoring is on."""
+        if self.loop_monitor:
+            return self.loop_monitor.phase(name)
+        return contextlib.nullcontext()
+
+    async def _start_physics_worker(self) -> None:
+        """Start the device physics worker process if enabled in config.
+
+        Controlled by simulation.runtime.physics_worker. On failure the
+        simulation continues with in-process physics.
+        """
+        config = self.config_loader.load_all()
+        runtime_cfg = config.get("simulation", {}).get("runtime", {})
+        if not runtime_cfg.get("physics_worker", False):
+            return
+
+        engines = {
+            **self.turbine_physics,
+            **self.hvac_physics,
+            **self.reactor_physics,
+        }
+        if not engines:
+            return
+
+        worker = PhysicsWorker(engines)
+        try:
+            await worker.start()
+        except RuntimeError as e:
+            logger.error(f"Physics worker failed to start: {e}, using in-process")
+            return
+
+        self.physics_worker = worker
+
+    async def _step_physics_worker(self, dt: float) -> bool:
+        """Step device physics in the worker process.
+
+        Args:
+            dt: Time delta in simulation seconds
+
+        Returns:
+            True if the worker stepped the engines, False to step in-process
+        """
+        if not self.physics_worker:
+            return False
+
+        try:
+            await self.physics_worker.step(dt)
+            return True
+        except RuntimeError as e:
+            # Engines still hold the last good state - continue in-process
+            logger.error(f"Physics worker failed: {e}, falling back to in-process")
+            await self.physics_worker.stop()
+            self.physics_worker = None
+            return False
+
     async def _sync_protocol_servers(self) -> None:
         """Sync device registers with protocol servers (Option C: manual sync).
 
@@ -1413,6 +1673,16 @@ class SimulatorManager:
         for name, reactor in self.reactor_physics.items():
             reactor_status[name] = reactor.get_telemetry()
 
+        integrator_status = {
+            name: engine.get_integrator_stats()
+            for engines in (
+                self.turbine_physics,
+                self.hvac_physics,
+                self.reactor_physics,
+            )
+            for name, engine in engines.items()
+        }
+
         return {
             "running": self._running,
             "paused": self._paused,
@@ -1427,7 +1697,19 @@ class SimulatorManager:
                 "hvac": hvac_status,
                 "reactors": reactor_status,
                 "power_flow": self.power_flow is not None,
+                "integrator": integrator_status,
+                "worker": (
+                    self.physics_worker.get_status() if self.physics_worker else None
+                ),
+                "coupling": (
+                    self.physics_coupling.get_status()
+                    if self.physics_coupling
+                    else None
+                ),
             },
+            "loop_health": (
+                self.loop_monitor.get_status() if self.loop_monitor else None
+            ),
         }
 
     async def _log_status(self) -> None:
@@ -1451,6 +1733,10 @@ class SimulatorManager:
                 f"Load={grid['total_load_mw']:.1f}MW"
             )
 
+        # Log event-loop health if monitored
+        if status["loop_health"]:
+            logger.debug(self._loop_health_summary(status["loop_health"]))
+
     async def _log_final_statistics(self) -> None:
         """Log final simulation statistics."""
         elapsed_sim = self.sim_time.now() - self._start_time
@@ -1466,8 +1752,31 @@ class SimulatorManager:
         logger.info(f"Simulation time elapsed: {elapsed_sim:.1f}s")
         logger.info(f"Wall-clock time elapsed: {elapsed_wall:.1f}s")
         logger.info(f"Time ratio: {ratio:.2f}x")
+        if self.loop_monitor:
+            loop_health = self.loop_monitor.get_status()
+            logger.info(self._loop_health_summary(loop_health))
+            for offender in loop_health["top_offenders"][:5]:
+                logger.info(
+                    f"  Slow task {offender['task']}: "
+                    f"{offender['slow_steps']} steps, "
+                    f"{offender['total_ms']:.0f}ms total, "
+                    f"max {offender['max_ms']:.0f}ms"
+                )
         logger.info("------------------------")
 
+    @staticmethod
+    def _loop_health_summary(loop_health: dict[str, Any]) -> str:
+        """One-line event-loop lag and worst offender summary."""
+        lag = loop_health["lag"]
+        summary = (
+            f"Loop lag: p50={lag['p50_ms']}ms, p99={lag['p99_ms']}ms, "
+            f"max={lag['max_ms']:.1f}ms"
+        )
+        if loop_health["top_offenders"]:
+            worst = loop_health["top_offenders"][0]
+            summary += f", worst task {worst['task']} ({worst['total_ms']:.0f}ms)"
+        return summary
+
     # ----------------------------------------------------------------
     # Signal handling
     # ----------------------------------------------------------------